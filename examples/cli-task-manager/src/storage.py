@@ -1,26 +1,41 @@
 """
 Task storage and persistence layer for the CLI Task Manager.
 
-This module handles saving and loading tasks from JSON files,
-providing a simple file-based database solution.
+Tasks are kept in an append-only JSON Lines log: every add, update or
+delete appends one record, and the log is compacted (rewritten with only
+the live tasks) once superseded records outnumber the live ones. On open
+the log is replayed into in-memory indexes by id, status and priority,
+so writes cost O(1) amortised and lookups never scan the file.
+
+Files written by earlier versions (a single JSON document) are migrated
+to the log format the first time they are opened.
 """
 
+import copy
+import heapq
 import json
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime
 import shutil
 
 from models import Task, Priority, TaskStats
 
+LOG_FORMAT = "cli-task-log"
+LOG_VERSION = 2
+
+# Compact once superseded records exceed both this and the live task count
+COMPACT_MIN_DEAD = 1000
+
 
 class TaskStorage:
     """
-    File-based storage for tasks using JSON format.
+    Log-structured file storage for tasks.
 
-    This class provides a simple persistence layer that saves tasks
-    to a JSON file in the user's home directory or current directory.
+    The log lives at file_path (tasks.json by default). Its first line is a
+    header; each following line is either {"put": <task>} or {"del": <id>}.
+    A backup of the previous log is kept at <file>.backup on compaction.
     """
 
     def __init__(self, file_path: Optional[str] = None):
@@ -37,97 +52,235 @@ class TaskStorage:
             # Default to tasks.json in current directory
             self.file_path = Path("tasks.json")
 
+        self._tasks: Dict[int, Task] = {}
+        self._by_status: Dict[bool, set] = {False: set(), True: set()}
+        self._by_priority: Dict[Priority, set] = {p: set() for p in Priority}
+        self._id_heap: List[int] = []  # negated ids; entries of deleted tasks are dropped lazily
+        self._dead = 0  # superseded records still in the log
+        self._offset = 0  # bytes of the log replayed so far
+        self._inode = None
+
         self._ensure_file_exists()
-        self._backup_interval = 10  # Backup every 10 operations
+        self._load()
+
+    # ─── Log file ─────────────────────────────────────────
 
     def _ensure_file_exists(self) -> None:
         """Ensure the tasks file exists, creating it if necessary."""
         if not self.file_path.exists():
-            # Create empty tasks file
             self._save_tasks_to_file([])
 
-    def _save_tasks_to_file(self, tasks: List[Task]) -> None:
-        """Save tasks to the JSON file with error handling."""
+    def _save_tasks_to_file(self, tasks: Iterable[Task]) -> None:
+        """Rewrite the log with just the given tasks (compaction)."""
+        temp_path = self.file_path.with_suffix(".tmp")
         try:
-            # Convert tasks to dictionaries for JSON serialization
-            tasks_data = [task.to_dict() for task in tasks]
-
-            # Create backup before writing
+            # Keep the previous log as a backup before replacing it
             self._create_backup_if_needed()
 
-            # Write to temporary file first, then move (atomic operation)
-            temp_path = self.file_path.with_suffix(".tmp")
             with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "tasks": tasks_data,
-                        "metadata": {
-                            "last_updated": datetime.now().isoformat(),
-                            "version": "1.0",
-                            "task_count": len(tasks),
-                        },
-                    },
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                )
+                header = {
+                    "format": LOG_FORMAT,
+                    "version": LOG_VERSION,
+                    "compacted_at": datetime.now().isoformat(),
+                }
+                f.write(json.dumps(header) + "\n")
+                for task in tasks:
+                    f.write(self._record({"put": task.to_dict()}))
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic move
             temp_path.replace(self.file_path)
 
         except Exception as e:
             # Clean up temp file if it exists
-            temp_path = self.file_path.with_suffix(".tmp")
             if temp_path.exists():
                 temp_path.unlink()
             raise RuntimeError(f"Failed to save tasks: {str(e)}") from e
 
-    def _load_tasks_from_file(self) -> List[Task]:
-        """Load tasks from the JSON file with error handling."""
-        try:
-            if not self.file_path.exists() or self.file_path.stat().st_size == 0:
-                return []
+    def _create_backup_if_needed(self) -> None:
+        """Create a backup copy of the tasks file."""
+        if self.file_path.exists():
+            backup_path = self.file_path.with_suffix(".backup")
+            shutil.copy(self.file_path, backup_path)
 
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    @staticmethod
+    def _record(record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False) + "\n"
 
-            # Handle both old format (direct list) and new format (with metadata)
-            if isinstance(data, list):
-                tasks_data = data
-            elif isinstance(data, dict) and "tasks" in data:
-                tasks_data = data["tasks"]
-            else:
-                raise ValueError("Invalid file format")
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the log and apply them to the indexes (call _refresh first)."""
+        data = "".join(self._record(r) for r in records).encode("utf-8")
+        try:
+            with open(self.file_path, "ab") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size != self._offset:
+                    # A torn record from a crashed write: end it so ours stays parseable
+                    data = b"\n" + data
+                    self._dead += 1
+                f.write(data)
+        except OSError as e:
+            raise RuntimeError(f"Failed to save tasks: {str(e)}") from e
+        self._offset = size + len(data)
+        for record in records:
+            self._apply(record)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._dead > max(COMPACT_MIN_DEAD, len(self._tasks)):
+            self._compact()
+
+    def _compact(self, tasks: Optional[Iterable[Task]] = None) -> None:
+        """Rewrite the log from the live tasks (or the given ones) and reload."""
+        self._save_tasks_to_file(self._tasks.values() if tasks is None else tasks)
+        self._load()
+
+    # ─── Replay and indexes ───────────────────────────────
+
+    def _reset_indexes(self) -> None:
+        self._tasks = {}
+        self._by_status = {False: set(), True: set()}
+        self._by_priority = {p: set() for p in Priority}
+        self._id_heap = []
+        self._dead = 0
+        self._offset = 0
+
+    def _load(self, allow_restore: bool = True) -> None:
+        """Replay the whole log into fresh indexes, migrating old files."""
+        self._reset_indexes()
+        if not self.file_path.exists() or self.file_path.stat().st_size == 0:
+            self._save_tasks_to_file([])
 
-            # Convert dictionaries back to Task objects
-            tasks = []
-            for task_data in tasks_data:
-                try:
-                    task = Task.from_dict(task_data)
-                    tasks.append(task)
-                except Exception as e:
-                    # Log corrupted task but continue loading others
-                    print(f"Warning: Skipped corrupted task: {e}")
+        with open(self.file_path, "rb") as f:
+            first = f.readline()
+            if self._is_header(first):
+                self._offset = len(first)
+                self._inode = os.fstat(f.fileno()).st_ino
+                self._replay(f)
+                return
+        self._migrate(allow_restore)
+
+    def _replay(self, f) -> None:
+        """Apply complete log records from the current offset of an open file."""
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # torn or in-progress write at the tail
+            self._offset += len(line)
+            try:
+                self._apply(json.loads(line))
+            except Exception as e:
+                # Log corrupted record but continue loading others
+                print(f"Warning: Skipped corrupted task: {e}")
+                self._dead += 1
 
-            return tasks
+    def _refresh(self) -> None:
+        """Pick up records appended (or a compaction done) by another process."""
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            self._load()
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._load()
+        elif stat.st_size > self._offset:
+            with open(self.file_path, "rb") as f:
+                f.seek(self._offset)
+                self._replay(f)
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if "put" in record:
+            self._index(Task.from_dict(record["put"]))
+        elif "del" in record:
+            if self._unindex(record["del"]) is None:
+                raise ValueError(f"delete of unknown task {record['del']}")
+            self._dead += 2  # the delete record and the put it cancels
+        else:
+            raise ValueError("Invalid log record")
 
+    def _index(self, task: Task) -> None:
+        if self._unindex(task.id) is not None:
+            self._dead += 1
+        else:
+            heapq.heappush(self._id_heap, -task.id)
+        self._tasks[task.id] = task
+        self._by_status[task.completed].add(task.id)
+        self._by_priority[task.priority].add(task.id)
+
+    def _unindex(self, task_id: int) -> Optional[Task]:
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        self._by_status[task.completed].discard(task_id)
+        self._by_priority[task.priority].discard(task_id)
+        return task
+
+    def _max_id(self) -> int:
+        """Highest live task ID, so freed top IDs are reused, as before."""
+        heap = self._id_heap
+        while heap and -heap[0] not in self._tasks:
+            heapq.heappop(heap)
+        return -heap[0] if heap else 0
+
+    def _migrate(self, allow_restore: bool = True) -> None:
+        """Convert a JSON document written by an earlier version into a log."""
+        try:
+            tasks = self._load_tasks_from_file()
         except (json.JSONDecodeError, ValueError) as e:
-            # Try to restore from backup
+            # Try to restore from backup (either format)
             backup_path = self.file_path.with_suffix(".backup")
-            if backup_path.exists():
+            if allow_restore and backup_path.exists():
                 print(f"Warning: Corrupted tasks file, restoring from backup...")
                 shutil.copy(backup_path, self.file_path)
-                return self._load_tasks_from_file()
+                self._load(allow_restore=False)
+                return
 
             # If no backup or backup also fails, start fresh
             print(f"Warning: Could not load tasks file ({e}), starting with empty list")
-            return []
+            tasks = []
 
-    def _create_backup_if_needed(self) -> None:
-        """Create a backup copy of the tasks file."""
-        if self.file_path.exists():
-            backup_path = self.file_path.with_suffix(".backup")
-            shutil.copy(self.file_path, backup_path)
+        self._save_tasks_to_file(tasks)
+        self._load(allow_restore=False)
+
+    def _load_tasks_from_file(self) -> List[Task]:
+        """Load tasks from a legacy single-document JSON file."""
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # Handle both old format (direct list) and new format (with metadata)
+        if isinstance(data, list):
+            tasks_data = data
+        elif isinstance(data, dict) and "tasks" in data:
+            tasks_data = data["tasks"]
+        else:
+            raise ValueError("Invalid file format")
+
+        # Convert dictionaries back to Task objects
+        tasks = []
+        for task_data in tasks_data:
+            try:
+                task = Task.from_dict(task_data)
+                tasks.append(task)
+            except Exception as e:
+                # Log corrupted task but continue loading others
+                print(f"Warning: Skipped corrupted task: {e}")
+
+        return tasks
+
+    @staticmethod
+    def _is_header(line: bytes) -> bool:
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return False
+        return isinstance(header, dict) and header.get("format") == LOG_FORMAT
+
+    def _snapshot(self, ids: Optional[Iterable[int]] = None) -> List[Task]:
+        """Copies of the stored tasks, so callers cannot mutate the indexes (call _refresh first)."""
+        if ids is None:
+            return [copy.copy(task) for task in self._tasks.values()]
+        return [copy.copy(self._tasks[task_id]) for task_id in ids]
+
+    # ─── Public API ───────────────────────────────────────
 
     def get_tasks(self, include_completed: bool = True) -> List[Task]:
         """
@@ -139,10 +292,11 @@ class TaskStorage:
         Returns:
             List of Task objects sorted by creation date
         """
-        tasks = self._load_tasks_from_file()
-
-        if not include_completed:
-            tasks = [task for task in tasks if not task.completed]
+        self._refresh()
+        if include_completed:
+            tasks = self._snapshot()
+        else:
+            tasks = self._snapshot(self._by_status[False])
 
         # Sort by completion status first (pending first), then by creation date
         return sorted(tasks, key=lambda t: (t.completed, t.created_at))
@@ -157,11 +311,9 @@ class TaskStorage:
         Returns:
             Task object if found, None otherwise
         """
-        tasks = self._load_tasks_from_file()
-        for task in tasks:
-            if task.id == task_id:
-                return task
-        return None
+        self._refresh()
+        task = self._tasks.get(task_id)
+        return copy.copy(task) if task else None
 
     def add_task(self, task: Task) -> None:
         """
@@ -170,14 +322,13 @@ class TaskStorage:
         Args:
             task: Task object to add
         """
-        tasks = self._load_tasks_from_file()
+        self._refresh()
 
         # Ensure unique ID
-        if any(t.id == task.id for t in tasks):
+        if task.id in self._tasks:
             raise ValueError(f"Task with ID {task.id} already exists")
 
-        tasks.append(task)
-        self._save_tasks_to_file(tasks)
+        self._append([{"put": task.to_dict()}])
 
     def update_task(self, updated_task: Task) -> bool:
         """
@@ -189,15 +340,12 @@ class TaskStorage:
         Returns:
             True if task was found and updated, False otherwise
         """
-        tasks = self._load_tasks_from_file()
+        self._refresh()
+        if updated_task.id not in self._tasks:
+            return False
 
-        for i, task in enumerate(tasks):
-            if task.id == updated_task.id:
-                tasks[i] = updated_task
-                self._save_tasks_to_file(tasks)
-                return True
-
-        return False
+        self._append([{"put": updated_task.to_dict()}])
+        return True
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -209,16 +357,12 @@ class TaskStorage:
         Returns:
             True if task was found and deleted, False otherwise
         """
-        tasks = self._load_tasks_from_file()
-        initial_count = len(tasks)
+        self._refresh()
+        if task_id not in self._tasks:
+            return False
 
-        tasks = [task for task in tasks if task.id != task_id]
-
-        if len(tasks) < initial_count:
-            self._save_tasks_to_file(tasks)
-            return True
-
-        return False
+        self._append([{"del": task_id}])
+        return True
 
     def complete_task(self, task_id: int) -> bool:
         """
@@ -268,8 +412,12 @@ class TaskStorage:
         if not query.strip():
             return []
 
-        tasks = self._load_tasks_from_file()
-        return [task for task in tasks if task.matches_query(query, case_sensitive)]
+        self._refresh()
+        return [
+            copy.copy(task)
+            for task in self._tasks.values()
+            if task.matches_query(query, case_sensitive)
+        ]
 
     def get_next_id(self) -> int:
         """
@@ -278,12 +426,8 @@ class TaskStorage:
         Returns:
             Next available ID (1-based)
         """
-        tasks = self._load_tasks_from_file()
-        if not tasks:
-            return 1
-
-        max_id = max(task.id for task in tasks)
-        return max_id + 1
+        self._refresh()
+        return self._max_id() + 1
 
     def get_stats(self) -> TaskStats:
         """
@@ -292,8 +436,17 @@ class TaskStorage:
         Returns:
             TaskStats object with calculated statistics
         """
-        tasks = self._load_tasks_from_file()
-        return TaskStats.from_tasks(tasks)
+        self._refresh()
+        stats = TaskStats(
+            total=len(self._tasks),
+            completed=len(self._by_status[True]),
+            pending=len(self._by_status[False]),
+            high_priority=len(self._by_priority[Priority.HIGH]),
+            normal_priority=len(self._by_priority[Priority.NORMAL]),
+            low_priority=len(self._by_priority[Priority.LOW]),
+        )
+        stats.overdue = sum(1 for i in self._by_status[False] if self._tasks[i].is_overdue)
+        return stats
 
     def get_overdue_tasks(self) -> List[Task]:
         """
@@ -302,8 +455,8 @@ class TaskStorage:
         Returns:
             List of overdue Task objects
         """
-        tasks = self._load_tasks_from_file()
-        return [task for task in tasks if task.is_overdue]
+        self._refresh()
+        return self._snapshot(i for i in self._by_status[False] if self._tasks[i].is_overdue)
 
     def get_due_today(self) -> List[Task]:
         """
@@ -312,13 +465,13 @@ class TaskStorage:
         Returns:
             List of Task objects due today
         """
-        tasks = self._load_tasks_from_file()
+        self._refresh()
         today = datetime.now().date()
-        return [
-            task
-            for task in tasks
-            if task.due_date and task.due_date.date() == today and not task.completed
-        ]
+        return self._snapshot(
+            i
+            for i in self._by_status[False]
+            if self._tasks[i].due_date and self._tasks[i].due_date.date() == today
+        )
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
         """
@@ -330,8 +483,8 @@ class TaskStorage:
         Returns:
             List of Task objects with the specified priority
         """
-        tasks = self._load_tasks_from_file()
-        return [task for task in tasks if task.priority == priority]
+        self._refresh()
+        return self._snapshot(self._by_priority[priority])
 
     def clear_completed_tasks(self) -> int:
         """
@@ -340,13 +493,12 @@ class TaskStorage:
         Returns:
             Number of tasks that were removed
         """
-        tasks = self._load_tasks_from_file()
-        completed_count = len([task for task in tasks if task.completed])
+        self._refresh()
+        completed = sorted(self._by_status[True])
+        if completed:
+            self._append([{"del": task_id} for task_id in completed])
 
-        tasks = [task for task in tasks if not task.completed]
-        self._save_tasks_to_file(tasks)
-
-        return completed_count
+        return len(completed)
 
     def export_to_json(self, export_path: str) -> None:
         """
@@ -355,12 +507,12 @@ class TaskStorage:
         Args:
             export_path: Path where to save the exported tasks
         """
-        tasks = self._load_tasks_from_file()
+        self._refresh()
         export_data = {
             "exported_at": datetime.now().isoformat(),
             "source_file": str(self.file_path),
-            "task_count": len(tasks),
-            "tasks": [task.to_dict() for task in tasks],
+            "task_count": len(self._tasks),
+            "tasks": [task.to_dict() for task in self._tasks.values()],
         }
 
         with open(export_path, "w", encoding="utf-8") as f:
@@ -395,17 +547,16 @@ class TaskStorage:
                 print(f"Warning: Skipped invalid task during import: {e}")
 
         if merge:
-            existing_tasks = self._load_tasks_from_file()
+            self._refresh()
             # Update IDs to avoid conflicts
-            max_existing_id = max((task.id for task in existing_tasks), default=0)
+            max_existing_id = self._max_id()
             for i, task in enumerate(imported_tasks):
                 task.id = max_existing_id + i + 1
-
-            all_tasks = existing_tasks + imported_tasks
+            if imported_tasks:
+                self._append([{"put": task.to_dict()} for task in imported_tasks])
         else:
-            all_tasks = imported_tasks
+            self._compact(imported_tasks)
 
-        self._save_tasks_to_file(all_tasks)
         return len(imported_tasks)
 
     def get_file_info(self) -> Dict[str, Any]:
@@ -418,13 +569,13 @@ class TaskStorage:
         if not self.file_path.exists():
             return {"exists": False, "path": str(self.file_path)}
 
+        self._refresh()
         stat = self.file_path.stat()
-        task_count = len(self._load_tasks_from_file())
 
         return {
             "exists": True,
             "path": str(self.file_path.absolute()),
             "size": stat.st_size,
             "modified": datetime.fromtimestamp(stat.st_mtime),
-            "task_count": task_count,
+            "task_count": len(self._tasks),
         }
@@ -0,0 +1,158 @@
+"""
+Storage tests for the CLI Task Manager: log format, migration, indexes and scale.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import storage as storage_module
+from models import Priority, Task
+from storage import TaskStorage
+
+BENCH_TASKS = 100_000
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TaskStorage(str(tmp_path / "tasks.json"))
+
+
+def test_crud_round_trip(store, tmp_path):
+    for i in range(1, 6):
+        store.add_task(Task(id=i, title=f"Task {i}", priority=Priority.HIGH if i % 2 else Priority.LOW))
+    with pytest.raises(ValueError):
+        store.add_task(Task(id=3, title="duplicate"))
+
+    assert store.complete_task(2)
+    assert store.delete_task(5)
+    assert not store.delete_task(5)
+    assert store.get_next_id() == 5  # freed top IDs are reused, as before
+
+    reopened = TaskStorage(str(tmp_path / "tasks.json"))
+    assert [t.id for t in reopened.get_tasks()] == [1, 3, 4, 2]
+    assert [t.id for t in reopened.get_tasks(include_completed=False)] == [1, 3, 4]
+    assert {t.id for t in reopened.get_tasks_by_priority(Priority.HIGH)} == {1, 3}
+    stats = reopened.get_stats()
+    assert (stats.total, stats.completed, stats.high_priority) == (4, 1, 2)
+
+
+def test_sparse_high_id_does_not_slow_writes(store, tmp_path):
+    # Walking the high-water mark down one id at a time would never finish here
+    far = 10**15
+    store.add_task(Task(id=1, title="low"))
+    store.add_task(Task(id=far, title="far"))
+    for i in range(20):
+        far_task = store.get_task(far)
+        far_task.update_title(f"far {i}")
+        assert store.update_task(far_task)
+    assert store.get_next_id() == far + 1
+
+    reopened = TaskStorage(str(tmp_path / "tasks.json"))
+    assert reopened.get_task(far).title == "far 19"
+    assert reopened.delete_task(far)
+    assert reopened.get_next_id() == 2
+    assert TaskStorage(str(tmp_path / "tasks.json")).get_next_id() == 2
+
+
+def test_returned_tasks_do_not_alias_storage(store):
+    store.add_task(Task(id=1, title="original"))
+    store.get_task(1).update_title("changed without saving")
+    assert store.get_task(1).title == "original"
+
+
+def test_legacy_json_file_is_migrated(tmp_path):
+    path = tmp_path / "tasks.json"
+    legacy = [Task(id=1, title="old"), Task(id=7, title="older", completed=True)]
+    path.write_text(json.dumps({"tasks": [t.to_dict() for t in legacy], "metadata": {}}, indent=2))
+
+    migrated = TaskStorage(str(path))
+    assert [t.id for t in migrated.get_tasks()] == [1, 7]
+    assert json.loads(path.read_text().splitlines()[0])["format"] == storage_module.LOG_FORMAT
+    assert migrated.get_next_id() == 8
+
+
+def test_torn_tail_is_ignored_and_sealed(store):
+    store.add_task(Task(id=1, title="kept"))
+    with open(store.file_path, "a") as f:
+        f.write('{"put": {"id": 2, "tit')  # crash mid-append
+
+    reopened = TaskStorage(str(store.file_path))
+    assert [t.id for t in reopened.get_tasks()] == [1]
+    reopened.add_task(Task(id=2, title="after crash"))
+    assert [t.id for t in TaskStorage(str(store.file_path)).get_tasks()] == [1, 2]
+
+
+def test_sees_writes_from_another_instance(store):
+    other = TaskStorage(str(store.file_path))
+    other.add_task(Task(id=1, title="from another process"))
+    assert store.get_task(1).title == "from another process"
+    other.delete_task(1)
+    assert store.get_task(1) is None
+
+
+def test_compaction_bounds_log_size(store, monkeypatch):
+    monkeypatch.setattr(storage_module, "COMPACT_MIN_DEAD", 10)
+    store.add_task(Task(id=1, title="hot"))
+    for i in range(100):
+        task = store.get_task(1)
+        task.update_title(f"hot {i}")
+        store.update_task(task)
+
+    lines = store.file_path.read_text().splitlines()
+    assert len(lines) <= 12  # header + live task + at most 10 superseded records
+    assert store.get_task(1).title == "hot 99"
+    assert store.file_path.with_suffix(".backup").exists()
+
+
+def _run_workload(path, count):
+    """Add count tasks, read and complete every tenth, reopen; returns timings and the reopened store."""
+    store = TaskStorage(str(path))
+    now = datetime.now()
+    timings = {}
+
+    start = time.perf_counter()
+    for i in range(1, count + 1):
+        store.add_task(Task(id=i, title=f"Task {i}", created_at=now,
+                            due_date=now + timedelta(days=i % 30)))
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1, count + 1, 10):
+        assert store.get_task(i).id == i
+    timings["get"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1, count + 1, 10):
+        store.complete_task(i)
+    timings["complete"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reopened = TaskStorage(str(path))
+    timings["reopen"] = time.perf_counter() - start
+    return timings, reopened
+
+
+def test_workload_survives_reopen(tmp_path):
+    _, reopened = _run_workload(tmp_path / "tasks.json", 2_000)
+    assert len(reopened.get_tasks(include_completed=False)) == 1_800
+    assert reopened.get_task(11).completed
+    stats = reopened.get_stats()
+    assert (stats.total, stats.completed) == (2_000, 200)
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+def test_benchmark_100k_tasks(tmp_path):
+    timings, reopened = _run_workload(tmp_path / "tasks.json", BENCH_TASKS)
+    print("\n" + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items()))
+    assert len(reopened.get_tasks(include_completed=False)) == BENCH_TASKS - BENCH_TASKS // 10
+    # Per-operation cost stays flat: the old storage took seconds per write at 50k
+    assert timings["add"] / BENCH_TASKS < 0.001
+    assert timings["complete"] / (BENCH_TASKS // 10) < 0.002
@@ -1,2 +1,24 @@
-from .db import get_db, get_async_db, get_db_session, init_db
-from .models import Base, YouTubeVideo, AINews, GitHubProject, YouTubeAutomation, ScraperLog
+from .db import (
+    get_async_db,
+    get_async_db_session,
+    get_db,
+    get_db_session,
+    init_async_db,
+    init_db,
+)
+from .models import AINews, Base, GitHubProject, ScraperLog, YouTubeAutomation, YouTubeVideo
+
+__all__ = [
+    "get_db",
+    "get_async_db",
+    "get_db_session",
+    "get_async_db_session",
+    "init_db",
+    "init_async_db",
+    "Base",
+    "YouTubeVideo",
+    "AINews",
+    "GitHubProject",
+    "YouTubeAutomation",
+    "ScraperLog",
+]
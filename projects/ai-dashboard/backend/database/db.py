@@ -1,9 +1,9 @@
 # AI Dashboard - Database Connection
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 import os
 
 from .models import Base
@@ -25,9 +25,22 @@ ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
 # Sync engine (for migrations and simple ops)
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
-# Async engine (for FastAPI)
+# Async engine (for FastAPI routes and scheduled scrapers)
 async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
 
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    """WAL lets dashboard reads proceed while a scraper holds the write lock"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+event.listen(engine, "connect", _configure_sqlite)
+event.listen(async_engine.sync_engine, "connect", _configure_sqlite)
+
 # Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 AsyncSessionLocal = sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
@@ -39,6 +52,13 @@ def init_db():
     print(f"Database initialized at {DB_PATH}")
 
 
+async def init_async_db():
+    """Initialize database tables without blocking the event loop"""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    print(f"Database initialized at {DB_PATH}")
+
+
 def get_db():
     """Dependency for sync database sessions"""
     db = SessionLocal()
@@ -71,6 +91,18 @@ async def get_async_db():
             await session.close()
 
 
+@asynccontextmanager
+async def get_async_db_session():
+    """Async context manager for database sessions (scheduled jobs)"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 # Initialize database on import
 if not os.path.exists(DB_PATH):
     init_db()
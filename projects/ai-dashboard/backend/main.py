@@ -9,7 +9,8 @@ from typing import Optional, List
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,8 +24,8 @@ logger = logging.getLogger(__name__)
 
 # Import database
 from database import (
-    get_db,
-    init_db,
+    get_async_db,
+    init_async_db,
     YouTubeVideo,
     AINews,
     GitHubProject,
@@ -32,11 +33,10 @@ from database import (
     ScraperLog,
 )
 
-# Import scrapers and services
-from scrapers import YouTubeScraper, NewsAggregator, GitHubTrendingScraper
+# Import services
 from services import SchedulerService, YouTubeAutomationService, PromptOptimizer
 
-# Initialize services
+# Initialize services (routes share the scheduler's scraper instances)
 scheduler = SchedulerService()
 youtube_automation = YouTubeAutomationService()
 
@@ -80,13 +80,14 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AI Dashboard...")
     validate_api_keys()
-    init_db()
+    await init_async_db()
     scheduler.start()
     yield
     # Shutdown
     logger.info("Shutting down AI Dashboard...")
     scheduler.stop(wait=True)  # Wait for running jobs to complete
     await youtube_automation.close()
+    await scheduler.news_aggregator.close()
 
 
 # Create FastAPI app
@@ -229,19 +230,19 @@ async def root():
 async def get_videos(
     limit: int = Query(20, ge=1, le=100),
     min_views: int = Query(1000, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get top AI videos"""
-    scraper = YouTubeScraper()
-    videos = scraper.get_top_videos(db, limit=limit, min_views=min_views)
+    scraper = scheduler.youtube_scraper
+    videos = await scraper.get_top_videos(db, limit=limit, min_views=min_views)
     return videos
 
 
 @app.post("/api/videos/scrape")
-async def trigger_video_scrape(db: Session = Depends(get_db)):
+async def trigger_video_scrape(db: AsyncSession = Depends(get_async_db)):
     """Manually trigger YouTube scraper"""
     try:
-        scraper = YouTubeScraper()
+        scraper = scheduler.youtube_scraper
         await scraper.scrape_videos(db)
         return {"status": "success", "message": "YouTube scrape completed"}
     except Exception as e:
@@ -255,27 +256,29 @@ async def trigger_video_scrape(db: Session = Depends(get_db)):
 async def get_news(
     limit: int = Query(50, ge=1, le=200),
     source: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get latest AI news"""
-    aggregator = NewsAggregator()
-    news = aggregator.get_latest_news(db, limit=limit, source=source)
+    aggregator = scheduler.news_aggregator
+    news = await aggregator.get_latest_news(db, limit=limit, source=source)
     return news
 
 
 @app.get("/api/news/trending", response_model=List[NewsResponse])
-async def get_trending_news(limit: int = Query(20, ge=1, le=50), db: Session = Depends(get_db)):
+async def get_trending_news(
+    limit: int = Query(20, ge=1, le=50), db: AsyncSession = Depends(get_async_db)
+):
     """Get trending AI news"""
-    aggregator = NewsAggregator()
-    news = aggregator.get_trending_news(db, limit=limit)
+    aggregator = scheduler.news_aggregator
+    news = await aggregator.get_trending_news(db, limit=limit)
     return news
 
 
 @app.post("/api/news/scrape")
-async def trigger_news_scrape(db: Session = Depends(get_db)):
+async def trigger_news_scrape(db: AsyncSession = Depends(get_async_db)):
     """Manually trigger news aggregator"""
     try:
-        aggregator = NewsAggregator()
+        aggregator = scheduler.news_aggregator
         await aggregator.aggregate_news(db)
         return {"status": "success", "message": "News aggregation completed"}
     except Exception as e:
@@ -289,27 +292,29 @@ async def trigger_news_scrape(db: Session = Depends(get_db)):
 async def get_projects(
     limit: int = Query(20, ge=1, le=100),
     min_stars: int = Query(100, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get top AI GitHub projects"""
-    scraper = GitHubTrendingScraper()
-    projects = scraper.get_top_projects(db, limit=limit, min_stars=min_stars)
+    scraper = scheduler.github_scraper
+    projects = await scraper.get_top_projects(db, limit=limit, min_stars=min_stars)
     return projects
 
 
 @app.get("/api/projects/trending", response_model=List[ProjectResponse])
-async def get_trending_projects(limit: int = Query(20, ge=1, le=50), db: Session = Depends(get_db)):
+async def get_trending_projects(
+    limit: int = Query(20, ge=1, le=50), db: AsyncSession = Depends(get_async_db)
+):
     """Get trending AI GitHub projects"""
-    scraper = GitHubTrendingScraper()
-    projects = scraper.get_trending_projects(db, limit=limit)
+    scraper = scheduler.github_scraper
+    projects = await scraper.get_trending_projects(db, limit=limit)
     return projects
 
 
 @app.post("/api/projects/scrape")
-async def trigger_projects_scrape(db: Session = Depends(get_db)):
+async def trigger_projects_scrape(db: AsyncSession = Depends(get_async_db)):
     """Manually trigger GitHub scraper"""
     try:
-        scraper = GitHubTrendingScraper()
+        scraper = scheduler.github_scraper
         await scraper.scrape_trending(db)
         return {"status": "success", "message": "GitHub scrape completed"}
     except Exception as e:
@@ -323,24 +328,24 @@ async def trigger_projects_scrape(db: Session = Depends(get_db)):
 async def get_automations(
     status: Optional[str] = None,
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all video automations"""
-    drafts = youtube_automation.get_all_drafts(db, status=status, limit=limit)
+    drafts = await youtube_automation.get_all_drafts(db, status=status, limit=limit)
     return drafts
 
 
 @app.get("/api/automation/{automation_id}", response_model=AutomationResponse)
-async def get_automation(automation_id: int, db: Session = Depends(get_db)):
+async def get_automation(automation_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific automation"""
-    draft = youtube_automation.get_draft(db, automation_id)
+    draft = await youtube_automation.get_draft(db, automation_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Automation not found")
     return draft
 
 
 @app.post("/api/automation", response_model=AutomationResponse)
-async def create_automation(data: AutomationCreate, db: Session = Depends(get_db)):
+async def create_automation(data: AutomationCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new video automation from prompt"""
     try:
         draft = await youtube_automation.create_video_draft(
@@ -356,7 +361,7 @@ async def create_automation(data: AutomationCreate, db: Session = Depends(get_db
 
 @app.patch("/api/automation/{automation_id}", response_model=AutomationResponse)
 async def update_automation(
-    automation_id: int, data: AutomationUpdate, db: Session = Depends(get_db)
+    automation_id: int, data: AutomationUpdate, db: AsyncSession = Depends(get_async_db)
 ):
     """Update a video automation draft"""
     try:
@@ -370,7 +375,7 @@ async def update_automation(
 
 
 @app.post("/api/automation/{automation_id}/generate-video")
-async def generate_video(automation_id: int, db: Session = Depends(get_db)):
+async def generate_video(automation_id: int, db: AsyncSession = Depends(get_async_db)):
     """Generate HeyGen video for automation"""
     try:
         draft = await youtube_automation.generate_heygen_video(db, automation_id)
@@ -382,14 +387,14 @@ async def generate_video(automation_id: int, db: Session = Depends(get_db)):
 
 
 @app.get("/api/automation/{automation_id}/video-status")
-async def check_video_status(automation_id: int, db: Session = Depends(get_db)):
+async def check_video_status(automation_id: int, db: AsyncSession = Depends(get_async_db)):
     """Check HeyGen video generation status"""
     status = await youtube_automation.check_heygen_status(db, automation_id)
     return status
 
 
 @app.post("/api/automation/{automation_id}/approve")
-async def approve_automation(automation_id: int, db: Session = Depends(get_db)):
+async def approve_automation(automation_id: int, db: AsyncSession = Depends(get_async_db)):
     """Approve and upload video to YouTube"""
     try:
         draft = await youtube_automation.approve_and_upload(db, automation_id)
@@ -429,22 +434,35 @@ async def run_job(job_id: str):
 # ---------- Stats ----------
 
 
+STATS_QUERY = select(
+    *(
+        select(func.count()).select_from(model).scalar_subquery().label(label)
+        for model, label in (
+            (YouTubeVideo, "videos"),
+            (AINews, "news"),
+            (GitHubProject, "projects"),
+            (YouTubeAutomation, "automations"),
+        )
+    )
+)
+
+
 @app.get("/api/stats")
-async def get_stats(db: Session = Depends(get_db)):
+async def get_stats(db: AsyncSession = Depends(get_async_db)):
     """Get dashboard statistics"""
-    video_count = db.query(YouTubeVideo).count()
-    news_count = db.query(AINews).count()
-    project_count = db.query(GitHubProject).count()
-    automation_count = db.query(YouTubeAutomation).count()
+    # All four table counts in one round trip
+    counts = (await db.execute(STATS_QUERY)).one()
 
     # Get recent scraper logs
-    recent_logs = db.query(ScraperLog).order_by(ScraperLog.started_at.desc()).limit(10).all()
+    recent_logs = (
+        await db.scalars(select(ScraperLog).order_by(ScraperLog.started_at.desc()).limit(10))
+    ).all()
 
     return {
-        "videos": video_count,
-        "news": news_count,
-        "projects": project_count,
-        "automations": automation_count,
+        "videos": counts.videos,
+        "news": counts.news,
+        "projects": counts.projects,
+        "automations": counts.automations,
         "recent_scrapes": [
             {
                 "scraper": log.scraper_name,
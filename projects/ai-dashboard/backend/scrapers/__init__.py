@@ -1,3 +1,15 @@
-from .youtube_scraper import YouTubeScraper
-from .news_aggregator import NewsAggregator
+from .feed_fetcher import FeedFetcher, FeedResult
 from .github_trending import GitHubTrendingScraper
+from .news_aggregator import NewsAggregator
+from .upsert import BatchUpsertSink, UpsertStats
+from .youtube_scraper import YouTubeScraper
+
+__all__ = [
+    "YouTubeScraper",
+    "NewsAggregator",
+    "GitHubTrendingScraper",
+    "BatchUpsertSink",
+    "UpsertStats",
+    "FeedFetcher",
+    "FeedResult",
+]
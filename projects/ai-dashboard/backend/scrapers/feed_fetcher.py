@@ -0,0 +1,173 @@
+# AI Dashboard - Concurrent Feed Fetcher
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 15.0  # seconds, whole request including body
+
+
+@dataclass
+class FeedResult:
+    """Outcome of fetching one feed"""
+
+    name: str
+    url: str
+    status: int = 0
+    text: Optional[str] = None
+    not_modified: bool = False
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    validators: Optional[Dict[str, str]] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.text is not None
+
+
+class _HostState:
+    """Per-host concurrency slot and request spacing"""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.next_start = 0.0
+
+
+class FeedFetcher:
+    """
+    Fetches many feeds concurrently over one pooled HTTP client
+
+    At most max_concurrency requests are in flight overall and
+    per_host_concurrency per host, with request starts to the same host
+    spaced by host_intervals[host] (or per_host_interval) seconds. A request
+    waits for its host's slot and spacing before it takes a global slot, so
+    a rate-limited host never holds slots other hosts could use.
+
+    ETag and Last-Modified validators come back on each FeedResult. Once the
+    caller has stored a feed's content it passes the result to remember(),
+    and later fetches of that URL send them as conditional headers, so an
+    unchanged feed costs a 304 and no parsing.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        per_host_interval: float = 0.0,
+        host_intervals: Optional[Dict[str, float]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+            ),
+            follow_redirects=True,
+        )
+        self._owns_client = client is None
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_interval = per_host_interval
+        self.host_intervals = host_intervals or {}
+        self.timeout = timeout
+        self.validators: Dict[str, Dict[str, str]] = {}
+        self._loop = None
+        self._semaphore = None
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _bind_loop(self):
+        # asyncio primitives belong to one event loop; rebuild them if the loop changed
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._hosts = {}
+
+    def _host(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.per_host_concurrency)
+        return state
+
+    async def _wait_turn(self, host: str, state: _HostState):
+        """Reserve the next start slot for host and sleep until it comes up"""
+        interval = self.host_intervals.get(host, self.per_host_interval)
+        if interval <= 0:
+            return
+        now = self._loop.time()
+        start = max(now, state.next_start)
+        state.next_start = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def fetch(
+        self, name: str, url: str, params: Optional[Dict] = None, conditional: bool = True
+    ) -> FeedResult:
+        """Fetch one URL; never raises, failures are reported on the result"""
+        self._bind_loop()
+        host = httpx.URL(url).host
+        state = self._host(host)
+        result = FeedResult(name=name, url=url)
+
+        async with state.semaphore:
+            await self._wait_turn(host, state)
+            async with self._semaphore:
+                await self._get(url, params, conditional, result)
+
+        if result.error:
+            logger.error(f"Failed to fetch {name}: {result.error}")
+        elif result.not_modified:
+            logger.info(f"{name} not modified ({result.elapsed:.2f}s)")
+        return result
+
+    async def _get(self, url: str, params: Optional[Dict], conditional: bool, result: FeedResult):
+        headers = {}
+        cached = self.validators.get(url) if conditional else None
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                self.client.get(url, params=params, headers=headers), self.timeout
+            )
+            result.status = response.status_code
+            if response.status_code == 304:
+                result.not_modified = True
+            else:
+                response.raise_for_status()
+                result.text = response.text
+                if conditional:
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        result.validators = {"etag": etag, "last_modified": last_modified}
+        except asyncio.TimeoutError:
+            result.error = f"timed out after {self.timeout}s"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.elapsed = time.perf_counter() - started
+
+    def remember(self, results: List[FeedResult]):
+        """Send these results' validators on later fetches; call once their content is stored"""
+        for result in results:
+            if result.validators:
+                self.validators[result.url] = result.validators
+
+    async def fetch_all(self, feeds: Dict[str, str]) -> List[FeedResult]:
+        """Fetch {name: url} concurrently; results keep the input order"""
+        return await asyncio.gather(*(self.fetch(name, url) for name, url in feeds.items()))
+
+    async def close(self):
+        if self._owns_client:
+            await self.client.aclose()
@@ -5,9 +5,11 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import GitHubProject, ScraperLog
+from .upsert import BatchUpsertSink
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,18 @@ AI_SEARCH_QUERIES = [
     "topic:ai-agents stars:>100",
 ]
 
+# Columns refreshed when a known repository is scraped again
+REPOSITORY_UPDATE_COLUMNS = [
+    "stars",
+    "forks",
+    "watchers",
+    "open_issues",
+    "pushed_at",
+    "topics",
+    "trending_score",
+    "weekly_stars",
+]
+
 
 class GitHubTrendingScraper:
     """Scrapes trending AI/ML projects from GitHub"""
@@ -50,9 +64,16 @@ class GitHubTrendingScraper:
         }
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
+        self.sink = BatchUpsertSink(
+            GitHubProject,
+            key="repo_id",
+            update_columns=REPOSITORY_UPDATE_COLUMNS,
+            previous_columns=["stars"],
+            prepare=self._prepare_repository,
+        )
 
     async def scrape_trending(
-        self, db: Session, queries: List[str] = None, max_results: int = 100
+        self, db: AsyncSession, queries: List[str] = None, max_results: int = 100
     ) -> List[Dict]:
         """
         Scrape trending AI projects from GitHub
@@ -72,7 +93,7 @@ class GitHubTrendingScraper:
         # Log scraper start
         log = ScraperLog(scraper_name="github", status="running")
         db.add(log)
-        db.commit()
+        await db.commit()
 
         try:
             async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
@@ -98,17 +119,14 @@ class GitHubTrendingScraper:
                         continue
 
             # Save repositories to database
-            saved_count = 0
-            for repo_data in all_repos:
-                saved = self._save_repository(db, repo_data)
-                if saved:
-                    saved_count += 1
+            stats = await self.sink.write(db, all_repos)
+            saved_count = stats.inserted
 
             # Update log
             log.completed_at = datetime.utcnow()
             log.status = "success"
             log.items_scraped = saved_count
-            db.commit()
+            await db.commit()
 
             logger.info(f"GitHub scraper completed: {saved_count} repositories saved")
             return all_repos
@@ -117,7 +135,7 @@ class GitHubTrendingScraper:
             log.completed_at = datetime.utcnow()
             log.status = "failed"
             log.error_message = str(e)
-            db.commit()
+            await db.commit()
             logger.error(f"GitHub scraper failed: {e}")
             raise
 
@@ -192,85 +210,45 @@ class GitHubTrendingScraper:
             logger.error(f"Failed to parse repository: {e}")
             return None
 
-    def _save_repository(self, db: Session, repo_data: Dict) -> bool:
-        """Save repository to database"""
-        try:
-            # Check if repository already exists
-            existing = (
-                db.query(GitHubProject)
-                .filter(GitHubProject.repo_id == repo_data["repo_id"])
-                .first()
-            )
-
-            if existing:
-                # Update stats and calculate trending score
-                previous_stars = existing.stars
-                existing.stars = repo_data["stars"]
-                existing.forks = repo_data["forks"]
-                existing.watchers = repo_data["watchers"]
-                existing.open_issues = repo_data["open_issues"]
-                existing.pushed_at = repo_data["pushed_at"]
-                existing.topics = repo_data["topics"]
-                existing.calculate_trending_score(previous_stars)
-                return False
-
-            # Create new repository
-            repo = GitHubProject(
-                repo_id=repo_data["repo_id"],
-                name=repo_data["name"],
-                full_name=repo_data["full_name"],
-                description=repo_data.get("description", ""),
-                url=repo_data["url"],
-                stars=repo_data["stars"],
-                forks=repo_data["forks"],
-                watchers=repo_data["watchers"],
-                open_issues=repo_data["open_issues"],
-                language=repo_data.get("language"),
-                topics=repo_data.get("topics", []),
-                license=repo_data.get("license"),
-                created_at=repo_data.get("created_at"),
-                updated_at=repo_data.get("updated_at"),
-                pushed_at=repo_data.get("pushed_at"),
-            )
-            repo.calculate_trending_score()
-
-            db.add(repo)
-            db.commit()
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to save repository: {e}")
-            db.rollback()
-            return False
+    def _prepare_repository(self, repo_data: Dict, previous: Optional[Dict]) -> Dict:
+        """Final column values for a repository, scored against its previous star count"""
+        repo = GitHubProject(**repo_data)
+        repo.calculate_trending_score(previous["stars"] if previous else 0)
+        return {
+            **repo_data,
+            "trending_score": repo.trending_score,
+            "weekly_stars": repo.weekly_stars,
+        }
 
-    def get_top_projects(
-        self, db: Session, limit: int = 20, min_stars: int = 100
+    async def get_top_projects(
+        self, db: AsyncSession, limit: int = 20, min_stars: int = 100
     ) -> List[GitHubProject]:
         """Get top AI projects by stars"""
-        return (
-            db.query(GitHubProject)
-            .filter(GitHubProject.stars >= min_stars)
+        result = await db.scalars(
+            select(GitHubProject)
+            .where(GitHubProject.stars >= min_stars)
             .order_by(GitHubProject.stars.desc())
             .limit(limit)
-            .all()
         )
+        return result.all()
 
-    def get_trending_projects(self, db: Session, limit: int = 20) -> List[GitHubProject]:
+    async def get_trending_projects(self, db: AsyncSession, limit: int = 20) -> List[GitHubProject]:
         """Get trending AI projects by weekly growth"""
-        return (
-            db.query(GitHubProject).order_by(GitHubProject.trending_score.desc()).limit(limit).all()
+        result = await db.scalars(
+            select(GitHubProject).order_by(GitHubProject.trending_score.desc()).limit(limit)
         )
+        return result.all()
 
-    def get_recently_updated(
-        self, db: Session, limit: int = 20, days: int = 7
+    async def get_recently_updated(
+        self, db: AsyncSession, limit: int = 20, days: int = 7
     ) -> List[GitHubProject]:
         """Get recently updated AI projects"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        return (
-            db.query(GitHubProject)
-            .filter(GitHubProject.pushed_at >= cutoff_date)
+        result = await db.scalars(
+            select(GitHubProject)
+            .where(GitHubProject.pushed_at >= cutoff_date)
             .order_by(GitHubProject.pushed_at.desc())
             .limit(limit)
-            .all()
         )
+        return result.all()
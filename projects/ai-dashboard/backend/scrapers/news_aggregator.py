@@ -1,15 +1,20 @@
 # AI Dashboard - AI News Aggregator
 
+import asyncio
 import os
 import logging
 import hashlib
+import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import httpx
 import feedparser
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import AINews, ScraperLog
+from .feed_fetcher import FeedFetcher, FeedResult
+from .upsert import BatchUpsertSink
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +35,38 @@ RSS_FEEDS = {
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 HN_ALGOLIA_API = "https://hn.algolia.com/api/v1"
 
+# Fetcher limits: feeds in flight overall and per host, and per-host spacing (seconds)
+FEED_CONCURRENCY = 8
+FEED_HOST_CONCURRENCY = 2
+FEED_HOST_INTERVALS = {"hn.algolia.com": 0.5}
+
 
 class NewsAggregator:
     """Aggregates AI news from multiple sources"""
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=FEED_CONCURRENCY),
+            follow_redirects=True,
+        )
+        self.fetcher = FeedFetcher(
+            self.client,
+            max_concurrency=FEED_CONCURRENCY,
+            per_host_concurrency=FEED_HOST_CONCURRENCY,
+            host_intervals=FEED_HOST_INTERVALS,
+        )
+        self.sink = BatchUpsertSink(
+            AINews,
+            key="url_hash",
+            update_columns=["score", "comments_count"],
+            previous_columns=["score", "comments_count"],
+            prepare=self._prepare_article,
+        )
 
     async def aggregate_news(
         self,
-        db: Session,
+        db: AsyncSession,
         include_rss: bool = True,
         include_hackernews: bool = True,
         max_items_per_source: int = 20,
@@ -61,29 +88,38 @@ class NewsAggregator:
         # Log scraper start
         log = ScraperLog(scraper_name="news", status="running")
         db.add(log)
-        db.commit()
+        await db.commit()
 
         try:
+            # RSS feeds and Hacker News are fetched side by side on the shared client
+            fetches = []
             if include_rss:
-                rss_news = await self._fetch_rss_feeds(max_items_per_source)
-                all_news.extend(rss_news)
-
+                fetches.append(self._fetch_rss_feeds(max_items_per_source))
             if include_hackernews:
-                hn_news = await self._fetch_hackernews(max_items_per_source)
-                all_news.extend(hn_news)
+                fetches.append(self._fetch_hackernews(max_items_per_source))
+            stored_results = []
+            for articles, results in await asyncio.gather(*fetches):
+                all_news.extend(articles)
+                stored_results.extend(results)
+
+            # Save to database with deduplication (by URL hash)
+            stats = await self.sink.write(
+                db,
+                (
+                    {**article, "url_hash": hashlib.sha256(article["url"].encode()).hexdigest()}
+                    for article in all_news
+                ),
+            )
+            saved_count = stats.inserted
 
-            # Save to database with deduplication
-            saved_count = 0
-            for article in all_news:
-                saved = self._save_article(db, article)
-                if saved:
-                    saved_count += 1
+            # The articles are saved, so later runs may let these feeds answer 304
+            self.fetcher.remember(stored_results)
 
             # Update log
             log.completed_at = datetime.utcnow()
             log.status = "success"
             log.items_scraped = saved_count
-            db.commit()
+            await db.commit()
 
             logger.info(f"News aggregator completed: {saved_count} articles saved")
             return all_news
@@ -92,56 +128,67 @@ class NewsAggregator:
             log.completed_at = datetime.utcnow()
             log.status = "failed"
             log.error_message = str(e)
-            db.commit()
+            await db.commit()
             logger.error(f"News aggregator failed: {e}")
             raise
 
-    async def _fetch_rss_feeds(self, max_items: int) -> List[Dict]:
-        """Fetch articles from RSS feeds"""
+    async def _fetch_rss_feeds(self, max_items: int) -> Tuple[List[Dict], List[FeedResult]]:
+        """Fetch articles from RSS feeds, with the results of the feeds that parsed"""
         articles = []
+        parsed = []
 
-        for source_name, feed_url in RSS_FEEDS.items():
-            logger.info(f"Fetching RSS: {source_name}")
+        # Unchanged feeds answer 304 and are skipped; failures are logged by the fetcher
+        for result in await self.fetcher.fetch_all(RSS_FEEDS):
+            if not result.ok:
+                continue
 
             try:
-                response = await self.client.get(feed_url)
-                response.raise_for_status()
-
-                feed = feedparser.parse(response.text)
+                feed = feedparser.parse(result.text)
 
                 for entry in feed.entries[:max_items]:
-                    article = self._parse_rss_entry(entry, source_name)
+                    article = self._parse_rss_entry(entry, result.name)
                     if article:
                         articles.append(article)
+                parsed.append(result)
 
             except Exception as e:
-                logger.error(f"Failed to fetch {source_name}: {e}")
+                logger.error(f"Failed to parse {result.name}: {e}")
                 continue
 
-        return articles
+        return articles, parsed
 
-    async def _fetch_hackernews(self, max_items: int) -> List[Dict]:
+    async def _fetch_hackernews(self, max_items: int) -> Tuple[List[Dict], List[FeedResult]]:
         """Fetch AI-related stories from Hacker News using Algolia API"""
         articles = []
 
         # Search queries for AI content
         ai_queries = ["AI", "GPT", "LLM", "machine learning", "Claude", "OpenAI", "Anthropic"]
 
-        for query in ai_queries[:3]:  # Limit queries to avoid rate limiting
-            logger.info(f"Fetching Hacker News: {query}")
+        # Limit queries to avoid rate limiting; FEED_HOST_INTERVALS spaces them out
+        since = int((datetime.utcnow() - timedelta(days=7)).timestamp())
+        results = await asyncio.gather(
+            *(
+                self.fetcher.fetch(
+                    f"Hacker News: {query}",
+                    f"{HN_ALGOLIA_API}/search",
+                    params={
+                        "query": query,
+                        "tags": "story",
+                        "numericFilters": f"created_at_i>{since}",
+                        "hitsPerPage": max_items,
+                    },
+                    conditional=False,
+                )
+                for query in ai_queries[:3]
+            )
+        )
+
+        for result in results:
+            if not result.ok:
+                continue
 
             try:
-                url = f"{HN_ALGOLIA_API}/search"
-                params = {
-                    "query": query,
-                    "tags": "story",
-                    "numericFilters": f"created_at_i>{int((datetime.utcnow() - timedelta(days=7)).timestamp())}",
-                    "hitsPerPage": max_items,
-                }
-
-                response = await self.client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+                data = json.loads(result.text)
 
                 for hit in data.get("hits", []):
                     article = self._parse_hn_story(hit)
@@ -149,10 +196,10 @@ class NewsAggregator:
                         articles.append(article)
 
             except Exception as e:
-                logger.error(f"Failed to fetch HN for '{query}': {e}")
+                logger.error(f"Failed to parse {result.name}: {e}")
                 continue
 
-        return articles
+        return articles, results
 
     def _parse_rss_entry(self, entry: Dict, source: str) -> Optional[Dict]:
         """Parse RSS feed entry into article format"""
@@ -230,71 +277,53 @@ class NewsAggregator:
             logger.error(f"Failed to parse HN story: {e}")
             return None
 
-    def _save_article(self, db: Session, article_data: Dict) -> bool:
-        """Save article to database with deduplication"""
-        try:
-            # Generate URL hash for deduplication
-            url_hash = hashlib.sha256(article_data["url"].encode()).hexdigest()
-
-            # Check if article already exists
-            existing = db.query(AINews).filter(AINews.url_hash == url_hash).first()
-
-            if existing:
-                # Update score if applicable
-                if article_data.get("score"):
-                    existing.score = article_data["score"]
-                if article_data.get("comments_count"):
-                    existing.comments_count = article_data["comments_count"]
-                return False
-
-            # Create new article
-            article = AINews(
-                url=article_data["url"],
-                url_hash=url_hash,
-                title=article_data["title"],
-                summary=article_data.get("summary", ""),
-                source=article_data["source"],
-                author=article_data.get("author", ""),
-                published_at=article_data.get("published_at", datetime.utcnow()),
-                score=article_data.get("score", 0),
-                comments_count=article_data.get("comments_count", 0),
-                category=article_data.get("category", "AI"),
-                thumbnail_url=article_data.get("thumbnail_url"),
-            )
-
-            db.add(article)
-            db.commit()
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to save article: {e}")
-            db.rollback()
-            return False
-
-    def get_latest_news(
-        self, db: Session, limit: int = 50, source: Optional[str] = None, days: int = 7
+    def _prepare_article(self, article_data: Dict, previous: Optional[Dict]) -> Dict:
+        """Final column values for an article; scores only move when the source reports one"""
+        row = {
+            "url": article_data["url"],
+            "url_hash": article_data["url_hash"],
+            "title": article_data["title"],
+            "summary": article_data.get("summary", ""),
+            "source": article_data["source"],
+            "author": article_data.get("author", ""),
+            "published_at": article_data.get("published_at", datetime.utcnow()),
+            "score": article_data.get("score", 0),
+            "comments_count": article_data.get("comments_count", 0),
+            "category": article_data.get("category", "AI"),
+            "thumbnail_url": article_data.get("thumbnail_url"),
+        }
+        if previous:
+            row["score"] = row["score"] or previous["score"]
+            row["comments_count"] = row["comments_count"] or previous["comments_count"]
+        return row
+
+    async def get_latest_news(
+        self, db: AsyncSession, limit: int = 50, source: Optional[str] = None, days: int = 7
     ) -> List[AINews]:
         """Get latest AI news from database"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        query = db.query(AINews).filter(AINews.scraped_at >= cutoff_date)
+        query = select(AINews).where(AINews.scraped_at >= cutoff_date)
 
         if source:
-            query = query.filter(AINews.source == source)
+            query = query.where(AINews.source == source)
 
-        return query.order_by(AINews.published_at.desc()).limit(limit).all()
+        result = await db.scalars(query.order_by(AINews.published_at.desc()).limit(limit))
+        return result.all()
 
-    def get_trending_news(self, db: Session, limit: int = 20, days: int = 3) -> List[AINews]:
+    async def get_trending_news(
+        self, db: AsyncSession, limit: int = 20, days: int = 3
+    ) -> List[AINews]:
         """Get trending AI news (by score/comments)"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        return (
-            db.query(AINews)
-            .filter(AINews.scraped_at >= cutoff_date)
+        result = await db.scalars(
+            select(AINews)
+            .where(AINews.scraped_at >= cutoff_date)
             .order_by((AINews.score + AINews.comments_count).desc())
             .limit(limit)
-            .all()
         )
+        return result.all()
 
     async def close(self):
         """Close HTTP client"""
@@ -0,0 +1,142 @@
+# AI Dashboard - Batched Upsert Sink
+
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# SQLite allows 32766 bound parameters per statement (3.32+)
+MAX_SQL_PARAMS = 32000
+
+# prepare(row, previous) -> final column values, or None to skip the row.
+# previous holds the stored previous_columns for an existing key, else None.
+PrepareFn = Callable[[Dict, Optional[Dict]], Optional[Dict]]
+
+
+@dataclass
+class UpsertStats:
+    """Row counts for one upsert batch (or the sum of several)"""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    batches: List["UpsertStats"] = field(default_factory=list, repr=False)
+
+    def add(self, batch: "UpsertStats"):
+        self.inserted += batch.inserted
+        self.updated += batch.updated
+        self.skipped += batch.skipped
+        self.batches.append(batch)
+
+
+class BatchUpsertSink:
+    """
+    Persists scraped rows in batches with INSERT ... ON CONFLICT DO UPDATE
+
+    Each batch is deduplicated in memory (last row per key wins) and costs
+    one SELECT for the previous values of keys already stored, one
+    multi-row upsert and one commit. Existing rows are only rewritten when
+    one of update_columns actually changes; unchanged rows, in-batch
+    duplicates and rows rejected by prepare are counted as skipped.
+    """
+
+    def __init__(
+        self,
+        model,
+        key: str,
+        update_columns: Sequence[str],
+        previous_columns: Sequence[str] = (),
+        prepare: Optional[PrepareFn] = None,
+        batch_size: int = 500,
+    ):
+        self.table = model.__table__
+        self.key = key
+        self.update_columns = list(update_columns)
+        self.previous_columns = list(previous_columns)
+        self.prepare = prepare
+        self.batch_size = max(1, min(batch_size, MAX_SQL_PARAMS // len(self.table.columns)))
+
+    async def write(self, db: AsyncSession, rows: Iterable[Dict]) -> UpsertStats:
+        """Upsert rows batch by batch, committing after each batch"""
+        total = UpsertStats()
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                total.add(await self.write_batch(db, batch))
+                batch = []
+        if batch:
+            total.add(await self.write_batch(db, batch))
+        return total
+
+    async def write_batch(self, db: AsyncSession, rows: List[Dict]) -> UpsertStats:
+        """Upsert one batch in a single transaction"""
+        stats = UpsertStats()
+        unique: Dict = {}
+        for row in rows:
+            if row.get(self.key) is None:
+                stats.skipped += 1
+                continue
+            unique[row[self.key]] = row
+        stats.skipped += len(rows) - stats.skipped - len(unique)
+        if not unique:
+            return stats
+
+        key_column = self.table.c[self.key]
+        columns = [self.table.c[name] for name in self.previous_columns]
+        result = await db.execute(select(key_column, *columns).where(key_column.in_(unique)))
+        previous = {r[0]: dict(zip(self.previous_columns, r[1:])) for r in result}
+
+        # Group by column set: one executemany needs the same columns in every row
+        groups: Dict[frozenset, List[Dict]] = {}
+        for key, row in unique.items():
+            if self.prepare:
+                try:
+                    row = self.prepare(row, previous.get(key))
+                except Exception as e:
+                    logger.error(f"Failed to prepare {self.table.name} row {key!r}: {e}")
+                    row = None
+                if row is None:
+                    stats.skipped += 1
+                    continue
+            groups.setdefault(frozenset(row), []).append(row)
+
+        try:
+            written = []
+            for group in groups.values():
+                # executemany of one cached statement; SQLAlchemy packs the
+                # parameter sets into multi-row VALUES ("insertmanyvalues")
+                stmt = insert(self.table)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[self.key],
+                    set_={name: stmt.excluded[name] for name in self.update_columns},
+                    where=or_(
+                        *(
+                            self.table.c[name].is_distinct_from(stmt.excluded[name])
+                            for name in self.update_columns
+                        )
+                    ),
+                ).returning(key_column)
+                written.extend((await db.execute(stmt, group)).scalars())
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        for key in written:
+            if key in previous:
+                stats.updated += 1
+            else:
+                stats.inserted += 1
+        stats.skipped += sum(len(group) for group in groups.values()) - len(written)
+
+        logger.info(
+            f"Upserted {self.table.name}: {stats.inserted} inserted, "
+            f"{stats.updated} updated, {stats.skipped} skipped"
+        )
+        return stats
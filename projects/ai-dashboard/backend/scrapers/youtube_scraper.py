@@ -7,9 +7,11 @@ from typing import List, Dict, Optional
 import httpx
 from apify_client import ApifyClient
 from apify_client.clients.resource_clients import ActorClient
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import YouTubeVideo, ScraperLog
+from .upsert import BatchUpsertSink
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +50,17 @@ class YouTubeScraper:
         # Fallback: YouTube Data API
         self.youtube_api_key = os.getenv("YOUTUBE_API_KEY")
 
+        self.sink = BatchUpsertSink(
+            YouTubeVideo,
+            key="video_id",
+            update_columns=["view_count", "like_count", "comment_count", "quality_score"],
+            previous_columns=["channel_subscribers"],
+            prepare=self._prepare_video,
+        )
+
     async def scrape_videos(
         self,
-        db: Session,
+        db: AsyncSession,
         queries: List[str] = None,
         max_results_per_query: int = 20,
         published_after_days: int = 7,
@@ -73,7 +83,7 @@ class YouTubeScraper:
         # Log scraper start
         log = ScraperLog(scraper_name="youtube", status="running")
         db.add(log)
-        db.commit()
+        await db.commit()
 
         try:
             if self.client:
@@ -90,17 +100,14 @@ class YouTubeScraper:
                 raise ValueError("No API keys configured for YouTube scraping")
 
             # Save videos to database
-            saved_count = 0
-            for video_data in all_videos:
-                saved = self._save_video(db, video_data)
-                if saved:
-                    saved_count += 1
+            stats = await self.sink.write(db, all_videos)
+            saved_count = stats.inserted
 
             # Update log
             log.completed_at = datetime.utcnow()
             log.status = "success"
             log.items_scraped = saved_count
-            db.commit()
+            await db.commit()
 
             logger.info(f"YouTube scraper completed: {saved_count} videos saved")
             return all_videos
@@ -109,7 +116,7 @@ class YouTubeScraper:
             log.completed_at = datetime.utcnow()
             log.status = "failed"
             log.error_message = str(e)
-            db.commit()
+            await db.commit()
             logger.error(f"YouTube scraper failed: {e}")
             raise
 
@@ -265,69 +272,47 @@ class YouTubeScraper:
             logger.error(f"Failed to parse YouTube API video: {e}")
             return None
 
-    def _save_video(self, db: Session, video_data: Dict) -> bool:
-        """Save video to database, skip if already exists"""
-        try:
-            # Check if video already exists
-            existing = (
-                db.query(YouTubeVideo)
-                .filter(YouTubeVideo.video_id == video_data["video_id"])
-                .first()
-            )
-
-            if existing:
-                # Update stats
-                existing.view_count = video_data["view_count"]
-                existing.like_count = video_data["like_count"]
-                existing.comment_count = video_data["comment_count"]
-                existing.calculate_quality_score()
-                return False
-
-            # Parse published date
-            published_at = video_data.get("published_at")
-            if isinstance(published_at, str):
-                try:
-                    published_at = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                except:
-                    published_at = datetime.utcnow()
-
-            # Create new video
-            video = YouTubeVideo(
-                video_id=video_data["video_id"],
-                title=video_data["title"],
-                description=video_data.get("description", ""),
-                channel_name=video_data.get("channel_name"),
-                channel_id=video_data.get("channel_id"),
-                channel_subscribers=video_data.get("channel_subscribers", 0),
-                view_count=video_data.get("view_count", 0),
-                like_count=video_data.get("like_count", 0),
-                comment_count=video_data.get("comment_count", 0),
-                duration=video_data.get("duration"),
-                thumbnail_url=video_data.get("thumbnail_url"),
-                published_at=published_at,
-                search_query=video_data.get("search_query"),
-            )
-            video.calculate_quality_score()
-
-            db.add(video)
-            db.commit()
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to save video: {e}")
-            db.rollback()
-            return False
-
-    def get_top_videos(
-        self, db: Session, limit: int = 20, min_views: int = 1000, days: int = 7
+    def _prepare_video(self, video_data: Dict, previous: Optional[Dict]) -> Dict:
+        """Final column values for a video, scored with the stored subscriber count if known"""
+        # Parse published date
+        published_at = video_data.get("published_at")
+        if isinstance(published_at, str):
+            try:
+                published_at = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+            except:
+                published_at = datetime.utcnow()
+
+        row = {
+            "video_id": video_data["video_id"],
+            "title": video_data["title"],
+            "description": video_data.get("description", ""),
+            "channel_name": video_data.get("channel_name"),
+            "channel_id": video_data.get("channel_id"),
+            "channel_subscribers": video_data.get("channel_subscribers", 0),
+            "view_count": video_data.get("view_count", 0),
+            "like_count": video_data.get("like_count", 0),
+            "comment_count": video_data.get("comment_count", 0),
+            "duration": video_data.get("duration"),
+            "thumbnail_url": video_data.get("thumbnail_url"),
+            "published_at": published_at,
+            "search_query": video_data.get("search_query"),
+        }
+        video = YouTubeVideo(**row)
+        if previous:
+            video.channel_subscribers = previous["channel_subscribers"]
+        row["quality_score"] = video.calculate_quality_score()
+        return row
+
+    async def get_top_videos(
+        self, db: AsyncSession, limit: int = 20, min_views: int = 1000, days: int = 7
     ) -> List[YouTubeVideo]:
         """Get top rated AI videos from database"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        return (
-            db.query(YouTubeVideo)
-            .filter(YouTubeVideo.view_count >= min_views, YouTubeVideo.scraped_at >= cutoff_date)
+        result = await db.scalars(
+            select(YouTubeVideo)
+            .where(YouTubeVideo.view_count >= min_views, YouTubeVideo.scraped_at >= cutoff_date)
             .order_by(YouTubeVideo.quality_score.desc())
             .limit(limit)
-            .all()
         )
+        return result.all()
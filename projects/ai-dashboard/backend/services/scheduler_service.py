@@ -4,9 +4,8 @@ import logging
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy.orm import Session
 
-from database import get_db_session
+from database import get_async_db_session
 from scrapers import YouTubeScraper, NewsAggregator, GitHubTrendingScraper
 
 logger = logging.getLogger(__name__)
@@ -74,7 +73,7 @@ class SchedulerService:
         """Run YouTube scraper job"""
         logger.info("Starting YouTube scraper job...")
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 await self.youtube_scraper.scrape_videos(db)
             logger.info("YouTube scraper job completed")
         except Exception as e:
@@ -84,7 +83,7 @@ class SchedulerService:
         """Run news aggregator job"""
         logger.info("Starting news aggregator job...")
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 await self.news_aggregator.aggregate_news(db)
             logger.info("News aggregator job completed")
         except Exception as e:
@@ -94,7 +93,7 @@ class SchedulerService:
         """Run GitHub scraper job"""
         logger.info("Starting GitHub scraper job...")
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 await self.github_scraper.scrape_trending(db)
             logger.info("GitHub scraper job completed")
         except Exception as e:
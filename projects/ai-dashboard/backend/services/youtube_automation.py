@@ -9,7 +9,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import YouTubeAutomation
 from .prompt_optimizer import PromptOptimizer
@@ -155,7 +156,7 @@ class YouTubeAutomationService:
 
     async def create_video_draft(
         self,
-        db: Session,
+        db: AsyncSession,
         user_prompt: str,
         target_audience: str = "tech enthusiasts",
         video_length: str = "5-10",
@@ -193,15 +194,15 @@ class YouTubeAutomationService:
         )
 
         db.add(automation)
-        db.commit()
-        db.refresh(automation)
+        await db.commit()
+        await db.refresh(automation)
 
         logger.info(f"Created video draft: {automation.id}")
         return automation
 
     async def generate_heygen_video(
         self,
-        db: Session,
+        db: AsyncSession,
         automation_id: int,
         avatar_id: str = "Kristin_public_3_20240108",
         voice_id: str = None,
@@ -222,9 +223,7 @@ class YouTubeAutomationService:
         if voice_id is None:
             voice_id = os.getenv("HEYGEN_DEFAULT_VOICE_ID", "1bd001e7e50f421d891986aad5158bc8")
         
-        automation = (
-            db.query(YouTubeAutomation).filter(YouTubeAutomation.id == automation_id).first()
-        )
+        automation = await db.get(YouTubeAutomation, automation_id)
 
         if not automation:
             raise ValueError(f"Automation {automation_id} not found")
@@ -233,7 +232,7 @@ class YouTubeAutomationService:
             logger.warning("HeyGen API key not configured")
             automation.status = "pending_review"
             automation.heygen_video_url = "https://example.com/placeholder-video.mp4"
-            db.commit()
+            await db.commit()
             return automation
 
         try:
@@ -265,7 +264,7 @@ class YouTubeAutomationService:
 
             automation.heygen_video_id = data.get("data", {}).get("video_id")
             automation.status = "generating"
-            db.commit()
+            await db.commit()
 
             logger.info(f"HeyGen video generation started: {automation.heygen_video_id}")
             return automation
@@ -281,7 +280,7 @@ class YouTubeAutomationService:
             automation.status = "failed"
             automation.user_edits = automation.user_edits or {}
             automation.user_edits["heygen_error"] = error_detail
-            db.commit()
+            await db.commit()
             raise ValueError(error_detail)
         except Exception as e:
             error_detail = f"HeyGen video generation failed: {type(e).__name__}: {str(e)}"
@@ -289,14 +288,12 @@ class YouTubeAutomationService:
             automation.status = "failed"
             automation.user_edits = automation.user_edits or {}
             automation.user_edits["heygen_error"] = error_detail
-            db.commit()
+            await db.commit()
             raise
 
-    async def check_heygen_status(self, db: Session, automation_id: int) -> Dict:
+    async def check_heygen_status(self, db: AsyncSession, automation_id: int) -> Dict:
         """Check HeyGen video generation status"""
-        automation = (
-            db.query(YouTubeAutomation).filter(YouTubeAutomation.id == automation_id).first()
-        )
+        automation = await db.get(YouTubeAutomation, automation_id)
 
         if not automation or not automation.heygen_video_id:
             return {"status": "not_found"}
@@ -318,7 +315,7 @@ class YouTubeAutomationService:
             if status == "completed":
                 automation.heygen_video_url = data.get("data", {}).get("video_url")
                 automation.status = "pending_review"
-                db.commit()
+                await db.commit()
 
             return {"status": status, "video_url": automation.heygen_video_url}
 
@@ -327,7 +324,7 @@ class YouTubeAutomationService:
             return {"status": "error", "error": str(e)}
 
     async def update_draft(
-        self, db: Session, automation_id: int, updates: Dict
+        self, db: AsyncSession, automation_id: int, updates: Dict
     ) -> YouTubeAutomation:
         """
         Update video draft with user edits
@@ -340,9 +337,7 @@ class YouTubeAutomationService:
         Returns:
             Updated YouTubeAutomation record
         """
-        automation = (
-            db.query(YouTubeAutomation).filter(YouTubeAutomation.id == automation_id).first()
-        )
+        automation = await db.get(YouTubeAutomation, automation_id)
 
         if not automation:
             raise ValueError(f"Automation {automation_id} not found")
@@ -367,13 +362,13 @@ class YouTubeAutomationService:
             elif field == "thumbnail_url":
                 automation.thumbnail_url = value
 
-        db.commit()
-        db.refresh(automation)
+        await db.commit()
+        await db.refresh(automation)
 
         logger.info(f"Updated video draft: {automation.id}")
         return automation
 
-    async def approve_and_upload(self, db: Session, automation_id: int) -> YouTubeAutomation:
+    async def approve_and_upload(self, db: AsyncSession, automation_id: int) -> YouTubeAutomation:
         """
         Approve draft and upload to YouTube
 
@@ -384,9 +379,7 @@ class YouTubeAutomationService:
         Returns:
             Updated YouTubeAutomation record with YouTube URL
         """
-        automation = (
-            db.query(YouTubeAutomation).filter(YouTubeAutomation.id == automation_id).first()
-        )
+        automation = await db.get(YouTubeAutomation, automation_id)
 
         if not automation:
             raise ValueError(f"Automation {automation_id} not found")
@@ -406,12 +399,12 @@ class YouTubeAutomationService:
                 )
                 automation.uploaded_at = datetime.utcnow()
                 automation.status = "uploaded"
-                db.commit()
+                await db.commit()
                 return automation
 
             logger.warning("YouTube OAuth credentials not configured - marking ready for upload")
             automation.status = "ready_for_upload"
-            db.commit()
+            await db.commit()
             return automation
 
         if not automation.heygen_video_url:
@@ -442,7 +435,7 @@ class YouTubeAutomationService:
             automation.youtube_url = f"https://youtube.com/watch?v={video_id}"
             automation.uploaded_at = datetime.utcnow()
             automation.status = "uploaded"
-            db.commit()
+            await db.commit()
             return automation
         except Exception as e:
             error_detail = f"YouTube upload failed: {type(e).__name__}: {str(e)}"
@@ -450,7 +443,7 @@ class YouTubeAutomationService:
             automation.status = "failed"
             automation.user_edits = automation.user_edits or {}
             automation.user_edits["youtube_error"] = error_detail
-            db.commit()
+            await db.commit()
             raise
         finally:
             for path in (video_path, thumbnail_path):
@@ -460,18 +453,25 @@ class YouTubeAutomationService:
                     except Exception:
                         logger.warning("Failed to delete temp file: %s", path)
 
-    def get_draft(self, db: Session, automation_id: int) -> Optional[YouTubeAutomation]:
+    async def get_draft(
+        self, db: AsyncSession, automation_id: int
+    ) -> Optional[YouTubeAutomation]:
         """Get a video draft by ID"""
-        return db.query(YouTubeAutomation).filter(YouTubeAutomation.id == automation_id).first()
+        return await db.get(YouTubeAutomation, automation_id)
 
-    def get_all_drafts(self, db: Session, status: Optional[str] = None, limit: int = 50) -> list:
+    async def get_all_drafts(
+        self, db: AsyncSession, status: Optional[str] = None, limit: int = 50
+    ) -> list:
         """Get all video drafts, optionally filtered by status"""
-        query = db.query(YouTubeAutomation)
+        query = select(YouTubeAutomation)
 
         if status:
-            query = query.filter(YouTubeAutomation.status == status)
+            query = query.where(YouTubeAutomation.status == status)
 
-        return query.order_by(YouTubeAutomation.created_at.desc()).limit(limit).all()
+        result = await db.scalars(
+            query.order_by(YouTubeAutomation.created_at.desc()).limit(limit)
+        )
+        return result.all()
 
     async def close(self):
         """Close HTTP client"""
@@ -0,0 +1,177 @@
+"""
+AI Dashboard Load Tests — async data layer under concurrent clients
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "dashboard.db"))
+
+import httpx
+from database import get_async_db
+from database.db import _configure_sqlite
+from database.models import AINews, Base, GitHubProject, ScraperLog, YouTubeVideo
+from main import app
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 8
+ENDPOINTS = ["/api/stats", "/api/news?limit=50", "/api/projects?limit=20", "/api/videos?limit=20"]
+
+SLOW_QUERY_SECONDS = 2.0
+# Stands in for a slow, I/O-bound query (say a cold cache on a large table)
+SLOW_QUERY = text(f"SELECT sleep({SLOW_QUERY_SECONDS})")
+
+
+def add_sleep_function(dbapi_connection, connection_record):
+    dbapi_connection.run_async(lambda conn: conn.create_function("sleep", 1, time.sleep))
+
+
+async def seed(engine, session_factory):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    now = datetime.utcnow()
+    async with session_factory() as db:
+        db.add_all(
+            AINews(url=f"https://news.test/{i}", url_hash=f"{i:064x}", title=f"Story {i}",
+                   source="Test", score=i % 97, published_at=now)
+            for i in range(2000)
+        )
+        db.add_all(
+            GitHubProject(repo_id=i, name=f"repo{i}", full_name=f"test/repo{i}",
+                          url=f"https://github.test/{i}", stars=100 + i, trending_score=i / 10)
+            for i in range(500)
+        )
+        db.add_all(
+            YouTubeVideo(video_id=f"v{i}", title=f"Video {i}", view_count=1000 + i,
+                         quality_score=i / 100)
+            for i in range(500)
+        )
+        db.add_all(ScraperLog(scraper_name="news", status="success") for _ in range(20))
+        await db.commit()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A seeded database in tmp_path, served to the app in place of DATABASE_PATH's"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dashboard.db'}")
+    event.listen(engine.sync_engine, "connect", _configure_sqlite)
+    event.listen(engine.sync_engine, "connect", add_sleep_function)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_test_db():
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, get_test_db)
+    run(engine, seed(engine, session_factory))
+    return engine, session_factory
+
+
+def run(engine, coro):
+    """Run coro on a fresh event loop; pooled connections are bound to the loop that opened them"""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_clients(session_factory, clients, slow_query=False):
+    """Fire `clients` concurrent clients at the API; return latencies and the longest loop stall"""
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    async def client(n):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            for i in range(REQUESTS_PER_CLIENT):
+                start = time.perf_counter()
+                r = await http.get(ENDPOINTS[(n + i) % len(ENDPOINTS)])
+                latencies.append(time.perf_counter() - start)
+                assert r.status_code == 200
+
+    async def slow():
+        async with session_factory() as db:
+            await db.execute(SLOW_QUERY)
+
+    beat = asyncio.create_task(heartbeat())
+    slow_task = asyncio.create_task(slow()) if slow_query else None
+    started = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(clients)))
+    elapsed = time.perf_counter() - started
+    if slow_task:
+        await slow_task
+    done.set()
+    await beat
+    return latencies, stall, elapsed
+
+
+def test_stats_is_one_aggregate_query(db):
+    engine, _ = db
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        r = run(engine, _get("/api/stats"))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    data = r.json()
+    assert (data["news"], data["projects"], data["videos"], data["automations"]) == (2000, 500, 500, 0)
+    assert len(data["recent_scrapes"]) == 10
+    assert len(statements) == 2  # counts + recent scraper logs
+
+
+async def _get(path):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        return await http.get(path)
+
+
+async def load_scenario(session_factory):
+    await run_clients(session_factory, 4)  # warm up connections and statement caches
+    quiet, _, _ = await run_clients(session_factory, CLIENTS)
+    loaded, stall, elapsed = await run_clients(session_factory, CLIENTS, slow_query=True)
+    return quiet, loaded, stall, elapsed
+
+
+@pytest.mark.slow
+def test_p99_flat_under_concurrency_with_slow_query(db):
+    engine, session_factory = db
+    quiet, latencies, stall, elapsed = run(engine, load_scenario(session_factory))
+
+    p99_quiet, p99 = percentile(quiet, 99), percentile(latencies, 99)
+    assert len(latencies) == CLIENTS * REQUESTS_PER_CLIENT
+    # Queries run off the event loop: the slow query never holds it...
+    assert stall < SLOW_QUERY_SECONDS / 4
+    # ...so dashboard requests finish while it is still running, and p99 stays flat
+    assert elapsed < SLOW_QUERY_SECONDS
+    assert p99 < p99_quiet * 1.5 + 0.05
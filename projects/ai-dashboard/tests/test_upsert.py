@@ -0,0 +1,175 @@
+"""
+AI Dashboard Scraper Persistence Tests — batched upsert sink
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "dashboard.db"))
+
+from database.db import _configure_sqlite
+from database.models import AINews, Base, GitHubProject
+from scrapers import GitHubTrendingScraper, NewsAggregator
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+ITEMS = 1000
+
+
+def run_in_db(path, scenario):
+    """Run scenario(session) against a fresh SQLite database at path"""
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        event.listen(engine.sync_engine, "connect", _configure_sqlite)  # same pragmas as the app
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            async with session_factory() as db:
+                return await scenario(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def repos():
+    """1,000 parsed repositories as _parse_repository would return them"""
+    pushed = datetime(2025, 1, 1)
+    return [
+        {
+            "repo_id": 10_000 + i,
+            "name": f"repo{i}",
+            "full_name": f"owner{i % 50}/repo{i}",
+            "description": f"Synthetic AI project {i}",
+            "url": f"https://github.com/owner{i % 50}/repo{i}",
+            "stars": 100 + i * 7,
+            "forks": i % 300,
+            "watchers": 100 + i * 7,
+            "open_issues": i % 40,
+            "language": "Python",
+            "topics": ["llm", "agents"] if i % 2 else ["machine-learning"],
+            "license": "MIT License",
+            "created_at": pushed - timedelta(days=400),
+            "updated_at": pushed,
+            "pushed_at": pushed - timedelta(hours=i),
+        }
+        for i in range(ITEMS)
+    ]
+
+
+async def save_row_by_row(db, items):
+    """The previous persistence path: one lookup and one commit per repository"""
+    saved = 0
+    for repo_data in items:
+        existing = await db.scalar(
+            select(GitHubProject).where(GitHubProject.repo_id == repo_data["repo_id"])
+        )
+        if existing:
+            previous_stars = existing.stars
+            for field in ("stars", "forks", "watchers", "open_issues", "pushed_at", "topics"):
+                setattr(existing, field, repo_data[field])
+            existing.calculate_trending_score(previous_stars)
+            continue
+        repo = GitHubProject(**repo_data)
+        repo.calculate_trending_score()
+        db.add(repo)
+        await db.commit()
+        saved += 1
+    return saved
+
+
+def test_counts_inserted_updated_skipped(tmp_path, repos):
+    scraper = GitHubTrendingScraper()
+    first = repos[:600]
+    bumped = [dict(r, stars=r["stars"] + 50) for r in repos[500:600]]
+    second = bumped + repos[550:700] + [repos[650], {"name": "no key"}]
+
+    async def scenario(db):
+        stats_one = await scraper.sink.write(db, first)
+        stats_two = await scraper.sink.write(db, second)
+        stored = await db.scalar(select(GitHubProject).where(GitHubProject.repo_id == 10_500))
+        total = await db.scalar(select(func.count()).select_from(GitHubProject))
+        return stats_one, stats_two, stored, total
+
+    stats_one, stats_two, stored, total = run_in_db(tmp_path / "db.sqlite", scenario)
+
+    assert (stats_one.inserted, stats_one.updated, stats_one.skipped) == (600, 0, 0)
+    assert [b.inserted for b in stats_one.batches] == [500, 100]
+    # 500-599 are rescored (550-599 appear twice, the later plain copy wins), 600-699 are new;
+    # skipped: those 50 in-batch duplicates, the repeated 650 and the row without a key
+    assert (stats_two.inserted, stats_two.updated, stats_two.skipped) == (100, 100, 52)
+    assert total == 700
+    assert stored.stars == repos[500]["stars"] + 50
+    assert stored.weekly_stars == 50
+    assert stored.scraped_at is not None
+
+
+def test_news_scores_only_move_when_reported(tmp_path):
+    aggregator = NewsAggregator()
+    article = {"url": "https://news.test/a", "url_hash": "a" * 64, "title": "A", "source": "HN",
+               "score": 10, "comments_count": 3}
+
+    async def scenario(db):
+        await aggregator.sink.write(db, [article])
+        update = dict(article, score=0, comments_count=7)
+        stats = await aggregator.sink.write(db, [update])
+        repeat = await aggregator.sink.write(db, [update])
+        return stats, repeat, await db.scalar(select(AINews))
+
+    stats, repeat, stored = run_in_db(tmp_path / "db.sqlite", scenario)
+    asyncio.run(aggregator.close())
+    assert (stats.inserted, stats.updated, stats.skipped) == (0, 1, 0)
+    assert (repeat.inserted, repeat.updated, repeat.skipped) == (0, 0, 1)
+    assert (stored.score, stored.comments_count) == (10, 7)
+
+
+def test_bulk_upsert_round_trips_per_batch(tmp_path, repos):
+    sink = GitHubTrendingScraper().sink
+
+    async def scenario(db):
+        statements, commits = [], []
+        engine = db.bind.sync_engine
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: statements.append(sql.split()[0].upper()))
+        event.listen(engine, "commit", lambda conn: commits.append(True))
+        stats = await sink.write(db, repos)
+        return stats, statements, commits
+
+    stats, statements, commits = run_in_db(tmp_path / "db.sqlite", scenario)
+
+    batches = len(stats.batches)
+    assert stats.inserted == ITEMS and batches == -(-ITEMS // sink.batch_size)
+    # One SELECT of stored keys and one multi-row upsert per batch, then one commit
+    assert statements == ["SELECT", "INSERT"] * batches
+    assert len(commits) == batches
+
+
+@pytest.mark.slow
+def test_bulk_upsert_10x_faster_than_row_by_row(tmp_path, repos):
+    sink = GitHubTrendingScraper().sink
+
+    async def timed(db, save):
+        start = time.perf_counter()
+        result = await save(db)
+        return time.perf_counter() - start, result
+
+    row_seconds, saved = run_in_db(
+        tmp_path / "rows.sqlite", lambda db: timed(db, lambda db: save_row_by_row(db, repos))
+    )
+    bulk_seconds, stats = run_in_db(
+        tmp_path / "bulk.sqlite", lambda db: timed(db, lambda db: sink.write(db, repos))
+    )
+
+    print(f"\n{ITEMS} repositories: row-by-row {row_seconds:.2f}s, "
+          f"batched upsert {bulk_seconds:.3f}s ({row_seconds / bulk_seconds:.0f}x)")
+    assert saved == stats.inserted == ITEMS
+    assert row_seconds / bulk_seconds >= 10
@@ -21,5 +21,8 @@ def get_db():
 
 
 def init_db():
-    """Create all tables."""
+    """Create all tables, and any indexes added since the tables were created."""
     Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -2,7 +2,7 @@
 API Hub Database Models
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, Index
 from .db import Base
 
 
@@ -11,7 +11,7 @@ class APIKey(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)  # Friendly name
-    provider = Column(String(50), nullable=False)  # openrouter, deepseek, gemini, openai
+    provider = Column(String(50), nullable=False, index=True)  # openrouter, deepseek, gemini, openai
     key_value = Column(Text, nullable=False)  # Encrypted/stored key
     key_preview = Column(String(20), nullable=False)  # Last 6 chars for display
     base_url = Column(String(255), nullable=True)  # Provider base URL
@@ -34,4 +34,24 @@ class UsageLog(Base):
     cost = Column(Float, default=0.0)
     status_code = Column(Integer, nullable=True)
     response_time_ms = Column(Integer, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        Index("ix_usage_logs_key_created", "api_key_id", "created_at"),
+    )
+
+
+class UsageHourly(Base):
+    """Per-key, per-hour usage counters, maintained by the usage buffer"""
+    __tablename__ = "usage_hourly"
+
+    api_key_id = Column(Integer, primary_key=True)
+    hour = Column(DateTime, primary_key=True)  # Start of the hour (UTC)
+    requests = Column(Integer, default=0)
+    tokens = Column(Integer, default=0)
+    cost = Column(Float, default=0.0)
+    errors = Column(Integer, default=0)  # Responses with status >= 400
+
+    __table_args__ = (
+        Index("ix_usage_hourly_hour", "hour"),
+    )
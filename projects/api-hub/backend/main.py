@@ -2,16 +2,19 @@
 API Hub — Centralized API Key Manager
 FastAPI application entry point.
 """
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func
 
-from database.db import get_db, init_db
-from database.models import APIKey, UsageLog
-from schemas import APIKeyCreate, APIKeyResponse, APIKeyUsage, DashboardResponse, UsageLogResponse
+from database.db import SessionLocal, engine, get_db, init_db
+from database.models import APIKey, UsageHourly, UsageLog
+from schemas import (APIKeyCreate, APIKeyResponse, APIKeyUsage, DashboardResponse,
+                     UsageHourlyResponse, UsageLogResponse)
+from usage_buffer import UsageBuffer, hour_bucket
 
 app = FastAPI(
     title="API Hub",
@@ -28,9 +31,41 @@ app.add_middleware(
 )
 
 
+def usage_spill_path() -> str:
+    """Absolute path for spilled usage rows, beside the database they belong to."""
+    database = engine.url.database
+    if not database or database == ":memory:":
+        return str(Path(__file__).resolve().parent / "usage_spill.jsonl")
+    database = Path(database).resolve()
+    return str(database.with_name(f"{database.stem}_usage_spill.jsonl"))
+
+
+# Usage rows are written behind the request in batches (see usage_buffer.py)
+usage_buffer = UsageBuffer(SessionLocal, spill_path=usage_spill_path())
+
+
 @app.on_event("startup")
 def startup():
     init_db()
+    usage_buffer.start()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    usage_buffer.close()
+
+
+def with_pending(key: APIKey) -> APIKeyResponse:
+    """The key's stored totals plus the usage still queued in the buffer."""
+    response = APIKeyResponse.model_validate(key)
+    pending = usage_buffer.pending_totals(key.id)
+    if not pending["requests"]:
+        return response
+    return response.model_copy(update={
+        "total_requests": response.total_requests + pending["requests"],
+        "total_tokens": response.total_tokens + pending["tokens"],
+        "total_cost": response.total_cost + pending["cost"],
+    })
 
 
 def mask_key(key: str) -> str:
@@ -67,7 +102,7 @@ def list_keys(provider: str = None, active_only: bool = True, db: Session = Depe
         query = query.filter(APIKey.provider == provider.lower())
     if active_only:
         query = query.filter(APIKey.is_active == True)
-    return query.order_by(APIKey.created_at.desc()).all()
+    return [with_pending(key) for key in query.order_by(APIKey.created_at.desc()).all()]
 
 
 @app.get("/api/keys/{key_id}", response_model=APIKeyResponse)
@@ -76,7 +111,7 @@ def get_key(key_id: int, db: Session = Depends(get_db)):
     key = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not key:
         raise HTTPException(status_code=404, detail="Key not found")
-    return key
+    return with_pending(key)
 
 
 @app.delete("/api/keys/{key_id}")
@@ -118,80 +153,119 @@ def activate_key(key_id: int, db: Session = Depends(get_db)):
 def log_usage(key_id: int, tokens: int = 0, cost: float = 0.0,
               endpoint: str = None, status_code: int = 200,
               response_time_ms: int = None, db: Session = Depends(get_db)):
-    """Log usage for a key."""
+    """Log usage for a key. The row is queued and written with the next batch."""
     key = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not key:
         raise HTTPException(status_code=404, detail="Key not found")
 
-    log = UsageLog(
-        api_key_id=key_id,
-        endpoint=endpoint,
-        tokens_used=tokens,
+    pending = usage_buffer.add(
+        key_id,
+        tokens=tokens,
         cost=cost,
+        endpoint=endpoint,
         status_code=status_code,
         response_time_ms=response_time_ms,
     )
-    db.add(log)
-
-    # Update key totals
-    key.total_requests += 1
-    key.total_tokens += tokens
-    key.total_cost += cost
-    db.commit()
-    return {"message": "Usage logged", "total_requests": key.total_requests}
+    return {"message": "Usage logged", "total_requests": key.total_requests + pending}
 
 
 @app.get("/api/keys/{key_id}/usage", response_model=APIKeyUsage)
 def get_usage(key_id: int, limit: int = 20, db: Session = Depends(get_db)):
-    """Get usage stats and recent logs for a key."""
+    """Get usage stats and recent logs for a key, including rows not yet written."""
     key = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not key:
         raise HTTPException(status_code=404, detail="Key not found")
 
+    queued = [UsageLogResponse(**row) for row in usage_buffer.pending_rows(key_id, limit)]
     logs = db.query(UsageLog).filter(
         UsageLog.api_key_id == key_id
-    ).order_by(UsageLog.created_at.desc()).limit(limit).all()
+    ).order_by(UsageLog.created_at.desc()).limit(limit - len(queued)).all()
+    totals = with_pending(key)
 
     return APIKeyUsage(
         key_id=key.id,
         name=key.name,
         provider=key.provider,
-        total_requests=key.total_requests,
-        total_tokens=key.total_tokens,
-        total_cost=key.total_cost,
-        recent_logs=[UsageLogResponse.model_validate(l) for l in logs],
+        total_requests=totals.total_requests,
+        total_tokens=totals.total_tokens,
+        total_cost=totals.total_cost,
+        recent_logs=queued + [UsageLogResponse.model_validate(l) for l in logs],
     )
 
 
+@app.get("/api/keys/{key_id}/usage/hourly", response_model=List[UsageHourlyResponse])
+def get_hourly_usage(key_id: int, hours: int = 24, db: Session = Depends(get_db)):
+    """Hourly usage counters for a key, newest hour first, including queued rows."""
+    key = db.query(APIKey).filter(APIKey.id == key_id).first()
+    if not key:
+        raise HTTPException(status_code=404, detail="Key not found")
+
+    since = hour_bucket(datetime.utcnow()) - timedelta(hours=hours - 1)
+    rows = db.query(UsageHourly).filter(
+        UsageHourly.api_key_id == key_id, UsageHourly.hour >= since
+    ).all()
+    by_hour = {row.hour: UsageHourlyResponse.model_validate(row) for row in rows}
+    for hour, pending in usage_buffer.pending_hourly(key_id).items():
+        if hour < since:
+            continue
+        stored = by_hour.get(hour)
+        if stored is None:
+            by_hour[hour] = UsageHourlyResponse(api_key_id=key_id, hour=hour, **pending)
+        else:
+            by_hour[hour] = stored.model_copy(update={
+                name: getattr(stored, name) + value for name, value in pending.items()})
+    return [by_hour[hour] for hour in sorted(by_hour, reverse=True)]
+
+
 # ─── Dashboard ────────────────────────────────────────────
 
 @app.get("/api/dashboard", response_model=DashboardResponse)
 def dashboard(db: Session = Depends(get_db)):
-    """Usage dashboard — overview of all keys and providers."""
-    keys = db.query(APIKey).all()
-    active = [k for k in keys if k.is_active]
+    """
+    Usage dashboard — overview of all keys and providers.
 
+    Answered from the per-key totals and hourly rollups, never from
+    usage_logs, so the cost does not grow with usage history. Figures lag
+    the usage buffer by at most one flush interval.
+    """
     # Group by provider
-    providers = {}
-    for k in keys:
-        if k.provider not in providers:
-            providers[k.provider] = {"keys": 0, "requests": 0, "tokens": 0, "cost": 0.0}
-        providers[k.provider]["keys"] += 1
-        providers[k.provider]["requests"] += k.total_requests
-        providers[k.provider]["tokens"] += k.total_tokens
-        providers[k.provider]["cost"] += k.total_cost
+    rows = db.query(
+        APIKey.provider,
+        func.count(APIKey.id),
+        func.sum(case((APIKey.is_active.is_(True), 1), else_=0)),
+        func.sum(APIKey.total_requests),
+        func.sum(APIKey.total_tokens),
+        func.sum(APIKey.total_cost),
+    ).group_by(APIKey.provider).all()
+    providers = {
+        provider: {"keys": keys, "requests": requests or 0, "tokens": tokens or 0, "cost": cost or 0.0}
+        for provider, keys, _, requests, tokens, cost in rows
+    }
 
     # Top keys by usage
-    top = sorted(keys, key=lambda k: k.total_requests, reverse=True)[:5]
+    top = db.query(APIKey.name, APIKey.provider, APIKey.total_requests).order_by(
+        APIKey.total_requests.desc()
+    ).limit(5).all()
+
+    # Last 24 hours from the hourly rollups
+    since = hour_bucket(datetime.utcnow()) - timedelta(hours=23)
+    last_day = db.query(
+        func.coalesce(func.sum(UsageHourly.requests), 0),
+        func.coalesce(func.sum(UsageHourly.tokens), 0),
+        func.coalesce(func.sum(UsageHourly.cost), 0.0),
+        func.coalesce(func.sum(UsageHourly.errors), 0),
+    ).filter(UsageHourly.hour >= since).one()
 
     return DashboardResponse(
-        total_keys=len(keys),
-        active_keys=len(active),
-        total_requests=sum(k.total_requests for k in keys),
-        total_tokens=sum(k.total_tokens for k in keys),
-        total_cost=sum(k.total_cost for k in keys),
+        total_keys=sum(p["keys"] for p in providers.values()),
+        active_keys=sum(row[2] or 0 for row in rows),
+        total_requests=sum(p["requests"] for p in providers.values()),
+        total_tokens=sum(p["tokens"] for p in providers.values()),
+        total_cost=sum(p["cost"] for p in providers.values()),
         providers=providers,
-        top_keys=[{"name": k.name, "provider": k.provider, "requests": k.total_requests} for k in top],
+        top_keys=[{"name": name, "provider": provider, "requests": requests}
+                  for name, provider, requests in top],
+        last_24h=dict(zip(("requests", "tokens", "cost", "errors"), last_day)),
     )
 
 
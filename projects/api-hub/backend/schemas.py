@@ -42,7 +42,7 @@ class APIKeyUsage(BaseModel):
 
 
 class UsageLogResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # None while the row is still queued in the usage buffer
     api_key_id: int
     endpoint: Optional[str]
     tokens_used: int
@@ -55,6 +55,18 @@ class UsageLogResponse(BaseModel):
         from_attributes = True
 
 
+class UsageHourlyResponse(BaseModel):
+    api_key_id: int
+    hour: datetime
+    requests: int
+    tokens: int
+    cost: float
+    errors: int
+
+    class Config:
+        from_attributes = True
+
+
 class DashboardResponse(BaseModel):
     total_keys: int
     active_keys: int
@@ -63,3 +75,4 @@ class DashboardResponse(BaseModel):
     total_cost: float
     providers: dict
     top_keys: list
+    last_24h: dict = {}
@@ -0,0 +1,288 @@
+"""
+API Hub Usage Buffer — write-behind ingestion for usage logs
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from database.models import APIKey, UsageHourly, UsageLog
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+logger = logging.getLogger(__name__)
+
+
+def hour_bucket(ts: datetime) -> datetime:
+    """Truncate a timestamp to the start of its hour."""
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _empty_totals() -> Dict:
+    return {"requests": 0, "tokens": 0, "cost": 0.0}
+
+
+class UsageBuffer:
+    """
+    Collects usage rows in memory and writes them in batches.
+
+    A background thread flushes every flush_interval seconds, or as soon as
+    max_batch rows are waiting. Each flush is one transaction: a bulk insert
+    into usage_logs, one executemany bumping the per-key totals and one
+    upsert into the hourly rollups. A failed flush puts its rows back in
+    front of the queue; after max_attempts failures in a row the batch is
+    spilled to spill_path instead. close() drains whatever is left; rows
+    that still cannot be written are spilled too, and start() replays them.
+
+    Per-key totals and hourly counters of the queued rows are kept up to
+    date on every add, so readers can merge them into what the database
+    holds without forcing a flush.
+    """
+
+    def __init__(self, session_factory, max_batch: int = 500, flush_interval: float = 1.0,
+                 max_pending: int = 10_000, spill_path: Optional[str] = None,
+                 max_attempts: int = 5):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.spill_path = spill_path
+        self.max_attempts = max_attempts
+        self.flushes = 0
+        self._failures = 0
+        self._rows: List[Dict] = []
+        # Aggregates of self._rows, maintained on every add and write
+        self._pending: Dict[int, Dict] = {}
+        self._pending_hourly: Dict[Tuple[int, datetime], Dict] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ─── Producer side ────────────────────────────────────
+
+    def add(self, api_key_id: int, tokens: int = 0, cost: float = 0.0, endpoint: str = None,
+            status_code: int = 200, response_time_ms: int = None) -> int:
+        """Queue one usage row; returns how many rows are pending for the key."""
+        row = {
+            "api_key_id": api_key_id,
+            "endpoint": endpoint,
+            "tokens_used": tokens,
+            "cost": cost,
+            "status_code": status_code,
+            "response_time_ms": response_time_ms,
+            "created_at": datetime.utcnow(),
+        }
+        with self._lock:
+            self._rows.append(row)
+            self._count([row], 1)
+            pending_for_key = self._pending[api_key_id]["requests"]
+            queued = len(self._rows)
+
+        if queued >= self.max_pending or (queued >= self.max_batch and not self.running):
+            self.flush()  # backpressure: the caller pays for the write
+        elif queued >= self.max_batch:
+            self._wake.set()
+        return pending_for_key
+
+    def pending(self, api_key_id: int = None) -> int:
+        """Rows not yet written, for one key or overall."""
+        with self._lock:
+            if api_key_id is None:
+                return len(self._rows)
+            return self._pending.get(api_key_id, {}).get("requests", 0)
+
+    def pending_totals(self, api_key_id: int) -> Dict:
+        """requests, tokens and cost of the key's queued rows."""
+        with self._lock:
+            return dict(self._pending.get(api_key_id) or _empty_totals())
+
+    def pending_hourly(self, api_key_id: int) -> Dict[datetime, Dict]:
+        """Hourly counters of the key's queued rows, by hour."""
+        with self._lock:
+            return {hour: dict(bucket) for (key_id, hour), bucket in self._pending_hourly.items()
+                    if key_id == api_key_id}
+
+    def pending_rows(self, api_key_id: int, limit: int) -> List[Dict]:
+        """Up to limit of the key's queued rows, newest first."""
+        rows = []
+        with self._lock:
+            for row in reversed(self._rows):
+                if len(rows) >= limit:
+                    break
+                if row["api_key_id"] == api_key_id:
+                    rows.append(dict(row))
+        return rows
+
+    def _count(self, rows: List[Dict], sign: int):
+        """Add (sign=1) or remove (sign=-1) rows from the pending aggregates; caller holds _lock."""
+        for row in rows:
+            key_id = row["api_key_id"]
+            tokens, cost = row["tokens_used"] or 0, row["cost"] or 0.0
+            total = self._pending.setdefault(key_id, _empty_totals())
+            total["requests"] += sign
+            total["tokens"] += sign * tokens
+            total["cost"] += sign * cost
+            if not total["requests"]:
+                del self._pending[key_id]
+
+            hour = (key_id, hour_bucket(row["created_at"]))
+            bucket = self._pending_hourly.setdefault(hour, dict(_empty_totals(), errors=0))
+            bucket["requests"] += sign
+            bucket["tokens"] += sign * tokens
+            bucket["cost"] += sign * cost
+            bucket["errors"] += sign * (1 if (row["status_code"] or 0) >= 400 else 0)
+            if not bucket["requests"]:
+                del self._pending_hourly[hour]
+
+    # ─── Flushing ─────────────────────────────────────────
+
+    def flush(self) -> int:
+        """Write every queued row now; returns the number of rows written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = self._rows[:self.max_batch]
+                    del self._rows[:self.max_batch]
+                if not batch:
+                    return written
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    self._failures += 1
+                    if self.spill_path and self._failures >= self.max_attempts:
+                        self._failures = 0
+                        with self._lock:
+                            self._count(batch, -1)
+                        self._spill(batch)
+                        logger.error(f"Spilled {len(batch)} usage rows to {self.spill_path} "
+                                     f"after {self.max_attempts} failed writes: {e}")
+                    else:
+                        with self._lock:
+                            self._rows[:0] = batch
+                    raise
+                self._failures = 0
+                with self._lock:
+                    self._count(batch, -1)
+                written += len(batch)
+
+    def _write(self, batch: List[Dict]):
+        totals: Dict[int, Dict] = {}
+        hourly: Dict[tuple, Dict] = {}
+        for row in batch:
+            key_id = row["api_key_id"]
+            total = totals.setdefault(key_id, {"key_id": key_id, "requests": 0, "tokens": 0, "cost": 0.0})
+            total["requests"] += 1
+            total["tokens"] += row["tokens_used"] or 0
+            total["cost"] += row["cost"] or 0.0
+
+            hour = hour_bucket(row["created_at"])
+            bucket = hourly.setdefault((key_id, hour), {
+                "api_key_id": key_id, "hour": hour,
+                "requests": 0, "tokens": 0, "cost": 0.0, "errors": 0,
+            })
+            bucket["requests"] += 1
+            bucket["tokens"] += row["tokens_used"] or 0
+            bucket["cost"] += row["cost"] or 0.0
+            bucket["errors"] += 1 if (row["status_code"] or 0) >= 400 else 0
+
+        key_update = (
+            update(APIKey.__table__)
+            .where(APIKey.__table__.c.id == bindparam("key_id"))
+            .values(
+                total_requests=APIKey.__table__.c.total_requests + bindparam("requests"),
+                total_tokens=APIKey.__table__.c.total_tokens + bindparam("tokens"),
+                total_cost=APIKey.__table__.c.total_cost + bindparam("cost"),
+            )
+        )
+        rollup = sqlite_insert(UsageHourly.__table__)
+        rollup = rollup.on_conflict_do_update(
+            index_elements=["api_key_id", "hour"],
+            set_={
+                name: UsageHourly.__table__.c[name] + rollup.excluded[name]
+                for name in ("requests", "tokens", "cost", "errors")
+            },
+        )
+
+        db = self.session_factory()
+        try:
+            db.execute(insert(UsageLog.__table__), batch)
+            db.connection().execute(key_update, list(totals.values()))
+            db.execute(rollup, list(hourly.values()))
+            db.commit()
+            self.flushes += 1
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ─── Lifecycle ────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Replay spilled rows and start the background flusher."""
+        self._replay_spill()
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="usage-buffer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Usage flush failed, {self.pending()} rows kept for retry: {e}")
+
+    def close(self):
+        """Stop the flusher and drain the queue; spill rows that cannot be written."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        except Exception as e:
+            if not self.spill_path:
+                logger.error(f"Dropping {self.pending()} usage rows, final flush failed: {e}")
+                raise
+            with self._lock:
+                rows, self._rows = self._rows, []
+                self._pending, self._pending_hourly = {}, {}
+            self._spill(rows)
+            logger.error(f"Final usage flush failed, spilled rows to {self.spill_path}: {e}")
+
+    def _spill(self, rows: List[Dict]):
+        with open(self.spill_path, "a") as f:
+            for row in rows:
+                f.write(json.dumps(dict(row, created_at=row["created_at"].isoformat())) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replay_spill(self):
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path) as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        for row in rows:
+            row["created_at"] = datetime.fromisoformat(row["created_at"])
+        with self._lock:
+            self._count(rows, 1)
+            self._rows[:0] = rows
+        os.remove(self.spill_path)
+        logger.info(f"Replaying {len(rows)} spilled usage rows")
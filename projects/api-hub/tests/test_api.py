@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from fastapi.testclient import TestClient
 from database.db import Base, engine
-from main import app
+from main import app, usage_buffer
 
 # Reset DB for each test run
 Base.metadata.drop_all(bind=engine)
@@ -88,6 +88,7 @@ def test_log_usage():
     
     r = client.get("/api/keys/1")
     assert r.json()["total_requests"] == 5
+    assert usage_buffer.pending(1) == 5  # reads merge the queue instead of flushing it
 
 
 def test_get_usage():
@@ -99,6 +100,29 @@ def test_get_usage():
     assert len(data["recent_logs"]) == 5
 
 
+def test_hourly_usage():
+    r = client.get("/api/keys/1/usage/hourly")
+    assert r.status_code == 200
+    buckets = r.json()
+    assert len(buckets) == 1
+    assert buckets[0]["requests"] == 5
+    assert buckets[0]["tokens"] == 1500 + 1000 + 1100 + 1200 + 1300
+
+
+def test_reads_merge_written_and_queued_usage():
+    usage_buffer.flush()
+    client.post("/api/keys/1/log-usage?tokens=10&cost=0.5&status_code=500")
+    assert usage_buffer.pending(1) == 1
+
+    assert client.get("/api/keys/1").json()["total_requests"] == 6
+    usage = client.get("/api/keys/1/usage?limit=3").json()
+    assert usage["total_tokens"] == 6110
+    assert [log["id"] is None for log in usage["recent_logs"]] == [True, False, False]
+    hourly = client.get("/api/keys/1/usage/hourly").json()
+    assert [(b["requests"], b["errors"]) for b in hourly] == [(6, 1)]
+    assert usage_buffer.pending(1) == 1
+
+
 def test_deactivate_key():
     r = client.post("/api/keys/1/deactivate")
     assert r.status_code == 200
@@ -133,6 +157,8 @@ def test_dashboard():
     assert "openrouter" in data["providers"]
     assert "deepseek" in data["providers"]
     assert len(data["top_keys"]) > 0
+    assert data["top_keys"][0]["requests"] == 5
+    assert data["last_24h"]["requests"] == 5
 
 
 def test_delete_key():
@@ -148,6 +174,12 @@ def test_delete_nonexistent():
     assert r.status_code == 404
 
 
+def test_usage_spill_sits_beside_database():
+    spill = usage_buffer.spill_path
+    assert os.path.isabs(spill)
+    assert os.path.dirname(spill) == os.path.dirname(os.path.abspath(engine.url.database))
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,149 @@
+"""
+API Hub Usage Buffer Tests — batching, rollups, drain and spill
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from database.db import Base
+from database.models import APIKey, UsageHourly, UsageLog
+from sqlalchemy import create_engine, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from usage_buffer import UsageBuffer
+
+ROWS = 2000
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'hub.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    db.add_all(APIKey(name=f"key{i}", provider="openai", key_value=f"sk-test-{i:06d}",
+                      key_preview="***", total_requests=0, total_tokens=0, total_cost=0.0)
+               for i in range(3))
+    db.commit()
+    db.close()
+    yield session_factory
+    engine.dispose()
+
+
+def log_rows(buffer, n=ROWS):
+    for i in range(n):
+        buffer.add(1 + i % 3, tokens=10 + i % 7, cost=0.001, status_code=500 if i % 10 == 0 else 200)
+
+
+def test_flush_writes_batches_and_rollups(session_factory):
+    buffer = UsageBuffer(session_factory, max_batch=500)
+    log_rows(buffer)  # no flusher thread: full batches are written inline
+    assert buffer.pending() == 0
+    assert buffer.flushes == ROWS // 500
+
+    db = session_factory()
+    assert db.query(func.count(UsageLog.id)).scalar() == ROWS
+    # Key totals and hourly rollups agree with a scan of the raw log
+    per_key = dict(db.query(UsageLog.api_key_id, func.sum(UsageLog.tokens_used))
+                   .group_by(UsageLog.api_key_id).all())
+    for key in db.query(APIKey):
+        assert key.total_tokens == per_key[key.id]
+        assert key.total_requests == sum(h.requests for h in db.query(UsageHourly).filter_by(api_key_id=key.id))
+    assert db.query(func.sum(UsageHourly.errors)).scalar() == ROWS // 10
+    db.close()
+
+
+def test_close_drains_background_queue(session_factory):
+    buffer = UsageBuffer(session_factory, max_batch=10_000, flush_interval=60)
+    buffer.start()
+    log_rows(buffer, 123)
+    assert buffer.pending(api_key_id=1) == 41
+    buffer.close()
+
+    assert buffer.pending() == 0
+    db = session_factory()
+    assert db.query(func.count(UsageLog.id)).scalar() == 123
+    db.close()
+
+
+def test_failed_flush_is_retried_then_spilled(session_factory, tmp_path):
+    broken_engine = create_engine(f"sqlite:///{tmp_path / 'missing-tables.db'}")
+    spill = tmp_path / "spill.jsonl"
+    buffer = UsageBuffer(sessionmaker(bind=broken_engine), spill_path=str(spill))
+    log_rows(buffer, 50)
+
+    with pytest.raises(OperationalError):
+        buffer.flush()
+    assert buffer.pending() == 50  # rows went back on the queue
+    buffer.close()
+    assert buffer.pending() == 0 and len(spill.read_text().splitlines()) == 50
+
+    replay = UsageBuffer(session_factory, spill_path=str(spill))
+    replay.start()
+    replay.close()
+    assert not spill.exists()
+    db = session_factory()
+    assert db.query(func.count(UsageLog.id)).scalar() == 50
+    db.close()
+
+
+def test_batch_spilled_after_max_attempts(tmp_path):
+    broken_engine = create_engine(f"sqlite:///{tmp_path / 'missing-tables.db'}")
+    spill = tmp_path / "spill.jsonl"
+    buffer = UsageBuffer(sessionmaker(bind=broken_engine), max_attempts=3, spill_path=str(spill))
+    log_rows(buffer, 30)
+    buffer.max_batch = 20
+
+    for _ in range(2):
+        with pytest.raises(OperationalError):
+            buffer.flush()
+        assert buffer.pending() == 30 and not spill.exists()
+    with pytest.raises(OperationalError):
+        buffer.flush()
+    # The head batch gave up and moved to disk; the rest keeps its own attempts
+    assert buffer.pending() == 10 and len(spill.read_text().splitlines()) == 20
+    assert sum(buffer.pending_totals(k)["requests"] for k in (1, 2, 3)) == 10
+
+
+def test_pending_aggregates_track_the_queue(session_factory):
+    buffer = UsageBuffer(session_factory, max_batch=1000)
+    log_rows(buffer, 30)
+
+    totals = buffer.pending_totals(1)
+    assert totals["requests"] == 10
+    assert totals["tokens"] == sum(10 + i % 7 for i in range(0, 30, 3))
+    (bucket,) = buffer.pending_hourly(1).values()
+    assert (bucket["requests"], bucket["errors"]) == (10, 1)
+    recent = buffer.pending_rows(1, 3)
+    assert [r["tokens_used"] for r in recent] == [10 + i % 7 for i in (27, 24, 21)]
+
+    buffer.flush()
+    assert buffer.pending_totals(1) == {"requests": 0, "tokens": 0, "cost": 0.0}
+    assert buffer.pending_hourly(1) == {} and buffer.pending_rows(1, 3) == []
+
+
+def test_buffered_ingest_faster_than_commit_per_row(session_factory):
+    db = session_factory()
+    start = time.perf_counter()
+    for i in range(ROWS):  # the previous log_usage path
+        key = db.query(APIKey).filter(APIKey.id == 1 + i % 3).first()
+        db.add(UsageLog(api_key_id=key.id, tokens_used=10, cost=0.001, status_code=200))
+        key.total_requests += 1
+        key.total_tokens += 10
+        key.total_cost += 0.001
+        db.commit()
+    per_row = time.perf_counter() - start
+    db.close()
+
+    buffer = UsageBuffer(session_factory, max_batch=500)
+    start = time.perf_counter()
+    log_rows(buffer)
+    buffer.flush()
+    buffered = time.perf_counter() - start
+
+    print(f"\n{ROWS} usage rows: commit per row {per_row:.2f}s, buffered {buffered:.3f}s "
+          f"({per_row / buffered:.0f}x)")
+    assert per_row / buffered >= 5
@@ -0,0 +1,203 @@
+"""Tests for the content-addressed, incremental backup store."""
+import os
+import time
+
+import backup_store
+import pytest
+from backup_store import BackupError, BackupStore
+
+CHUNK = 4096
+
+
+def make_workspace(root):
+    app = root / "projects" / "app"
+    (app / "src").mkdir(parents=True)
+    (app / "src" / "main.py").write_text("print('hello')\n" * 500)
+    (app / "data.bin").write_bytes(os.urandom(10 * CHUNK + 123))
+    (app / "copy.bin").write_bytes((app / "data.bin").read_bytes())
+    (app / "empty.txt").write_bytes(b"")
+    (app / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    (app / "run.sh").chmod(0o755)
+    os.symlink("src/main.py", app / "entry.py")
+    (root / "notes.md").write_text("# notes\n")
+    return {"projects": root / "projects", "notes.md": root / "notes.md", "missing": root / "nope"}
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "ws"
+    root.mkdir()
+    sources = make_workspace(root)
+    # Sources written just now share the snapshot's mtime tick; age them so
+    # the stat cache trusts them the way it would a real workspace.
+    past = time.time_ns() - 10**9
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), ns=(past, past), follow_symlinks=False)
+    return root, sources
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BackupStore(tmp_path / "store", workers=4, chunk_size=CHUNK)
+
+
+def tree(root):
+    result = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root)
+            if os.path.islink(path):
+                result[rel] = ("link", os.readlink(path))
+            else:
+                st = os.stat(path)
+                result[rel] = (open(path, "rb").read(), st.st_mode & 0o777, st.st_mtime_ns)
+    return result
+
+
+def test_round_trip_with_dedupe(workspace, store, tmp_path):
+    root, sources = workspace
+    manifest = store.backup(sources, extra={".env.template": b"KEY=YOUR_VALUE_HERE\n"})
+    stats = manifest["stats"]
+
+    # data.bin and copy.bin share every chunk
+    data_chunks = {e["path"]: e["chunks"] for e in manifest["files"] if "chunks" in e}
+    assert data_chunks["projects/app/data.bin"] == data_chunks["projects/app/copy.bin"]
+    assert stats["new_chunks"] == len({d for c in data_chunks.values() for d in c})
+
+    out = tmp_path / "restored"
+    store.restore("latest", out)
+    original = tree(root)
+    restored = tree(out)
+    assert restored.pop(".env.template")[0] == b"KEY=YOUR_VALUE_HERE\n"
+    assert restored == original
+    assert store.verify()["ok"]
+
+
+def test_unchanged_backup_reads_nothing(workspace, store, monkeypatch):
+    _, sources = workspace
+    first = store.backup(sources)
+    size_after_first = store.size()
+
+    put_chunk, hashed = store._put_chunk, []
+    monkeypatch.setattr(store, "_put_chunk", lambda data: hashed.append(data) or put_chunk(data))
+    second = store.backup(sources)
+
+    assert second["stats"]["reused_files"] == first["stats"]["files"]
+    assert second["stats"]["read_bytes"] == second["stats"]["new_chunks"] == 0
+    assert len(hashed) == len(second["tree"])  # only the (unchanged) file list
+    assert store.size() - size_after_first == second["stats"]["manifest_bytes"] < 1024
+    assert [e["path"] for e in second["files"]] == [e["path"] for e in first["files"]]
+
+
+def test_changed_file_stores_only_changed_chunks(workspace, store, tmp_path):
+    root, sources = workspace
+    first = store.backup(sources)
+    path = root / "projects" / "app" / "data.bin"
+    data = bytearray(path.read_bytes())
+    data[5 * CHUNK + 10] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    second = store.backup(sources)
+    assert second["stats"]["read_bytes"] == len(data)
+    assert second["stats"]["new_chunks"] == 1
+
+    store.restore(first["id"], tmp_path / "old", only="projects/app/data.bin")
+    store.restore(second["id"], tmp_path / "new", only="projects/app/data.bin")
+    assert (tmp_path / "old/projects/app/data.bin").read_bytes() == (root / "projects/app/copy.bin").read_bytes()
+    assert (tmp_path / "new/projects/app/data.bin").read_bytes() == bytes(data)
+    assert sorted(os.listdir(tmp_path / "new" / "projects" / "app")) == ["data.bin"]
+
+
+def test_verify_reports_missing_and_corrupt_chunks(workspace, store, tmp_path):
+    _, sources = workspace
+    manifest = store.backup(sources)
+    by_path = {e["path"]: e for e in manifest["files"]}
+    main_chunk = by_path["projects/app/src/main.py"]["chunks"][0]
+    sh_chunk = by_path["projects/app/run.sh"]["chunks"][0]
+
+    store._chunk_path(main_chunk).unlink()
+    store._chunk_path(sh_chunk).write_bytes(b"garbage")
+
+    quick = store.verify(quick=True)
+    deep = store.verify()
+    assert quick["missing"] == [main_chunk] and not quick["corrupt"]
+    assert (deep["missing"], deep["corrupt"]) == ([main_chunk], [sh_chunk])
+    assert sorted(deep["damaged_files"]) == ["projects/app/run.sh", "projects/app/src/main.py"]
+    with pytest.raises(BackupError, match="missing|corrupt"):
+        store.restore("latest", tmp_path / "out")
+
+
+def test_prune_keeps_newest_and_collects_unused_chunks(workspace, store, tmp_path):
+    root, sources = workspace
+    ids = []
+    for i in range(4):
+        (root / "projects" / "app" / "version.txt").write_text(f"version {i}\n")
+        ids.append(store.backup(sources)["id"])
+
+    result = store.prune(keep=2)
+    assert store.snapshot_ids() == ids[2:]
+    # one version.txt chunk and one file-list chunk per dropped snapshot
+    assert (result["snapshots_removed"], result["chunks_removed"]) == (2, 4)
+    assert store.verify(ids[2])["ok"] and store.verify(ids[3])["ok"]
+    store.restore(ids[2], tmp_path / "out")
+    assert (tmp_path / "out/projects/app/version.txt").read_text() == "version 2\n"
+    with pytest.raises(BackupError, match="not found"):
+        store.load(ids[0])
+
+
+def test_cmd_backup_creates_and_restores(tmp_path, monkeypatch, capsys):
+    root = tmp_path / "mywork"
+    (root / "projects" / "demo").mkdir(parents=True)
+    (root / "projects" / "demo" / "app.py").write_text("x = 1\n")
+    (root / "tools").mkdir()
+    (root / ".env").write_text("SECRET=abc\n# comment\n")
+    monkeypatch.setattr(backup_store, "MYWORK_ROOT", root)
+    monkeypatch.setattr(backup_store, "PROJECTS_DIR", root / "projects")
+    monkeypatch.setattr(backup_store, "TOOLS_DIR", root / "tools")
+
+    assert backup_store.cmd_backup([]) == 0
+    assert backup_store.cmd_backup(["verify"]) == 0
+    assert backup_store.cmd_backup(["restore", "latest", str(tmp_path / "out")]) == 0
+    assert (tmp_path / "out/projects/demo/app.py").read_text() == "x = 1\n"
+    assert (tmp_path / "out/.env.template").read_text() == "SECRET=YOUR_VALUE_HERE\n# comment\n"
+    assert backup_store.cmd_backup(["restore", "nope", str(tmp_path / "x")]) == 1
+    assert "not found" in capsys.readouterr().out
+
+
+@pytest.mark.slow
+def test_benchmark_incremental_backup(tmp_path):
+    root = tmp_path / "ws"
+    files, size = 0, 0
+    block = os.urandom(1 << 16)
+    for p in range(20):
+        project = root / "projects" / f"p{p}"
+        project.mkdir(parents=True)
+        for i in range(200):
+            text = (f"# module {p}/{i}\n" + "def f(x):\n    return x * 2\n" * 200).encode()
+            (project / f"m{i}.py").write_bytes(text)
+            files, size = files + 1, size + len(text)
+        blob = os.urandom(16) + block * 160  # ~10 MB, partly compressible
+        (project / "assets.bin").write_bytes(blob)
+        files, size = files + 1, size + len(blob)
+    past = time.time_ns() - 10**9
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            os.utime(os.path.join(dirpath, name), ns=(past, past))
+
+    store = BackupStore(tmp_path / "store")
+    sources = {"projects": root / "projects"}
+    first = store.backup(sources)
+    after_first = store.size()
+    start = time.perf_counter()
+    second = store.backup(sources)
+    second_seconds = time.perf_counter() - start
+    added = store.size() - after_first
+
+    print(f"\n{files} files, {size / 2**20:.0f} MB: first {first['stats']['seconds']:.2f}s "
+          f"({after_first / 2**20:.1f} MB stored), unchanged {second_seconds:.3f}s (+{added} bytes)")
+    assert second["stats"]["read_bytes"] == 0
+    assert added < 2048
+    assert second_seconds < first["stats"]["seconds"] / 10
+    assert store.verify(quick=True)["ok"]
@@ -0,0 +1,126 @@
+"""Tests for the streaming, cached changelog generator."""
+import itertools
+import subprocess
+import time
+
+import changelog_gen
+import pytest
+from changelog_gen import ChangelogCache, cmd_changelog, get_commits, iter_commits
+
+
+def git(repo, *args, stdin=None):
+    return subprocess.run(["git", *args], cwd=repo, input=stdin, check=True,
+                          capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    git(repo, "config", "user.email", "dev@example.com")
+    git(repo, "config", "user.name", "Dev")
+    return repo
+
+
+def commit(repo, *messages):
+    (repo / "f").write_text(str(time.monotonic_ns()))
+    git(repo, "add", "f")
+    git(repo, "commit", "-q", *itertools.chain.from_iterable(("-m", m) for m in messages))
+
+
+def test_stream_parses_bodies_with_separators(repo):
+    commit(repo, "feat(ui): a | b", "line <<<END>>> here\n\nBREAKING CHANGE: yes")
+    commit(repo, "fix!: second")
+    commit(repo, "plain")
+
+    commits = list(iter_commits(cwd=repo))
+    assert [c["subject"] for c in commits] == ["plain", "fix!: second", "feat(ui): a | b"]
+    assert commits[2]["body"] == "line <<<END>>> here\n\nBREAKING CHANGE: yes"
+    assert [c["breaking"] for c in commits] == [False, True, True]
+    assert commits[0]["author"] == "Dev" and len(commits[0]["hash"]) == 40
+
+    # Stopping early terminates git instead of draining the log
+    assert [c["subject"] for c in itertools.islice(iter_commits(cwd=repo), 1)] == ["plain"]
+
+
+def test_new_tag_reads_only_new_commits(repo, tmp_path, monkeypatch):
+    for i in range(3):
+        commit(repo, f"feat: one {i}")
+    git(repo, "tag", "v1.0.0")
+    for i in range(2):
+        commit(repo, f"fix: two {i}")
+    git(repo, "tag", "-a", "v1.1.0", "-m", "release")
+
+    read = []
+    real_iter = changelog_gen.iter_commits
+    monkeypatch.setattr(changelog_gen, "iter_commits",
+                        lambda f=None, t="HEAD", cwd=None: read.append((f, t)) or real_iter(f, t, cwd))
+
+    def changelog():
+        read.clear()
+        cache = ChangelogCache(cwd=repo, cache_dir=tmp_path / "cache")
+        ranges = [get_commits(f, t, cwd=repo, cache=cache)
+                  for f, t in (("v1.1.0", "HEAD"), ("v1.0.0", "v1.1.0"), (None, "v1.0.0"))]
+        cache.save()
+        return [[c["subject"] for c in r] for r in ranges]
+
+    first = changelog()
+    assert first == [[], ["fix: two 1", "fix: two 0"], ["feat: one 2", "feat: one 1", "feat: one 0"]]
+    assert len(read) == 3
+    assert changelog() == first and read == [("v1.1.0", "HEAD")]
+
+    commit(repo, "perf: three")
+    git(repo, "tag", "v1.2.0")
+    cache = ChangelogCache(cwd=repo, cache_dir=tmp_path / "cache")
+    read.clear()
+    assert [c["subject"] for c in get_commits("v1.1.0", "v1.2.0", cwd=repo, cache=cache)] == ["perf: three"]
+    assert get_commits("v1.0.0", "v1.1.0", cwd=repo, cache=cache) == get_commits("v1.0.0", "v1.1.0", cwd=repo)
+    assert read == [("v1.1.0", "v1.2.0"), ("v1.0.0", "v1.1.0")]  # second read is the uncached call
+
+
+def test_full_changelog_identical_from_cache(repo, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(changelog_gen, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.chdir(repo)
+    commit(repo, "feat(api): add endpoint")
+    commit(repo, "fix: crash", "BREAKING CHANGE: removed x")
+    git(repo, "tag", "v0.1.0")
+    commit(repo, "docs: readme")
+    commit(repo, "chore(deps): bump")
+
+    outputs = []
+    for args in (["--full"], ["--full"], ["--full", "--no-cache"]):
+        assert cmd_changelog(args) == 0
+        outputs.append(capsys.readouterr().out)
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert "## 💥 Breaking Changes\n\n- crash (" in outputs[0]
+    assert outputs[0].startswith("# Unreleased\n\n*2 commits by 1 contributors*\n")
+
+
+@pytest.mark.slow
+def test_benchmark_large_history(repo, tmp_path):
+    n = 50000
+    stream = []
+    for i in range(n):
+        msg = f"feat(m{i % 7}): change {i}\n\nBody of change {i}\n"
+        stream.append(f"commit refs/heads/master\nmark :{i + 1}\n"
+                      f"committer Dev <dev@example.com> {1600000000 + i} +0000\n"
+                      f"data {len(msg.encode())}\n{msg}\n")
+        if i + 1 in (n // 2, n - 10):
+            stream.append(f"reset refs/tags/v{i + 1}\nfrom :{i + 1}\n\n")
+    git(repo, "fast-import", "--quiet", stdin="".join(stream))
+    git(repo, "checkout", "-q", "master")
+
+    def timed():
+        start = time.perf_counter()
+        cache = ChangelogCache(cwd=repo, cache_dir=tmp_path / "cache")
+        counts = [len(get_commits(f, t, cwd=repo, cache=cache)) for f, t in
+                  ((f"v{n - 10}", "HEAD"), (f"v{n // 2}", f"v{n - 10}"), (None, f"v{n // 2}"))]
+        cache.save()
+        return counts, time.perf_counter() - start
+
+    cold_counts, cold = timed()
+    warm_counts, warm = timed()
+    print(f"\n{n} commits: cold {cold:.2f}s, cached {warm:.2f}s")
+    assert cold_counts == warm_counts == [10, n // 2 - 10, n // 2]
+    assert warm < cold / 2
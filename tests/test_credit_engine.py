@@ -0,0 +1,87 @@
+"""Tests for the indexed CreditEngine transaction store."""
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "simulation"))
+from credit_engine import CreditEngine, TransactionStatus
+
+
+@pytest.fixture
+def engine():
+    rng = random.Random(11)
+    engine = CreditEngine(max_balance=10_000.0)
+    users = [f"user_{i}" for i in range(12)]
+    for user_id in users:
+        engine.create_user_balance(user_id, 100.0)
+    for _ in range(400):
+        user_id = rng.choice(users)
+        action = rng.random()
+        if action < 0.4:
+            engine.top_up(user_id, rng.uniform(1, 50))
+        elif action < 0.7:
+            engine.spend(user_id, rng.uniform(1, 40))
+        elif action < 0.9:
+            engine.transfer(user_id, rng.choice(users), rng.uniform(1, 20))
+        else:
+            engine.earn_commission(user_id, rng.uniform(1, 10), "sale")
+    return engine
+
+
+def backdate(engine, days_ago):
+    """Move every transaction back in time while keeping their order."""
+    base = datetime.now() - timedelta(days=days_ago)
+    for position, tx in enumerate(engine.transactions):
+        tx.timestamp = (base + timedelta(hours=position)).isoformat()
+    rebuilt = engine.transactions
+    fresh = CreditEngine()
+    for tx in rebuilt:
+        fresh._index_transaction(tx)
+    for name in ("transactions", "_user_index", "_timestamps", "_chronological",
+                 "_daily_volume", "_completed_by_type"):
+        setattr(engine, name, getattr(fresh, name))
+
+
+def test_user_transactions_match_scan(engine):
+    for user_id in engine.balances:
+        expected = [tx for tx in engine.transactions if tx.user_id == user_id]
+        expected.sort(key=lambda x: x.timestamp, reverse=True)
+        assert engine.get_user_transactions(user_id) == expected
+        assert engine.get_user_transactions(user_id, limit=3) == expected[:3]
+    assert engine.get_user_transactions("nobody") == []
+
+
+@pytest.mark.parametrize("days", [1, 3, 10, 30])
+def test_volume_matches_scan(engine, days):
+    backdate(engine, 20)
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+    recent = [tx for tx in engine.transactions
+              if tx.timestamp >= cutoff and tx.status == TransactionStatus.COMPLETED]
+
+    volume = engine.get_transaction_volume(days)
+    assert volume["total_transactions"] == len(recent)
+    assert volume["total_volume"] == round(sum(tx.amount for tx in recent), 2)
+
+
+def test_report_counts_by_type(engine):
+    report = engine.generate_system_report()
+    stats = report["transaction_stats"]
+    assert stats["total_transactions"] == len(engine.transactions)
+    assert sum(stats["transactions_by_type"].values()) == stats["completed_transactions"]
+
+
+def test_jsonl_export_streams_records(engine, tmp_path):
+    engine.earn_commissions(["user_1", "user_2"], [1.5, 2.5])
+    path = engine.export_data(str(tmp_path / "credits.jsonl"))
+
+    records = [json.loads(line) for line in Path(path).read_text().splitlines()]
+    kinds = [r["record"] for r in records]
+    assert kinds[0] == "config" and kinds[-1] == "report"
+    assert kinds.count("balance") == len(engine.balances)
+    assert kinds.count("transaction") == len(engine.transactions)
+    assert kinds.count("commission") == 2
+    assert records[-1]["transaction_stats"] == engine.generate_system_report()["transaction_stats"]
@@ -0,0 +1,161 @@
+"""Tests for db_manager table statistics and streaming export."""
+import csv
+import json
+import resource
+import sqlite3
+import time
+import tracemalloc
+
+import pytest
+from db_manager import SQLiteDB
+
+BENCH_ROWS = 5_000_000
+
+
+def make_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT, payload TEXT, amount REAL);
+        CREATE TABLE tags (name TEXT PRIMARY KEY, uses INTEGER) WITHOUT ROWID;
+        CREATE TABLE empty (id INTEGER PRIMARY KEY);
+    """)
+    conn.execute(f"""
+        WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {rows})
+        INSERT INTO events SELECT i, 'kind' || (i % 7), 'payload ' || i || ' "quoted", line', i * 0.5 FROM n
+    """)
+    conn.executemany("INSERT INTO tags VALUES (?, ?)", [(f"tag{i}", i) for i in range(250)])
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "app.db"
+    make_db(path, 20_000)
+    db = SQLiteDB(str(path))
+    db.connect()
+    yield db
+    db.close()
+
+
+def traced(db):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    return statements
+
+
+def test_tables_estimates_without_counting(db):
+    statements = traced(db)
+    tables = {t["name"]: t for t in db.tables()}
+
+    assert not any("COUNT(*)" in s or "dbstat" in s for s in statements)
+    assert (tables["events"]["rows"], tables["events"]["source"]) == (20_000, "sample")
+    assert (tables["tags"]["rows"], tables["tags"]["source"]) == (250, "sample")
+    assert tables["empty"]["rows"] == 0
+    assert not any(t["exact"] for t in tables.values())
+    # The sampled ANALYZE is rolled back
+    assert db.conn.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is None
+
+
+def test_estimates_survive_deletes_and_sparse_keys(db):
+    db.conn.execute("DELETE FROM events WHERE id % 2 = 0")
+    db.conn.execute("INSERT INTO events (id, kind) VALUES (?, 'far')", (2**62,))
+    db.conn.execute("CREATE TABLE sparse (id INTEGER PRIMARY KEY)")
+    db.conn.executemany("INSERT INTO sparse VALUES (?)", [(i,) for i in range(1, 11)] + [(1_700_000_000_000_000,)])
+    db.conn.commit()
+
+    tables = {t["name"]: t for t in db.tables()}
+    assert (tables["events"]["rows"], tables["events"]["source"]) == (10_001, "sample")
+    assert (tables["sparse"]["rows"], tables["sparse"]["exact"]) == (11, False)
+
+
+def test_tables_prefers_analyze_stats_and_exact_on_request(db):
+    db.conn.execute("DELETE FROM events WHERE id % 2 = 0")
+    db.conn.execute("ANALYZE")
+    db.conn.commit()
+
+    estimated = {t["name"]: t for t in db.tables()}
+    exact = {t["name"]: t for t in db.tables(exact=True)}
+    assert (estimated["events"]["rows"], estimated["events"]["source"]) == (10_000, "stat1")
+    assert all(t["exact"] and t["source"] == "count" for t in exact.values())
+    assert {n: t["rows"] for n, t in exact.items()} == {"empty": 0, "events": 10_000, "tags": 250}
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "ndjson"])
+def test_export_formats_round_trip(db, tmp_path, fmt):
+    out = db.export_table("events", fmt, out_path=str(tmp_path / f"events.{fmt}"), chunk_size=999)
+    cols, rows = db.query("SELECT * FROM events")
+    expected = [dict(zip(cols, row)) for row in rows]
+
+    text = open(out).read()
+    if fmt == "json":
+        # Byte-for-byte what the old fetchall() + json.dumps produced
+        assert text == json.dumps(expected, indent=2, default=str)
+    elif fmt == "ndjson":
+        assert [json.loads(line) for line in text.splitlines()] == expected
+    else:
+        with open(out, newline="") as f:
+            parsed = list(csv.reader(f))
+        assert parsed[0] == cols and len(parsed) == len(rows) + 1
+        assert parsed[1] == [str(v) for v in rows[0]]
+
+
+def test_export_empty_table_json(db, tmp_path):
+    out = db.export_table("empty", "json", out_path=str(tmp_path / "empty.json"))
+    assert json.load(open(out)) == []
+
+
+def test_export_memory_stays_flat(db, tmp_path):
+    tracemalloc.start()
+    try:
+        db.export_table("events", "ndjson", out_path=str(tmp_path / "events.ndjson"), chunk_size=1000)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # 20k rows are ~2MB of Python objects; a streamed export holds one chunk
+    assert peak < 1_000_000
+
+
+@pytest.mark.slow
+def test_benchmark_5m_rows(tmp_path):
+    path = tmp_path / "big.db"
+    start = time.perf_counter()
+    make_db(path, BENCH_ROWS)
+    generated = time.perf_counter() - start
+
+    db = SQLiteDB(str(path))
+    db.connect()
+    try:
+        # The sampled ANALYZE reads a bounded slice of each index; a table
+        # without one is counted in full, like COUNT(*)
+        db.query("CREATE INDEX events_kind ON events (kind)")
+        start = time.perf_counter()
+        exact = {t["name"]: t["rows"] for t in db.tables(exact=True)}
+        exact_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        estimated = {t["name"]: t["rows"] for t in db.tables()}
+        estimate_seconds = time.perf_counter() - start
+
+        db.query("ANALYZE")
+        start = time.perf_counter()
+        analyzed = {t["name"]: t["rows"] for t in db.tables()}
+        analyzed_seconds = time.perf_counter() - start
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        db.export_table("events", "ndjson", out_path=str(tmp_path / "events.ndjson"))
+        export_seconds = time.perf_counter() - start
+        rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before  # KiB
+    finally:
+        db.close()
+
+    print(f"\n{BENCH_ROWS:,} rows (generated in {generated:.1f}s): tables ~{estimate_seconds * 1000:.1f}ms, "
+          f"{analyzed_seconds * 1000:.1f}ms analyzed, --exact {exact_seconds * 1000:.0f}ms; "
+          f"ndjson export {export_seconds:.1f}s, peak RSS growth {rss_growth / 1024:.1f}MB")
+    assert analyzed == exact
+    assert {n: r for n, r in estimated.items() if n != "events"} == {"empty": 0, "tags": 250}
+    assert abs(estimated["events"] - BENCH_ROWS) < BENCH_ROWS / 4
+    assert estimate_seconds < exact_seconds / 10
+    assert analyzed_seconds < exact_seconds / 10
+    assert rss_growth < 50 * 1024  # materialising 5M rows would take GBs
@@ -0,0 +1,139 @@
+"""Tests for depgraph's import cache, resolution and cycle detection."""
+import os
+import time
+
+import pytest
+from depgraph import ImportCache, cycle_path, detect_cycles, scan_project, watch
+
+
+def write(root, rel, text=""):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "proj"
+    write(root, "app/__init__.py")
+    write(root, "app/models.py", "from .db import session\nimport json\n")
+    write(root, "app/db.py", "from app.models import Base\n")
+    write(root, "app/views.py", "from app import models\nfrom . import db\n")
+    write(root, "app/node_modules/junk.py", "import app.views\n")
+    write(root, "main.py", "import app.views\nimport requests\n")
+    return root
+
+
+def test_scan_resolves_imports_to_modules(project, tmp_path):
+    graph = scan_project(project, include_external=True, cache=ImportCache(project, tmp_path / "c"))
+
+    assert sorted(graph) == ["app", "app.db", "app.models", "app.views", "main"]
+    assert graph["app.views"]["imports"] == ["app.db", "app.models"]
+    assert graph["app.models"]["imports"] == ["app.db"]
+    assert graph["main"]["imports"] == ["app.views"]
+    # local_deps / external_deps keep their top-level-name form
+    assert graph["main"]["local_deps"] == ["app"]
+    assert graph["main"]["external_deps"] == ["requests"]
+    assert graph["app.models"]["external_deps"] == ["json"]
+
+
+def test_cache_reparses_only_changed_content(project, tmp_path):
+    def scan():
+        cache = ImportCache(project, tmp_path / "c")
+        return scan_project(project, cache=cache), cache
+
+    first, cache = scan()
+    assert cache.parsed == 5 and cache.hits == 0
+
+    second, cache = scan()
+    assert second == first and (cache.parsed, cache.hits) == (0, 5)
+
+    os.utime(project / "main.py")  # touched, same content
+    write(project, "app/db.py", "import app.views\n")
+    third, cache = scan()
+    assert (cache.parsed, cache.rehashed, cache.hits) == (1, 1, 3)
+    assert third["app.db"]["imports"] == ["app.views"]
+
+    (project / "main.py").unlink()
+    fourth, cache = scan()
+    assert "main" not in fourth and "main.py" not in cache.entries
+
+
+def test_detect_cycles_reports_every_group():
+    def node(*imports):
+        return {"local_deps": [], "loc": 1, "imports": list(imports)}
+
+    graph = {
+        "a": node("b"), "b": node("c"), "c": node("a", "d"),
+        "d": node("e"), "e": node("d"),
+        "f": node("a"), "g": node("g"),
+    }
+    cycles = detect_cycles(graph)
+    assert cycles == [["a", "b", "c"], ["d", "e"], ["g"]]
+    assert cycle_path(graph, cycles[0]) == ["a", "b", "c", "a"]
+    assert cycle_path(graph, cycles[2]) == ["g", "g"]
+
+
+def test_detect_cycles_deep_chain_is_iterative():
+    n = 20000
+    graph = {f"m{i}": {"imports": [f"m{i + 1}"]} for i in range(n)}
+    graph[f"m{n}"] = {"imports": ["m0"]}
+    cycles = detect_cycles(graph)
+    assert len(cycles) == 1 and len(cycles[0]) == n + 1
+
+
+def test_watch_reports_changes_and_new_cycles(project, tmp_path, monkeypatch):
+    import depgraph
+    monkeypatch.setattr(depgraph, "CACHE_DIR", tmp_path / "c")
+    sleeps = iter([lambda: None,
+                   lambda: write(project, "app/db.py", "import app.views\n")])
+    monkeypatch.setattr(depgraph.time, "sleep", lambda s: next(sleeps)())
+    out = []
+
+    graph = watch(project, max_updates=1, out=out.append)
+    assert graph["app.db"]["imports"] == ["app.views"]
+    assert any("changed" in line and "app.db" in line for line in out)
+    assert any("new cycle" in line and "app.db" in line for line in out)
+
+
+@pytest.mark.parametrize("args", [["--watch", "--interval"], ["--watch", "--interval", "soon"],
+                                  ["--watch", "--interval", "0"]])
+def test_bad_interval_is_a_usage_error(args, capsys):
+    import depgraph
+    with pytest.raises(SystemExit) as exc:
+        depgraph.main(args)
+    assert exc.value.code == 1
+    assert "--interval needs a positive number of seconds" in capsys.readouterr().out
+
+
+@pytest.mark.slow
+def test_benchmark_unchanged_rescan(tmp_path):
+    root = tmp_path / "big"
+    for p in range(50):
+        write(root, f"pkg{p}/__init__.py")
+        for m in range(100):
+            write(root, f"pkg{p}/mod{m}.py",
+                  f"import os\nfrom pkg{(p + 1) % 50} import mod{m}\nfrom .mod{(m + 1) % 100} import x\n"
+                  + "def f():\n    return 1\n" * 20)
+    past = time.time_ns() - 10**9
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            os.utime(os.path.join(dirpath, name), ns=(past, past))
+
+    start = time.perf_counter()
+    first = scan_project(root, cache=ImportCache(root, tmp_path / "c"))
+    cold = time.perf_counter() - start
+    cache = ImportCache(root, tmp_path / "c")
+    start = time.perf_counter()
+    second = scan_project(root, cache=cache)
+    warm = time.perf_counter() - start
+    start = time.perf_counter()
+    cycles = detect_cycles(second)
+    cycle_seconds = time.perf_counter() - start
+
+    print(f"\n{len(first)} modules: cold scan {cold:.2f}s, cached rescan {warm:.3f}s, "
+          f"cycles {cycle_seconds:.3f}s")
+    assert second == first and cache.parsed == 0
+    assert len(cycles) == 1 and len(cycles[0]) == 5000
+    assert warm < 1
@@ -0,0 +1,102 @@
+"""Tests for the sharded, concurrent e2e suite runner."""
+import json
+import time
+
+import pytest
+from e2e import run_all_tests
+from e2e.run_all_tests import DurationHistory
+
+UNIT_TEST = """import os, time
+
+def test_fast():
+    pass
+
+def test_slow():
+    time.sleep({sleep})
+
+def test_workspace(tmp_path):
+    assert os.environ["TMPDIR"] == os.environ["MYWORK_E2E_WORKSPACE"]
+    assert str(tmp_path).startswith(os.environ["TMPDIR"])
+
+def test_skipped():
+    import pytest
+    pytest.skip("nope")
+"""
+
+SUITE = """import json, os, sys, time
+from pathlib import Path
+time.sleep({sleep})
+Path(os.environ["TMPDIR"], "scratch.txt").write_text("x")  # would collide without isolation
+Path(__file__).with_name(Path(__file__).stem + "_results.json").write_text(json.dumps(
+    {{"summary": {{"total_tests": 2, "passed": 2, "failed": 0, "success_rate": 100.0,
+                  "workspace": os.getcwd()}}}}))
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "tests").mkdir(parents=True)
+    (root / "tools" / "e2e").mkdir(parents=True)
+    for i in range(3):
+        (root / "tests" / f"test_unit{i}.py").write_text(UNIT_TEST.format(sleep=0.2 * i))
+    (root / "tests" / "test_broken.py").write_text("def test_fails():\n    assert 1 == 2\n")
+    for name in ("test_gsd.py", "test_health.py"):
+        (root / "tools" / "e2e" / name).write_text(SUITE.format(sleep=0.3))
+    (root / "tools" / "smoke_test_marketplace.py").write_text(
+        "import sys\nsys.exit('Connection refused')\n")
+    return root
+
+
+def make_runner(project, tmp_path, **kw):
+    return run_all_tests.TestSuiteRunner(str(project), history_dir=str(tmp_path / "history"), **kw)
+
+
+def test_full_run_reports_shards_timings_and_history(project, tmp_path):
+    runner = make_runner(project, tmp_path, workers=4, shards=3)
+    report = runner.run_all_tests()
+
+    pytest_results = report["pytest_results"]
+    assert {k: pytest_results[k] for k in ("total", "passed", "failed", "skipped")} == {
+        "total": 13, "passed": 9, "failed": 1, "skipped": 3}
+    assert [s["tests"] for s in pytest_results["shards"]] == [5, 4, 4]
+    assert pytest_results["slowest_tests"][0]["test"] == "tests/test_unit2.py::test_slow"
+
+    statuses = {r["test"]: r["status"] for r in report["all_results"]}
+    assert statuses == {"pytest": "FAIL", "e2e_test_gsd": "PASS", "e2e_test_health": "PASS",
+                        "e2e_test_marketplace_e2e": "SKIP", "e2e_test_brain_e2e": "SKIP",
+                        "e2e_test_autoforge": "SKIP", "smoke_marketplace": "WARN"}
+    workspaces = {json.loads((project / "tools" / "e2e" / f"{n}_results.json").read_text())
+                  ["summary"]["workspace"] for n in ("test_gsd", "test_health")}
+    assert len(workspaces) == 2 and not any(project.as_posix() in w for w in workspaces)
+
+    assert set(report["timings"]["suites"]) == {"pytest", "e2e_test_gsd", "e2e_test_health",
+                                                "smoke_marketplace"}
+    markdown = next(runner.reports_dir.glob("*.md")).read_text()
+    assert "| e2e_test_gsd |" in markdown and "1. `tests/test_unit2.py::test_slow`" in markdown
+
+    history = DurationHistory(project, tmp_path / "history").durations
+    assert history["tests/test_unit2.py::test_slow"] >= 0.4
+    assert history["tools/e2e/test_gsd.py"] >= 0.3
+
+    # The next run balances on what was recorded: the slow tests land on different shards
+    shards = make_runner(project, tmp_path, shards=3).plan_pytest()
+    slow = [[t for t in tests if t.endswith("test_slow")] for tests, _ in shards]
+    assert sorted(len(s) for s in slow) == [1, 1, 1]
+
+
+@pytest.mark.slow
+def test_benchmark_concurrent_vs_serial(project, tmp_path):
+    for i in range(8):
+        (project / "tests" / f"test_more{i}.py").write_text(
+            "import time\n\ndef test_wait():\n    time.sleep(1)\n")
+
+    def wall(**kw):
+        start = time.perf_counter()
+        make_runner(project, tmp_path, **kw).run_all_tests()
+        return time.perf_counter() - start
+
+    serial = wall(workers=1, shards=1)
+    concurrent = wall(workers=4, shards=4)
+    print(f"\nfull suite: serial {serial:.1f}s, 4 workers {concurrent:.1f}s")
+    assert concurrent < serial * 0.7  # interpreter start-up is CPU bound on small machines
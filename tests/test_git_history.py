@@ -0,0 +1,79 @@
+"""Tests for the single-pass git history miner."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+import git_history
+from git_history import CACHE_FILE, GitHistory
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Ada", "GIT_AUTHOR_EMAIL": "ada@example.com",
+    "GIT_COMMITTER_NAME": "Ada", "GIT_COMMITTER_EMAIL": "ada@example.com",
+}
+
+
+def git(repo, *args):
+    env = {**os.environ, **GIT_ENV}
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    (tmp_path / "a.py").write_text("one\ntwo\n")
+    (tmp_path / "b.py").write_text("x\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-qm", "first")
+    git_history._loaded.clear()
+    return tmp_path
+
+
+def test_mines_numstat_and_renames(repo):
+    git(repo, "mv", "a.py", "c.py")
+    (repo / "b.py").write_text("x\ny\nz\n")
+    (repo / "blob.bin").write_bytes(b"\0\1\2")
+    git(repo, "add", ".")
+    git(repo, "commit", "-qm", "second")
+
+    history = GitHistory.load(repo, use_cache=False)
+    assert len(history) == 2
+    assert history.recent(1)[0][1] == "second"
+    files = {p: (a, d) for p, a, d in history.commit_files(1)}
+    assert files == {"b.py": (2, 0), "blob.bin": (0, 0), "c.py": (0, 0)}
+    assert history.file_counts(30)["b.py"] == 2
+    assert history.churn(30)["a.py"] == 2
+    assert history.author_activity(30) == {"Ada": {"commits": 2, "active_days": 1}}
+
+
+def test_cache_appends_new_commits(repo):
+    first = GitHistory.load(repo)
+    assert (repo / ".git" / CACHE_FILE).exists()
+    status = subprocess.run(["git", "status", "--porcelain"], cwd=repo, capture_output=True, text=True)
+    assert status.stdout == ""  # nothing left in the work tree
+    sha = first.head
+
+    (repo / "b.py").write_text("changed\n")
+    git(repo, "commit", "-qam", "third")
+    git_history._loaded.clear()
+
+    history = GitHistory.load(repo)
+    assert len(history) == 2
+    assert history.shas[0] == sha
+    assert history.subjects == ["first", "third"]
+
+
+def test_rewritten_history_rebuilds(repo):
+    GitHistory.load(repo)
+    git(repo, "commit", "-q", "--amend", "-m", "reworded")
+    git_history._loaded.clear()
+
+    history = GitHistory.load(repo)
+    assert history.subjects == ["reworded"]
+
+
+def test_not_a_repo(tmp_path):
+    assert GitHistory.load(tmp_path) is None
@@ -0,0 +1,115 @@
+"""Tests for the concurrent, cached HealthChecker."""
+import os
+import threading
+import time
+
+import pytest
+from health_check import CheckResult, HealthCache, HealthChecker, Probe, Status
+
+
+def probe(name, seconds=0.0, status=Status.OK, calls=None, block=None, **kwargs):
+    def run(checker, quick):
+        if calls is not None:
+            calls.append((name, time.monotonic()))
+        time.sleep(seconds)
+        if block is not None:
+            block()
+        checker.add_result(CheckResult(name=name, status=status, message=f"{name} {'quick' if quick else 'full'}"))
+    return Probe(name, run, **kwargs)
+
+
+@pytest.fixture
+def checker(tmp_path):
+    return HealthChecker(cache=HealthCache(tmp_path / "cache.json"))
+
+
+def test_probes_run_concurrently_in_declaration_order(checker):
+    # The barrier only opens once all five probes are running at the same time;
+    # run one after another, the first would break it and report an error
+    barrier = threading.Barrier(5, timeout=10)
+    probes = [probe(f"p{i}", block=barrier.wait) for i in range(5)]
+    results = checker.run_probes("full", probes)
+
+    assert [(r.name, r.status) for r in results] == [(f"p{i}", Status.OK) for i in range(5)]
+
+
+def test_dependencies_order_and_skip(checker):
+    calls = []
+    probes = [
+        probe("app", depends=("tool",), calls=calls),
+        probe("tool", seconds=0.2, calls=calls),
+        probe("broken", status=Status.ERROR),
+        probe("needs-broken", depends=("broken",), calls=calls),
+        probe("quick-only", modes=("quick",), calls=calls),
+    ]
+    results = {r.name: r for r in checker.run_probes("full", probes)}
+    started = dict(calls)
+
+    assert started["app"] >= started["tool"] + 0.2
+    assert "needs-broken" not in started and "quick-only" not in started
+    assert results["needs-broken"].status == Status.WARNING
+    assert results["needs-broken"].message == "Skipped — broken check failed"
+
+
+def test_per_probe_timeout(checker):
+    release, finished = threading.Event(), []
+    hang = probe("hang", timeout=0.2, block=lambda: finished.append(release.wait(30)))
+    probes = [hang, probe("after", depends=("hang",)), probe("fast")]
+    try:
+        results = checker.run_probes("full", probes)
+        assert finished == []  # returned without waiting for the hung probe
+    finally:
+        release.set()
+
+    assert [(r.name, r.status, r.message) for r in results] == [
+        ("hang", Status.WARNING, "Timed out after 0.2s"),
+        ("after", Status.WARNING, "Skipped — hang check timed out"),
+        ("fast", Status.OK, "fast full"),
+    ]
+
+
+def test_cache_ttl_inputs_path_and_fresh(tmp_path, monkeypatch):
+    watched = tmp_path / "tool.cfg"
+    watched.write_text("v1")
+    calls = []
+    probes = [probe("slow", calls=calls, ttl=60, watch_path=True, inputs=lambda: [watched])]
+
+    def run(fresh=False):
+        calls.clear()
+        checker = HealthChecker(fresh=fresh, cache=HealthCache(tmp_path / "cache.json"))
+        results = checker.run_probes("full", probes)
+        return [(r.name, r.status, r.message) for r in results], len(calls)
+
+    first = run()
+    assert first[1] == 1
+    assert run() == (first[0], 0)          # served from disk by a new checker
+    assert run(fresh=True)[1] == 1         # --fresh re-runs and refreshes
+
+    watched.write_text("v2 changed")
+    assert run()[1] == 1
+    monkeypatch.setenv("PATH", os.environ["PATH"] + os.pathsep + str(tmp_path))
+    assert run()[1] == 1
+    assert run()[1] == 0
+
+    cache = HealthCache(tmp_path / "cache.json")
+    for entry in cache.entries.values():
+        entry["expires"] = time.time() - 1
+    cache.dirty = True
+    cache.save()
+    assert run()[1] == 1
+
+
+@pytest.mark.slow
+def test_warm_run_of_real_checks(tmp_path):
+    cold_results = HealthChecker(cache=HealthCache(tmp_path / "cache.json")).run_all()
+    warm = HealthChecker(cache=HealthCache(tmp_path / "cache.json"))
+    start = time.perf_counter()
+    warm_results = warm.run_all()
+    warm_seconds = time.perf_counter() - start
+
+    live = {"Git Working Directory", "Disk Space"}  # may change while the suite runs
+    assert [(r.name, r.message) for r in warm_results if r.name not in live] == \
+        [(r.name, r.message) for r in cold_results if r.name not in live]
+    assert all(warm.timings[p] == 0.0 for p in ("Python", "Node.js", "Python Packages", "Security")
+               if p in warm.timings)
+    assert warm_seconds < 0.2
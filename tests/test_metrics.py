@@ -0,0 +1,62 @@
+"""Tests for mw metrics — single-read analysis pipeline."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from metrics import PARALLEL_MIN_FILES, analyze_file, analyze_project, python_complexity
+
+NESTED = '''
+def outer(x):
+    if x:
+        pass
+    def inner(y):
+        for i in y:
+            if i and y or x:
+                pass
+    return inner
+
+class Thing:
+    def method(self):
+        # TODO: tidy up
+        while True:
+            break
+'''
+
+
+def test_nested_functions_count_toward_parent(tmp_path):
+    f = tmp_path / "mod.py"
+    f.write_text(NESTED)
+    cx = python_complexity(str(f))
+    # outer: 1 + if + for + if + 2 (bool op operands) = 6; inner: 5; method: 2
+    assert cx["functions"] == 3
+    assert cx["classes"] == 1
+    assert cx["max_complexity"] == 6
+    assert cx["avg_complexity"] == round((6 + 5 + 2) / 3, 1)
+
+
+def test_analyze_file_single_read(tmp_path):
+    f = tmp_path / "mod.py"
+    f.write_text(NESTED)
+    result = analyze_file(str(f))
+    assert result["total"] == NESTED.count("\n")
+    assert result["blank"] == 2
+    assert result["complexity"]["functions"] == 3
+    assert result["debt"] == [f"{f}:13: TODO"]
+
+
+def test_analyze_file_skips_empty(tmp_path):
+    f = tmp_path / "empty.py"
+    f.write_text("")
+    assert analyze_file(str(f)) is None
+
+
+def test_parallel_matches_serial(tmp_path):
+    for i in range(PARALLEL_MIN_FILES + 10):
+        (tmp_path / f"mod_{i}.py").write_text(NESTED * (i % 3 + 1))
+    (tmp_path / "app.js").write_text("// FIXME later\nconst a = 1;\n")
+
+    serial = analyze_project(str(tmp_path), jobs=1)
+    parallel = analyze_project(str(tmp_path), jobs=2)
+    assert serial == parallel
+    assert serial["file_count"] == PARALLEL_MIN_FILES + 11
+    assert serial["tech_debt_count"] == sum(i % 3 + 1 for i in range(PARALLEL_MIN_FILES + 10)) + 1
@@ -0,0 +1,297 @@
+"""Tests for the pooled, paginated n8n client and bulk export/import, against a fake n8n server."""
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import n8n_api
+import pytest
+from n8n_api import HttpRequestError, N8nClient, export_instance, import_workflows
+
+API_KEY = "test-key"
+WORKFLOWS = 120
+
+
+class FakeN8n(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, workflows=WORKFLOWS, latency=0.005):
+        super().__init__(("127.0.0.1", 0), FakeN8nHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail = None  # callable(method, path) -> bool, answers 500 when true
+        self.workflows = {}
+        self.executions = []
+        for i in range(1, workflows + 1):
+            wf_id = f"w{i}"
+            self.workflows[wf_id] = {
+                "id": wf_id, "name": f"Workflow {i}", "active": i % 2 == 0,
+                "nodes": [{"name": "Start", "type": "n8n-nodes-base.start", "position": [0, 0]}],
+                "connections": {}, "settings": {}, "createdAt": "2025-01-01T00:00:00Z",
+            }
+            for j in range(i % 7):
+                self.executions.append({"id": f"e{i}-{j}", "workflowId": wf_id, "status": "success"})
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class FakeN8nHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.latency)
+            url = urlsplit(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            body = None
+            if self.headers.get("Content-Length"):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if self.headers.get("X-N8N-API-KEY") != API_KEY:
+                return self.send_json(401, {"message": "unauthorized"})
+            if server.fail and server.fail(method, url.path):
+                return self.send_json(500, {"message": "injected failure"})
+            self.route(method, url.path, query, body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def route(self, method, path, query, body):
+        server = self.server
+        if path == "/api/v1/workflows" and method == "GET":
+            items = list(server.workflows.values())
+            if query.get("active") == "true":
+                items = [wf for wf in items if wf["active"]]
+            # Like some n8n versions, omit nodes for a few workflows in listings
+            items = [{k: v for k, v in wf.items() if k != "nodes"} if wf["id"].endswith("0") else wf
+                     for wf in items]
+            return self.send_json(200, self.page(items, query))
+        if path == "/api/v1/workflows" and method == "POST":
+            with server.lock:
+                wf_id = f"w{len(server.workflows) + 1}"
+                server.workflows[wf_id] = dict(body, id=wf_id)
+            return self.send_json(200, server.workflows[wf_id])
+        if path.startswith("/api/v1/workflows/") and method == "GET":
+            wf = server.workflows.get(path.rsplit("/", 1)[1])
+            return self.send_json(200, wf) if wf else self.send_json(404, {"message": "not found"})
+        if path == "/api/v1/executions" and method == "GET":
+            items = [e for e in server.executions
+                     if query.get("workflowId") in (None, e["workflowId"])
+                     and query.get("status") in (None, e["status"])]
+            return self.send_json(200, self.page(items, query))
+        if path.startswith("/api/v1/executions/") and method == "GET":
+            execution_id = path.rsplit("/", 1)[1]
+            execution = next((e for e in server.executions if e["id"] == execution_id), None)
+            if execution is None:
+                return self.send_json(404, {"message": "not found"})
+            if query.get("includeData") == "true":
+                execution = dict(execution, data={"resultData": {"runData": {}}})
+            return self.send_json(200, execution)
+        self.send_json(404, {"message": "not found"})
+
+    @staticmethod
+    def page(items, query):
+        start = int(query.get("cursor", "0"))
+        limit = int(query.get("limit", "100"))
+        end = start + limit
+        return {"data": items[start:end], "nextCursor": str(end) if end < len(items) else None}
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+
+@pytest.fixture
+def server():
+    httpd = FakeN8n()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(params=["httpx", "stdlib"])
+def transport(request, monkeypatch):
+    if request.param == "httpx":
+        pytest.importorskip("httpx")
+    else:
+        monkeypatch.setattr(n8n_api, "_HTTPX_AVAILABLE", False)
+    return request.param
+
+
+def read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_pagination_generator_reuses_one_connection(server, transport):
+    with N8nClient(server.url, API_KEY) as client:
+        workflows = list(client.iter_workflows(page_size=25))
+        active = list(client.iter_workflows(active_only=True, page_size=25))
+
+    assert [wf["id"] for wf in workflows] == list(server.workflows)
+    assert len(active) == WORKFLOWS // 2
+    assert server.requests == 5 + 3
+    assert server.connections == 1
+
+
+def test_module_level_executions_paginate(server, monkeypatch):
+    monkeypatch.setattr(n8n_api, "N8N_API_URL", server.url)
+    monkeypatch.setattr(n8n_api, "N8N_API_KEY", API_KEY)
+
+    first = n8n_api.list_executions(limit=50)
+    assert len(first["data"]) == 50 and first["nextCursor"] == "50"
+    assert [e["id"] for e in n8n_api.iter_executions(page_size=50)] == [e["id"] for e in server.executions]
+    assert len(list(n8n_api.iter_executions(workflow_id="w6"))) == 6
+
+
+def test_export_streams_all_records_with_bounded_concurrency(server, transport, tmp_path):
+    # Executions of a deleted workflow are still exported
+    server.executions.append({"id": "e-deleted", "workflowId": "w-deleted", "status": "error"})
+    with N8nClient(server.url, API_KEY) as client:
+        counts = export_instance(tmp_path, client=client, concurrency=4, page_size=25)
+
+    workflows = read_ndjson(tmp_path / "workflows.ndjson")
+    executions = read_ndjson(tmp_path / "executions.ndjson")
+    assert counts["workflows"] == WORKFLOWS and counts["executions"] == len(server.executions)
+    assert sorted(wf["id"] for wf in workflows) == sorted(server.workflows)
+    assert all("nodes" in wf for wf in workflows)  # listing gaps were filled in
+    assert sorted(e["id"] for e in executions) == sorted(e["id"] for e in server.executions)
+    assert 1 < server.max_in_flight <= 4
+    assert server.connections <= 4
+
+
+def test_export_fetches_execution_data_concurrently(server, tmp_path):
+    server.latency = 0.02
+    with N8nClient(server.url, API_KEY) as client:
+        counts = export_instance(tmp_path, client=client, include_data=True, concurrency=6, page_size=50)
+
+    executions = read_ndjson(tmp_path / "executions.ndjson")
+    assert counts["executions"] == len(server.executions)
+    assert all("data" in e for e in executions)
+    # Concurrency bounds every request, listings included
+    assert server.max_in_flight == 6
+    assert server.connections <= 6
+
+
+def test_export_resumes_after_failure_without_duplicates(server, tmp_path):
+    calls = {"executions": 0}
+
+    def flaky(method, path):
+        if path == "/api/v1/executions":
+            calls["executions"] += 1
+            return calls["executions"] > 40
+        return False
+
+    server.fail = flaky
+    with N8nClient(server.url, API_KEY) as client:
+        with pytest.raises(HttpRequestError):
+            export_instance(tmp_path, client=client, concurrency=4, page_size=5)
+        # Simulate a crash mid-write on top of the failure
+        with open(tmp_path / "executions.ndjson", "a") as f:
+            f.write('{"id": "e1-0", "work')
+        partial = len(read_ndjson(tmp_path / "workflows.ndjson"))
+
+        server.fail = None
+        requests_before = server.requests
+        counts = export_instance(tmp_path, client=client, concurrency=4, page_size=5)
+        resumed_requests = server.requests - requests_before
+
+    executions = read_ndjson(tmp_path / "executions.ndjson")
+    assert partial == WORKFLOWS and counts["workflows"] == 0
+    assert sorted(e["id"] for e in executions) == sorted(e["id"] for e in server.executions)
+    # The workflow chain and finished execution chains were not fetched again
+    assert resumed_requests < WORKFLOWS
+
+
+def test_import_is_bounded_and_resumable(server, transport, tmp_path):
+    with N8nClient(server.url, API_KEY) as client:
+        export_instance(tmp_path, client=client, include_executions=False)
+
+    target = FakeN8n(workflows=0)
+    threading.Thread(target=target.serve_forever, daemon=True).start()
+    created = {"count": 0}
+
+    def flaky(method, path):
+        if method == "POST":
+            created["count"] += 1
+            return created["count"] % 10 == 0
+        return False
+
+    try:
+        target.fail = flaky
+        with N8nClient(target.url, API_KEY) as client:
+            first = import_workflows(tmp_path, client=client, concurrency=4)
+            target.fail = None
+            second = import_workflows(tmp_path, client=client, concurrency=4)
+    finally:
+        target.shutdown()
+        target.server_close()
+
+    assert first["imported"] + len(first["errors"]) == WORKFLOWS and first["errors"]
+    assert second == {"imported": len(first["errors"]), "skipped": first["imported"], "errors": []}
+    assert sorted(wf["name"] for wf in target.workflows.values()) == sorted(
+        wf["name"] for wf in server.workflows.values()
+    )
+    assert all("createdAt" not in wf for wf in target.workflows.values())
+    assert target.max_in_flight <= 4
+
+
+def test_import_records_bad_items_and_continues(server, tmp_path, monkeypatch):
+    with N8nClient(server.url, API_KEY) as client:
+        export_instance(tmp_path, client=client, include_executions=False)
+    with open(tmp_path / "workflows.ndjson", "a") as f:
+        f.write('["not", "a", "workflow"]\n{"id": "broken", "name": \n')
+
+    target = FakeN8n(workflows=0)
+    threading.Thread(target=target.serve_forever, daemon=True).start()
+    original_route = FakeN8nHandler.route
+
+    def route(self, method, path, query, body):
+        if method == "POST" and body["name"] == "Workflow 7":
+            return self.send_json(200, {"message": "created, but no id"})
+        return original_route(self, method, path, query, body)
+
+    monkeypatch.setattr(FakeN8nHandler, "route", route)
+    try:
+        with N8nClient(target.url, API_KEY) as client:
+            result = import_workflows(tmp_path, client=client, concurrency=4)
+    finally:
+        target.shutdown()
+        target.server_close()
+
+    assert result["imported"] == WORKFLOWS - 1
+    errors = sorted(result["errors"], key=lambda e: e.get("line", 0))
+    assert [e.get("line") for e in errors] == [None, WORKFLOWS + 1, WORKFLOWS + 2]
+    assert errors[0]["id"] == "w7" and errors[0]["error"].startswith("KeyError")
@@ -0,0 +1,113 @@
+"""Tests for static, manifest-cached plugin discovery."""
+import os
+import time
+
+import plugin_manager
+import pytest
+from plugin_manager import PluginManifest, discover_plugins, find_plugin, run_plugin
+
+
+def plugin_source(name, description="Does things", marker=None, extra=""):
+    side_effect = f"open({str(marker)!r}, 'a').write('imported\\n')\n" if marker else ""
+    return (f'{side_effect}NAME = "{name}"\nDESCRIPTION = "{description}"\nVERSION = "1.2.0"\n'
+            f'RUNS = []\n{extra}\ndef run(args):\n    RUNS.append(list(args))\n')
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    global_dir, local_dir = tmp_path / "global", tmp_path / "local"
+    global_dir.mkdir()
+    local_dir.mkdir()
+    monkeypatch.setattr(plugin_manager, "GLOBAL_PLUGIN_DIR", global_dir)
+    monkeypatch.setattr(plugin_manager, "LOCAL_PLUGIN_DIR", local_dir)
+    monkeypatch.setattr(plugin_manager, "PLUGIN_REGISTRY", global_dir / "registry.json")
+    monkeypatch.setattr(plugin_manager, "_LOADED", {})
+    return global_dir, local_dir
+
+
+def test_discovery_reads_metadata_without_importing(dirs, tmp_path):
+    global_dir, local_dir = dirs
+    marker = tmp_path / "imported.txt"
+    (global_dir / "deploy.py").write_text(plugin_source("deploy", marker=marker))
+    (local_dir / "lint.py").write_text(plugin_source("lint", "Local lint"))
+    (global_dir / "broken.py").write_text("NAME = 'broken'\ndef run(:\n")
+    (global_dir / "_helper.py").write_text("raise SystemExit")
+
+    plugins = discover_plugins()
+    assert not marker.exists()
+    assert plugins["deploy"] == {"name": "deploy", "description": "Does things", "version": "1.2.0",
+                                 "author": "", "path": str(global_dir / "deploy.py"), "source": "global"}
+    assert plugins["lint"]["source"] == "local"
+    assert plugins["broken"]["source"] == "error"
+    assert plugins["broken"]["description"].startswith("⚠️ Error loading:")
+
+
+def test_run_imports_only_the_invoked_plugin_once(dirs, tmp_path):
+    global_dir, _ = dirs
+    markers = [tmp_path / f"m{i}.txt" for i in range(3)]
+    for i, marker in enumerate(markers):
+        (global_dir / f"p{i}.py").write_text(plugin_source(f"p{i}", marker=marker))
+
+    assert run_plugin("p1", ["a"]) and run_plugin("p1", ["b"])
+    assert [m.exists() for m in markers] == [False, True, False]
+    assert markers[1].read_text() == "imported\n"
+    assert plugin_manager._LOADED[str(global_dir / "p1.py")].RUNS == [["a"], ["b"]]
+    assert run_plugin("missing", []) is False
+
+
+def test_manifest_rereads_only_changed_files(dirs, monkeypatch):
+    global_dir, _ = dirs
+    for i in range(3):
+        (global_dir / f"p{i}.py").write_text(plugin_source(f"p{i}"))
+    parsed = []
+    real = plugin_manager.read_metadata
+    monkeypatch.setattr(plugin_manager, "read_metadata", lambda p: parsed.append(os.path.basename(p)) or real(p))
+
+    discover_plugins()
+    assert sorted(parsed) == ["p0.py", "p1.py", "p2.py"]
+    parsed.clear()
+    discover_plugins()
+    assert parsed == []
+
+    os.utime(global_dir / "p0.py", ns=(1, 1))  # same bytes, new mtime: hash only
+    (global_dir / "p1.py").write_text(plugin_source("p1", "Changed"))
+    assert discover_plugins()["p1"]["description"] == "Changed"
+    assert parsed == ["p1.py"]
+    assert len(PluginManifest().entries) == 3
+
+
+def test_lookup_falls_back_when_file_is_not_named_after_plugin(dirs, tmp_path):
+    global_dir, local_dir = dirs
+    (global_dir / "tool.py").write_text(plugin_source("tool", "global"))
+    (local_dir / "tool.py").write_text(plugin_source("tool", "local"))
+    (global_dir / "misc.py").write_text(plugin_source("renamed"))
+    (global_dir / "dyn.py").write_text(
+        'import os\nNAME = "dyn"\nDESCRIPTION = os.path.join("computed", "desc")\n')
+
+    assert find_plugin("tool")["description"] == "local"
+    assert find_plugin("renamed")["path"] == str(global_dir / "misc.py")
+    assert find_plugin("dyn")["description"] == os.path.join("computed", "desc")
+
+
+@pytest.mark.slow
+def test_benchmark_dispatch_independent_of_plugin_count(dirs):
+    global_dir, _ = dirs
+    body = "\n".join(f"def helper_{i}(x):\n    return [x] * {i}\n" for i in range(200))
+
+    def dispatch_time(count):
+        for i in range(count):
+            path = global_dir / f"p{i}.py"
+            if not path.exists():
+                path.write_text(plugin_source(f"p{i}", extra=body))
+        find_plugin("p0")  # warm the manifest
+        times = []
+        for _ in range(20):
+            plugin_manager._LOADED.clear()
+            start = time.perf_counter()
+            run_plugin("p0", [])
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    few, many = dispatch_time(5), dispatch_time(500)
+    print(f"\ndispatch: 5 plugins {few * 1000:.2f}ms, 500 plugins {many * 1000:.2f}ms")
+    assert many < few * 3
@@ -0,0 +1,164 @@
+"""Property tests: the indexed ProductLifecycleSimulator agrees with full scans."""
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "simulation"))
+from product_simulator import (
+    OrderStatus,
+    ProductLifecycleSimulator,
+    ProductStatus,
+    ProductType,
+    ReviewStatus,
+    WebhookEventType,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_random():
+    state = random.getstate()
+    yield
+    random.setstate(state)
+
+
+def scan_metrics(sim, product_id):
+    """get_product_metrics' breakdowns computed the old way, by scanning everything"""
+    orders = [o for o in sim.orders.values() if o.product_id == product_id]
+    reviews = [r for r in sim.reviews.values() if r.product_id == product_id]
+    return ({s.value: sum(1 for o in orders if o.status == s) for s in OrderStatus},
+            {s.value: sum(1 for r in reviews if r.status == s) for s in ReviewStatus})
+
+
+def scan_dashboard(sim, seller_id):
+    products = [p for p in sim.products.values() if p.seller_id == seller_id]
+    if not products:
+        return None
+    return {
+        "total_products": len(products),
+        "active_products": sum(1 for p in products if p.status == ProductStatus.ACTIVE),
+        "total_revenue": round(sum(p.total_revenue for p in products), 2),
+        "status": {s.value: sum(1 for p in products if p.status == s) for s in ProductStatus},
+        "type": {t.value: sum(1 for p in products if p.product_type == t) for t in ProductType},
+        "top": [p.product_id for p in sorted(products, key=lambda x: x.total_revenue, reverse=True)[:5]],
+    }
+
+
+def scan_system(sim):
+    approved = [r.rating for r in sim.reviews.values() if r.status == ReviewStatus.APPROVED]
+    return {
+        "products": {s.value: sum(1 for p in sim.products.values() if p.status == s) for s in ProductStatus},
+        "types": {t.value: sum(1 for p in sim.products.values() if p.product_type == t) for t in ProductType},
+        "orders": {s.value: sum(1 for o in sim.orders.values() if o.status == s) for s in OrderStatus},
+        "reviews": {s.value: sum(1 for r in sim.reviews.values() if r.status == s) for s in ReviewStatus},
+        "average_rating": round(sum(approved) / max(1, len(approved)), 2),
+        "webhooks": {t.value: sum(1 for w in sim.webhook_events if w.event_type == t) for t in WebhookEventType},
+    }
+
+
+def random_lifecycle(sim, rng, steps):
+    """Random, often invalid, calls against random entities"""
+    sellers = [f"seller_{i}" for i in range(4)]
+    buyers = [f"buyer_{i}" for i in range(6)]
+    for _ in range(steps):
+        products, orders, reviews = list(sim.products), list(sim.orders), list(sim.reviews)
+        action = rng.randrange(11)
+        if action == 0 or not products:
+            sim.generate_realistic_product(rng.choice(sellers), rng.choice(list(ProductType)))
+        elif action == 1:
+            sim.submit_for_review(rng.choice(products))
+        elif action == 2:
+            sim.review_product(rng.choice(products), approve=rng.random() < 0.8)
+        elif action == 3:
+            sim.activate_product(rng.choice(products))
+            sim.simulate_product_view(rng.choice(products))
+        elif action == 4:
+            sim.create_order(rng.choice(buyers), rng.choice(products))
+        elif action == 5 and orders:
+            sim.simulate_payment_success(rng.choice(orders))
+        elif action == 6 and orders:
+            sim.simulate_delivery(rng.choice(orders))
+        elif action == 7 and orders:
+            order = sim.orders[rng.choice(orders)]
+            sim.create_review(order.buyer_id, order.order_id, rng.randint(0, 5), "t", "c")
+        elif action == 8 and reviews:
+            sim.moderate_review(rng.choice(reviews), approve=rng.random() < 0.7)
+        elif action == 9 and orders:
+            sim.process_refund(rng.choice(orders), "reason")
+        elif action == 10:
+            sim.simulate_full_lifecycle(rng.choice(sellers), rng.choice(buyers))
+            sim.simulate_subscription_events(rng.choice(buyers), rng.choice(products))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_indexed_queries_match_full_scans(seed):
+    rng = random.Random(seed)
+    random.seed(seed)  # the simulator's own choices
+    sim = ProductLifecycleSimulator()
+    random_lifecycle(sim, rng, rng.randint(20, 300))
+
+    for product_id in sim.products:
+        metrics = sim.get_product_metrics(product_id)
+        assert (metrics["order_breakdown"], metrics["review_breakdown"]) == scan_metrics(sim, product_id)
+
+    for seller_id in [f"seller_{i}" for i in range(5)]:
+        dashboard = sim.get_seller_dashboard(seller_id)
+        expected = scan_dashboard(sim, seller_id)
+        if expected is None:
+            assert dashboard == {"seller_id": seller_id, "error": "No products found"}
+            continue
+        summary = dashboard["summary"]
+        assert {
+            "total_products": summary["total_products"],
+            "active_products": summary["active_products"],
+            "total_revenue": summary["total_revenue"],
+            "status": dashboard["product_status_breakdown"],
+            "type": dashboard["product_type_breakdown"],
+            "top": [p["product_id"] for p in dashboard["top_products"]],
+        } == expected
+
+    stats = sim.get_system_stats()
+    assert {
+        "products": stats["products"]["by_status"],
+        "types": stats["products"]["by_type"],
+        "orders": stats["orders"]["by_status"],
+        "reviews": stats["reviews"]["by_status"],
+        "average_rating": stats["reviews"]["average_rating"],
+        "webhooks": stats["webhooks"]["by_type"],
+    } == scan_system(sim)
+
+
+def test_unknown_ids_do_not_create_index_entries():
+    sim = ProductLifecycleSimulator()
+    assert sim.get_product_metrics("missing") is None
+    assert sim.get_seller_dashboard("nobody")["error"] == "No products found"
+    product = sim.generate_realistic_product("seller", ProductType.DIGITAL)
+    assert sim.get_product_metrics(product.product_id)["order_breakdown"]["pending"] == 0
+    assert dict(sim._products_by_seller) == {"seller": [product.product_id]}
+
+
+@pytest.mark.slow
+def test_benchmark_metrics_at_marketplace_scale():
+    random.seed(3)
+    sim = ProductLifecycleSimulator()
+    sellers = [f"seller_{i}" for i in range(200)]
+    for i in range(20000):
+        sim.simulate_full_lifecycle(sellers[i % len(sellers)], f"buyer_{i % 977}", ProductType.DIGITAL)
+    product_ids = list(sim.products)[:200]
+
+    start = time.perf_counter()
+    indexed = [sim.get_product_metrics(pid)["order_breakdown"] for pid in product_ids]
+    dashboards = [sim.get_seller_dashboard(s)["product_status_breakdown"] for s in sellers]
+    fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [scan_metrics(sim, pid)[0] for pid in product_ids]
+    scanned_dashboards = [scan_dashboard(sim, s)["status"] for s in sellers]
+    slow = time.perf_counter() - start
+
+    print(f"\n{len(sim.products)} products, {len(sim.orders)} orders: "
+          f"indexed {fast * 1000:.1f}ms, scans {slow * 1000:.0f}ms")
+    assert indexed == scanned and dashboards == scanned_dashboards
+    assert fast < slow / 10
@@ -0,0 +1,106 @@
+"""Tests for the concurrent, cached quality gate runner."""
+import json
+import sys
+import time
+
+import quality_gate
+from quality_gate import CheckCache, GateCheck, _run_check, run_gate
+
+
+def sleeper(seconds, ok=True, spans=None):
+    """A check running a sleeping subprocess; spans collects its (start, end)."""
+    def check(project):
+        start = time.perf_counter()
+        code = f"import time, sys; time.sleep({seconds}); sys.exit({0 if ok else 1})"
+        passed, output, dur = _run_check("sleep", [sys.executable, "-c", code])
+        if spans is not None:
+            spans.append((start, time.perf_counter()))
+        return f"sleep {seconds}", passed, output, dur
+    return check
+
+
+def test_checks_overlap_and_keep_order():
+    delays = {"Lint": 0.2, "Test": 0.6, "Types": 0.4, "Security": 0.1, "Git": 0.3}
+    spans, streamed = [], []
+    checks = [GateCheck(name, sleeper(d, spans=spans)) for name, d in delays.items()]
+
+    results = run_gate({}, checks, on_result=lambda r: streamed.append(r["check"]))
+
+    assert [r["check"] for r in results] == streamed == list(delays)
+    assert all(r["passed"] for r in results)
+    # Every check had started before the first one finished
+    assert max(start for start, _ in spans) < min(end for _, end in spans)
+
+
+def test_jobs_limit_serialises():
+    spans = []
+    run_gate({}, [GateCheck(f"c{i}", sleeper(0.1, spans=spans)) for i in range(3)], jobs=1)
+    spans.sort()
+    assert all(end <= next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+
+
+def test_blocking_failure_cancels_running_checks():
+    checks = [
+        GateCheck("Lint", sleeper(0.1, ok=False)),
+        GateCheck("Slow", sleeper(10)),
+        GateCheck("Test", sleeper(0.2, ok=False), blocking=True),
+        GateCheck("Types", sleeper(10)),
+    ]
+    results = run_gate({}, checks, jobs=2)
+
+    assert [r["passed"] for r in results] == [False, None, False, None]
+    # "Slow" was already running: _run_check only reports Cancelled after killing it
+    assert results[1]["detail"] == results[3]["detail"] == "Cancelled"
+
+    # A non-blocking failure never cancels anything
+    results = run_gate({}, checks[:1] + [GateCheck("Quick", sleeper(0.3))])
+    assert [r["passed"] for r in results] == [False, True]
+
+
+def test_passing_results_cached_on_file_content(tmp_path):
+    project = tmp_path / "proj"
+    (project / "pkg").mkdir(parents=True)
+    (project / "pkg" / "mod.py").write_text("x = 1\n")
+    (project / "node_modules").mkdir()
+    calls = []
+
+    def counted(name, ok=True):
+        def check(p):
+            calls.append(name)
+            return name.lower(), ok, f"{name} output", 0.5
+        return check
+
+    checks = [
+        GateCheck("Lint", counted("Lint"), cacheable=True),
+        GateCheck("Types", counted("Types", ok=False), cacheable=True),
+        GateCheck("Git", counted("Git")),
+    ]
+
+    def gate():
+        calls.clear()
+        cache = CheckCache(str(project), cache_dir=tmp_path / "cache")
+        return run_gate({"path": str(project)}, checks, cache=cache)
+
+    first = gate()
+    assert sorted(calls) == ["Git", "Lint", "Types"] and not any(r["cached"] for r in first)
+
+    second = gate()
+    assert sorted(calls) == ["Git", "Types"]  # failures and uncacheable checks re-run
+    assert second[0] == {"check": "Lint", "cached": True, "tool": "lint", "passed": True,
+                         "detail": "Lint output", "duration": 0.0}
+
+    (project / "node_modules" / "dep.js").write_text("ignored")
+    gate()
+    assert "Lint" not in calls
+
+    (project / "pkg" / "mod.py").write_text("x = 2\n")
+    gate()
+    assert "Lint" in calls
+
+
+def test_cmd_check_json_order(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(quality_gate, "CACHE_DIR", tmp_path / "cache")
+    assert quality_gate.cmd_check([str(tmp_path), "--json", "-j", "2"]) == 0
+    out = capsys.readouterr().out
+    report = json.loads(out[out.index("{"):])
+    assert [c["check"] for c in report["checks"]] == ["Lint", "Test", "Types", "Security", "Git"]
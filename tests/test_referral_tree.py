@@ -0,0 +1,200 @@
+"""Tests for the array-backed referral tree engine."""
+import random
+import sys
+from collections import deque
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "simulation"))
+from mlm_simulator import MLMSimulator
+from referral_tree import ReferralTree
+
+
+def brute_force_levels(mlm, user_id, max_levels):
+    """Level-by-level BFS over the dataclass tree."""
+    counts = [0] * (max_levels + 1)
+    queue = deque([(user_id, 0)])
+    while queue:
+        current, level = queue.popleft()
+        counts[level] += 1
+        for child in mlm.referral_tree[current].children:
+            queue.append((child, level + 1))
+    return counts[1:]
+
+
+def test_counters_match_bfs():
+    rng = random.Random(7)
+    mlm = MLMSimulator()
+    codes = []
+    for i in range(400):
+        referrer = rng.choice(codes) if codes and rng.random() < 0.9 else None
+        ok, code = mlm.add_user(f"user_{i}", referrer)
+        if ok:
+            codes.append(code)
+
+    for user_id, node in mlm.referral_tree.items():
+        levels = brute_force_levels(mlm, user_id, mlm.max_levels)
+        stats = mlm.get_referral_stats(user_id)
+        assert node.total_referrals == sum(levels)
+        assert [stats["level_breakdown"][f"level_{k}"] for k in range(1, 6)] == levels
+
+
+def test_add_many_matches_add():
+    parents = [-1, 0, 0, 1, 3, -1, 5, 4, 2]
+    one_by_one = ReferralTree()
+    for parent in parents:
+        one_by_one.add(parent)
+    bulk = ReferralTree()
+    assert list(bulk.add_many(parents)) == list(range(len(parents)))
+
+    assert bulk.total == one_by_one.total
+    assert bulk.direct == one_by_one.direct
+    assert bulk.level_counts == one_by_one.level_counts
+    assert bulk.total[0] == 6
+    assert bulk.level_count(0, 3) == 1
+
+
+def test_depth_limit():
+    tree = ReferralTree(max_levels=2)
+    node = tree.add()
+    node = tree.add(node)
+    node = tree.add(node)
+    with pytest.raises(ValueError):
+        tree.add(node)
+    with pytest.raises(ValueError):
+        tree.add_many([node])
+    assert len(tree) == 3
+
+
+@pytest.mark.parametrize("batch", [[0, 1, 5], [1, 2, 3, 4]], ids=["missing-parent", "too-deep"])
+def test_failed_add_many_leaves_tree_unchanged(batch):
+    tree = ReferralTree(max_levels=3)
+    tree.add_many([-1, 0])
+    before = [list(tree.parent), list(tree.depth), list(tree.total), list(tree.direct)]
+
+    with pytest.raises(ValueError):
+        tree.add_many(batch)
+    assert [list(tree.parent), list(tree.depth), list(tree.total), list(tree.direct)] == before
+    assert tree.depth[tree.add(0)] == 1
+
+
+def test_pay_skips_inactive_without_shifting_levels():
+    tree = ReferralTree()
+    a = tree.add()
+    b = tree.add(a)
+    c = tree.add(b)
+    tree.active[b] = 0
+    paid = tree.pay(c, 100.0)
+    assert paid == [(a, 2, pytest.approx(10.0))]
+    assert tree.earned[a] == pytest.approx(10.0)
+
+
+def test_random_tree_respects_depth():
+    tree = ReferralTree.random_tree(5000, seed=1)
+    assert len(tree) == 5000
+    assert max(tree.depth) <= tree.max_levels
+    assert sum(tree.total[i] for i in range(len(tree)) if tree.parent[i] < 0) == 5000 - 10
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def numpy_mode(request, monkeypatch):
+    import mlm_simulator
+    import referral_tree
+    if request.param == "pure":
+        monkeypatch.setattr(referral_tree, "np", None)
+        monkeypatch.setattr(mlm_simulator, "np", None)
+    elif referral_tree.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def test_pay_many_matches_pay(numpy_mode):
+    tree = ReferralTree.random_tree(3000, seed=3)
+    tree.active[5] = 0
+    reference = ReferralTree.random_tree(3000, seed=3)
+    reference.active[5] = 0
+    rng = random.Random(4)
+    buyers = [rng.randrange(len(tree)) for _ in range(2000)]
+    amounts = [rng.choice([10.0, 49.99, 100.0]) for _ in buyers]
+
+    expected = []
+    for sale, (buyer, amount) in enumerate(zip(buyers, amounts)):
+        expected.extend((sale, node, level, c) for node, level, c in reference.pay(buyer, amount))
+
+    columns = tree.pay_many(buyers, amounts)
+    rows = list(zip(*(list(col) for col in columns)))
+    assert [r[:3] for r in rows] == [e[:3] for e in expected]
+    assert [r[3] for r in rows] == pytest.approx([e[3] for e in expected])
+    assert list(tree.earned) == pytest.approx(list(reference.earned))
+
+
+def test_process_sales_matches_process_sale(numpy_mode):
+    def build():
+        mlm = MLMSimulator()
+        codes = []
+        for i in range(60):
+            ok, code = mlm.add_user(f"u{i}", codes[(i * 7) % len(codes)] if codes else None)
+            if ok:
+                codes.append(code)
+        return mlm
+
+    sales = [(f"u{i % 60}", 20.0 + i % 5, f"p{i % 3}") for i in range(300)] + [("ghost", 5.0, "p0")]
+    one_by_one, batched = build(), build()
+    for buyer, amount, product in sales:
+        one_by_one.process_sale(buyer, amount, product)
+    result = batched.process_sales(*zip(*sales))
+
+    assert result["processed"] == 300 and result["skipped"] == 1
+    assert len(batched.sales_log) == 300
+    for user_id, node in one_by_one.referral_tree.items():
+        assert batched.referral_tree[user_id].total_commission_earned == pytest.approx(
+            node.total_commission_earned)
+    expected = one_by_one.generate_mlm_report()
+    report = batched.generate_mlm_report()
+    assert report["overview"]["total_commissions_paid"] == expected["overview"]["total_commissions_paid"]
+    assert report["overview"]["total_sales_volume"] == expected["overview"]["total_sales_volume"]
+    assert report["performance"]["commission_by_level"] == expected["performance"]["commission_by_level"]
+
+
+def test_process_sales_follows_activity_toggles(numpy_mode):
+    mlm = MLMSimulator()
+    _, code = mlm.add_user("root")
+    _, code = mlm.add_user("mid", code)
+    mlm.add_user("leaf", code)
+
+    mlm.referral_tree["mid"].is_active = False
+    assert list(mlm.tree.active) == [1, 0, 1]
+    mlm.process_sales(["leaf"], [100.0], ["p"])
+    assert mlm.referral_tree["mid"].total_commission_earned == 0
+    root_before = mlm.referral_tree["root"].total_commission_earned
+    assert root_before > 0
+
+    mlm.referral_tree["mid"].is_active = True
+    mlm.process_sales(["leaf"], [100.0], ["p"])
+    assert mlm.referral_tree["mid"].total_commission_earned > 0
+    assert mlm.referral_tree["root"].total_commission_earned == pytest.approx(2 * root_before)
+    assert "_active_slot" not in asdict(mlm.referral_tree["mid"])
+
+
+def test_credit_engine_bulk_commissions():
+    from credit_engine import CreditEngine
+
+    engine = CreditEngine(max_balance=1000.0)
+    for user_id in ("a", "b", "c"):
+        engine.create_user_balance(user_id, 10.0)
+    engine.freeze_account("c")
+
+    result = engine.earn_commissions(
+        ["a", "b", "a", "c", "missing", "b", "a"],
+        [5.0, 2.5, 5.0, 1.0, 3.0, 995.0, 0.001],
+        levels=[1, 2, 1, 1, 1, 3, 1],
+    )
+    assert result == {"applied": 2, "rejected": 5, "users_credited": 1, "total_amount": 10.0}
+    assert engine.get_balance("a") == 20.0
+    assert engine.get_balance("b") == 10.0  # 997.5 + 10 would exceed max_balance
+    assert engine.commission_log.column("user") == ["a", "a"]
+    report = engine.generate_system_report()
+    assert report["transaction_stats"]["transactions_by_type"]["commission"] == 2
+    assert report["recent_volume"]["volume_by_type"]["commission"]["volume"] == 10.0
@@ -0,0 +1,109 @@
+"""Tests for the parallel scenario runner and ColumnarLog spilling."""
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "simulation"))
+from event_log import STR, ColumnarLog
+from run_simulation import SimulationOrchestrator
+from scenario_runner import make_sweep, run_scenario, run_sweep
+
+
+def test_spill_appends_and_load_reads_back(tmp_path):
+    log = ColumnarLog(kind=STR, amount="d")
+    log.append(kind="a", amount=1.0)
+    log.append(kind="b", amount=2.0)
+    assert log.spill(tmp_path) == 2 and len(log) == 0
+    log.append(kind="b", amount=3.0)
+    log.append(kind="c\nd", amount=4.0)
+    assert log.spill(tmp_path) == 2
+
+    loaded = ColumnarLog.load(tmp_path)
+    assert list(loaded.rows()) == [{"kind": "a", "amount": 1.0}, {"kind": "b", "amount": 2.0},
+                                   {"kind": "b", "amount": 3.0}, {"kind": "c\nd", "amount": 4.0}]
+    assert loaded.values["kind"] == ["a", "b", "c\nd"]
+
+
+def test_sweep_names_and_seeds():
+    sweep = make_sweep(2, {"target_users": [10, 20]}, base_seed=7)
+    assert [s.name for s in sweep] == ["target_users=10,r0", "target_users=10,r1",
+                                       "target_users=20,r0", "target_users=20,r1"]
+    assert sweep[2].params == {"target_users": 20}
+    assert make_sweep(2, {"target_users": [10, 20]}, base_seed=7) == sweep
+    assert len({s.seed for s in sweep + make_sweep(2, {"target_users": [10, 20]})}) == 8
+    with pytest.raises(ValueError):
+        make_sweep(1, {"scenarios_passed": [1]})
+
+
+def test_parallel_results_match_serial(tmp_path):
+    scenarios = make_sweep(3, {"target_users": [12, 30]})
+    state, uuid4 = random.getstate(), uuid.uuid4
+
+    serial = run_sweep(scenarios, workers=1, log_dir=str(tmp_path / "serial"))
+    parallel = run_sweep(scenarios[::-1], workers=3, log_dir=str(tmp_path / "parallel"))
+    assert (random.getstate(), uuid.uuid4) == (state, uuid4)
+
+    def key(result):
+        return result["name"], result["stats"]
+
+    assert [key(r) for r in serial["scenarios"]] == [key(r) for r in parallel["scenarios"][::-1]]
+    assert serial["merged"] == parallel["merged"]
+    assert serial["merged"]["users"]["total"] == 3 * 12 + 3 * 30
+    assert len({r["stats"]["revenue"] for r in serial["scenarios"]}) > 1  # seeds differ
+
+    for result in serial["scenarios"]:
+        name = result["name"]
+        serial_log = ColumnarLog.load(tmp_path / "serial" / name)
+        assert len(serial_log) == result["stats"]["events"]
+        assert list(serial_log.rows()) == list(ColumnarLog.load(tmp_path / "parallel" / name).rows())
+    phases = [phase for phase, _ in SimulationOrchestrator().scenarios()]
+    assert set(serial_log.column("phase")) <= set(phases)
+
+    # A scenario run on its own in this process matches its run inside the sweep
+    alone = run_scenario(scenarios[4])
+    assert alone["stats"] == serial["scenarios"][4]["stats"] and alone["log"] is None
+
+
+def test_rerun_replaces_previous_logs(tmp_path):
+    first = make_sweep(1, {"target_users": [12]}, base_seed=1)[0]
+    rerun = make_sweep(1, {"target_users": [12]}, base_seed=2)[0]
+    assert first.name == rerun.name and first.seed != rerun.seed
+
+    run_scenario(first, str(tmp_path))
+    result = run_scenario(rerun, str(tmp_path))
+    log = ColumnarLog.load(tmp_path / rerun.name)
+    assert len(log) == result["stats"]["events"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [rerun.name]
+
+    alone = tmp_path / "alone"
+    run_scenario(rerun, str(alone))
+    assert list(log.rows()) == list(ColumnarLog.load(alone / rerun.name).rows())
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+def test_benchmark_hundred_scenario_sweep():
+    scenarios = make_sweep(100, {"target_users": [200], "target_purchases": [300]})
+    cores = os.cpu_count() or 1
+    workers = min(cores, 8)
+
+    def wall(n):
+        start = time.perf_counter()
+        sweep = run_sweep(scenarios, workers=n)
+        return time.perf_counter() - start, sweep
+
+    serial, serial_sweep = wall(1)
+    parallel, parallel_sweep = wall(max(workers, 2))
+    print(f"\n100 scenarios: 1 worker {serial:.2f}s, {max(workers, 2)} workers {parallel:.2f}s "
+          f"({cores} cores)")
+    assert [r["stats"] for r in serial_sweep["scenarios"]] == \
+        [r["stats"] for r in parallel_sweep["scenarios"]]
+    if workers == 1:
+        assert parallel < serial * 1.25  # no cores to scale onto; pool overhead stays small
+    else:
+        assert parallel < serial / workers * 1.5
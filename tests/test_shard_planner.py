@@ -0,0 +1,151 @@
+"""Tests for the duration-aware shard planner and mw test --all."""
+import os
+import time
+
+import mw
+import pytest
+from shard_planner import (
+    DurationHistory,
+    Suite,
+    SuiteScheduler,
+    balance_shards,
+    parse_pytest_output,
+    prioritize,
+)
+
+PYTEST = ["pytest"]
+
+
+def write_project(root, name, tests):
+    """A pytest project with one file per (file name -> {test name: body})"""
+    project = root / name
+    (project / "tests").mkdir(parents=True)
+    for file_name, bodies in tests.items():
+        (project / "tests" / file_name).write_text("import time\n\n" + "".join(
+            f"def {test}():\n    {body}\n\n" for test, body in bodies.items()))
+    return project
+
+
+def test_balance_shards_uses_history():
+    tests = ["a", "b", "c", "d", "e", "f"]
+    shards = balance_shards(tests, {"a": 5.0, "b": 4.0, "c": 3.0, "d": 2.0, "e": 1.0}, 2)
+    # f has no history and is assumed to take the mean, 3s
+    assert shards == [(["a", "e", "f"], 9.0), (["b", "c", "d"], 9.0)]
+    assert [len(t) for t, _ in balance_shards(tests, {}, 4)] == [2, 2, 1, 1]
+    assert balance_shards(["x"], {}, 8) == [(["x"], 1.0)]
+    assert balance_shards([], {}, 3) == []
+
+
+def test_parse_pytest_output():
+    statuses, durations = parse_pytest_output(
+        "tests/t.py::test_a PASSED                                   [ 33%]\n"
+        "tests/t.py::test_a ERROR                                    [ 33%]\n"
+        "tests/t.py::test_b[x y] SKIPPED (why)                       [ 66%]\n"
+        "tests/t.py::TestC::test_c FAILED                            [100%]\n"
+        "============================= slowest durations =============================\n"
+        "0.50s call     tests/t.py::test_a\n"
+        "0.25s setup    tests/t.py::test_a\n"
+        "0.00s teardown tests/t.py::TestC::test_c\n"
+        "FAILED tests/t.py::TestC::test_c - assert 1 == 2\n")
+    assert statuses == {"tests/t.py::test_a": "ERROR", "tests/t.py::test_b[x y]": "SKIPPED",
+                        "tests/t.py::TestC::test_c": "FAILED"}
+    assert durations == {"tests/t.py::test_a": 0.75, "tests/t.py::TestC::test_c": 0.0}
+
+
+def test_prioritize_failed_then_changed():
+    tests = ["a.py::x", "b.py::y", "c.py::z", "a.py::w"]
+    assert prioritize(tests, failed={"c.py::z"}, changed={"a.py"}) == [
+        "c.py::z", "a.py::x", "a.py::w", "b.py::y"]
+
+
+def test_suites_merge_in_order_and_slow_ones_shard(tmp_path):
+    slow = write_project(tmp_path, "slow", {
+        f"test_s{i}.py": {"test_sleep": "time.sleep(0.1)", "test_quick": "pass"} for i in range(4)})
+    (slow / "tests" / "test_s3.py").write_text(
+        (slow / "tests" / "test_s3.py").read_text() + "def test_broken():\n    assert False\n")
+    quick = write_project(tmp_path, "quick", {"test_q.py": {"test_ok": "pass"}})
+    suites = [Suite("slow", slow, pytest=PYTEST), Suite("shell", tmp_path, command="echo hi; exit 3"),
+              Suite("quick", quick, pytest=PYTEST)]
+
+    def run():
+        return SuiteScheduler(suites, workers=4, history_dir=tmp_path / "history",
+                              shard_seconds=0.15).run()
+
+    first = run()
+    assert [(r["name"], r["shards"], r["returncode"]) for r in first] == [
+        ("slow", 1, 1), ("shell", 1, 3), ("quick", 1, 0)]
+    assert first[0]["counts"] == {"passed": 8, "failed": 1, "skipped": 0}
+    assert first[0]["failed_tests"] == ["tests/test_s3.py::test_broken"]
+    assert first[1]["counts"] is None and first[1]["output"] == "hi\n"
+    history = DurationHistory(slow, tmp_path / "history")
+    assert history.failed == {"tests/test_s3.py::test_broken"}
+    assert history.durations["tests/test_s0.py::test_sleep"] >= 0.1
+
+    # The slow suite now shards; the failing test runs first in its shard
+    second = run()
+    assert [r["shards"] for r in second] == [3, 1, 1]
+    assert second[0]["counts"] == first[0]["counts"]
+    shard = next(out for out in second[0]["output"].split("test session starts") if "test_broken" in out)
+    assert list(parse_pytest_output(shard)[0])[0] == "tests/test_s3.py::test_broken"
+
+    # Once it passes it is no longer recorded as failing
+    (slow / "tests" / "test_s3.py").write_text("def test_broken():\n    pass\n")
+    assert run()[0]["returncode"] == 0
+    assert DurationHistory(slow, tmp_path / "history").failed == set()
+
+
+def test_unsharded_suite_runs_failing_tests_first(tmp_path):
+    project = write_project(tmp_path, "small", {"test_a.py": {"test_ok": "pass"},
+                                                "test_z.py": {"test_broken": "assert False"}})
+
+    def run():
+        return SuiteScheduler([Suite("small", project, pytest=PYTEST)], workers=1,
+                              history_dir=tmp_path / "history").run()[0]
+
+    first = run()
+    assert list(parse_pytest_output(first["output"])[0]) == ["tests/test_a.py::test_ok",
+                                                             "tests/test_z.py::test_broken"]
+    second = run()
+    assert second["shards"] == 1
+    assert list(parse_pytest_output(second["output"])[0]) == ["tests/test_z.py::test_broken",
+                                                              "tests/test_a.py::test_ok"]
+
+
+def test_mw_test_all(tmp_path, monkeypatch, capsys):
+    from tools import shard_planner as mw_scheduler
+    monkeypatch.setattr(mw_scheduler, "DURATIONS_DIR", tmp_path / "history")
+    projects = tmp_path / "projects"
+    write_project(projects, "alpha", {"test_a.py": {"test_one": "pass", "test_two": "time.sleep(0.05)"}})
+    write_project(projects, "beta", {"test_b.py": {"test_bad": "assert 1 == 2"}})
+    (projects / "readme-only").mkdir()
+    (projects / "readme-only" / "README.md").write_text("hi")
+    monkeypatch.setattr(mw, "PROJECTS_DIR", projects)
+
+    assert mw.cmd_test(["--all", "-j", "2"]) == 1
+    out = capsys.readouterr().out
+    assert "Testing 2 projects with 2 workers" in out and "No tests detected: readme-only" in out
+    lines = out.splitlines()
+    alpha = next(i for i, line in enumerate(lines) if "alpha" in line and "passed" in line)
+    beta = next(i for i, line in enumerate(lines) if line.startswith("❌ beta"))
+    assert alpha < beta and "2 passed, 0 failed" in lines[alpha]
+    assert "  ❌ beta: tests/test_b.py::test_bad" in lines
+    assert "1 of 2 projects failed" in lines[-1]
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+def test_benchmark_twenty_projects(tmp_path):
+    projects = [write_project(tmp_path, f"p{i:02d}", {"test_x.py": {
+        f"test_{j}": "time.sleep(0.25)" for j in range(4)}}) for i in range(20)]
+    suites = [Suite(p.name, p, pytest=PYTEST) for p in projects]
+
+    def wall(workers):
+        start = time.perf_counter()
+        results = SuiteScheduler(suites, workers=workers, history_dir=tmp_path / f"h{workers}").run()
+        assert all(r["returncode"] == 0 for r in results)
+        return time.perf_counter() - start
+
+    serial, parallel = wall(1), wall(8)
+    print(f"\n20 projects: 1 worker {serial:.1f}s, 8 workers {parallel:.1f}s ({os.cpu_count()} cores)")
+    # Each project pays a CPU-bound interpreter start-up; the rest overlaps on any core count
+    assert parallel < serial * (0.75 if (os.cpu_count() or 1) == 1 else 0.5)
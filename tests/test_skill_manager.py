@@ -0,0 +1,125 @@
+"""Tests for the SkillManager index, in-process runner and batch install."""
+import os
+import sys
+import time
+
+import pytest
+from skills import skill_manager
+from skills.skill_manager import SkillManager
+
+SCRIPT = """import os, sys
+from pathlib import Path
+os.chdir(Path(__file__).parent)
+Path(os.environ["OUT"]).write_text(repr((sys.argv[1:], os.environ["SKILL_NAME"], Path.cwd().name)))
+sys.exit(int(sys.argv[1]) if sys.argv[1:] and sys.argv[1].isdigit() else 0)
+"""
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(skill_manager, "INSTALLED_DIR", tmp_path / "installed")
+    monkeypatch.setattr(skill_manager, "INDEX_DIR", tmp_path / "index")
+    return lambda **kw: SkillManager(**kw)
+
+
+def add_skill(manager, name, script=SCRIPT):
+    path = manager.installed_dir / name
+    path.mkdir(parents=True)
+    (path / "SKILL.md").write_text(
+        f"# {name}\n\n**Description:** The {name} skill\n\n**Version:** 2.0.0\n\n"
+        f"## Commands\n\n### go\n\n**Script:** go.py\n\nDo it.\n")
+    (path / "go.py").write_text(script)
+    return path
+
+
+def test_index_reparses_only_changed_manifests(make_manager, monkeypatch):
+    manager = make_manager()
+    for name in ("alpha", "beta"):
+        add_skill(manager, name)
+    parsed = []
+    real = SkillManager._parse_skill_manifest
+    monkeypatch.setattr(SkillManager, "_parse_skill_manifest",
+                        lambda self, content: parsed.append(content.split("\n")[0]) or real(self, content))
+
+    first = manager.list_skills()
+    assert [s["name"] for s in first] == ["alpha", "beta"] and len(parsed) == 2
+    assert first[0]["commands"]["go"] == {"description": "Do it.", "script": "go.py", "usage": ""}
+
+    parsed.clear()
+    second = make_manager().list_skills()
+    assert second == first and parsed == []
+    second[0]["commands"].clear()  # a caller's copy, not the index
+    assert make_manager()._get_skill_info("alpha")["commands"]
+
+    manifest = manager.installed_dir / "beta" / "SKILL.md"
+    manifest.write_text(manifest.read_text().replace("2.0.0", "2.1.0"))
+    assert [s["version"] for s in make_manager().list_skills()] == ["2.0.0", "2.1.0"]
+    assert parsed == ["# beta"]
+
+
+def test_in_process_run_isolates_argv_cwd_and_env(make_manager, tmp_path, monkeypatch):
+    manager = make_manager(in_process=True)
+    add_skill(manager, "alpha")
+    monkeypatch.setenv("OUT", str(tmp_path / "out.txt"))
+    monkeypatch.delenv("SKILL_NAME", raising=False)
+    argv, path, cwd = sys.argv[:], sys.path[:], os.getcwd()
+
+    assert manager.run_skill_command("alpha", "go", ["x", "y"]) == 0
+    assert (tmp_path / "out.txt").read_text() == repr((["x", "y"], "alpha", "alpha"))
+    assert manager.run_skill_command("alpha", "go", ["3"]) == 3
+    assert (sys.argv, sys.path, os.getcwd()) == (argv, path, cwd)
+    assert "SKILL_NAME" not in os.environ
+
+    add_skill(manager, "broken", script="raise RuntimeError('boom')\n")
+    assert manager.run_skill_command("broken", "go") == 1
+
+    # The subprocess path sees the same thing
+    assert make_manager(in_process=False).run_skill_command("alpha", "go", ["x", "y"]) == 0
+    assert (tmp_path / "out.txt").read_text() == repr((["x", "y"], "alpha", "alpha"))
+
+
+def test_install_skills_concurrently(make_manager, tmp_path):
+    manager = make_manager()
+    sources = []
+    for i in range(6):
+        src = add_skill(manager, f"src{i}")
+        sources.append(str(src.rename(tmp_path / f"skill-{i}")))
+    bad = tmp_path / "not-a-skill"
+    bad.mkdir()
+
+    results = manager.install_skills(sources + [str(bad)])
+    assert results == {**dict.fromkeys(sources, True), str(bad): False}
+    assert [s["name"] for s in manager.list_skills()] == [f"src{i}" for i in range(6)]
+    assert not (manager.installed_dir / "not-a-skill").exists()
+
+
+@pytest.mark.slow
+def test_benchmark_listing_and_dispatch_with_200_skills(make_manager, tmp_path, monkeypatch):
+    manager = make_manager()
+    for i in range(200):
+        add_skill(manager, f"skill{i:03d}", script="import sys\n")
+    monkeypatch.setattr(SkillManager, "_save_index", lambda self: None)  # measure parsing, not caching
+
+    def best(fn, n=5):
+        times = []
+        for _ in range(n):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    cold_list = best(lambda: make_manager().list_skills())
+    monkeypatch.undo()
+    monkeypatch.setattr(skill_manager, "INSTALLED_DIR", manager.installed_dir)
+    monkeypatch.setattr(skill_manager, "INDEX_DIR", tmp_path / "index")
+    make_manager().list_skills()
+    warm = make_manager(in_process=True)
+    warm_list = best(warm.list_skills)
+
+    subprocess_run = best(lambda: make_manager().run_skill_command("skill100", "go"))
+    in_process_run = best(lambda: warm.run_skill_command("skill100", "go"))
+
+    print(f"\n200 skills: list {cold_list * 1000:.1f}ms -> {warm_list * 1000:.1f}ms, "
+          f"dispatch {subprocess_run * 1000:.1f}ms -> {in_process_run * 1000:.2f}ms")
+    assert warm_list < cold_list / 3
+    assert in_process_run < subprocess_run / 10
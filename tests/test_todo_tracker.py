@@ -0,0 +1,159 @@
+"""Tests for the persisted, incremental TODO index."""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+import todo_tracker
+from todo_tracker import PATTERN, TodoIndex, scan_file
+
+
+def per_line(text):
+    """The original line-by-line scan, as the reference for _scan_text."""
+    items = []
+    for lineno, line in enumerate(text.splitlines(keepends=True), 1):
+        m = PATTERN.search(line)
+        if m:
+            items.append([lineno, m.group(1).upper(), m.group(2).strip()])
+    return items
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "src").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "src" / "app.py").write_text("x = 1  # TODO: tidy\n# fixme broken\n")
+    (root / "src" / "ui.ts").write_text("# HACK around\n")
+    (root / "notes.txt").write_text("# TODO not scanned\n")
+    (root / "node_modules" / "dep.js").write_text("# TODO skipped\n")
+    (root / "README.md").write_text("nothing here\n")
+    return root
+
+
+def test_scan_text_matches_line_by_line():
+    text = ("a = 1 # note: first # TODO second\n"
+            "# TODO:\nFIXME not a comment\n"
+            "\t#   xxx\t spaced  \r\n"
+            "#hack\n# TODOS are not TODO\n# todo last")
+    assert todo_tracker._scan_text(text, todo_tracker.DEFAULT_PROFILE) == per_line(text)
+    assert per_line(text)[0] == [1, "NOTE", "first # TODO second"]
+
+
+def test_refresh_rescans_only_changed_files(tree, tmp_path):
+    def index():
+        return TodoIndex(tree, index_dir=tmp_path / "index")
+
+    idx = index()
+    assert idx.refresh() == {"files": 3, "scanned": 3, "removed": 0}
+    idx.save()
+    assert [(i["file"], i["line"], i["marker"], i["priority"]) for i in idx.query()] == [
+        ("src/app.py", 1, "TODO", "low"),
+        ("src/app.py", 2, "FIXME", "high"),
+        ("src/ui.ts", 1, "HACK", "high"),
+    ]
+
+    idx = index()
+    assert idx.refresh()["scanned"] == 0
+    assert [i["text"] for i in idx.query(priority="high", path="app")] == ["broken"]
+    assert [i["file"] for i in idx.query(marker="hack")] == ["src/ui.ts"]
+
+    (tree / "src" / "ui.ts").write_text("const x = 1;\n")
+    (tree / "src" / "app.py").unlink()
+    (tree / "src" / "new.py").write_text("# XXX new\n")
+    idx = index()
+    assert idx.refresh() == {"files": 3, "scanned": 2, "removed": 1}
+    idx.save()
+    assert [(i["file"], i["marker"]) for i in index().query()] == [("src/new.py", "XXX")]
+
+
+def test_process_pool_rescan(tree, tmp_path, monkeypatch):
+    for i in range(40):
+        (tree / "src" / f"m{i}.py").write_text(f"pass\n# TODO item {i}\n")
+    serial = TodoIndex(tree, index_dir=tmp_path / "a")
+    serial.refresh(workers=1)
+
+    monkeypatch.setattr(todo_tracker, "POOL_THRESHOLD", 10)
+    monkeypatch.setattr(todo_tracker, "BATCH_SIZE", 7)
+    pooled = TodoIndex(tree, index_dir=tmp_path / "b")
+    pooled.refresh(workers=2)
+    assert pooled.query() == serial.query() and len(serial.query()) == 43
+
+
+def test_blame_is_lazy_and_cached(tree, tmp_path, monkeypatch):
+    def git(*args):
+        subprocess.run(["git", "-C", str(tree), *args], check=True, capture_output=True)
+    git("init", "-q")
+    git("-c", "user.name=Ann", "-c", "user.email=a@x", "add", ".")
+    git("-c", "user.name=Ann", "-c", "user.email=a@x", "commit", "-q", "-m", "init")
+
+    calls = []
+    real = todo_tracker._git_blame
+    monkeypatch.setattr(todo_tracker, "_git_blame", lambda *a: calls.append(a) or real(*a))
+
+    idx = TodoIndex(tree, index_dir=tmp_path / "index")
+    idx.refresh()
+    assert "author" not in idx.query()[0] and not calls
+
+    items = idx.blame(idx.query(path="app.py"))
+    assert [(i["author"], i["age_days"]) for i in items] == [("Ann", 0), ("Ann", 0)]
+    assert calls == [(idx.root, "src/app.py", [1, 2])]
+    idx.save()
+
+    idx = TodoIndex(tree, index_dir=tmp_path / "index")
+    idx.refresh()
+    idx.blame(idx.query())
+    assert [c[1] for c in calls] == ["src/app.py", "src/ui.ts"]
+
+    (tree / "src" / "app.py").write_text("# TODO changed\n")
+    idx.refresh()
+    assert idx.blame(idx.query(path="app.py"))[0]["author"] == "Not Committed Yet"
+
+
+def test_scan_file_keeps_its_shape(tree):
+    assert scan_file(tree / "src" / "ui.ts") == [{
+        "file": str(tree / "src" / "ui.ts"), "line": 1, "marker": "HACK",
+        "text": "around", "priority": "high"}]
+
+
+@pytest.mark.slow
+def test_benchmark_warm_queries_on_100k_files(tmp_path):
+    root = tmp_path / "big"
+    body = "def f():\n    return 1\n" * 5
+    for d in range(400):
+        folder = root / f"pkg{d}"
+        folder.mkdir(parents=True)
+        for f in range(250):
+            text = body + (f"# TODO item {d}/{f}\n" if f % 50 == 0 else "")
+            (folder / f"m{f}.py").write_text(text)
+
+    start = time.perf_counter()
+    idx = TodoIndex(root, index_dir=tmp_path / "index")
+    idx.refresh()
+    idx.save()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    items = TodoIndex(root, index_dir=tmp_path / "index").query(priority="low")
+    query = time.perf_counter() - start
+
+    start = time.perf_counter()
+    idx = TodoIndex(root, index_dir=tmp_path / "index")
+    stats = idx.refresh()
+    refresh = time.perf_counter() - start
+
+    print(f"\n100k files: cold index {cold:.2f}s, warm query {query * 1000:.1f}ms, "
+          f"warm refresh {refresh:.2f}s")
+    assert len(items) == 2000 and stats["scanned"] == 0
+    assert query < 0.05
+    assert refresh < cold / 2
+
+
+def test_profile_fingerprint_is_stable_across_processes():
+    code = "import todo_tracker as t; print(t.DEFAULT_PROFILE.fingerprint())"
+    keys = {subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                           cwd=os.path.dirname(todo_tracker.__file__),
+                           env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+            for seed in ("1", "2", "3")}
+    assert keys == {todo_tracker.DEFAULT_PROFILE.fingerprint() + "\n"}
@@ -0,0 +1,131 @@
+"""Tests for the streaming tree viewer and its gitignore matching."""
+import os
+import re
+import subprocess
+import time
+
+import pytest
+import tree_viewer
+from tree_viewer import build_tree, iter_tree
+
+ANSI = re.compile(r"\033\[[0-9;]*m")
+
+
+def git(repo, *args):
+    return subprocess.run(["git", "-C", str(repo), *args], check=True,
+                          capture_output=True, text=True).stdout
+
+
+def plain(lines):
+    return [ANSI.sub("", line) for line in lines]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    files = [
+        "app/main.py", "app/debug.log", "app/keep.log", "app/cache/x.bin",
+        "app/sub/notes.tmp", "app/sub/deep/notes.tmp", "app/sub/data.csv",
+        "docs/build/index.html", "docs/guide.md", "top.tmp", "lib/a1.py", "lib/ab.py",
+        "logs/today.txt", "src/logs/today.txt", "vendor/pkg/mod.py",
+    ]
+    for rel in files:
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(rel)
+    (repo / ".gitignore").write_text(
+        "# comment\n*.log\n!keep.log\ncache/\n/top.tmp\n**/deep/*.tmp\n"
+        "lib/a[0-9].py\n/logs\nvendor/**\n")
+    (repo / "app" / "sub" / ".gitignore").write_text("*.csv\nnotes.tmp\n")
+    (repo / "app" / ".gitignore").write_text("!debug.log\n")
+    git(repo, "init", "-q")
+    return repo
+
+
+def test_ignore_rules_agree_with_git(repo):
+    candidates = []
+    for dirpath, dirnames, filenames in os.walk(repo):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        rel_dir = os.path.relpath(dirpath, repo)
+        for name in dirnames + filenames:
+            candidates.append(os.path.normpath(os.path.join(rel_dir, name)))
+    out = subprocess.run(["git", "-C", str(repo), "check-ignore", "--no-index", *candidates],
+                         capture_output=True, text=True).stdout
+    expected = set(out.split())
+
+    stack = tree_viewer._ancestor_rules(repo, repo)
+    for rel_dir in ("", "app", "app/sub"):
+        rules = tree_viewer.IgnoreRules.load(repo / rel_dir / ".gitignore", rel_dir)
+        stack.append(rules)
+    ours = set()
+    for rel in candidates:
+        parts = rel.split("/")
+        # only rules from the path's own ancestors apply
+        applicable = [r for r in stack if not r.base or rel.startswith(r.base + "/")]
+        ancestors = ["/".join(parts[:i]) for i in range(1, len(parts))]
+        if any(tree_viewer._is_ignored(applicable, a, a.split("/")[-1], True) for a in ancestors):
+            continue  # git reports the ignored directory, not its contents
+        if tree_viewer._is_ignored(applicable, rel, parts[-1], (repo / rel).is_dir()):
+            ours.add(rel)
+    expected = {p for p in expected
+                if not any(p.startswith(e + "/") for e in expected if e != p)}
+    assert ours == expected
+    assert {"app/debug.log", "app/keep.log", "lib/ab.py", "src/logs/today.txt"}.isdisjoint(ours)
+
+
+def test_tree_respects_gitignore_and_status(repo):
+    git(repo, "add", "app/main.py", "docs")
+    git(repo, "-c", "user.name=a", "-c", "user.email=a@x", "commit", "-q", "-m", "init")
+    (repo / "app" / "main.py").write_text("changed")
+
+    lines, stats = build_tree(repo, max_depth=3)
+    text = plain(lines)
+    assert "│   └── 🐍 main.py [M]" in text
+    assert "│   ├── 📄 debug.log [??]" in text
+    assert not any(n in line for line in text for n in ("x.bin", "top.tmp", "data.csv", "a1.py", "mod.py"))
+    assert any(line.endswith("📁 src/ [??]") for line in text)
+    assert any(line.endswith("📁 logs/ [??]") for line in text)  # src/logs is not anchored-out
+
+    # A subtree gets the ancestor rules and status relative to itself
+    sub = plain(build_tree(repo / "app", max_depth=2)[0])
+    assert sub[:3] == ["├── 📁 sub/ [??]", "│   └── 📁 deep/ [??]", "├── 📄 debug.log [??]"]
+    assert sub[-1] == "└── 🐍 main.py [M]" and not any("cache" in line for line in sub)
+
+    everything = plain(build_tree(repo, max_depth=4, show_all=True)[0])
+    assert any("x.bin" in line for line in everything) and any("top.tmp" in line for line in everything)
+
+
+def test_output_streams_per_directory(tmp_path, monkeypatch):
+    for d in range(20):
+        (tmp_path / f"d{d:02d}").mkdir()
+        (tmp_path / f"d{d:02d}" / "f.txt").write_text("x")
+    listed = []
+    real = os.scandir
+    monkeypatch.setattr(tree_viewer.os, "scandir", lambda p: listed.append(p) or real(p))
+
+    stats = {}
+    lines = iter_tree(tmp_path, max_depth=2, stats=stats)
+    assert plain([next(lines), next(lines)]) == ["├── 📁 d00/", "│   └── 📄 f.txt"]
+    assert len(listed) == 2
+    rest = list(lines)
+    assert len(rest) == 38 and stats == {"dirs": 20, "files": 20, "total_size": 0}
+    assert plain(rest)[-2:] == ["└── 📁 d19/", "    └── 📄 f.txt"]
+
+
+@pytest.mark.slow
+def test_benchmark_large_directory(tmp_path):
+    big = tmp_path / "big"
+    for d in range(20):
+        folder = big / f"d{d:02d}"
+        folder.mkdir(parents=True)
+        for f in range(10000):
+            (folder / f"f{f}.txt").touch()
+
+    start = time.perf_counter()
+    lines = iter_tree(big, max_depth=2)
+    next(lines)
+    first = time.perf_counter() - start
+    count = 1 + sum(1 for _ in lines)
+    total = time.perf_counter() - start
+    print(f"\n200k entries: first line {first * 1000:.0f}ms, all {count} lines {total:.2f}s")
+    assert count == 200020
+    assert first < total / 10
@@ -15,6 +15,7 @@ Commands:
 
 import os
 import re
+import sys
 import json
 import subprocess
 from pathlib import Path
@@ -22,6 +23,12 @@ from datetime import datetime, timedelta
 from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from git_history import GitHistory
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from git_history import GitHistory
+
 
 def color(text: str, code: str) -> str:
     return f"\033[{code}m{text}\033[0m"
@@ -88,36 +95,21 @@ def analyze_languages(root: Path) -> Dict[str, int]:
 
 def analyze_git_trends(root: Path) -> Dict:
     """Analyze git commit patterns."""
-    # Commits per day (last 30 days)
-    log = run_cmd(
-        'git log --since="30 days ago" --format="%ai" 2>/dev/null',
-        cwd=str(root)
-    )
-    if not log:
+    history = GitHistory.load(root, days=30)
+    if history is None:
         return {"available": False}
     
-    dates = []
-    for line in log.splitlines():
-        if line.strip():
-            date_str = line.split()[0]
-            dates.append(date_str)
-    
-    daily = Counter(dates)
-    total_commits = len(dates)
+    # Commits per day (last 30 days)
+    daily = history.daily_counts(30)
+    if not daily:
+        return {"available": False}
+    total_commits = sum(daily.values())
     
     # Top contributors
-    authors = run_cmd(
-        'git log --since="30 days ago" --format="%an" 2>/dev/null',
-        cwd=str(root)
-    )
-    author_counts = Counter(authors.splitlines()) if authors else {}
+    author_counts = history.author_counts(30)
     
     # Files changed most
-    files_changed = run_cmd(
-        'git log --since="30 days ago" --name-only --format="" 2>/dev/null',
-        cwd=str(root)
-    )
-    file_counts = Counter(f for f in files_changed.splitlines() if f.strip())
+    file_counts = history.file_counts(30)
     
     # Streak
     today = datetime.now().date()
@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Backup Store
+============
+Content-addressed, deduplicating snapshots of the MyWork workspace.
+
+Files are split into fixed-size chunks, each chunk is named by the sha256 of
+its contents and stored zlib-compressed exactly once under chunks/. A
+snapshot is a small gzipped JSON manifest; its file list (every path and the
+chunks it is made of) is itself stored as chunks, so a backup of an
+unchanged workspace only walks the tree and writes a few hundred bytes.
+
+Usage:
+    mw backup                          Create a snapshot (keeps the last 5)
+    mw backup list                     List snapshots
+    mw backup restore <id|latest> <dir> [--only <prefix>]
+    mw backup verify [id|latest] [--quick]
+    mw backup prune [--keep N]         Drop old snapshots and unused chunks
+    mw backup --zip                    Legacy single-file zip archive
+
+Layout:
+    backups/store/chunks/ab/cdef...    zlib-compressed chunk, named by sha256
+    backups/store/snapshots/<id>.json.gz
+"""
+
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
+
+try:
+    from config import MYWORK_ROOT, PROJECTS_DIR, TOOLS_DIR
+except ImportError:
+    def _get_mywork_root() -> Path:
+        if env_root := os.environ.get("MYWORK_ROOT"):
+            return Path(env_root)
+        script_dir = Path(__file__).resolve().parent
+        if script_dir.name == "tools":
+            potential_root = script_dir.parent
+            if (potential_root / "CLAUDE.md").exists():
+                return potential_root
+        return Path.home() / "MyWork"
+
+    MYWORK_ROOT = _get_mywork_root()
+    PROJECTS_DIR = MYWORK_ROOT / "projects"
+    TOOLS_DIR = MYWORK_ROOT / "tools"
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+STORE_VERSION = 1
+DEFAULT_KEEP = 5
+
+
+class Colors:
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    ENDC = "\033[0m"
+    BOLD = "\033[1m"
+
+
+class BackupError(Exception):
+    """Raised for missing snapshots and unreadable or damaged store data."""
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+class BackupStore:
+    """
+    A directory of deduplicated chunks plus one manifest per snapshot.
+
+    Hashing and compression run on a thread pool; both hashlib and zlib
+    release the GIL on large buffers, so chunks are processed on all cores
+    while the calling thread keeps reading. Files whose size and mtime match
+    the previous snapshot are not read at all, their chunk list is reused.
+    """
+
+    def __init__(self, root, workers: int = None, level: int = 6, chunk_size: int = CHUNK_SIZE):
+        self.root = Path(root)
+        self.chunks_dir = self.root / "chunks"
+        self.snapshots_dir = self.root / "snapshots"
+        self.workers = workers or os.cpu_count() or 1
+        self.level = level
+        self.chunk_size = chunk_size
+        self._known: Optional[set] = None
+        self._inflight: set = set()
+        self._lock = threading.Lock()
+
+    # ─── Chunks ───────────────────────────────────────────
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest[2:]
+
+    def _iter_chunk_files(self) -> Iterable[os.DirEntry]:
+        if not self.chunks_dir.exists():
+            return
+        for shard in os.scandir(self.chunks_dir):
+            if shard.is_dir():
+                yield from (e for e in os.scandir(shard.path) if e.is_file())
+
+    def _known_chunks(self) -> set:
+        if self._known is None:
+            self._known = {
+                os.path.basename(os.path.dirname(e.path)) + e.name
+                for e in self._iter_chunk_files() if not e.name.endswith(".tmp")
+            }
+        return self._known
+
+    def _put_chunk(self, data: bytes):
+        """Store one chunk unless it already exists; returns (digest, bytes written)."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._known or digest in self._inflight:
+                return digest, 0
+            self._inflight.add(digest)
+        try:
+            packed = zlib.compress(data, self.level)
+            path = self._chunk_path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(packed)
+            os.replace(tmp, path)
+        finally:
+            with self._lock:
+                self._inflight.discard(digest)
+        with self._lock:
+            self._known.add(digest)
+        return digest, len(packed)
+
+    def _get_chunk(self, digest: str) -> bytes:
+        try:
+            data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except FileNotFoundError as e:
+            raise BackupError(f"chunk {digest[:12]} is missing") from e
+        except zlib.error as e:
+            raise BackupError(f"chunk {digest[:12]} is corrupt: {e}") from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BackupError(f"chunk {digest[:12]} does not match its hash")
+        return data
+
+    # ─── Snapshots ────────────────────────────────────────
+
+    def snapshot_ids(self) -> List[str]:
+        if not self.snapshots_dir.exists():
+            return []
+        return sorted(p.name[:-len(".json.gz")] for p in self.snapshots_dir.glob("*.json.gz"))
+
+    def load(self, snapshot_id: str = "latest", files: bool = True) -> Dict[str, Any]:
+        """Read a snapshot manifest; "latest" picks the newest one."""
+        if snapshot_id == "latest":
+            ids = self.snapshot_ids()
+            if not ids:
+                raise BackupError(f"no snapshots in {self.root}")
+            snapshot_id = ids[-1]
+        path = self.snapshots_dir / f"{snapshot_id}.json.gz"
+        if not path.exists():
+            raise BackupError(f"snapshot {snapshot_id} not found")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if files:
+            manifest["files"] = json.loads(b"".join(self._get_chunk(d) for d in manifest["tree"]))
+        return manifest
+
+    def snapshots(self) -> List[Dict[str, Any]]:
+        """Manifest summaries (everything but the file list), oldest first."""
+        return [self.load(snapshot_id, files=False) for snapshot_id in self.snapshot_ids()]
+
+    def _new_snapshot_id(self) -> str:
+        base = datetime.now().strftime("%Y%m%d_%H%M%S")
+        snapshot_id, n = base, 0
+        while (self.snapshots_dir / f"{snapshot_id}.json.gz").exists():
+            n += 1
+            snapshot_id = f"{base}_{n:02d}"
+        return snapshot_id
+
+    def _save(self, manifest: Dict[str, Any], entries: List[Dict[str, Any]]) -> int:
+        """Store the file list as chunks, then the manifest; returns bytes added."""
+        listing = json.dumps(entries, separators=(",", ":")).encode()
+        manifest["tree"], added = [], 0
+        for i in range(0, len(listing), self.chunk_size):
+            digest, written = self._put_chunk(listing[i:i + self.chunk_size])
+            manifest["tree"].append(digest)
+            added += written
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshots_dir / f"{manifest['id']}.json.gz"
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(json.dumps(manifest, separators=(",", ":")).encode())
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp, path)
+        return added + path.stat().st_size
+
+    @contextmanager
+    def _locked(self):
+        """Serialise writers, so prune never collects chunks of a backup in progress."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / "lock", "w") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    # ─── Backup ───────────────────────────────────────────
+
+    def _walk(self, label: str, top: Path, exclude: List[str]):
+        """Yield (archive path, filesystem path) for everything under top."""
+        if top.is_symlink() or top.is_file():
+            yield label, top
+            return
+        for dirpath, dirnames, filenames in os.walk(top):
+            rel = os.path.relpath(dirpath, top)
+            prefix = label if rel == "." else f"{label}/{Path(rel).as_posix()}"
+            dirnames[:] = sorted(d for d in dirnames if not _excluded(d, exclude))
+            for name in list(dirnames):
+                if os.path.islink(os.path.join(dirpath, name)):
+                    dirnames.remove(name)  # recorded as a link, not followed
+                    yield f"{prefix}/{name}", Path(dirpath, name)
+            for name in sorted(filenames):
+                if not _excluded(name, exclude):
+                    yield f"{prefix}/{name}", Path(dirpath, name)
+
+    def backup(self, sources: Dict[str, Path], extra: Dict[str, bytes] = None,
+               metadata: Dict[str, Any] = None, exclude: List[str] = ()) -> Dict[str, Any]:
+        """
+        Snapshot the given sources.
+
+        sources maps an archive name to a file or directory; extra maps an
+        archive path to generated content (e.g. a sanitised .env). Returns
+        the manifest, whose "stats" say how much was read and stored.
+        """
+        with self._locked():
+            return self._backup(sources, extra or {}, metadata or {}, list(exclude))
+
+    def _backup(self, sources, extra, metadata, exclude):
+        started = time.perf_counter()
+        started_ns = time.time_ns()
+        try:
+            previous = self.load("latest")
+        except BackupError:
+            previous = None
+        # A file touched after the previous snapshot started may have changed
+        # within the same mtime tick, so only older entries are trusted.
+        cache = {}
+        if previous and previous.get("chunk_size") == self.chunk_size:
+            cache = {
+                e["path"]: e for e in previous["files"]
+                if "chunks" in e and e["mtime_ns"] < previous["started_ns"]
+            }
+
+        stats = {"files": 0, "bytes": 0, "reused_files": 0, "read_bytes": 0,
+                 "new_chunks": 0, "stored_bytes": 0, "skipped": []}
+        entries = []
+        self._known_chunks()
+        inflight = threading.BoundedSemaphore(self.workers * 4)
+
+        def submit(pool, data):
+            inflight.acquire()
+            future = pool.submit(self._put_chunk, data)
+            future.add_done_callback(lambda _: inflight.release())
+            return future
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backup") as pool:
+            for label, top in sources.items():
+                top = Path(top)
+                if not top.exists() and not top.is_symlink():
+                    continue
+                for arc_path, path in self._walk(label, top, exclude):
+                    try:
+                        st = path.lstat()
+                        if path.is_symlink():
+                            entries.append({"path": arc_path, "link": os.readlink(path),
+                                            "mtime_ns": st.st_mtime_ns})
+                            continue
+                        entry = {"path": arc_path, "size": st.st_size,
+                                 "mtime_ns": st.st_mtime_ns, "mode": st.st_mode & 0o7777}
+                        cached = cache.get(arc_path)
+                        if cached and (cached["size"], cached["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                            entry["chunks"] = cached["chunks"]
+                            stats["reused_files"] += 1
+                        else:
+                            futures = []
+                            with open(path, "rb") as f:
+                                while data := f.read(self.chunk_size):
+                                    futures.append(submit(pool, data))
+                                    stats["read_bytes"] += len(data)
+                            entry["chunks"] = futures
+                    except OSError as e:
+                        stats["skipped"].append(f"{arc_path}: {e.strerror or e}")
+                        continue
+                    entries.append(entry)
+
+            now_ns = time.time_ns()
+            for arc_path, data in extra.items():
+                futures = [submit(pool, data[i:i + self.chunk_size])
+                           for i in range(0, len(data), self.chunk_size)]
+                entries.append({"path": arc_path, "size": len(data), "mtime_ns": now_ns,
+                                "mode": 0o644, "chunks": futures})
+
+            for entry in entries:
+                if "chunks" not in entry:
+                    continue
+                if entry["chunks"] and not isinstance(entry["chunks"][0], str):
+                    chunks = []
+                    for future in entry["chunks"]:
+                        digest, written = future.result()
+                        chunks.append(digest)
+                        if written:
+                            stats["new_chunks"] += 1
+                            stats["stored_bytes"] += written
+                    entry["chunks"] = chunks
+                stats["files"] += 1
+                stats["bytes"] += entry["size"]
+
+        stats["seconds"] = round(time.perf_counter() - started, 3)
+        manifest = {
+            "version": STORE_VERSION,
+            "id": self._new_snapshot_id(),
+            "created": datetime.now().isoformat(),
+            "started_ns": started_ns,
+            "chunk_size": self.chunk_size,
+            "metadata": metadata,
+            "stats": stats,
+        }
+        stats["manifest_bytes"] = self._save(manifest, entries)
+        manifest["files"] = entries
+        return manifest
+
+    # ─── Restore / verify / prune ─────────────────────────
+
+    def restore(self, snapshot_id: str, dest, only: str = None) -> Dict[str, int]:
+        """Recreate a snapshot under dest, optionally only paths below `only`."""
+        manifest = self.load(snapshot_id)
+        dest = Path(dest).resolve()
+        entries = [e for e in manifest["files"]
+                   if not only or e["path"] == only or e["path"].startswith(only.rstrip("/") + "/")]
+
+        def target(entry) -> Path:
+            path = Path(os.path.normpath(dest / entry["path"]))
+            if dest not in path.parents:
+                raise BackupError(f"refusing to restore outside {dest}: {entry['path']}")
+            return path
+
+        def restore_file(entry):
+            path = target(entry)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                for digest in entry["chunks"]:
+                    f.write(self._get_chunk(digest))
+            os.chmod(path, entry["mode"])
+            os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            return entry["size"]
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="restore") as pool:
+            restored = sum(pool.map(restore_file, [e for e in entries if "chunks" in e]))
+        for entry in entries:
+            if "link" in entry:
+                path = target(entry)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if path.is_symlink() or path.exists():
+                    path.unlink()
+                os.symlink(entry["link"], path)
+        return {"files": len(entries), "bytes": restored}
+
+    def verify(self, snapshot_id: str = "latest", quick: bool = False) -> Dict[str, Any]:
+        """
+        Check that every chunk of a snapshot is present and, unless quick,
+        that it decompresses to data matching its hash.
+        """
+        manifest = self.load(snapshot_id)
+        digests = sorted({d for e in manifest["files"] for d in e.get("chunks", ())} | set(manifest["tree"]))
+        missing, corrupt = [], []
+
+        def check(digest):
+            if quick:
+                return None if self._chunk_path(digest).exists() else "missing"
+            try:
+                self._get_chunk(digest)
+            except BackupError as e:
+                return "missing" if "missing" in str(e) else "corrupt"
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify") as pool:
+            for digest, problem in zip(digests, pool.map(check, digests)):
+                if problem == "missing":
+                    missing.append(digest)
+                elif problem == "corrupt":
+                    corrupt.append(digest)
+        damaged = set(missing) | set(corrupt)
+        return {
+            "snapshot": manifest["id"],
+            "files": len(manifest["files"]),
+            "chunks": len(digests),
+            "missing": missing,
+            "corrupt": corrupt,
+            "damaged_files": [e["path"] for e in manifest["files"]
+                              if damaged.intersection(e.get("chunks", ()))],
+            "ok": not damaged,
+        }
+
+    def prune(self, keep: int = DEFAULT_KEEP) -> Dict[str, int]:
+        """Delete all but the newest `keep` snapshots, then every chunk none of them uses."""
+        with self._locked():
+            ids = self.snapshot_ids()
+            doomed = ids[:-keep] if keep > 0 else ids
+            for snapshot_id in doomed:
+                (self.snapshots_dir / f"{snapshot_id}.json.gz").unlink()
+            referenced = set()
+            for snapshot_id in self.snapshot_ids():
+                manifest = self.load(snapshot_id)
+                referenced.update(manifest["tree"])
+                for entry in manifest["files"]:
+                    referenced.update(entry.get("chunks", ()))
+
+            chunks_removed = bytes_freed = 0
+            for e in list(self._iter_chunk_files()):
+                digest = os.path.basename(os.path.dirname(e.path)) + e.name
+                if e.name.endswith(".tmp") or digest not in referenced:
+                    bytes_freed += e.stat().st_size
+                    os.remove(e.path)
+                    chunks_removed += 0 if e.name.endswith(".tmp") else 1
+            self._known = None
+            return {"snapshots_removed": len(doomed), "chunks_removed": chunks_removed,
+                    "bytes_freed": bytes_freed}
+
+    def size(self) -> int:
+        """Bytes used by chunks and manifests."""
+        total = sum(e.stat().st_size for e in self._iter_chunk_files())
+        if self.snapshots_dir.exists():
+            total += sum(p.stat().st_size for p in self.snapshots_dir.iterdir())
+        return total
+
+
+def _excluded(name: str, patterns: List[str]) -> bool:
+    return any(fnmatch.fnmatch(name, p) for p in patterns)
+
+
+# ─── Workspace backup ─────────────────────────────────────
+
+def default_store() -> BackupStore:
+    return BackupStore(MYWORK_ROOT / "backups" / "store")
+
+
+def sanitize_env(text: str) -> str:
+    """Replace every value in a .env file with a placeholder."""
+    lines = []
+    for line in text.split("\n"):
+        if "=" in line and not line.strip().startswith("#"):
+            key, _ = line.split("=", 1)
+            lines.append(f"{key}=YOUR_VALUE_HERE")
+        else:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def workspace_sources():
+    """What `mw backup` captures: (sources, generated files)."""
+    sources = {"projects": PROJECTS_DIR}
+    for brain_file in ("brain_data.json", "brain.py"):
+        sources[brain_file] = TOOLS_DIR / brain_file
+    for config_dir in (".planning", "tools"):
+        sources[config_dir] = MYWORK_ROOT / config_dir
+    extra = {}
+    env_file = MYWORK_ROOT / ".env"
+    if env_file.exists():
+        extra[".env.template"] = sanitize_env(env_file.read_text()).encode()
+    return sources, extra
+
+
+def _print_help():
+    print(f"""
+{Colors.BOLD}Backup Commands — Incremental Workspace Backups{Colors.ENDC}
+================================================
+Usage:
+    mw backup [--keep N] [--exclude PATTERN]   Create a snapshot (keeps the last 5)
+    mw backup list                             List snapshots
+    mw backup restore <id|latest> <dir> [--only <path>]
+                                               Restore a snapshot (or part of it)
+    mw backup verify [id|latest] [--quick]     Check chunks are present and intact
+    mw backup prune [--keep N]                 Drop old snapshots and unused chunks
+    mw backup --zip                            Legacy single-file zip archive
+    mw backup --help                           Show this help message
+
+Description:
+    Snapshots contain all projects, brain data, .planning/, tools/ and a
+    sanitized .env. Files are stored as deduplicated, compressed chunks in
+    backups/store/, so unchanged files cost nothing in later snapshots.
+
+Examples:
+    mw backup                                  # Snapshot the workspace
+    mw backup restore latest /tmp/restored     # Restore everything
+    mw backup restore 20260101_120000 . --only projects/my-app
+""")
+
+
+def _option(args: List[str], flag: str, default=None):
+    if flag in args:
+        i = args.index(flag)
+        if i + 1 < len(args):
+            value = args[i + 1]
+            del args[i:i + 2]
+            return value
+    return default
+
+
+def cmd_backup(args: List[str] = None) -> int:
+    args = list(args or [])
+    if args and args[0] in ("--help", "-h", "help"):
+        _print_help()
+        return 0
+
+    store = default_store()
+    sub = args.pop(0) if args and not args[0].startswith("-") else "create"
+    try:
+        if sub == "create":
+            keep = int(_option(args, "--keep", DEFAULT_KEEP))
+            exclude = []
+            while "--exclude" in args:
+                exclude.append(_option(args, "--exclude"))
+            return _create(store, keep, exclude)
+        if sub == "list":
+            return _list(store)
+        if sub == "restore":
+            only = _option(args, "--only")
+            if len(args) < 2:
+                print(f"{Colors.RED}Usage: mw backup restore <id|latest> <dir> [--only <path>]{Colors.ENDC}")
+                return 1
+            result = store.restore(args[0], args[1], only=only)
+            print(f"{Colors.GREEN}✅ Restored {result['files']} files "
+                  f"({format_bytes(result['bytes'])}) to {args[1]}{Colors.ENDC}")
+            return 0
+        if sub == "verify":
+            quick = "--quick" in args
+            args = [a for a in args if a != "--quick"]
+            return _verify(store, args[0] if args else "latest", quick)
+        if sub == "prune":
+            result = store.prune(int(_option(args, "--keep", DEFAULT_KEEP)))
+            print(f"🗑️  Removed {result['snapshots_removed']} snapshots and {result['chunks_removed']} "
+                  f"chunks, freed {format_bytes(result['bytes_freed'])}")
+            return 0
+    except (BackupError, ValueError, OSError) as e:
+        print(f"{Colors.RED}❌ Backup {sub} failed: {e}{Colors.ENDC}")
+        return 1
+    print(f"{Colors.RED}Unknown backup command: {sub}{Colors.ENDC}")
+    _print_help()
+    return 1
+
+
+def _create(store: BackupStore, keep: int, exclude: List[str]) -> int:
+    print(f"{Colors.BOLD}📦 Creating MyWork-AI snapshot in {store.root}{Colors.ENDC}")
+    sources, extra = workspace_sources()
+    metadata = {
+        "mywork_root": str(MYWORK_ROOT),
+        "included_items": [name for name, path in sources.items() if path.exists()] + list(extra),
+    }
+    manifest = store.backup(sources, extra=extra, metadata=metadata, exclude=exclude)
+    stats = manifest["stats"]
+    print(f"\n{Colors.GREEN}📦 Snapshot {manifest['id']} created in {stats['seconds']:.1f}s{Colors.ENDC}")
+    print(f"   📁 Files: {stats['files']} ({format_bytes(stats['bytes'])}), "
+          f"{stats['reused_files']} unchanged")
+    print(f"   📊 Added: {stats['new_chunks']} chunks, "
+          f"{format_bytes(stats['stored_bytes'] + stats['manifest_bytes'])}")
+    for skipped in stats["skipped"]:
+        print(f"   {Colors.YELLOW}⚠️  Skipped {skipped}{Colors.ENDC}")
+    if keep > 0:
+        pruned = store.prune(keep)
+        if pruned["snapshots_removed"]:
+            print(f"   🗑️  Pruned {pruned['snapshots_removed']} old snapshots, "
+                  f"freed {format_bytes(pruned['bytes_freed'])}")
+    return 0
+
+
+def _list(store: BackupStore) -> int:
+    snapshots = store.snapshots()
+    if not snapshots:
+        print("No snapshots yet. Run: mw backup")
+        return 0
+    print(f"{Colors.BOLD}{'ID':<20} {'Files':>7} {'Size':>10} {'Added':>10}{Colors.ENDC}")
+    for s in snapshots:
+        st = s["stats"]
+        print(f"{s['id']:<20} {st['files']:>7} {format_bytes(st['bytes']):>10} "
+              f"{format_bytes(st['stored_bytes'] + st.get('manifest_bytes', 0)):>10}")
+    print(f"\nStore size: {format_bytes(store.size())} ({store.root})")
+    return 0
+
+
+def _verify(store: BackupStore, snapshot_id: str, quick: bool) -> int:
+    report = store.verify(snapshot_id, quick=quick)
+    if report["ok"]:
+        print(f"{Colors.GREEN}✅ Snapshot {report['snapshot']}: {report['files']} files, "
+              f"{report['chunks']} chunks OK{Colors.ENDC}")
+        return 0
+    print(f"{Colors.RED}❌ Snapshot {report['snapshot']}: {len(report['missing'])} missing, "
+          f"{len(report['corrupt'])} corrupt chunks{Colors.ENDC}")
+    for path in report["damaged_files"][:20]:
+        print(f"   • {path}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(cmd_backup(sys.argv[1:]))
@@ -9,11 +9,16 @@ Usage:
     mw changelog --output <file>    Write to file instead of stdout
     mw changelog --unreleased       Show only unreleased changes
     mw changelog --tag <version>    Generate for specific tag
+    mw changelog --no-cache         Re-read tagged history instead of using the cache
 
 Parses conventional commits (feat:, fix:, docs:, etc.) into categorized,
-readable changelogs with stats.
+readable changelogs with stats. The log is streamed rather than buffered,
+and commits in tagged ranges are cached in ~/.mywork/changelog_cache, so
+after a new tag only the commits since the previous one are read.
 """
 
+import hashlib
+import itertools
 import json
 import os
 import re
@@ -62,42 +67,139 @@ def get_tags(cwd=None):
     return [t for t in output.split("\n") if t.strip()] if output else []
 
 
-def get_commits(from_ref=None, to_ref="HEAD", cwd=None):
+CACHE_DIR = Path(os.environ.get("MYWORK_CHANGELOG_CACHE", Path.home() / ".mywork" / "changelog_cache"))
+CACHE_VERSION = 1
+
+# One NUL-terminated field per value; -z also ends each record with a NUL
+LOG_FIELDS = ("hash", "short", "subject", "author", "date", "body")
+LOG_FORMAT = "%x00".join(["%H", "%h", "%s", "%an", "%aI", "%b"])
+
+
+def iter_commits(from_ref=None, to_ref="HEAD", cwd=None):
+    """Stream commits between refs, newest first, without buffering the log."""
+    range_spec = f"{from_ref}..{to_ref}" if from_ref else to_ref
+    try:
+        proc = subprocess.Popen(
+            ["git", "log", "-z", range_spec, f"--format={LOG_FORMAT}"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=cwd or os.getcwd()
+        )
+    except OSError:
+        return
+    try:
+        fields = []
+        pending = b""
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+            values = (pending + chunk).split(b"\0")
+            pending = values.pop()
+            for value in values:
+                fields.append(value)
+                if len(fields) == len(LOG_FIELDS):
+                    commit = _make_commit(fields)
+                    fields = []
+                    if commit:
+                        yield commit
+        if pending:
+            fields.append(pending)
+        if len(fields) == len(LOG_FIELDS):
+            commit = _make_commit(fields)
+            if commit:
+                yield commit
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _make_commit(fields):
+    commit = dict(zip(LOG_FIELDS, (f.decode("utf-8", errors="replace") for f in fields)))
+    commit["hash"] = commit["hash"].lstrip()
+    if not commit["hash"]:
+        return None
+    body = commit["body"].rstrip()
+    subject = commit["subject"]
+    has_breaking = "BREAKING CHANGE" in body
+    if ":" in subject:
+        has_breaking = has_breaking or "!" in subject.split(":")[0]
+    commit["body"] = body
+    commit["breaking"] = has_breaking
+    return commit
+
+
+class ChangelogCache:
+    """Commits per tag range, keyed on the commit SHAs the refs resolve to.
+
+    A tagged range never changes, so once it has been read it is served from
+    disk; only the range past the newest tag (or a retagged one) is re-read.
+    """
+
+    def __init__(self, cwd=None, cache_dir=None, persist=True):
+        self.cwd = cwd
+        self.persist = persist
+        self.tags = {}  # tag -> commit SHA
+        for line in run_git(["for-each-ref", "refs/tags",
+                             "--format=%(refname:short)%00%(objectname)%00%(*objectname)"], cwd).split("\n"):
+            parts = line.split("\0")
+            if len(parts) == 3:
+                self.tags[parts[0]] = parts[2] or parts[1]
+        toplevel = run_git(["rev-parse", "--show-toplevel"], cwd) or os.path.abspath(cwd or os.getcwd())
+        digest = hashlib.sha1(toplevel.encode()).hexdigest()[:16]
+        self.path = Path(cache_dir or CACHE_DIR) / f"{digest}.json"
+        self.ranges = {}
+        self.dates = {}
+        self.dirty = False
+        if not persist:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == CACHE_VERSION:
+                self.ranges, self.dates = data["ranges"], data["dates"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _key(self, from_ref, to_ref):
+        if to_ref not in self.tags or (from_ref and from_ref not in self.tags):
+            return None
+        return f"{self.tags[from_ref] if from_ref else ''}..{self.tags[to_ref]}"
+
+    def commits(self, from_ref, to_ref):
+        key = self._key(from_ref, to_ref)
+        if key is None:
+            return list(iter_commits(from_ref, to_ref, self.cwd))
+        if key not in self.ranges:
+            self.ranges[key] = list(iter_commits(from_ref, to_ref, self.cwd))
+            self.dirty = True
+        return self.ranges[key]
+
+    def tag_date(self, tag):
+        sha = self.tags.get(tag)
+        if sha is None:
+            return run_git(["log", "-1", "--format=%aI", tag], self.cwd)[:10]
+        if sha not in self.dates:
+            self.dates[sha] = run_git(["log", "-1", "--format=%aI", tag], self.cwd)[:10]
+            self.dirty = True
+        return self.dates[sha]
+
+    def save(self):
+        if not (self.dirty and self.persist):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "ranges": self.ranges,
+                                       "dates": self.dates}))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # caching is best effort
+
+
+def get_commits(from_ref=None, to_ref="HEAD", cwd=None, cache=None):
     """Get commits between refs."""
-    fmt = "%H|%h|%s|%an|%aI|%b<<<END>>>"
-    if from_ref:
-        range_spec = f"{from_ref}..{to_ref}"
-    else:
-        range_spec = to_ref
-    
-    output = run_git(["log", range_spec, f"--pretty=format:{fmt}"], cwd)
-    if not output:
-        return []
-    
-    commits = []
-    for block in output.split("<<<END>>>"):
-        block = block.strip()
-        if not block or "|" not in block:
-            continue
-        parts = block.split("|", 5)
-        if len(parts) < 5:
-            continue
-        
-        body = parts[5] if len(parts) > 5 else ""
-        subject = parts[2]
-        has_breaking = "BREAKING CHANGE" in body
-        if ":" in subject:
-            has_breaking = has_breaking or "!" in subject.split(":")[0]
-        commits.append({
-            "hash": parts[0],
-            "short": parts[1],
-            "subject": subject,
-            "author": parts[3],
-            "date": parts[4],
-            "body": body,
-            "breaking": has_breaking,
-        })
-    return commits
+    if cache is not None:
+        return cache.commits(from_ref, to_ref)
+    return list(iter_commits(from_ref, to_ref, cwd))
 
 
 def parse_commit(commit):
@@ -238,6 +340,7 @@ def cmd_changelog(args=None):
     full = False
     unreleased = False
     tag = None
+    use_cache = True
     
     i = 0
     while i < len(args):
@@ -256,6 +359,9 @@ def cmd_changelog(args=None):
         elif args[i] == "--full":
             full = True
             i += 1
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
         elif args[i] == "--unreleased":
             unreleased = True
             i += 1
@@ -266,12 +372,12 @@ def cmd_changelog(args=None):
             i += 1
     
     tags = get_tags()
+    cache = ChangelogCache(persist=use_cache)
     sections = []
     
     if since:
         # Get commits since date
-        commits = get_commits(cwd=None)
-        commits = [c for c in commits if c["date"][:10] >= since]
+        commits = [c for c in iter_commits() if c["date"][:10] >= since]
         if commits:
             stats = get_stats(commits)
             groups, breaking = group_commits(commits)
@@ -286,11 +392,11 @@ def cmd_changelog(args=None):
         if tag in tags:
             idx = tags.index(tag)
             from_ref = tags[idx + 1] if idx + 1 < len(tags) else None
-            commits = get_commits(from_ref, tag)
+            commits = get_commits(from_ref, tag, cache=cache)
             if commits:
                 stats = get_stats(commits)
                 groups, breaking = group_commits(commits)
-                tag_date = run_git(["log", "-1", "--format=%aI", tag])[:10]
+                tag_date = cache.tag_date(tag)
                 title = f"{tag} ({tag_date})"
                 if fmt == "json":
                     content = format_json(groups, breaking, stats)
@@ -313,11 +419,11 @@ def cmd_changelog(args=None):
             # Each tag pair
             for i_tag in range(len(tags)):
                 from_ref = tags[i_tag + 1] if i_tag + 1 < len(tags) else None
-                commits = get_commits(from_ref, tags[i_tag])
+                commits = get_commits(from_ref, tags[i_tag], cache=cache)
                 if commits:
                     stats = get_stats(commits)
                     groups, breaking = group_commits(commits)
-                    tag_date = run_git(["log", "-1", "--format=%aI", tags[i_tag]])[:10]
+                    tag_date = cache.tag_date(tags[i_tag])
                     sections.append(format_markdown(groups, breaking, f"{tags[i_tag]} ({tag_date})", stats))
         else:
             # No tags - all commits
@@ -349,12 +455,12 @@ def cmd_changelog(args=None):
             if not commits:
                 # Show last tag's changes instead
                 from_ref = tags[1] if len(tags) > 1 else None
-                commits = get_commits(from_ref, tags[0])
+                commits = get_commits(from_ref, tags[0], cache=cache)
                 title = f"{tags[0]}"
             else:
                 title = "Unreleased Changes"
         else:
-            commits = get_commits()[:50]
+            commits = list(itertools.islice(iter_commits(), 50))
             title = "Recent Changes"
         
         if commits:
@@ -369,6 +475,8 @@ def cmd_changelog(args=None):
             print("No changes found.")
             return 0
     
+    cache.save()
+    
     # Output
     result = "\n---\n\n".join(sections)
     
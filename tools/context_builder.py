@@ -26,6 +26,12 @@ import argparse
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple
 
+try:
+    from git_history import GitHistory
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from git_history import GitHistory
+
 
 # Key file patterns to auto-include
 KEY_FILES = [
@@ -181,9 +187,14 @@ def detect_project_type(root: str) -> Dict:
 def get_git_context(root: str, limit: int = 10) -> str:
     """Get recent git history and diff summary."""
     sections = []
+    history = GitHistory.load(root)
     
-    # Recent commits
-    log = run_cmd(f"git log --oneline -n {limit}", cwd=root)
+    # Recent commits (fall back to git log when the mined window is too short)
+    commits = history.recent(limit) if history else []
+    if len(commits) >= limit:
+        log = "\n".join(f"{sha[:7]} {subject}" for sha, subject in commits)
+    else:
+        log = run_cmd(f"git log --oneline -n {limit}", cwd=root)
     if log:
         sections.append(f"### Recent Commits\n```\n{log}\n```")
     
@@ -196,8 +207,13 @@ def get_git_context(root: str, limit: int = 10) -> str:
         sections.append(f"### Uncommitted Changes\n```\n{status}\n```")
     
     # Diff stats (last commit)
-    diff_stat = run_cmd("git diff --stat HEAD~1 2>/dev/null || echo 'No previous commit'", cwd=root)
-    if diff_stat and "No previous" not in diff_stat:
+    files = history.commit_files(len(history) - 1) if history and len(history) else []
+    if files:
+        width = max(len(path) for path, _, _ in files)
+        lines = [f" {path:<{width}} | +{added} -{deleted}" for path, added, deleted in files]
+        lines.append(f" {len(files)} files changed, {sum(f[1] for f in files)} insertions(+), "
+                     f"{sum(f[2] for f in files)} deletions(-)")
+        diff_stat = "\n".join(lines)
         sections.append(f"### Last Commit Diff Stats\n```\n{diff_stat}\n```")
     
     return "\n\n".join(sections)
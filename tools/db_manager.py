@@ -12,9 +12,9 @@ Usage:
     mw db migrate --rollback  Rollback last migration
     mw db seed [file]         Seed database with sample data
     mw db query "SQL"         Run an ad-hoc SQL query
-    mw db tables              List all tables with row counts
+    mw db tables [--exact]    List all tables with (approximate) row counts
     mw db schema [table]      Show table schema/columns
-    mw db export [table]      Export table(s) to CSV/JSON
+    mw db export [table]      Export table(s) to CSV/JSON/NDJSON (streamed)
     mw db backup [path]       Backup database
     mw db restore [path]      Restore from backup
     mw db reset               Drop all tables and re-migrate (with confirmation)
@@ -29,7 +29,11 @@ import csv
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterator
+
+EXPORT_FORMATS = ("csv", "json", "ndjson")
+EXPORT_CHUNK_ROWS = 10_000
+ANALYZE_SAMPLE = 1000  # rows per index read when estimating an unanalyzed table
 
 
 # ─── Colors ──────────────────────────────────────────────────────────
@@ -128,16 +132,79 @@ class SQLiteDB:
         if self.conn:
             self.conn.close()
     
-    def tables(self) -> List[Dict]:
+    def tables(self, exact: bool = False) -> List[Dict]:
+        """List tables with row counts.
+
+        By default counts are estimates: the row count ANALYZE stored in
+        sqlite_stat1, else a sampled ANALYZE capped by analysis_limit and
+        rolled back so nothing is written. The sample reads a bounded slice
+        of each index; SQLite still counts a table that has no index, which
+        costs as much as COUNT(*) but never reports a wrong number. exact=True
+        runs COUNT(*) on every table instead. Each entry says which
+        "source" it came from.
+        """
         cur = self.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
         )
+        names = [row[0] for row in cur.fetchall()]
+        stats = {} if exact else self._stat1_counts()
+        unanalyzed = [] if exact else [name for name in names if name not in stats]
+        samples = self._estimate_counts(unanalyzed) if unanalyzed else {}
         tables = []
-        for row in cur.fetchall():
-            name = row[0]
-            count = self.conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
-            tables.append({"name": name, "rows": count})
+        for name in names:
+            if exact:
+                rows, source = self.exact_count(name), "count"
+            elif name in stats:
+                rows, source = stats[name], "stat1"
+            else:
+                rows, source = samples[name]
+            tables.append({"name": name, "rows": rows, "exact": source == "count", "source": source})
         return tables
+
+    def exact_count(self, table: str) -> int:
+        return self.conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+    def _stat1_counts(self) -> Dict[str, int]:
+        """Row counts recorded by the last ANALYZE (first number of each stat)."""
+        try:
+            rows = self.conn.execute("SELECT tbl, stat FROM sqlite_stat1").fetchall()
+        except sqlite3.OperationalError:
+            return {}  # never analyzed
+        counts: Dict[str, int] = {}
+        for tbl, stat in rows:
+            try:
+                n = int(str(stat).split()[0])
+            except (ValueError, IndexError):
+                continue
+            counts[tbl] = max(counts.get(tbl, 0), n)
+        return counts
+
+    def _estimate_counts(self, tables: List[str]) -> Dict[str, Tuple[int, str]]:
+        try:
+            return {name: (rows, "sample") for name, rows in self._sampled_counts(tables).items()}
+        except sqlite3.OperationalError:
+            # read-only or locked database
+            return {name: (self.exact_count(name), "count") for name in tables}
+
+    def _sampled_counts(self, tables: List[str]) -> Dict[str, int]:
+        """Row counts from an ANALYZE of at most ANALYZE_SAMPLE rows per index, undone afterwards."""
+        if sqlite3.sqlite_version_info < (3, 32, 0):
+            raise sqlite3.OperationalError("analysis_limit needs SQLite 3.32")
+        self.conn.execute(f"PRAGMA analysis_limit = {ANALYZE_SAMPLE}")
+        self.conn.execute("SAVEPOINT mw_estimate")
+        try:
+            for table in tables:
+                self.conn.execute(f'ANALYZE "{table}"')
+            rows = self.conn.execute("SELECT tbl, stat FROM sqlite_stat1").fetchall()
+        finally:
+            self.conn.execute("ROLLBACK TO mw_estimate")
+            self.conn.execute("RELEASE mw_estimate")
+            self.conn.execute("PRAGMA analysis_limit = 0")
+        counts = dict.fromkeys(tables, 0)  # an empty table gets no stat row
+        for tbl, stat in rows:
+            if tbl in counts:
+                counts[tbl] = max(counts[tbl], int(str(stat).split()[0]))
+        return counts
     
     def schema(self, table: str) -> List[Dict]:
         cur = self.conn.execute(f'PRAGMA table_info("{table}")')
@@ -158,19 +225,61 @@ class SQLiteDB:
         self.conn.commit()
         return [], []
     
-    def export_table(self, table: str, fmt: str = "csv") -> str:
-        cols, rows = self.query(f'SELECT * FROM "{table}"')
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if fmt == "json":
-            out_path = f"{table}_{ts}.json"
-            data = [dict(zip(cols, row)) for row in rows]
-            Path(out_path).write_text(json.dumps(data, indent=2, default=str))
-        else:
-            out_path = f"{table}_{ts}.csv"
+    def iter_rows(self, sql: str, params: tuple = (), chunk_size: int = EXPORT_CHUNK_ROWS
+                  ) -> Tuple[List[str], Iterator[List[tuple]]]:
+        """Run a query and return its columns plus an iterator of row chunks.
+
+        Rows are pulled from the cursor chunk_size at a time as plain
+        tuples, so memory stays flat however large the result is.
+        """
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        cols = [d[0] for d in cur.description] if cur.description else []
+
+        def chunks():
+            try:
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        return
+                    yield rows
+            finally:
+                cur.close()
+
+        return cols, chunks()
+
+    def export_table(self, table: str, fmt: str = "csv", out_path: Optional[str] = None,
+                     chunk_size: int = EXPORT_CHUNK_ROWS) -> str:
+        """Stream a table to CSV, JSON or NDJSON without loading it into memory."""
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt} (use {', '.join(EXPORT_FORMATS)})")
+        cols, chunks = self.iter_rows(f'SELECT * FROM "{table}"', chunk_size=chunk_size)
+        if out_path is None:
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            out_path = f"{table}_{ts}.{fmt}"
+
+        if fmt == "csv":
             with open(out_path, "w", newline="") as f:
                 w = csv.writer(f)
                 w.writerow(cols)
-                w.writerows(rows)
+                for rows in chunks:
+                    w.writerows(rows)
+        elif fmt == "ndjson":
+            encode = json.JSONEncoder(default=str).encode
+            with open(out_path, "w") as f:
+                for rows in chunks:
+                    f.writelines(encode(dict(zip(cols, row))) + "\n" for row in rows)
+        else:
+            # Same layout as json.dumps(rows, indent=2), written one record at a time
+            with open(out_path, "w") as f:
+                first = True
+                for rows in chunks:
+                    for row in rows:
+                        record = json.dumps(dict(zip(cols, row)), indent=2, default=str)
+                        f.write(("[\n  " if first else ",\n  ") + record.replace("\n", "\n  "))
+                        first = False
+                f.write("[]" if first else "\n]")
         return out_path
 
 
@@ -320,7 +429,7 @@ def cmd_db(args: List[str] = None):
         print(f"  {cyan('Usage:')}")
         print(f"    mw db status                    Connection status & info")
         print(f"    mw db init [sqlite|postgres]     Initialize DB config")
-        print(f"    mw db tables                     List tables with row counts")
+        print("    mw db tables [--exact]           List tables with row counts (~ = estimate)")
         print(f"    mw db schema <table>             Show table columns")
         print(f"    mw db query \"SQL\"                Run ad-hoc SQL")
         print(f"    mw db migrate <name>             Create a new migration")
@@ -328,7 +437,8 @@ def cmd_db(args: List[str] = None):
         print(f"    mw db migrate --rollback         Rollback last migration")
         print(f"    mw db migrate --list             List all migrations")
         print(f"    mw db seed [file]                Seed with sample data")
-        print(f"    mw db export <table> [--json]    Export table to CSV/JSON")
+        print("    mw db export <table> [--json|--ndjson] [--out path]")
+        print("                                     Stream table to CSV/JSON/NDJSON")
         print(f"    mw db backup [path]              Backup database")
         print(f"    mw db restore <path>             Restore from backup")
         print(f"    mw db reset                      Drop all & re-migrate")
@@ -396,8 +506,9 @@ def cmd_db(args: List[str] = None):
                 if db.connect():
                     tables = db.tables()
                     total_rows = sum(t["rows"] for t in tables)
+                    approx = "" if all(t["exact"] for t in tables) else "~"
                     print(f"  Tables: {len(tables)}")
-                    print(f"  Rows:   {total_rows}")
+                    print(f"  Rows:   {approx}{total_rows}")
                     db.close()
             else:
                 print(f"  Path:   {red(path)} (not found)")
@@ -447,7 +558,7 @@ def cmd_db(args: List[str] = None):
         if subcmd == "tables":
             if not db or not db.connect():
                 return 1
-            tables = db.tables()
+            tables = db.tables(exact="--exact" in sub_args)
             if not tables:
                 print(f"\n  {yellow('!')} No tables found\n")
                 return 0
@@ -456,9 +567,13 @@ def cmd_db(args: List[str] = None):
             for t in tables:
                 bar = "█" * min(t["rows"] // 10 + 1, 30) if t["rows"] > 0 else dim("empty")
                 name = t['name']
-                rows_str = str(t['rows']).rjust(8)
-                print(f"  {name:<{max_name+2}} {green(rows_str)} rows  {bar}")
-            print(f"\n  Total: {sum(t['rows'] for t in tables)} rows in {len(tables)} tables\n")
+                rows_str = ("" if t["exact"] else "~") + str(t['rows'])
+                print(f"  {name:<{max_name+2}} {green(rows_str.rjust(9))} rows  {bar}")
+            approx = not all(t["exact"] for t in tables)
+            print(f"\n  Total: {'~' if approx else ''}{sum(t['rows'] for t in tables)} rows in {len(tables)} tables")
+            if approx:
+                print(f"  {dim('~ estimated without scanning; use --exact for COUNT(*)')}")
+            print()
             return 0
         
         # ── Schema ──
@@ -585,14 +700,22 @@ def cmd_db(args: List[str] = None):
         # ── Export ──
         elif subcmd == "export":
             if not sub_args:
-                print(f"  {red('✗')} Usage: mw db export <table> [--json]")
+                print(f"  {red('✗')} Usage: mw db export <table> [--json|--ndjson] [--out path]")
                 return 1
             if not db or not db.connect():
                 return 1
             table = sub_args[0]
-            fmt = "json" if "--json" in sub_args else "csv"
-            path = db.export_table(table, fmt)
-            print(f"  {green('✓')} Exported to: {path}")
+            fmt = "ndjson" if "--ndjson" in sub_args else "json" if "--json" in sub_args else "csv"
+            out_path = None
+            if "--out" in sub_args:
+                idx = sub_args.index("--out")
+                if idx + 1 >= len(sub_args):
+                    print(f"  {red('✗')} --out needs a path")
+                    return 1
+                out_path = sub_args[idx + 1]
+            start = time.time()
+            path = db.export_table(table, fmt, out_path=out_path)
+            print(f"  {green('✓')} Exported to: {path} ({time.time() - start:.1f}s)")
             return 0
         
         # ── Backup ──
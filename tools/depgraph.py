@@ -13,13 +13,21 @@ Usage:
     mw depgraph --module NAME       Show deps for a specific module only
     mw depgraph --cycles            Detect and highlight circular imports
     mw depgraph --stats             Show import statistics
+    mw depgraph --watch             Rescan as files change, reporting new cycles
+    mw depgraph --interval SECS     Polling interval for --watch (default: 1)
+    mw depgraph --no-cache          Re-parse every file instead of using the import cache
+
+Parsed imports are cached per file in ~/.mywork/depgraph_cache, so repeat
+scans only re-parse files whose contents changed.
 """
 
 import ast
+import hashlib
 import json
 import os
 import sys
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -35,144 +43,385 @@ BLUE = "\033[94m"
 MAGENTA = "\033[95m"
 
 
+SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", "env",
+             ".tox", ".mypy_cache", ".pytest_cache", "dist", "build", ".eggs"}
+
+CACHE_DIR = Path(os.environ.get("MYWORK_DEPGRAPH_CACHE", Path.home() / ".mywork" / "depgraph_cache"))
+CACHE_VERSION = 1
+
+
+def _parse_imports(source: str, filename: str) -> List[list]:
+    """Every import in a source file as [module, [names], level] records."""
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return []
+    records = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                records.append([alias.name, [], 0])
+        elif isinstance(node, ast.ImportFrom):
+            records.append([node.module or "", [alias.name for alias in node.names], node.level])
+    return records
+
+
+def _classify(records: List[list]) -> Tuple[Set[str], Set[str]]:
+    local_imports = set()
+    external_imports = set()
+    for module, names, level in records:
+        if not names:
+            external_imports.add(module.split(".")[0])
+        elif module:
+            name = module.split(".")[0]
+            if level > 0:
+                local_imports.add(name)
+            else:
+                external_imports.add(name)
+    return local_imports, external_imports
+
+
+def _count_loc(source: str) -> int:
+    return sum(1 for line in source.splitlines()
+               if line.strip() and not line.strip().startswith("#"))
+
+
 def extract_imports(filepath: Path) -> Tuple[Set[str], Set[str]]:
     """Extract import statements from a Python file.
     
     Returns:
         (local_imports, external_imports)
     """
-    local_imports = set()
-    external_imports = set()
-    
     try:
         source = filepath.read_text(encoding="utf-8", errors="ignore")
-        tree = ast.parse(source, filename=str(filepath))
-    except (SyntaxError, UnicodeDecodeError):
-        return local_imports, external_imports
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                name = alias.name.split(".")[0]
-                external_imports.add(name)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                name = node.module.split(".")[0]
-                if node.level > 0:
-                    local_imports.add(name)
-                else:
-                    external_imports.add(name)
-    
-    return local_imports, external_imports
+    except OSError:
+        return set(), set()
+    return _classify(_parse_imports(source, str(filepath)))
+
+
+class ImportCache:
+    """Parsed imports and LOC per file, persisted between runs.
+
+    An entry is reused while the file's size and mtime are unchanged; when
+    they differ the file is re-read, and only re-parsed if its sha1 changed.
+    """
+
+    def __init__(self, project_path: Path, cache_dir: Path = None):
+        project_path = Path(project_path).resolve()
+        digest = hashlib.sha1(str(project_path).encode()).hexdigest()[:16]
+        self.path = Path(cache_dir or CACHE_DIR) / f"{digest}.json"
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        self.hits = self.rehashed = self.parsed = 0
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def lookup(self, rel: str, filepath: Path) -> Tuple[List[list], int]:
+        """(import records, loc) for a file, parsing it only if its content changed."""
+        try:
+            st = filepath.stat()
+        except OSError:
+            return [], 0
+        entry = self.entries.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            self.hits += 1
+            return entry[3], entry[4]
+        try:
+            raw = filepath.read_bytes()
+        except OSError:
+            return [], 0
+        sha = hashlib.sha1(raw).hexdigest()
+        if entry and entry[2] == sha:
+            self.rehashed += 1
+            records, loc = entry[3], entry[4]
+        else:
+            self.parsed += 1
+            source = raw.decode("utf-8", errors="ignore")
+            records, loc = _parse_imports(source, str(filepath)), _count_loc(source)
+        self.entries[rel] = [st.st_size, st.st_mtime_ns, sha, records, loc]
+        self.dirty = True
+        return records, loc
+
+    def prune(self, live: Set[str]):
+        for rel in set(self.entries) - live:
+            del self.entries[rel]
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": self.entries},
+                                      separators=(",", ":")))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # caching is best effort
+
+
+class ModuleTrie:
+    """Dotted module names in a trie, for longest-prefix resolution of imports."""
+
+    _END = "\0"
+
+    def __init__(self, modules=()):
+        self.root: Dict[str, dict] = {}
+        for module in modules:
+            self.add(module)
 
+    def add(self, module: str):
+        node = self.root
+        for part in module.split("."):
+            node = node.setdefault(part, {})
+        node[self._END] = module
 
-def scan_project(project_path: Path, include_external: bool = False) -> Dict:
-    """Scan a project directory and build dependency map."""
+    def longest_prefix(self, parts: List[str]) -> Optional[str]:
+        """The longest module name that is a prefix of parts (a.b.c -> a.b if a.b.c is not a module)."""
+        node, found = self.root, None
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                break
+            found = node.get(self._END, found)
+        return found
+
+
+def _find_python_files(project_path: Path) -> List[Path]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        files.extend(Path(dirpath, f) for f in sorted(filenames) if f.endswith(".py"))
+    return sorted(files)
+
+
+def _resolve(module: str, is_package: bool, record: list, trie: ModuleTrie) -> Set[str]:
+    """Local modules an import record refers to."""
+    target, names, level = record
+    if level:
+        base = module.split(".") if is_package else module.split(".")[:-1]
+        if level - 1 > len(base):
+            return set()
+        base = base[:len(base) - (level - 1)]
+        parts = base + (target.split(".") if target else [])
+    else:
+        parts = target.split(".")
+    if not names:
+        found = trie.longest_prefix(parts)
+        return {found} if found else set()
+    resolved = set()
+    for name in names:
+        # `from pkg import sub` imports the submodule when there is one
+        found = trie.longest_prefix(parts + [name]) if name != "*" else None
+        found = found or trie.longest_prefix(parts)
+        if found:
+            resolved.add(found)
+    return resolved
+
+
+def scan_project(project_path: Path, include_external: bool = False,
+                 cache: Optional[ImportCache] = None, use_cache: bool = True) -> Dict:
+    """Scan a project directory and build dependency map.
+
+    Each entry has local_deps (top-level local names, as imported), loc,
+    optionally external_deps, and imports: the local modules its imports
+    resolve to, which is what cycle detection follows.
+    """
     project_path = project_path.resolve()
-    
-    # Find all Python files
-    py_files = sorted(project_path.rglob("*.py"))
-    
-    # Filter out common non-source dirs
-    skip_dirs = {".git", "__pycache__", "node_modules", ".venv", "venv", "env",
-                 ".tox", ".mypy_cache", ".pytest_cache", "dist", "build", ".eggs"}
-    
-    py_files = [
-        f for f in py_files
-        if not any(s in f.parts for s in skip_dirs)
-    ]
+    if cache is None and use_cache:
+        cache = ImportCache(project_path)
     
     # Build module name mapping
     modules = {}
-    for f in py_files:
-        try:
-            rel = f.relative_to(project_path)
-        except ValueError:
-            continue
+    packages = set()
+    for f in _find_python_files(project_path):
+        rel = f.relative_to(project_path)
         
         # Convert path to module name
         parts = list(rel.parts)
         if parts[-1] == "__init__.py":
             parts = parts[:-1]
         else:
-            parts[-1] = parts[-1].replace(".py", "")
+            parts[-1] = parts[-1][:-len(".py")]
         
         if parts:
             module_name = ".".join(parts)
-            modules[module_name] = f
+            modules[module_name] = (rel.as_posix(), f)
+            if rel.name == "__init__.py":
+                packages.add(module_name)
     
     # Get the set of local top-level package names
-    local_packages = set()
-    for m in modules:
-        local_packages.add(m.split(".")[0])
+    local_packages = {m.split(".")[0] for m in modules}
+    trie = ModuleTrie(modules)
     
     # Build dependency graph
-    graph = {}  # module -> {local_deps, external_deps, loc}
+    graph = {}  # module -> {local_deps, external_deps, loc, imports}
     
-    for module_name, filepath in modules.items():
-        local_imports, external_imports = extract_imports(filepath)
+    for module_name, (rel, filepath) in modules.items():
+        if cache is not None:
+            records, loc = cache.lookup(rel, filepath)
+        else:
+            try:
+                source = filepath.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                source = ""
+            records, loc = _parse_imports(source, str(filepath)), _count_loc(source)
+        local_imports, external_imports = _classify(records)
         
         # Classify: if top-level matches a local package, it's local
-        local_deps = set()
+        local_deps = set(local_imports)
         ext_deps = set()
-        
         for imp in external_imports:
             if imp in local_packages:
                 local_deps.add(imp)
             else:
                 ext_deps.add(imp)
         
-        local_deps.update(local_imports)
-        
-        # Count lines of code
-        try:
-            loc = sum(1 for line in filepath.read_text(errors="ignore").splitlines() 
-                      if line.strip() and not line.strip().startswith("#"))
-        except Exception:
-            loc = 0
+        resolved = set()
+        for record in records:
+            resolved |= _resolve(module_name, module_name in packages, record, trie)
+        resolved.discard(module_name)
         
-        entry = {"local_deps": sorted(local_deps), "loc": loc}
+        entry = {"local_deps": sorted(local_deps), "loc": loc, "imports": sorted(resolved)}
         if include_external:
             entry["external_deps"] = sorted(ext_deps)
         
         graph[module_name] = entry
     
+    if cache is not None:
+        cache.prune({rel for rel, _ in modules.values()})
+        cache.save()
     return graph
 
 
+def _edges(graph: Dict) -> Dict[str, List[str]]:
+    return {m: [d for d in data.get("imports", data.get("local_deps", [])) if d in graph]
+            for m, data in graph.items()}
+
+
+def strongly_connected_components(edges: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan's algorithm with an explicit stack, so deep graphs can't hit the recursion limit."""
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components = []
+    
+    for root in edges:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, neighbours = work[-1]
+            for nxt in neighbours:
+                if nxt not in index:
+                    index[nxt] = low[nxt] = len(index)
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(edges.get(nxt, ()))))
+                    break
+                if nxt in on_stack:
+                    low[node] = min(low[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
 def detect_cycles(graph: Dict) -> List[List[str]]:
-    """Detect circular import cycles using DFS."""
-    cycles = []
-    visited = set()
-    rec_stack = set()
-    path = []
-    
-    def dfs(node):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-        
-        deps = graph.get(node, {}).get("local_deps", [])
-        for dep in deps:
-            # Find modules that start with this dep
-            matching = [m for m in graph if m == dep or m.startswith(dep + ".")]
-            for neighbor in matching:
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    idx = path.index(neighbor)
-                    cycle = path[idx:] + [neighbor]
-                    cycles.append(cycle)
-        
-        path.pop()
-        rec_stack.discard(node)
-    
-    for node in graph:
-        if node not in visited:
-            dfs(node)
-    
-    return cycles
+    """Every group of mutually dependent modules (strongly connected
+    component), largest first, each sorted by name."""
+    edges = _edges(graph)
+    groups = [sorted(c) for c in strongly_connected_components(edges)
+              if len(c) > 1 or c[0] in edges[c[0]]]
+    return sorted(groups, key=lambda g: (-len(g), g))
+
+
+def cycle_path(graph: Dict, group: List[str]) -> List[str]:
+    """The shortest cycle through a group's first module: [a, b, ..., a]."""
+    edges = _edges(graph)
+    members = set(group)
+    start = group[0]
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for nxt in edges[node]:
+            if nxt == start:
+                path = [node]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return path[::-1] + [start]
+            if nxt in members and nxt not in parents:
+                parents[nxt] = node
+                queue.append(nxt)
+    return list(group)
+
+
+def diff_graphs(old: Dict, new: Dict) -> Dict[str, List[str]]:
+    """Modules added, removed and changed between two scans."""
+    return {
+        "added": sorted(set(new) - set(old)),
+        "removed": sorted(set(old) - set(new)),
+        "changed": sorted(m for m in set(old) & set(new) if old[m] != new[m]),
+    }
+
+
+def watch(project_path: Path, include_external: bool = False, interval: float = 1.0,
+          max_updates: Optional[int] = None, out=print) -> Dict:
+    """Rescan on an interval and report changed modules and cycles.
+
+    Unchanged files are served from the import cache, so each pass costs a
+    directory walk and a stat per file. Returns the last graph.
+    """
+    cache = ImportCache(project_path)
+    graph = scan_project(project_path, include_external, cache=cache)
+    cycles = detect_cycles(graph)
+    out(f"{CYAN}👀 Watching {project_path} — {len(graph)} modules, {len(cycles)} cycle groups "
+        f"(Ctrl+C to stop){RESET}")
+    updates = 0
+    try:
+        while max_updates is None or updates < max_updates:
+            time.sleep(interval)
+            new_graph = scan_project(project_path, include_external, cache=cache)
+            changes = diff_graphs(graph, new_graph)
+            if not any(changes.values()):
+                continue
+            updates += 1
+            new_cycles = detect_cycles(new_graph)
+            stamp = time.strftime("%H:%M:%S")
+            for kind, color in (("added", GREEN), ("removed", RED), ("changed", YELLOW)):
+                for module in changes[kind]:
+                    out(f"{DIM}{stamp}{RESET} {color}{kind:8s}{RESET} {module}")
+            for group in new_cycles:
+                if group not in cycles:
+                    out(f"{DIM}{stamp}{RESET} {RED}new cycle: {' → '.join(cycle_path(new_graph, group))}{RESET}")
+            for group in cycles:
+                if group not in new_cycles:
+                    out(f"{DIM}{stamp}{RESET} {GREEN}cycle resolved: {', '.join(group)}{RESET}")
+            graph, cycles = new_graph, new_cycles
+    except KeyboardInterrupt:
+        pass
+    return graph
 
 
 def format_ascii(graph: Dict, module_filter: Optional[str] = None, max_depth: Optional[int] = None) -> str:
@@ -250,17 +499,10 @@ def format_dot(graph: Dict, project_name: str = "project") -> str:
     
     lines.append('')
     
-    for module_name, data in graph.items():
+    for module_name, deps in _edges(graph).items():
         safe_name = module_name.replace(".", "_")
-        for dep in data.get("local_deps", []):
-            safe_dep = dep.replace(".", "_")
-            if safe_dep + "_" in "".join(f"{m.replace('.', '_')}" for m in graph):
-                # Find best match
-                matches = [m for m in graph if m.startswith(dep)]
-                for match in matches[:1]:
-                    lines.append(f'  {safe_name} -> {match.replace(".", "_")};')
-            else:
-                lines.append(f'  {safe_name} -> {safe_dep};')
+        for dep in deps:
+            lines.append(f'  {safe_name} -> {dep.replace(".", "_")};')
     
     lines.append('}')
     return "\n".join(lines)
@@ -334,6 +576,9 @@ def main(args: List[str] = None):
     module_filter = None
     show_cycles = False
     show_statistics = False
+    watch_mode = False
+    interval = 1.0
+    use_cache = True
     project_path = Path.cwd()
     
     i = 0
@@ -357,6 +602,21 @@ def main(args: List[str] = None):
         elif arg in ("--stats", "-s"):
             show_statistics = True
             i += 1
+        elif arg in ("--watch", "-w"):
+            watch_mode = True
+            i += 1
+        elif arg == "--interval":
+            try:
+                interval = float(args[i + 1])
+            except (IndexError, ValueError):
+                interval = 0.0
+            if not interval > 0:
+                print(f"{RED}Error: --interval needs a positive number of seconds{RESET}")
+                sys.exit(1)
+            i += 2
+        elif arg == "--no-cache":
+            use_cache = False
+            i += 1
         elif arg in ("--help", "-h"):
             print(__doc__)
             return
@@ -372,8 +632,12 @@ def main(args: List[str] = None):
         print(f"{RED}Error: Path '{project_path}' does not exist{RESET}")
         sys.exit(1)
     
+    if watch_mode:
+        watch(project_path, include_external=include_external, interval=interval)
+        return
+    
     # Scan
-    graph = scan_project(project_path, include_external=include_external)
+    graph = scan_project(project_path, include_external=include_external, use_cache=use_cache)
     
     if not graph:
         print(f"{YELLOW}No Python modules found in {project_path}{RESET}")
@@ -383,9 +647,11 @@ def main(args: List[str] = None):
     if show_cycles:
         cycles = detect_cycles(graph)
         if cycles:
-            print(f"{RED}{BOLD}⚠️  Circular Import Cycles Detected!{RESET}")
-            for cycle in cycles:
-                print(f"  {RED}→ {' → '.join(cycle)}{RESET}")
+            print(f"{RED}{BOLD}⚠️  Circular Import Cycles Detected! ({len(cycles)} groups){RESET}")
+            for group in cycles:
+                print(f"  {RED}→ {' → '.join(cycle_path(graph, group))}{RESET}")
+                if len(group) > 2:
+                    print(f"    {DIM}{len(group)} modules: {', '.join(group)}{RESET}")
         else:
             print(f"{GREEN}✅ No circular imports detected{RESET}")
         print()
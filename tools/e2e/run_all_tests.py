@@ -4,18 +4,48 @@ E2E Test: Full Test Suite Runner
 ===============================
 Runs pytest on tests/ directory and all e2e tests.
 Aggregates results into comprehensive reports.
+
+pytest is split into shards balanced on the durations recorded by earlier
+runs, and the shards, e2e suites and smoke tests all run concurrently, each
+in its own temporary workspace.
 """
 
+import argparse
 import subprocess
 import sys
 import json
+import re
+import tempfile
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    from shard_planner import (
+        DEFAULT_DURATION,
+        STATUS_COUNTS,
+        DurationHistory,
+        balance_shards,
+        parse_pytest_output,
+    )
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from shard_planner import (
+        DEFAULT_DURATION,
+        STATUS_COUNTS,
+        DurationHistory,
+        balance_shards,
+        parse_pytest_output,
+    )
+
+SLOWEST_COUNT = 10
+
+
 class TestSuiteRunner:
-    def __init__(self, project_root: str = "/home/Memo1981/MyWork-AI"):
+    def __init__(self, project_root: str = "/home/Memo1981/MyWork-AI", workers: int = None,
+                 shards: int = None, history_dir: str = None):
         self.project_root = Path(project_root)
         self.e2e_dir = self.project_root / "tools" / "e2e"
         self.tests_dir = self.project_root / "tests"
@@ -27,6 +57,13 @@ class TestSuiteRunner:
         self.failed_tests = 0
         self.skipped_tests = 0
         
+        # Concurrency: thread pool size, and how many pytest shards to split into
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        self.history = DurationHistory(self.project_root, history_dir)
+        self.timings = {}  # suite name -> seconds
+        self.test_durations = {}  # pytest node id -> seconds, this run
+        
         # Ensure reports directory exists
         self.reports_dir.mkdir(exist_ok=True)
         
@@ -66,7 +103,8 @@ class TestSuiteRunner:
         self.results.append(result)
         print(f"[{status}] {test_name}: {message}")
         
-    def run_command(self, cmd: List[str], timeout: int = 300, cwd: Path = None) -> Dict[str, Any]:
+    def run_command(self, cmd: List[str], timeout: int = 300, cwd: Path = None,
+                    env: Dict[str, str] = None) -> Dict[str, Any]:
         """Run a command and return result"""
         try:
             start_time = time.time()
@@ -75,7 +113,8 @@ class TestSuiteRunner:
                 capture_output=True, 
                 text=True, 
                 timeout=timeout,
-                cwd=cwd or self.project_root
+                cwd=cwd or self.project_root,
+                env=env
             )
             end_time = time.time()
             
@@ -103,91 +142,128 @@ class TestSuiteRunner:
                 "duration": 0
             }
     
-    def run_pytest(self):
-        """Run pytest on the tests/ directory"""
+    def in_workspace(self, label: str, fn):
+        """Call fn(workspace, env) inside a fresh temp directory that is removed afterwards.
+
+        TMPDIR and friends point into the workspace so concurrent suites never
+        share scratch files.
+        """
+        prefix = "mw-e2e-" + re.sub(r"[^\w.-]", "_", label) + "-"
+        with tempfile.TemporaryDirectory(prefix=prefix) as workspace:
+            env = dict(os.environ, TMPDIR=workspace, TEMP=workspace, TMP=workspace,
+                       MYWORK_E2E_WORKSPACE=workspace)
+            return fn(Path(workspace), env)
+
+    def collect_pytest(self):
+        """Node ids of the tests pytest would run, or None if pytest can't be used."""
         if not self.tests_dir.exists():
             self.log_result("pytest", "SKIP", "tests/ directory not found")
             return None
-        
-        # Check if pytest is available
-        pytest_check = self.run_command(["python3", "-m", "pytest", "--version"], timeout=10)
-        if not pytest_check["success"]:
+
+        result = self.run_command([
+            sys.executable, "-m", "pytest", str(self.tests_dir),
+            f"--rootdir={self.project_root}", "--collect-only", "--verbosity=-1",
+            "-p", "no:cacheprovider"
+        ], timeout=120)
+        if "No module named pytest" in result["stderr"]:
             self.log_result("pytest_setup", "SKIP", "pytest not available")
             return None
-        
-        print("Running pytest on tests/ directory...")
-        
-        # Run pytest with verbose output and JSON report
-        pytest_cmd = [
-            "python3", "-m", "pytest", 
-            str(self.tests_dir),
-            "-v",
-            "--tb=short",
-            "--no-header"
-        ]
-        
-        result = self.run_command(pytest_cmd, timeout=180)
-        
-        if result["success"]:
-            # Parse pytest output
-            output_lines = result["stdout"].split('\n')
-            
-            # Count test results
-            test_count = 0
-            passed_count = 0
-            failed_count = 0
-            skipped_count = 0
-            
-            for line in output_lines:
-                if " PASSED " in line:
-                    passed_count += 1
-                    test_count += 1
-                elif " FAILED " in line:
-                    failed_count += 1
-                    test_count += 1
-                elif " SKIPPED " in line:
-                    skipped_count += 1
-                    test_count += 1
-            
-            if test_count > 0:
-                success_rate = (passed_count / test_count) * 100
-                status = "PASS" if failed_count == 0 else ("WARN" if success_rate >= 80 else "FAIL")
-                message = f"{passed_count}/{test_count} tests passed ({success_rate:.1f}%)"
-                
-                details = {
-                    "total": test_count,
-                    "passed": passed_count,
-                    "failed": failed_count,
-                    "skipped": skipped_count,
-                    "duration": result["duration"]
-                }
-                
-                self.log_result("pytest", status, message, details)
-                return details
-            else:
-                self.log_result("pytest", "WARN", "No tests found or executed", {"duration": result["duration"]})
-                return {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "duration": result["duration"]}
-        else:
-            self.log_result("pytest", "FAIL", f"pytest execution failed: {result['stderr']}")
+        if result["returncode"] not in (0, 5):  # 5: nothing collected
+            self.log_result("pytest", "FAIL", f"pytest collection failed: {(result['stderr'] or result['stdout'])[-200:]}")
             return None
-    
-    def run_e2e_tests(self):
-        """Run all E2E test files"""
+        return [line.strip() for line in result["stdout"].splitlines() if "::" in line]
+
+    def plan_pytest(self):
+        """Collect pytest and balance it into (tests, expected_seconds) shards."""
+        tests = self.collect_pytest()
+        if tests is None:
+            return None
+        shards = balance_shards(tests, self.history.durations, self.shards)
+        if shards:
+            print(f"Running pytest on tests/ directory: {len(tests)} tests in {len(shards)} shards...")
+        return shards
+
+    def run_pytest_shard(self, index: int, tests: List[str]) -> Dict[str, Any]:
+        """Run one shard of pytest node ids in its own workspace"""
+        def run(workspace, env):
+            return self.run_command([
+                sys.executable, "-m", "pytest", *tests,
+                f"--rootdir={self.project_root}",
+                "-v",
+                "--tb=short",
+                "--no-header",
+                "-p", "no:cacheprovider",
+                f"--basetemp={workspace / 'basetemp'}",
+                "--durations=0", "--durations-min=0"
+            ], timeout=180, env=env)
+        return self.in_workspace(f"pytest-{index}", run)
+
+    def finish_pytest(self, shards, results):
+        """Merge shard outputs into one pytest result"""
+        counts = {"passed": 0, "failed": 0, "skipped": 0}
+        shard_details = []
+        for (tests, expected), result in zip(shards, results):
+            statuses, durations = parse_pytest_output(result["stdout"])
+            self.test_durations.update(durations)
+            for status in statuses.values():
+                counts[STATUS_COUNTS[status]] += 1
+            missing = [t for t in tests if t not in statuses]
+            if result["returncode"] not in (0, 1, 5):
+                # Timed out or crashed: whatever did not report counts as failed
+                counts["failed"] += len(missing)
+                print(f"[FAIL] pytest shard {len(shard_details)}: {result['stderr'][:200]}")
+            shard_details.append({
+                "tests": len(tests),
+                "expected_duration": round(expected, 2),
+                "duration": result["duration"],
+                "returncode": result["returncode"]
+            })
+
+        duration = max((s["duration"] for s in shard_details), default=0)
+        self.timings["pytest"] = duration
+        test_count = sum(counts.values())
+        if test_count == 0:
+            self.log_result("pytest", "WARN", "No tests found or executed", {"duration": duration})
+            return {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "duration": duration}
+
+        success_rate = (counts["passed"] / test_count) * 100
+        status = "PASS" if counts["failed"] == 0 else ("WARN" if success_rate >= 80 else "FAIL")
+        message = f"{counts['passed']}/{test_count} tests passed ({success_rate:.1f}%)"
+        slowest = sorted(self.test_durations.items(), key=lambda kv: -kv[1])[:SLOWEST_COUNT]
+        details = {
+            "total": test_count,
+            **counts,
+            "duration": duration,
+            "cumulative_duration": round(sum(s["duration"] for s in shard_details), 2),
+            "shards": shard_details,
+            "slowest_tests": [{"test": t, "duration": round(d, 3)} for t, d in slowest]
+        }
+        self.log_result("pytest", status, message, details)
+        return details
+
+    def run_script(self, test_path: Path, timeout: int) -> Dict[str, Any]:
+        """Run a standalone test script from inside its own workspace"""
+        return self.in_workspace(test_path.stem, lambda workspace, env: self.run_command(
+            [sys.executable, str(test_path)], timeout=timeout, cwd=workspace, env=env))
+
+    def plan_e2e(self):
+        """E2E test files that exist"""
         print(f"\nRunning E2E tests from {self.e2e_dir}...")
-        
-        e2e_results = {}
-        
+        planned = []
         for test_file in self.e2e_tests:
-            test_path = self.e2e_dir / test_file
-            
-            if not test_path.exists():
+            if not (self.e2e_dir / test_file).exists():
                 self.log_result(f"e2e_{test_file.replace('.py', '')}", "SKIP", f"{test_file} not found")
                 continue
-            
-            print(f"\nRunning {test_file}...")
-            result = self.run_command(["python3", str(test_path)], timeout=180)
-            
+            planned.append(test_file)
+        return planned
+
+    def finish_e2e(self, planned, results):
+        """Log each E2E file's outcome, reading its JSON results when present"""
+        e2e_results = {}
+
+        for test_file, result in zip(planned, results):
             test_name = f"e2e_{test_file.replace('.py', '')}"
+            self.timings[test_name] = result["duration"]
             
             if result["success"]:
                 # Try to load JSON results if available
@@ -227,23 +303,19 @@ class TestSuiteRunner:
                 self.log_result(test_name, "FAIL", f"Execution failed: {result['stderr'][:200]}")
         
         return e2e_results
-    
-    def run_smoke_tests(self):
-        """Run existing smoke tests"""
+
+    def plan_smoke(self):
+        """Smoke test files that exist; missing ones are skipped silently"""
         print(f"\nRunning smoke tests from {self.project_root}/tools/...")
-        
+        return [f for f in self.smoke_tests if (self.project_root / "tools" / f).exists()]
+
+    def finish_smoke(self, planned, results):
+        """Log each smoke test's outcome"""
         smoke_results = {}
         
-        for test_file in self.smoke_tests:
-            test_path = self.project_root / "tools" / test_file
-            
-            if not test_path.exists():
-                continue  # Skip missing smoke tests silently
-            
-            print(f"Running {test_file}...")
-            result = self.run_command(["python3", str(test_path)], timeout=120)
-            
+        for test_file, result in zip(planned, results):
             test_name = f"smoke_{test_file.replace('.py', '').replace('smoke_test_', '')}"
+            self.timings[test_name] = result["duration"]
             
             if result["success"]:
                 self.log_result(test_name, "PASS", "Smoke test passed", {"duration": result["duration"]})
@@ -258,8 +330,57 @@ class TestSuiteRunner:
                     smoke_results[test_name] = {"status": "FAIL", "error": result["stderr"][:200]}
         
         return smoke_results
+
+    def run_phases(self, pytest: bool = True, e2e: bool = True, smoke: bool = True):
+        """Run the selected test types concurrently on one worker pool.
+
+        Every pytest shard and script suite becomes a job; jobs are started
+        longest-expected first so the slow ones don't end up last in the queue.
+        Results are logged in a fixed order once everything has finished.
+        """
+        shards = self.plan_pytest() if pytest else None
+        e2e_files = self.plan_e2e() if e2e else []
+        smoke_files = self.plan_smoke() if smoke else []
+
+        def script_job(path, timeout):
+            key = str(path.relative_to(self.project_root))
+            return (self.history.durations.get(key, DEFAULT_DURATION), self.run_script, path, timeout)
+
+        jobs = [(expected, self.run_pytest_shard, i, tests) for i, (tests, expected) in enumerate(shards or [])]
+        jobs += [script_job(self.e2e_dir / f, 180) for f in e2e_files]
+        jobs += [script_job(self.project_root / "tools" / f, 120) for f in smoke_files]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [None] * len(jobs)
+            for i in sorted(range(len(jobs)), key=lambda i: -jobs[i][0]):
+                futures[i] = pool.submit(*jobs[i][1:])
+            results = [f.result() for f in futures]
+
+        n_shards, n_e2e = len(shards or []), len(e2e_files)
+        pytest_results = self.finish_pytest(shards, results[:n_shards]) if shards is not None else None
+        e2e_results = self.finish_e2e(e2e_files, results[n_shards:n_shards + n_e2e])
+        smoke_results = self.finish_smoke(smoke_files, results[n_shards + n_e2e:])
+
+        measured = dict(self.test_durations)
+        for job, result in zip(jobs[n_shards:], results[n_shards:]):
+            measured[str(job[2].relative_to(self.project_root))] = result["duration"]
+        self.history.update(measured)
+        self.history.save()
+        return pytest_results, e2e_results, smoke_results
+
+    def run_pytest(self):
+        """Run pytest on the tests/ directory, sharded across workers"""
+        return self.run_phases(e2e=False, smoke=False)[0]
+    
+    def run_e2e_tests(self):
+        """Run all E2E test files concurrently"""
+        return self.run_phases(pytest=False, smoke=False)[1]
     
-    def generate_comprehensive_report(self, pytest_results, e2e_results, smoke_results):
+    def run_smoke_tests(self):
+        """Run existing smoke tests concurrently"""
+        return self.run_phases(pytest=False, e2e=False)[2]
+    
+    def generate_comprehensive_report(self, pytest_results, e2e_results, smoke_results, wall_time: float = None):
         """Generate comprehensive test report"""
         timestamp = time.strftime("%Y-%m-%d")
         success_rate = (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0
@@ -280,7 +401,12 @@ class TestSuiteRunner:
                 "failed": self.failed_tests,
                 "skipped": self.skipped_tests,
                 "success_rate": round(success_rate, 2),
-                "total_duration_seconds": round(total_duration, 2)
+                "total_duration_seconds": round(total_duration, 2),
+                "wall_time_seconds": round(wall_time if wall_time is not None else total_duration, 2)
+            },
+            "timings": {
+                "suites": dict(sorted(self.timings.items(), key=lambda kv: -kv[1])),
+                "slowest_tests": (pytest_results or {}).get("slowest_tests", [])
             },
             "pytest_results": pytest_results,
             "e2e_results": e2e_results,
@@ -303,7 +429,7 @@ class TestSuiteRunner:
         print(f"Failed: {self.failed_tests}")
         print(f"Skipped: {self.skipped_tests}")
         print(f"Success Rate: {success_rate:.1f}%")
-        print(f"Total Duration: {total_duration:.1f}s")
+        print(f"Total Duration: {total_duration:.1f}s (wall {report['summary']['wall_time_seconds']:.1f}s)")
         print(f"\nReports saved:")
         print(f"  JSON: {json_report_file}")
         print(f"  Markdown: {md_report_file}")
@@ -324,7 +450,22 @@ class TestSuiteRunner:
 - **Skipped:** {report['summary']['skipped']}
 - **Success Rate:** {report['summary']['success_rate']:.1f}%
 - **Duration:** {report['summary']['total_duration_seconds']:.1f}s
+- **Wall Time:** {report['summary']['wall_time_seconds']:.1f}s
+
+## Timings
 
+| Suite | Duration |
+|-------|----------|
+"""
+        for suite, duration in report['timings']['suites'].items():
+            md_content += f"| {suite} | {duration:.1f}s |\n"
+        
+        if report['timings']['slowest_tests']:
+            md_content += "\n### Slowest Tests\n\n"
+            for i, test in enumerate(report['timings']['slowest_tests'], 1):
+                md_content += f"{i}. `{test['test']}` - {test['duration']:.2f}s\n"
+        
+        md_content += """
 ## Test Results
 
 ### Unit Tests (pytest)
@@ -404,15 +545,14 @@ class TestSuiteRunner:
         
         start_time = time.time()
         
-        # Run all test types
-        pytest_results = self.run_pytest()
-        e2e_results = self.run_e2e_tests()
-        smoke_results = self.run_smoke_tests()
+        # Run all test types side by side
+        pytest_results, e2e_results, smoke_results = self.run_phases()
         
         end_time = time.time()
         
         # Generate comprehensive report
-        report = self.generate_comprehensive_report(pytest_results, e2e_results, smoke_results)
+        report = self.generate_comprehensive_report(pytest_results, e2e_results, smoke_results,
+                                                    wall_time=end_time - start_time)
         
         print(f"\nTotal execution time: {end_time - start_time:.1f}s")
         
@@ -421,7 +561,13 @@ class TestSuiteRunner:
 
 def main():
     """Main entry point"""
-    runner = TestSuiteRunner()
+    parser = argparse.ArgumentParser(description="Run pytest, e2e and smoke tests and write reports")
+    parser.add_argument("--root", default="/home/Memo1981/MyWork-AI", help="Project root")
+    parser.add_argument("-j", "--jobs", type=int, help="Concurrent jobs (default: CPU count)")
+    parser.add_argument("--shards", type=int, help="pytest shards (default: --jobs)")
+    args = parser.parse_args()
+
+    runner = TestSuiteRunner(args.root, workers=args.jobs, shards=args.shards)
     report = runner.run_all_tests()
     
     # Exit with appropriate code
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Git History Miner
+=================
+One streamed `git log --numstat -z` pass, parsed into a compact columnar
+structure (commit time, author, paths, churn) and cached by HEAD sha in
+the repository's git directory, so the cache never shows up as an
+untracked file in the work tree being analyzed.
+
+Reporters (mw analytics, mw insights, mw context) query this instead of
+running their own `git log` passes. When HEAD moves forward only the new
+commits are mined and appended; a rewritten history triggers a rebuild.
+
+Usage:
+    from git_history import GitHistory
+
+    history = GitHistory.load(root)
+    if history:
+        history.author_counts(days=30)
+"""
+
+import json
+import os
+import subprocess
+import time
+from array import array
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+CACHE_VERSION = 1
+CACHE_FILE = Path("mw") / "git_history.json"  # relative to `git rev-parse --git-dir`
+
+# Commits older than this are not mined unless a query asks for more
+DEFAULT_HORIZON_DAYS = 365
+
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+LOG_FORMAT = "%x1e%H%x1f%ct%x1f%at%x1f%ai%x1f%an%x1f%s"
+READ_CHUNK = 1 << 16
+
+# Histories already loaded in this process, by repository top-level path
+_loaded: Dict[str, "GitHistory"] = {}
+
+
+def _git(args: List[str], cwd: str) -> Optional[str]:
+    """Run a short git command, returning stripped stdout or None on failure."""
+    try:
+        r = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return r.stdout.strip() if r.returncode == 0 else None
+
+
+def _stream_tokens(args: List[str], cwd: str) -> Iterator[str]:
+    """Yield NUL-delimited tokens from a git command without buffering its output."""
+    proc = subprocess.Popen(["git"] + args, cwd=cwd, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL)
+    try:
+        rest = b""
+        while True:
+            chunk = proc.stdout.read(READ_CHUNK)
+            if not chunk:
+                break
+            parts = (rest + chunk).split(b"\0")
+            rest = parts.pop()
+            for part in parts:
+                yield part.decode("utf-8", errors="replace")
+        if rest:
+            yield rest.decode("utf-8", errors="replace")
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+class GitHistory:
+    """Columnar commit history for one repository, oldest commit first.
+
+    Per-commit columns are parallel arrays; the files touched by commit i are
+    path_ids[file_start[i]:file_start[i + 1]] with matching added/deleted.
+    """
+
+    def __init__(self):
+        self.head = ""
+        self.horizon = 0  # epoch seconds of the oldest commit time mined (0 = all)
+        self.shas: List[str] = []
+        self.subjects: List[str] = []
+        self.commit_time = array("q")
+        self.author_time = array("q")
+        self.author_tz = array("h")  # author UTC offset in minutes
+        self.author_ids = array("l")
+        self.file_start = array("l", [0])
+        self.path_ids = array("l")
+        self.added = array("l")
+        self.deleted = array("l")
+        self.authors: List[str] = []
+        self.paths: List[str] = []
+        self._author_index: Dict[str, int] = {}
+        self._path_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.shas)
+
+    # ── Loading ──────────────────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, root, days: int = DEFAULT_HORIZON_DAYS,
+             use_cache: bool = True) -> Optional["GitHistory"]:
+        """History of the repository containing root, covering at least `days`.
+
+        Returns None when root is not inside a git repository (or has no commits).
+        """
+        out = _git(["rev-parse", "--show-toplevel", "--absolute-git-dir", "HEAD"], str(root))
+        if not out or len(out.splitlines()) != 3:
+            return None
+        top, git_dir, head = out.splitlines()
+
+        horizon = int(time.time()) - max(days, DEFAULT_HORIZON_DAYS) * 86400
+        cache_path = Path(git_dir) / CACHE_FILE
+        history = None
+        if use_cache:
+            history = _loaded.get(top) or cls._read_cache(cache_path)
+
+        if history and history.horizon <= horizon:
+            if history.head == head:
+                _loaded[top] = history
+                return history
+            if _git(["merge-base", "--is-ancestor", history.head, head], top) is not None:
+                history._mine(top, [f"{history.head}..{head}"])
+                history.head = head
+                history._write_cache(cache_path)
+                _loaded[top] = history
+                return history
+
+        history = cls()
+        history.horizon = horizon
+        history._mine(top, [f"--since=@{horizon}", head])
+        history.head = head
+        if use_cache:
+            history._write_cache(cache_path)
+            _loaded[top] = history
+        return history
+
+    def _mine(self, cwd: str, rev_args: List[str]):
+        """Stream `git log` for rev_args and append the commits (oldest first)."""
+        args = ["log", "-z", "--numstat", "--reverse", "--no-color",
+                f"--format={LOG_FORMAT}"] + rev_args
+        rename_pending = 0
+        stat = ("0", "0")
+        in_commit = False
+        for token in _stream_tokens(args, cwd):
+            if rename_pending:
+                # Renames are "a\td\t" followed by old and new path tokens
+                rename_pending -= 1
+                if rename_pending == 0:
+                    self._add_file(token, stat[0], stat[1])
+                continue
+            if token.startswith("\n"):
+                token = token[1:]
+            if token.startswith(RECORD_SEP):
+                if in_commit:
+                    self.file_start.append(len(self.path_ids))
+                self._add_commit(token[1:])
+                in_commit = True
+                continue
+            if not token or not in_commit:
+                continue
+            added, deleted, path = (token.split("\t", 2) + ["", ""])[:3]
+            if path:
+                self._add_file(path, added, deleted)
+            else:
+                stat = (added, deleted)
+                rename_pending = 2
+        if in_commit:
+            self.file_start.append(len(self.path_ids))
+
+    def _add_commit(self, header: str):
+        sha, ct, at, ai, author, subject = (header.split(FIELD_SEP, 5) + [""] * 6)[:6]
+        tz = ai[-5:]
+        try:
+            offset = (int(tz[1:3]) * 60 + int(tz[3:5])) * (-1 if tz[0] == "-" else 1)
+        except (ValueError, IndexError):
+            offset = 0
+        author_id = self._author_index.get(author)
+        if author_id is None:
+            author_id = self._author_index[author] = len(self.authors)
+            self.authors.append(author)
+        self.shas.append(sha)
+        self.subjects.append(subject)
+        self.commit_time.append(int(ct or 0))
+        self.author_time.append(int(at or 0))
+        self.author_tz.append(offset)
+        self.author_ids.append(author_id)
+
+    def _add_file(self, path: str, added: str, deleted: str):
+        path_id = self._path_index.get(path)
+        if path_id is None:
+            path_id = self._path_index[path] = len(self.paths)
+            self.paths.append(path)
+        self.path_ids.append(path_id)
+        # Binary files report "-" for both counts
+        self.added.append(int(added) if added.isdigit() else 0)
+        self.deleted.append(int(deleted) if deleted.isdigit() else 0)
+
+    # ── Cache ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _read_cache(cls, path: Path) -> Optional["GitHistory"]:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION:
+            return None
+        history = cls()
+        history.head = data["head"]
+        history.horizon = data["horizon"]
+        history.shas = data["shas"]
+        history.subjects = data["subjects"]
+        history.authors = data["authors"]
+        history.paths = data["paths"]
+        for name, typecode in (("commit_time", "q"), ("author_time", "q"), ("author_tz", "h"),
+                               ("author_ids", "l"), ("file_start", "l"), ("path_ids", "l"),
+                               ("added", "l"), ("deleted", "l")):
+            setattr(history, name, array(typecode, data[name]))
+        history._author_index = {a: i for i, a in enumerate(history.authors)}
+        history._path_index = {p: i for i, p in enumerate(history.paths)}
+        return history
+
+    def _write_cache(self, path: Path):
+        data = {
+            "version": CACHE_VERSION,
+            "head": self.head,
+            "horizon": self.horizon,
+            "shas": self.shas,
+            "subjects": self.subjects,
+            "authors": self.authors,
+            "paths": self.paths,
+        }
+        for name in ("commit_time", "author_time", "author_tz", "author_ids",
+                     "file_start", "path_ids", "added", "deleted"):
+            data[name] = getattr(self, name).tolist()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Cache is best-effort; the in-memory history is still valid
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def commits_since(self, days: int) -> List[int]:
+        """Indices of commits made in the last `days` days, newest first (like git log)."""
+        cutoff = int(time.time()) - days * 86400
+        times = self.commit_time
+        return [i for i in range(len(times) - 1, -1, -1) if times[i] >= cutoff]
+
+    def author_date(self, i: int) -> str:
+        """Commit i's author date (YYYY-MM-DD) in the author's own timezone."""
+        tz = timezone(timedelta(minutes=self.author_tz[i]))
+        return datetime.fromtimestamp(self.author_time[i], tz).strftime("%Y-%m-%d")
+
+    def commit_files(self, i: int) -> List[Tuple[str, int, int]]:
+        """(path, added, deleted) for every file touched by commit i."""
+        lo, hi = self.file_start[i], self.file_start[i + 1]
+        return [(self.paths[self.path_ids[j]], self.added[j], self.deleted[j])
+                for j in range(lo, hi)]
+
+    def daily_counts(self, days: int) -> Counter:
+        return Counter(self.author_date(i) for i in self.commits_since(days))
+
+    def author_counts(self, days: int) -> Counter:
+        return Counter(self.authors[self.author_ids[i]] for i in self.commits_since(days))
+
+    def author_activity(self, days: int) -> Dict[str, Dict[str, int]]:
+        """Per author: commits and distinct active days."""
+        commits = Counter()
+        active = defaultdict(set)
+        for i in self.commits_since(days):
+            name = self.authors[self.author_ids[i]]
+            commits[name] += 1
+            active[name].add(self.author_date(i))
+        return {name: {"commits": n, "active_days": len(active[name])}
+                for name, n in commits.items()}
+
+    def file_counts(self, days: int) -> Counter:
+        """How many commits touched each path."""
+        counts = Counter()
+        for i in self.commits_since(days):
+            for j in range(self.file_start[i], self.file_start[i + 1]):
+                counts[self.paths[self.path_ids[j]]] += 1
+        return counts
+
+    def churn(self, days: int) -> Counter:
+        """Lines added + deleted per path."""
+        counts = Counter()
+        for i in self.commits_since(days):
+            for j in range(self.file_start[i], self.file_start[i + 1]):
+                counts[self.paths[self.path_ids[j]]] += self.added[j] + self.deleted[j]
+        return counts
+
+    def recent(self, limit: int = 10) -> List[Tuple[str, str]]:
+        """(sha, subject) for the newest `limit` commits, newest first."""
+        n = len(self.shas)
+        return [(self.shas[i], self.subjects[i]) for i in range(n - 1, max(n - limit, 0) - 1, -1)]
@@ -9,6 +9,7 @@ Usage:
     python health_check.py quick        # Quick status check
     python health_check.py fix          # Auto-fix common issues
     python health_check.py report       # Generate detailed report
+    python health_check.py ... --fresh  # Ignore cached probe results
 
 Checks:
     - GSD installation and version
@@ -20,14 +21,24 @@ Checks:
     - Dependency versions
     - Disk space
     - Security issues
+
+Checks are declared as probes with dependencies and run concurrently, each
+with its own timeout. Slow-changing probes (tool versions, installed
+packages, AutoForge's git state, ...) are cached under ~/.mywork/health_cache
+with a TTL and a fingerprint of the files and $PATH they depend on.
 """
 
 import os
 import sys
 import json
+import hashlib
+import shutil
 import socket
 import subprocess
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from importlib import metadata
 
 try:
     import fcntl  # Unix-only
@@ -39,8 +50,8 @@ except ImportError:  # pragma: no cover - Unix fallback
     msvcrt = None
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Any, Tuple, Optional
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
 # Configuration - Import from shared config
@@ -59,6 +70,8 @@ except ImportError:
 
 # Health check lock file for preventing concurrent runs
 HEALTH_CHECK_LOCK = MYWORK_ROOT / ".tmp" / "health_check.lock"
+HEALTH_CACHE_DIR = Path(os.environ.get("MYWORK_HEALTH_CACHE", Path.home() / ".mywork" / "health_cache"))
+HEALTH_CACHE = HEALTH_CACHE_DIR / f"{hashlib.sha1(str(MYWORK_ROOT.resolve()).encode()).hexdigest()[:16]}.json"
 
 GSD_PATH = Path.home() / ".claude" / "commands" / "gsd"
 N8N_SKILLS_PATH = Path.home() / ".claude" / "skills" / "n8n-skills"
@@ -237,49 +250,217 @@ class CheckResult:
     fix_command: Optional[str] = None
 
 
+@dataclass
+class Probe:
+    """
+    One health check as the scheduler sees it.
+
+    run(checker, quick) reports through checker.add_result. A probe starts
+    once everything in depends has finished, and is skipped if one of them
+    reported an error or timed out. ttl > 0 makes its results cacheable
+    until the fingerprint of inputs() (files or directories) or $PATH
+    changes.
+    """
+    name: str
+    run: Callable[["HealthChecker", bool], None]
+    modes: Tuple[str, ...] = ("full",)
+    depends: Tuple[str, ...] = ()
+    timeout: float = 15.0
+    ttl: float = 0.0
+    inputs: Optional[Callable[[], List[Optional[Path]]]] = None
+    watch_path: bool = False
+    desktop: bool = False
+
+
+def _which(*names: str) -> Callable[[], List[Optional[Path]]]:
+    """Probe inputs: the executables $PATH currently resolves the names to."""
+    return lambda: [Path(p) if (p := shutil.which(n)) else None for n in names]
+
+
+def _site_packages() -> List[Optional[Path]]:
+    import sysconfig
+    return [Path(sysconfig.get_paths()["purelib"])]
+
+
+def _tool_sources() -> List[Optional[Path]]:
+    return sorted((MYWORK_ROOT / "tools").glob("*.py")) + [MYWORK_ROOT / ".gitignore"]
+
+
+class HealthCache:
+    """Probe results on disk, each with an expiry time and an input fingerprint."""
+
+    def __init__(self, path: Path = HEALTH_CACHE):
+        self.path = path
+        try:
+            self.entries: Dict[str, Any] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    @staticmethod
+    def fingerprint(probe: Probe, mode: str) -> str:
+        parts: List[Any] = [mode]
+        if probe.watch_path:
+            parts.append(os.environ.get("PATH", ""))
+        for path in (probe.inputs() if probe.inputs else []):
+            try:
+                st = path.stat() if path else None
+                parts.append([str(path), st.st_mtime_ns, st.st_size] if st else [str(path), None])
+            except OSError:
+                parts.append([str(path), None])
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def get(self, key: str, fingerprint: str) -> Optional[List[CheckResult]]:
+        entry = self.entries.get(key)
+        if not entry or entry["fingerprint"] != fingerprint or entry["expires"] < time.time():
+            return None
+        return [CheckResult(**dict(r, status=Status[r["status"]])) for r in entry["results"]]
+
+    def put(self, key: str, fingerprint: str, ttl: float, results: List[CheckResult]):
+        with self._lock:
+            self.entries[key] = {
+                "fingerprint": fingerprint,
+                "expires": time.time() + ttl,
+                "results": [dict(asdict(r), status=r.status.name) for r in results],
+            }
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, default=str))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # caching is best effort
+
+
 class HealthChecker:
     """Performs health checks on MyWork framework components."""
 
-    def __init__(self):
+    def __init__(self, fresh: bool = False, cache: Optional[HealthCache] = None, workers: int = 8):
         self.results: List[CheckResult] = []
+        self.fresh = fresh
+        self.cache = cache if cache is not None else HealthCache()
+        self.workers = workers
+        self.timings: Dict[str, float] = {}
+        self._local = threading.local()
 
     def add_result(self, result: CheckResult):
-        self.results.append(result)
+        # Inside a probe, results go to that probe's own list
+        collector = getattr(self._local, "results", None)
+        (collector if collector is not None else self.results).append(result)
 
     def run_all(self) -> List[CheckResult]:
         """Run all health checks."""
-        server = _is_server_mode()
-        if not server:
-            self.check_gsd()
-            self.check_autoforge()
-            self.check_n8n()
-        else:
-            self.add_result(CheckResult(
-                name="Environment",
-                status=Status.OK,
-                message="Server mode detected — skipping desktop-only checks (GSD, AutoForge, n8n)",
-            ))
-        self.check_git_integrity()
-        self.check_projects()
-        self.check_api_keys()
-        self.check_dependencies()
-        self.check_security()
-        self.check_disk_space()
-        return self.results
+        return self.run_probes("full")
 
     def run_quick(self) -> List[CheckResult]:
         """Run quick status checks only."""
-        if not _is_server_mode():
-            self.check_gsd(quick=True)
-            self.check_autoforge(quick=True)
-            self.check_n8n(quick=True)
-        else:
+        return self.run_probes("quick")
+
+    def _run_probe(self, probe: Probe, mode: str) -> Tuple[List[CheckResult], bool]:
+        """Run (or replay) one probe; returns (results, came_from_cache)."""
+        key = f"{probe.name}:{mode}"
+        fingerprint = HealthCache.fingerprint(probe, mode) if probe.ttl else ""
+        if probe.ttl and not self.fresh:
+            cached = self.cache.get(key, fingerprint)
+            if cached is not None:
+                return cached, True
+
+        self._local.results = results = []
+        try:
+            probe.run(self, mode == "quick")
+        except Exception as e:
+            results.append(CheckResult(name=probe.name, status=Status.ERROR,
+                                       message=f"Error running check: {e}"))
+        finally:
+            self._local.results = None
+        if probe.ttl:
+            self.cache.put(key, fingerprint, probe.ttl, results)
+        return results, False
+
+    def run_probes(self, mode: str = "full", probes: List[Probe] = None) -> List[CheckResult]:
+        """
+        Run the probes for a mode concurrently, respecting dependencies and
+        per-probe timeouts. Results are collected in declaration order.
+        """
+        server = _is_server_mode()
+        probes = [p for p in (probes if probes is not None else PROBES)
+                  if mode in p.modes and not (server and p.desktop)]
+        names = {p.name for p in probes}
+        outcome: Dict[str, List[CheckResult]] = {}
+        failed: Dict[str, str] = {}  # probe -> why its dependents are skipped
+        pending = list(probes)
+        running: Dict[Any, Tuple[Probe, float]] = {}
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="health")
+
+        def finish(probe: Probe, results: List[CheckResult], reason: str = None):
+            outcome[probe.name] = results
+            if reason or any(r.status == Status.ERROR for r in results):
+                failed[probe.name] = reason or "failed"
+
+        try:
+            while pending or running:
+                for probe in list(pending):
+                    deps = [d for d in probe.depends if d in names]
+                    if any(d in failed for d in deps):
+                        blocker = next(d for d in deps if d in failed)
+                        finish(probe, [CheckResult(
+                            name=probe.name, status=Status.WARNING,
+                            message=f"Skipped — {blocker} check {failed[blocker]}",
+                        )], reason="skipped")
+                        pending.remove(probe)
+                    elif all(d in outcome for d in deps):
+                        future = pool.submit(self._run_probe, probe, mode)
+                        running[future] = (probe, time.monotonic())
+                        pending.remove(probe)
+                if not running:
+                    for probe in pending:  # only a dependency cycle gets here
+                        finish(probe, [CheckResult(name=probe.name, status=Status.WARNING,
+                                                   message="Skipped — circular dependency")], reason="skipped")
+                    break
+
+                now = time.monotonic()
+                next_deadline = min(start + p.timeout for p, start in running.values())
+                done, _ = wait(running, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    probe, start = running.pop(future)
+                    results, cached = future.result()
+                    self.timings[probe.name] = 0.0 if cached else time.monotonic() - start
+                    finish(probe, results)
+                now = time.monotonic()
+                for future, (probe, start) in list(running.items()):
+                    if now - start >= probe.timeout:
+                        del running[future]
+                        future.cancel()
+                        self.timings[probe.name] = probe.timeout
+                        finish(probe, [CheckResult(
+                            name=probe.name, status=Status.WARNING,
+                            message=f"Timed out after {probe.timeout:g}s",
+                        )], reason="timed out")
+        finally:
+            # Don't wait for timed-out probes; their subprocesses have their own timeouts
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.cache.save()
+
+        for probe in probes:
+            self.results.extend(outcome.get(probe.name, []))
+        return self.results
+
+    def check_environment(self, quick: bool = False):
+        """Note that desktop-only checks are skipped on a headless server."""
+        if _is_server_mode():
             self.add_result(CheckResult(
                 name="Environment",
                 status=Status.OK,
-                message="Server mode — desktop checks skipped",
+                message="Server mode — desktop checks skipped" if quick else
+                "Server mode detected — skipping desktop-only checks (GSD, AutoForge, n8n)",
             ))
-        return self.results
 
     def check_gsd(self, quick: bool = False):
         """Check GSD installation and status."""
@@ -384,6 +565,12 @@ class HealthChecker:
 
     def check_autoforge(self, quick: bool = False):
         """Check AutoForge installation and server status."""
+        self.check_autoforge_server()
+        if not quick:
+            self.check_autoforge_version()
+
+    def check_autoforge_server(self, quick: bool = False):
+        """Check AutoForge is installed and its server is up (always live)."""
         try:
             # Check installation  
             if not AUTOCODER_PATH.exists():
@@ -420,9 +607,20 @@ class HealthChecker:
                     )
                 )
 
-            if quick:
-                return
+        except Exception as e:
+            self.add_result(
+                CheckResult(
+                    name="AutoForge Check",
+                    status=Status.ERROR,
+                    message=f"Error checking AutoForge: {str(e)}",
+                )
+            )
 
+    def check_autoforge_version(self, quick: bool = False):
+        """Check AutoForge's commit, pending updates and venv."""
+        if not AUTOCODER_PATH.exists():
+            return  # reported by check_autoforge_server
+        try:
             # Check git status
             result = subprocess.run(
                 ["git", "rev-parse", "--short", "HEAD"],
@@ -770,149 +968,149 @@ class HealthChecker:
 
     def check_dependencies(self):
         """Check Python and Node.js dependencies."""
+        self.check_python()
+        self.check_node()
+        self.check_npm()
+        self.check_git_version()
+        self.check_python_packages()
+        self.check_framework_files()
+
+    def _tool_version(self, cmd: List[str]) -> Optional[str]:
+        """First line of `<tool> --version`, or None when the tool is missing or broken."""
         try:
-            # Check Python
-            result = subprocess.run(["python3", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                python_version = result.stdout.strip()
-                self.add_result(
-                    CheckResult(name="Python", status=Status.OK, message=python_version)
-                )
-            else:
-                self.add_result(
-                    CheckResult(name="Python", status=Status.ERROR, message="Python not found")
-                )
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def check_python(self, quick: bool = False):
+        python_version = self._tool_version(["python3", "--version"])
+        if python_version:
+            self.add_result(
+                CheckResult(name="Python", status=Status.OK, message=python_version)
+            )
+        else:
+            self.add_result(
+                CheckResult(name="Python", status=Status.ERROR, message="Python not found")
+            )
 
-            # Check Node.js
-            result = subprocess.run(["node", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                node_version = result.stdout.strip()
-                major_version = int(node_version.replace("v", "").split(".")[0])
-                status = Status.OK if major_version >= 18 else Status.WARNING
-                self.add_result(
-                    CheckResult(
-                        name="Node.js",
-                        status=status,
-                        message=node_version,
-                        details={"major": major_version},
-                    )
-                )
-            else:
-                self.add_result(
-                    CheckResult(name="Node.js", status=Status.ERROR, message="Node.js not found")
+    def check_node(self, quick: bool = False):
+        node_version = self._tool_version(["node", "--version"])
+        if node_version:
+            major_version = int(node_version.replace("v", "").split(".")[0])
+            status = Status.OK if major_version >= 18 else Status.WARNING
+            self.add_result(
+                CheckResult(
+                    name="Node.js",
+                    status=status,
+                    message=node_version,
+                    details={"major": major_version},
                 )
+            )
+        else:
+            self.add_result(
+                CheckResult(name="Node.js", status=Status.ERROR, message="Node.js not found")
+            )
 
-            # Check npm
-            result = subprocess.run(["npm", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                self.add_result(
-                    CheckResult(name="npm", status=Status.OK, message=f"v{result.stdout.strip()}")
-                )
+    def check_npm(self, quick: bool = False):
+        npm_version = self._tool_version(["npm", "--version"])
+        if npm_version:
+            self.add_result(
+                CheckResult(name="npm", status=Status.OK, message=f"v{npm_version}")
+            )
 
-            # Check git
-            result = subprocess.run(["git", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                git_version = result.stdout.strip()
-                self.add_result(
-                    CheckResult(name="Git", status=Status.OK, message=git_version)
-                )
+    def check_git_version(self, quick: bool = False):
+        git_version = self._tool_version(["git", "--version"])
+        if git_version:
+            self.add_result(
+                CheckResult(name="Git", status=Status.OK, message=git_version)
+            )
+        else:
+            self.add_result(
+                CheckResult(name="Git", status=Status.ERROR, message="Git not found")
+            )
 
-            # Check pip packages for MyWork framework
-            pip_requirements = [
-                ("httpx", "0.24.0"),
-                ("websockets", "10.0"),
-                ("pydantic", "2.0"),
-                ("python-dotenv", "0.19.0")
-            ]
-            
-            for package, min_version in pip_requirements:
-                try:
-                    result = subprocess.run(
-                        ["pip", "show", package], 
-                        capture_output=True, 
-                        text=True,
-                        timeout=10,
-                    )
-                    if result.returncode == 0:
-                        # Extract version from pip show output
-                        for line in result.stdout.split('\n'):
-                            if line.startswith('Version:'):
-                                version = line.split(':', 1)[1].strip()
-                                # Simple version comparison (works for basic semver)
-                                if version >= min_version:
-                                    status = Status.OK
-                                    message = f"v{version} (>= {min_version})"
-                                else:
-                                    status = Status.WARNING
-                                    message = f"v{version} (requires >= {min_version})"
-                                
-                                self.add_result(
-                                    CheckResult(
-                                        name=f"Python Package: {package}",
-                                        status=status,
-                                        message=message,
-                                        details={"installed_version": version, "required": min_version}
-                                    )
-                                )
-                                break
-                    else:
-                        self.add_result(
-                            CheckResult(
-                                name=f"Python Package: {package}",
-                                status=Status.ERROR,
-                                message="Not installed",
-                                fix_command=f"pip install {package}>={min_version}"
-                            )
-                        )
-                except Exception as pkg_e:
-                    self.add_result(
-                        CheckResult(
-                            name=f"Python Package: {package}",
-                            status=Status.ERROR,
-                            message=f"Check failed: {str(pkg_e)}"
-                        )
-                    )
+    def check_python_packages(self, quick: bool = False):
+        """Check pip packages for MyWork framework (read from package metadata, no pip subprocess)."""
+        pip_requirements = [
+            ("httpx", "0.24.0"),
+            ("websockets", "10.0"),
+            ("pydantic", "2.0"),
+            ("python-dotenv", "0.19.0")
+        ]
 
-            # Check framework-specific files
-            framework_files = [
-                ("pyproject.toml", "Framework configuration"),
-                ("requirements.txt", "Python dependencies"),
-                (".gitignore", "Git ignore rules"),
-                ("tools/mw.py", "MyWork CLI"),
-                ("tools/brain.py", "Brain knowledge system"),
-                ("tools/autoforge_api.py", "AutoForge integration")
-            ]
-            
-            missing_files = []
-            for file_path, description in framework_files:
-                full_path = MYWORK_ROOT / file_path
-                if not full_path.exists():
-                    missing_files.append(f"{file_path} ({description})")
-            
-            if missing_files:
+        for package, min_version in pip_requirements:
+            try:
+                version = metadata.version(package)
+            except metadata.PackageNotFoundError:
                 self.add_result(
                     CheckResult(
-                        name="Framework Files",
-                        status=Status.WARNING,
-                        message=f"{len(missing_files)} files missing",
-                        details={"missing": missing_files}
+                        name=f"Python Package: {package}",
+                        status=Status.ERROR,
+                        message="Not installed",
+                        fix_command=f"pip install {package}>={min_version}"
                     )
                 )
-            else:
+                continue
+            except Exception as pkg_e:
                 self.add_result(
                     CheckResult(
-                        name="Framework Files",
-                        status=Status.OK,
-                        message="All required files present"
+                        name=f"Python Package: {package}",
+                        status=Status.ERROR,
+                        message=f"Check failed: {str(pkg_e)}"
                     )
                 )
+                continue
+
+            # Simple version comparison (works for basic semver)
+            if version >= min_version:
+                status = Status.OK
+                message = f"v{version} (>= {min_version})"
+            else:
+                status = Status.WARNING
+                message = f"v{version} (requires >= {min_version})"
 
-        except Exception as e:
             self.add_result(
                 CheckResult(
-                    name="Dependencies Check",
-                    status=Status.ERROR,
-                    message=f"Error checking dependencies: {str(e)}",
+                    name=f"Python Package: {package}",
+                    status=status,
+                    message=message,
+                    details={"installed_version": version, "required": min_version}
+                )
+            )
+
+    def check_framework_files(self, quick: bool = False):
+        # Check framework-specific files
+        framework_files = [
+            ("pyproject.toml", "Framework configuration"),
+            ("requirements.txt", "Python dependencies"),
+            (".gitignore", "Git ignore rules"),
+            ("tools/mw.py", "MyWork CLI"),
+            ("tools/brain.py", "Brain knowledge system"),
+            ("tools/autoforge_api.py", "AutoForge integration")
+        ]
+
+        missing_files = []
+        for file_path, description in framework_files:
+            full_path = MYWORK_ROOT / file_path
+            if not full_path.exists():
+                missing_files.append(f"{file_path} ({description})")
+
+        if missing_files:
+            self.add_result(
+                CheckResult(
+                    name="Framework Files",
+                    status=Status.WARNING,
+                    message=f"{len(missing_files)} files missing",
+                    details={"missing": missing_files}
+                )
+            )
+        else:
+            self.add_result(
+                CheckResult(
+                    name="Framework Files",
+                    status=Status.OK,
+                    message="All required files present"
                 )
             )
 
@@ -1150,6 +1348,38 @@ class HealthChecker:
             )
 
 
+HOUR = 3600
+BOTH = ("quick", "full")
+
+# Declaration order is report order. Desktop probes are skipped in server mode.
+PROBES: List[Probe] = [
+    Probe("Environment", HealthChecker.check_environment, modes=BOTH),
+    Probe("GSD", HealthChecker.check_gsd, modes=BOTH, desktop=True, ttl=10 * 60,
+          inputs=lambda: [GSD_PATH, GSD_PATH / "version.json",
+                          Path.home() / ".claude" / "cache" / "gsd-update-check.json",
+                          Path.home() / ".claude" / "agents", Path.home() / ".claude" / "hooks"]),
+    Probe("AutoForge Server", HealthChecker.check_autoforge_server, modes=BOTH, desktop=True, timeout=5),
+    Probe("AutoForge Version", HealthChecker.check_autoforge_version, depends=("Git",), desktop=True,
+          timeout=40, ttl=15 * 60,
+          inputs=lambda: [AUTOCODER_PATH / ".git" / "HEAD", AUTOCODER_PATH / ".git" / "FETCH_HEAD",
+                          AUTOCODER_PATH / "venv"]),
+    Probe("n8n", HealthChecker.check_n8n, modes=BOTH, desktop=True, ttl=HOUR, watch_path=True,
+          inputs=lambda: [N8N_SKILLS_PATH / "skills", MYWORK_ROOT / ".mcp.json"] + _which("npx")()),
+    Probe("Git Integrity", lambda c, q: c.check_git_integrity(), depends=("Git",), timeout=30),
+    Probe("Projects", lambda c, q: c.check_projects()),
+    Probe("API Keys", lambda c, q: c.check_api_keys()),
+    Probe("Python", HealthChecker.check_python, ttl=24 * HOUR, watch_path=True, inputs=_which("python3")),
+    Probe("Node.js", HealthChecker.check_node, ttl=24 * HOUR, watch_path=True, inputs=_which("node")),
+    Probe("npm", HealthChecker.check_npm, depends=("Node.js",), ttl=24 * HOUR, watch_path=True,
+          inputs=_which("npm")),
+    Probe("Git", HealthChecker.check_git_version, ttl=24 * HOUR, watch_path=True, inputs=_which("git")),
+    Probe("Python Packages", HealthChecker.check_python_packages, ttl=HOUR, inputs=_site_packages),
+    Probe("Framework Files", HealthChecker.check_framework_files),
+    Probe("Security", lambda c, q: c.check_security(), ttl=HOUR, inputs=_tool_sources),
+    Probe("Disk Space", lambda c, q: c.check_disk_space()),
+]
+
+
 def print_results(results: List[CheckResult], verbose: bool = False):
     """Print formatted health check results."""
     print("\n" + "=" * 60)
@@ -1284,18 +1514,20 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 def main():
     """Main entry point."""
-    command = sys.argv[1] if len(sys.argv) > 1 else "full"
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    command = args[0] if args else "full"
+    fresh = "--fresh" in sys.argv
 
     # Use lock file protection for non-quick checks
     if command == "quick":
-        checker = HealthChecker()
+        checker = HealthChecker(fresh=fresh)
         results = checker.run_quick()
         print_results(results)
         return
 
     try:
         with HealthCheckLock(HEALTH_CHECK_LOCK, timeout=10):
-            checker = HealthChecker()
+            checker = HealthChecker(fresh=fresh)
 
             if command == "fix":
                 # Check file permissions before attempting fixes
@@ -6,7 +6,10 @@ Analyzes any project for lines of code, complexity, file distribution,
 test coverage estimation, code quality score, and tech debt indicators.
 
 Usage:
-    mw metrics [path] [--json] [--format=compact|full] [--compare=<snapshot>]
+    mw metrics [path] [--json] [--format=compact|full] [--compare=<snapshot>] [--jobs=N]
+
+Large trees are analyzed across a process pool (one worker per core by
+default); --jobs=1 forces a serial run.
 """
 
 import os
@@ -51,55 +54,84 @@ def should_skip(path: str) -> bool:
     return any(p in SKIP_DIRS or p.endswith('.egg-info') for p in parts)
 
 
-def count_lines(filepath: str) -> Tuple[int, int, int]:
-    """Returns (total, code, blank) line counts."""
+DEBT_TAGS = ('TODO', 'FIXME', 'HACK', 'XXX', 'DEPRECATED')
+DEBT_EXTS = {'.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java'}
+
+# McCabe-like branch points; BoolOps add one per extra operand
+BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler,
+                ast.With, ast.Assert, ast.comprehension)
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+
+def _read_lines(filepath: str) -> Optional[Tuple[str, List[str]]]:
+    """Read a file once, returning its text and its lines (as readlines() would split them)."""
     try:
         with open(filepath, 'r', errors='ignore') as f:
-            lines = f.readlines()
+            text = f.read()
     except (OSError, UnicodeDecodeError):
-        return 0, 0, 0
+        return None
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return text, lines
+
 
+def _line_counts(lines: List[str]) -> Tuple[int, int, int]:
     total = len(lines)
     blank = sum(1 for l in lines if not l.strip())
-    code = total - blank
-    return total, code, blank
+    return total, total - blank, blank
 
 
-def is_test_file(filepath: str) -> bool:
-    fp = filepath.lower()
-    return any(re.search(p, fp) for p in TEST_PATTERNS)
+def _debt_markers(filepath: str, lines: List[str]) -> List[str]:
+    markers = []
+    for i, line in enumerate(lines, 1):
+        for tag in DEBT_TAGS:
+            if tag in line:
+                markers.append(f"{filepath}:{i}: {tag}")
+                break
+    return markers
 
 
-def python_complexity(filepath: str) -> Dict:
-    """Analyze Python file complexity using AST."""
-    try:
-        with open(filepath, 'r', errors='ignore') as f:
-            tree = ast.parse(f.read(), filename=filepath)
-    except Exception:
-        return {'functions': 0, 'classes': 0, 'avg_complexity': 0}
+def _tree_complexity(tree: ast.AST) -> Dict:
+    """Per-function complexity in one pass over the tree.
+
+    Nodes are numbered in pre-order, then branch counts are folded into their
+    parents in reverse order, so every function gets the total for its whole
+    subtree (nested functions included, as before) without re-walking it.
+    """
+    nodes = []
+    parents = []
+    stack = [(tree, -1)]
+    while stack:
+        node, parent = stack.pop()
+        idx = len(nodes)
+        nodes.append(node)
+        parents.append(parent)
+        for child in ast.iter_child_nodes(node):
+            stack.append((child, idx))
+
+    branches = [0] * len(nodes)
+    for idx, node in enumerate(nodes):
+        if isinstance(node, BRANCH_NODES):
+            branches[idx] = 1
+        elif isinstance(node, ast.BoolOp):
+            branches[idx] = len(node.values) - 1
+    for idx in range(len(nodes) - 1, 0, -1):
+        branches[parents[idx]] += branches[idx]
 
-    functions = 0
     classes = 0
     complexities = []
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-            functions += 1
-            # McCabe-like: count branches
-            cc = 1
-            for child in ast.walk(node):
-                if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler,
-                                      ast.With, ast.Assert, ast.comprehension)):
-                    cc += 1
-                elif isinstance(child, ast.BoolOp):
-                    cc += len(child.values) - 1
-            complexities.append(cc)
+    for idx, node in enumerate(nodes):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            complexities.append(1 + branches[idx])
         elif isinstance(node, ast.ClassDef):
             classes += 1
 
     avg = sum(complexities) / len(complexities) if complexities else 0
     return {
-        'functions': functions,
+        'functions': len(complexities),
         'classes': classes,
         'avg_complexity': round(avg, 1),
         'max_complexity': max(complexities) if complexities else 0,
@@ -107,34 +139,70 @@ def python_complexity(filepath: str) -> Dict:
     }
 
 
-def detect_tech_debt(filepath: str) -> List[str]:
-    """Find TODO/FIXME/HACK/XXX markers."""
-    markers = []
+def _text_complexity(filepath: str, text: str) -> Dict:
     try:
-        with open(filepath, 'r', errors='ignore') as f:
-            for i, line in enumerate(f, 1):
-                for tag in ('TODO', 'FIXME', 'HACK', 'XXX', 'DEPRECATED'):
-                    if tag in line:
-                        markers.append(f"{filepath}:{i}: {tag}")
-                        break
-    except OSError:
-        pass
-    return markers
+        tree = ast.parse(text, filename=filepath)
+    except Exception:
+        return {'functions': 0, 'classes': 0, 'avg_complexity': 0}
+    return _tree_complexity(tree)
 
 
-def analyze_project(root: str) -> Dict:
-    """Full project analysis."""
-    root = os.path.abspath(root)
-    lang_stats = defaultdict(lambda: {'files': 0, 'total': 0, 'code': 0, 'blank': 0})
-    test_files = 0
-    test_lines = 0
-    source_files = 0
-    source_lines = 0
-    all_complexities = []
-    tech_debt = []
-    largest_files = []
-    file_count = 0
+def count_lines(filepath: str) -> Tuple[int, int, int]:
+    """Returns (total, code, blank) line counts."""
+    read = _read_lines(filepath)
+    if read is None:
+        return 0, 0, 0
+    return _line_counts(read[1])
 
+
+def is_test_file(filepath: str) -> bool:
+    fp = filepath.lower()
+    return any(re.search(p, fp) for p in TEST_PATTERNS)
+
+
+def python_complexity(filepath: str) -> Dict:
+    """Analyze Python file complexity using AST."""
+    read = _read_lines(filepath)
+    if read is None:
+        return {'functions': 0, 'classes': 0, 'avg_complexity': 0}
+    return _text_complexity(filepath, read[0])
+
+
+def detect_tech_debt(filepath: str) -> List[str]:
+    """Find TODO/FIXME/HACK/XXX markers."""
+    read = _read_lines(filepath)
+    if read is None:
+        return []
+    return _debt_markers(filepath, read[1])
+
+
+def analyze_file(filepath: str) -> Optional[Dict]:
+    """Line counts, complexity and tech debt for one file from a single read.
+
+    Returns None for unreadable or empty files. Runs in pool workers, so it
+    must stay a picklable top-level function.
+    """
+    read = _read_lines(filepath)
+    if read is None:
+        return None
+    text, lines = read
+    total, code, blank = _line_counts(lines)
+    if total == 0:
+        return None
+
+    ext = os.path.splitext(filepath)[1].lower()
+    return {
+        'total': total,
+        'code': code,
+        'blank': blank,
+        'complexity': _text_complexity(filepath, text) if ext == '.py' else None,
+        'debt': _debt_markers(filepath, lines) if ext in DEBT_EXTS else [],
+    }
+
+
+def _collect_files(root: str) -> List[Tuple[str, str]]:
+    """List (filepath, rel_path) pairs for every analyzable file under root."""
+    files = []
     for dirpath, dirnames, filenames in os.walk(root):
         dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.endswith('.egg-info')]
         rel_dir = os.path.relpath(dirpath, root)
@@ -152,39 +220,75 @@ def analyze_project(root: str) -> Dict:
 
             if should_skip(rel_path):
                 continue
+            files.append((filepath, rel_path))
+    return files
 
-            lang = LANG_MAP[ext]
-            total, code, blank = count_lines(filepath)
 
-            if total == 0:
-                continue
+def _analyze_files(paths: List[str], jobs: Optional[int] = None) -> List[Optional[Dict]]:
+    """Run analyze_file over paths, fanning out across processes for large trees.
+
+    Results come back in input order so the reduction is deterministic.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        chunksize = max(1, len(paths) // (workers * 8))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(analyze_file, paths, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No usable multiprocessing here (e.g. sandboxed /dev/shm) — fall back
+    return [analyze_file(p) for p in paths]
+
+
+def analyze_project(root: str, jobs: Optional[int] = None) -> Dict:
+    """Full project analysis."""
+    root = os.path.abspath(root)
+    lang_stats = defaultdict(lambda: {'files': 0, 'total': 0, 'code': 0, 'blank': 0})
+    test_files = 0
+    test_lines = 0
+    source_files = 0
+    source_lines = 0
+    all_complexities = []
+    tech_debt = []
+    largest_files = []
+    file_count = 0
+
+    files = _collect_files(root)
+    results = _analyze_files([fp for fp, _ in files], jobs=jobs)
+
+    for (filepath, rel_path), result in zip(files, results):
+        if result is None:
+            continue
+
+        lang = LANG_MAP[os.path.splitext(filepath)[1].lower()]
+        code = result['code']
+
+        file_count += 1
+        lang_stats[lang]['files'] += 1
+        lang_stats[lang]['total'] += result['total']
+        lang_stats[lang]['code'] += code
+        lang_stats[lang]['blank'] += result['blank']
+
+        is_test = is_test_file(rel_path)
+        if is_test:
+            test_files += 1
+            test_lines += code
+        else:
+            source_files += 1
+            source_lines += code
+
+        largest_files.append((code, rel_path))
+
+        # Python complexity
+        cx = result['complexity']
+        if cx and cx['functions'] > 0:
+            all_complexities.append(cx)
 
-            file_count += 1
-            lang_stats[lang]['files'] += 1
-            lang_stats[lang]['total'] += total
-            lang_stats[lang]['code'] += code
-            lang_stats[lang]['blank'] += blank
-
-            is_test = is_test_file(rel_path)
-            if is_test:
-                test_files += 1
-                test_lines += code
-            else:
-                source_files += 1
-                source_lines += code
-
-            largest_files.append((code, rel_path))
-
-            # Python complexity
-            if ext == '.py':
-                cx = python_complexity(filepath)
-                if cx['functions'] > 0:
-                    all_complexities.append(cx)
-
-            # Tech debt
-            if ext in ('.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java'):
-                debt = detect_tech_debt(filepath)
-                tech_debt.extend(debt)
+        # Tech debt
+        tech_debt.extend(result['debt'])
 
     largest_files.sort(reverse=True)
     largest_files = largest_files[:10]
@@ -308,12 +412,19 @@ def cmd_metrics(args: list = None) -> int:
     path = '.'
     as_json = False
     compact = False
+    jobs = None
 
     for a in args:
         if a == '--json':
             as_json = True
         elif a == '--compact':
             compact = True
+        elif a.startswith('--jobs='):
+            try:
+                jobs = max(1, int(a.split('=', 1)[1]))
+            except ValueError:
+                print(f"Error: invalid --jobs value '{a.split('=', 1)[1]}'")
+                return 1
         elif not a.startswith('-'):
             path = a
 
@@ -322,7 +433,7 @@ def cmd_metrics(args: list = None) -> int:
         return 1
 
     start = time.time()
-    data = analyze_project(path)
+    data = analyze_project(path, jobs=jobs)
     data['analysis_time'] = round(time.time() - start, 2)
 
     if as_json:
@@ -354,6 +354,7 @@ Status Commands — Framework Health Monitor
 ==========================================
 Usage:
     mw status              Quick health check of all components
+    mw status --fresh      Ignore cached results and re-run every probe
     mw status --help       Show this help message
 
 Description:
@@ -373,7 +374,7 @@ Examples:
     
     print(f"\n{Colors.BOLD}🔍 MyWork Quick Status{Colors.ENDC}")
     print("=" * 50)
-    return run_tool("health_check", ["quick"])
+    return run_tool("health_check", ["quick"] + [a for a in (args or []) if a == "--fresh"])
 
 
 def cmd_update(args: List[str]) -> int:
@@ -5521,13 +5522,26 @@ def cmd_release(args: List[str] = None) -> int:
 
 
 def cmd_backup(args: List[str] = None):
-    """Backup all projects and brain data."""
+    """Backup all projects and brain data.
+
+    Delegates to tools/backup_store.py for deduplicated, incremental
+    snapshots with restore and verify; ``--zip`` keeps the old archive.
+    """
+    args = args or []
+    if "--zip" in args:
+        return _cmd_backup_zip([a for a in args if a != "--zip"])
+    from tools.backup_store import cmd_backup as _backup_impl
+    return _backup_impl(args)
+
+
+def _cmd_backup_zip(args: List[str] = None):
+    """Backup all projects and brain data to a single zip archive."""
     if args and (args[0] in ["--help", "-h"]):
         print("""
-Backup Commands — Framework Backup
-==================================
+Backup Commands — Framework Backup (zip)
+========================================
 Usage:
-    mw backup                       Create timestamped backup
+    mw backup --zip                 Create timestamped zip backup
     mw backup --help                Show this help message
 
 Description:
@@ -5538,7 +5552,7 @@ Description:
     • Environment files (sanitized)
 
 Examples:
-    mw backup                       # Create backup archive
+    mw backup --zip                 # Create backup archive
 """)
         return 0
     
@@ -5793,52 +5807,14 @@ def _cmd_test_coverage(args: List[str] = None) -> int:
     return tc_main(args or [])
 
 
-def cmd_test(args: List[str] = None) -> int:
-    """Universal test runner — auto-detects project type and runs tests.
-    
-    Usage:
-        mw test                  Auto-detect and run all tests
-        mw test --watch          Re-run on file changes (Node only)
-        mw test --coverage       Run with coverage reporting
-        mw test --verbose        Verbose output
-        mw test <path>           Run specific test file/directory
+def _detect_test_command(cwd: str, paths: List[str] = (), coverage: bool = False,
+                         verbose: bool = False, watch: bool = False):
+    """Detect a project's type from its markers and build its test command.
+
+    Returns (detected, cmd); detected is None when no supported project is found.
     """
     import shutil
 
-    args = args or []
-    
-    if args and args[0] == "doctor":
-        # Run test doctor to find hanging/broken tests
-        return run_tool("test_doctor", args[1:])
-    
-    if args and args[0] in ["--help", "-h"]:
-        print("""
-🧪 mw test — Universal Test Runner
-
-Usage:
-    mw test                  Auto-detect and run all tests
-    mw test --watch          Re-run on file changes (Node only)
-    mw test --coverage       Run with coverage reporting
-    mw test --verbose        Verbose output  
-    mw test <path>           Run specific test file/directory
-
-Supported:
-    Python   → pytest (or unittest fallback)
-    Node.js  → npm test / jest / vitest / mocha
-    Rust     → cargo test
-    Go       → go test ./...
-    Ruby     → bundle exec rspec / rake test
-""")
-        return 0
-
-    coverage = "--coverage" in args
-    verbose = "--verbose" in args or "-v" in args
-    watch = "--watch" in args
-    
-    # Filter flags from args to get paths
-    paths = [a for a in args if not a.startswith("-")]
-    
-    cwd = os.getcwd()
     detected = None
     cmd = None
     
@@ -5848,7 +5824,7 @@ Supported:
        os.path.exists(os.path.join(cwd, "pyproject.toml")) or \
        os.path.exists(os.path.join(cwd, "tests")):
         # Check if it's actually a Python project
-        py_files = any(f.endswith('.py') for f in os.listdir(cwd) if os.path.isfile(f))
+        py_files = any(f.endswith('.py') for f in os.listdir(cwd) if os.path.isfile(os.path.join(cwd, f)))
         has_tests_dir = os.path.exists(os.path.join(cwd, "tests"))
         if py_files or has_tests_dir:
             detected = "Python"
@@ -5927,6 +5903,154 @@ Supported:
         else:
             cmd = "rake test"
 
+    return detected, cmd
+
+
+def _test_all(args: List[str]) -> int:
+    """Run every project's test suite concurrently (``mw test --all``).
+
+    Slow pytest suites are split into shards balanced on the durations
+    recorded by earlier runs; failing and recently changed tests go first.
+    """
+    import time
+
+    from tools.shard_planner import Suite, SuiteScheduler, slowest_tests
+
+    coverage = "--coverage" in args
+    verbose = "--verbose" in args or "-v" in args
+    workers = None
+    for flag in ("-j", "--jobs"):
+        if flag in args:
+            try:
+                workers = int(args[args.index(flag) + 1])
+            except (IndexError, ValueError):
+                print(f"❌ {flag} needs a number of workers")
+                return 1
+
+    if not PROJECTS_DIR.exists():
+        print("❌ Projects directory not found")
+        return 1
+
+    suites, kinds, skipped = [], {}, []
+    for project in sorted(p for p in PROJECTS_DIR.iterdir()
+                          if p.is_dir() and not p.name.startswith((".", "_"))):
+        detected, cmd = _detect_test_command(str(project), coverage=coverage, verbose=verbose)
+        if not detected:
+            skipped.append(project.name)
+            continue
+        kinds[project.name] = detected
+        if cmd.startswith("pytest") and not coverage:
+            suites.append(Suite(project.name, project, pytest=["pytest", "--timeout=30"]))
+        else:
+            suites.append(Suite(project.name, project, command=cmd))
+
+    if not suites:
+        print("❌ No testable projects found")
+        return 1
+
+    scheduler = SuiteScheduler(suites, workers=workers)
+    print(f"🧪 Testing {len(suites)} projects with {scheduler.workers} workers")
+    if skipped:
+        print(f"⏭️  No tests detected: {', '.join(skipped)}")
+    print("─" * 50)
+
+    start = time.perf_counter()
+    results = scheduler.run()
+    wall = time.perf_counter() - start
+
+    failed = []
+    for result in results:
+        ok = result["returncode"] == 0
+        if not ok:
+            failed.append(result)
+        counts = result["counts"]
+        if counts is None:
+            summary = "passed" if ok else f"exit code {result['returncode']}"
+        elif result["returncode"] == 5:
+            summary = "no tests collected"
+        else:
+            summary = f"{counts['passed']} passed, {counts['failed']} failed, {counts['skipped']} skipped"
+        shards = f" ({result['shards']} shards)" if result["shards"] > 1 else ""
+        print(f"{'✅' if ok else '❌'} {result['name']:<24} {kinds[result['name']]:<8} "
+              f"{summary:<40} {result['duration']:6.1f}s{shards}")
+        if verbose or not ok:
+            lines = result["output"].rstrip().splitlines()
+            for line in (lines if verbose else lines[-20:]):
+                print(f"    {line}")
+
+    print("─" * 50)
+    failing_tests = [(r["name"], t) for r in results for t in r["failed_tests"]]
+    if failing_tests:
+        print("Failed tests:")
+        for name, test in failing_tests:
+            print(f"  ❌ {name}: {test}")
+    slowest = slowest_tests(results, 5)
+    if slowest:
+        print("Slowest tests:")
+        for name, test, secs in slowest:
+            print(f"  {secs:6.2f}s  {name}: {test}")
+
+    busy = sum(r["cpu_time"] for r in results)
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} projects failed in {wall:.1f}s ({busy:.1f}s of test time)")
+        return 1
+    print(f"✅ All {len(results)} projects passed in {wall:.1f}s ({busy:.1f}s of test time)")
+    return 0
+
+
+def cmd_test(args: List[str] = None) -> int:
+    """Universal test runner — auto-detects project type and runs tests.
+    
+    Usage:
+        mw test                  Auto-detect and run all tests
+        mw test --watch          Re-run on file changes (Node only)
+        mw test --coverage       Run with coverage reporting
+        mw test --verbose        Verbose output
+        mw test <path>           Run specific test file/directory
+        mw test --all [-j N]     Test every project concurrently
+    """
+
+    args = args or []
+    
+    if args and args[0] == "doctor":
+        # Run test doctor to find hanging/broken tests
+        return run_tool("test_doctor", args[1:])
+    
+    if args and args[0] in ["--help", "-h"]:
+        print("""
+🧪 mw test — Universal Test Runner
+
+Usage:
+    mw test                  Auto-detect and run all tests
+    mw test --watch          Re-run on file changes (Node only)
+    mw test --coverage       Run with coverage reporting
+    mw test --verbose        Verbose output  
+    mw test <path>           Run specific test file/directory
+    mw test --all [-j N]     Test every project concurrently, sharding
+                             slow pytest suites; failing tests run first
+
+Supported:
+    Python   → pytest (or unittest fallback)
+    Node.js  → npm test / jest / vitest / mocha
+    Rust     → cargo test
+    Go       → go test ./...
+    Ruby     → bundle exec rspec / rake test
+""")
+        return 0
+
+    if "--all" in args:
+        return _test_all(args)
+
+    coverage = "--coverage" in args
+    verbose = "--verbose" in args or "-v" in args
+    watch = "--watch" in args
+    
+    # Filter flags from args to get paths
+    paths = [a for a in args if not a.startswith("-")]
+    
+    cwd = os.getcwd()
+    detected, cmd = _detect_test_command(cwd, paths, coverage, verbose, watch)
+
     if not detected:
         print("❌ Could not detect project type. Supported: Python, Node.js, Rust, Go, Ruby")
         print("   Make sure you're in a project root directory.")
@@ -7619,34 +7743,25 @@ Tags scanned: TODO, FIXME, HACK, XXX, NOTE, OPTIMIZE, REFACTOR
         _re.IGNORECASE,
     )
 
+    # Markers come from the persisted index; only changed files are re-read
+    from tools.todo_tracker import ScanProfile, TodoIndex
+
+    profile = ScanProfile(pattern.pattern, pattern.flags, tuple(TAGS),
+                          frozenset(EXTENSIONS), frozenset(SKIP_DIRS), ignore_ext_case=True)
+    index = TodoIndex(scan_path, profile)
+    index.refresh()
+    index.save()
+
     results = []
     tag_counts: dict = {}
-
-    for root_dir, dirs, files in os.walk(scan_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for fname in files:
-            fpath = Path(root_dir) / fname
-            if fpath.suffix.lower() not in EXTENSIONS:
-                continue
-            try:
-                lines = fpath.read_text(errors="ignore").splitlines()
-            except (OSError, PermissionError):
-                continue
-            for line_no, line in enumerate(lines, 1):
-                m = pattern.search(line)
-                if m:
-                    # Extract tag and text from whichever group matched
-                    tag = (m.group(1) or m.group(3) or m.group(5) or "").upper()
-                    text = (m.group(2) or m.group(4) or m.group(6) or "").strip()
-                    if filter_tag and tag != filter_tag:
-                        continue
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-                    results.append({
-                        "file": str(fpath),
-                        "line": line_no,
-                        "tag": tag,
-                        "text": text,
-                    })
+    for item in index.query(marker=filter_tag):
+        tag_counts[item["marker"]] = tag_counts.get(item["marker"], 0) + 1
+        results.append({
+            "file": str(scan_path / item["file"]),
+            "line": item["line"],
+            "tag": item["marker"],
+            "text": item["text"],
+        })
 
     if json_mode:
         print(json.dumps({"total": len(results), "by_tag": tag_counts, "items": results}, indent=2))
@@ -12287,6 +12402,7 @@ def cmd_completions(args: List[str] = None) -> int:
         "af": ["start", "stop", "pause", "resume", "status", "progress", "list", "ui", "service"],
         "test": ["--coverage", "--watch", "--verbose"],
         "test-coverage": ["--detail", "--scaffold", "--json", "--min"],
+        "backup": ["list", "restore", "verify", "prune", "--zip"],
         "db": ["status", "tables", "schema", "query", "migrate", "seed", "export", "backup", "restore"],
         "hook": ["install", "uninstall", "list", "run", "create"],
         "secrets": ["set", "get", "list", "delete", "inject", "export", "import", "audit", "rotate"],
@@ -9,6 +9,9 @@ Usage:
     python tools/n8n_api.py --action create --workflow-file "workflow.json"
     python tools/n8n_api.py --action activate --workflow-id "abc123"
     python tools/n8n_api.py --action execute --workflow-id "abc123" --data '{"key": "value"}'
+    python tools/n8n_api.py --action executions --all
+    python tools/n8n_api.py --action export --dir backups/n8n [--include-data] [--fresh]
+    python tools/n8n_api.py --action import --dir backups/n8n
 
 Environment Variables Required:
     - N8N_API_URL: n8n instance URL (e.g., https://seme.app.n8n.cloud)
@@ -18,8 +21,11 @@ Environment Variables Required:
 import os
 import json
 import argparse
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -47,6 +53,136 @@ class HttpRequestError(Exception):
         self.response_text = response_text
 
 
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PAGE_SIZE = 100
+
+# Safe to resend when a pooled keep-alive connection turns out to be stale
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class _Transport:
+    """
+    Keep-alive HTTP transport shared by every call made through it.
+
+    Uses a pooled httpx.Client when httpx is installed; otherwise keeps
+    idle http.client connections per host and reuses them, so neither path
+    pays a TCP/TLS handshake per request.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_CONCURRENCY) -> None:
+        self.max_connections = max_connections
+        self._client = None
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        *,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None,
+        timeout: float = 30.0,
+    ) -> Tuple[int, str]:
+        if _HTTPX_AVAILABLE:
+            try:
+                response = self._httpx().request(
+                    method, url, headers=headers, params=params, json=json_body, timeout=timeout
+                )
+            except httpx.RequestError as e:  # type: ignore
+                raise HttpRequestError(0, str(e), "") from e
+            return response.status_code, response.text
+
+        if params:
+            query = urllib.parse.urlencode(params, doseq=True)
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{query}"
+
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            headers = dict(headers)
+            headers.setdefault("Content-Type", "application/json")
+        return self._stdlib_request(method, url, headers, body, timeout)
+
+    def _httpx(self):
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(  # type: ignore
+                    limits=httpx.Limits(  # type: ignore
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+            return self._client
+
+    def _stdlib_request(
+        self, method: str, url: str, headers: dict, body: Optional[bytes], timeout: float
+    ) -> Tuple[int, str]:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise HttpRequestError(0, f"Unsupported URL scheme: {url}", "")
+        key = (parts.scheme, parts.netloc)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in range(2):
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+                text = response.read().decode()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and attempt == 0 and method.upper() in _IDEMPOTENT_METHODS:
+                    continue  # the server dropped an idle connection; retry on a fresh one
+                raise HttpRequestError(0, str(e), "") from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise HttpRequestError(0, str(e), "") from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return response.status, text
+        raise HttpRequestError(0, "Connection lost", "")  # pragma: no cover
+
+    def _checkout(self, key: Tuple[str, str], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, netloc = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=timeout), False
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_connections:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+            idle, self._idle = self._idle, {}
+        if client is not None:
+            client.close()
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_shared_transport = _Transport()
+
+
 def _request_json(
     method: str,
     url: str,
@@ -56,63 +192,20 @@ def _request_json(
     json_body: Optional[dict] = None,
     timeout: float = 30.0,
     allow_text: bool = False,
+    transport: Optional[_Transport] = None,
 ) -> dict:
-    if _HTTPX_AVAILABLE:
-        try:
-            response = httpx.request(  # type: ignore
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=json_body,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:  # type: ignore
-            raise HttpRequestError(e.response.status_code, str(e), e.response.text) from e
-        except httpx.RequestError as e:  # type: ignore
-            raise HttpRequestError(0, str(e), "") from e
-
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            if allow_text:
-                return {"status": "success", "response": response.text}
-            raise
-
-    if params:
-        query = urllib.parse.urlencode(params, doseq=True)
-        separator = "&" if "?" in url else "?"
-        url = f"{url}{separator}{query}"
-
-    body = None
-    if json_body is not None:
-        body = json.dumps(json_body).encode("utf-8")
-        headers = dict(headers)
-        headers.setdefault("Content-Type", "application/json")
-
-    request = urllib.request.Request(url, data=body, headers=headers, method=method)
+    status, text = (transport or _shared_transport).request(
+        method, url, headers, params=params, json_body=json_body, timeout=timeout
+    )
+    if status >= 400:
+        raise HttpRequestError(status, f"HTTP {status}", text)
 
     try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            text = response.read().decode()
-    except urllib.error.HTTPError as e:
-        response_text = ""
-        try:
-            response_text = e.read().decode()
-        except Exception:
-            response_text = ""
-        raise HttpRequestError(e.code, f"HTTP {e.code}", response_text) from e
-    except urllib.error.URLError as e:
-        raise HttpRequestError(0, str(e), "") from e
-
-    if allow_text:
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        if allow_text:
             return {"status": "success", "response": text}
-
-    return json.loads(text)
+        raise
 
 
 def _is_placeholder(value: str) -> bool:
@@ -156,6 +249,132 @@ def get_headers() -> dict:
     }
 
 
+class N8nClient:
+    """
+    n8n REST client with its own pooled transport.
+
+    One instance can be shared across threads. Listing endpoints are
+    exposed as generators that follow n8n's nextCursor pagination, so
+    callers see every workflow or execution without holding them all.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        *,
+        timeout: float = 30.0,
+        max_connections: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self.base_url = (N8N_API_URL if base_url is None else base_url).rstrip("/")
+        self.api_key = N8N_API_KEY if api_key is None else api_key
+        self.timeout = timeout
+        self._transport = _Transport(max_connections)
+
+    def __enter__(self) -> "N8nClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._transport.close()
+
+    def headers(self) -> dict:
+        return {
+            "X-N8N-API-KEY": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """Call an API path (e.g. "/api/v1/workflows") and return the decoded JSON."""
+        return _request_json(
+            method,
+            f"{self.base_url}{path}",
+            self.headers(),
+            params=params,
+            json_body=json_body,
+            timeout=self.timeout if timeout is None else timeout,
+            transport=self._transport,
+        )
+
+    def iter_pages(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield each page of a cursor-paginated listing.
+
+        Pages are the raw API responses ({"data": [...], "nextCursor": ...}),
+        so a caller can checkpoint page["nextCursor"] and resume from it.
+        """
+        while True:
+            page_params = dict(params or {}, limit=page_size)
+            if cursor:
+                page_params["cursor"] = cursor
+            page = self.request("GET", path, params=page_params)
+            if isinstance(page, list):  # very old instances return a bare list
+                page = {"data": page, "nextCursor": None}
+            yield page
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
+    def iter_workflows(self, active_only: bool = False, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """Yield every workflow, one page at a time."""
+        params = {"active": "true"} if active_only else {}
+        for page in self.iter_pages("/api/v1/workflows", params, page_size=page_size):
+            yield from page.get("data") or []
+
+    def iter_executions(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_data: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """Yield every execution matching the filters, one page at a time."""
+        params = _execution_params(workflow_id, status, include_data)
+        for page in self.iter_pages("/api/v1/executions", params, page_size=page_size):
+            yield from page.get("data") or []
+
+    def get_workflow(self, workflow_id: str) -> dict:
+        return self.request("GET", f"/api/v1/workflows/{workflow_id}")
+
+    def create_workflow(self, workflow_data: dict) -> dict:
+        return self.request("POST", "/api/v1/workflows", json_body=workflow_data)
+
+    def get_execution(self, execution_id: str, include_data: bool = False) -> dict:
+        params = {"includeData": "true"} if include_data else None
+        return self.request("GET", f"/api/v1/executions/{execution_id}", params=params)
+
+
+def _execution_params(
+    workflow_id: Optional[str] = None, status: Optional[str] = None, include_data: bool = False
+) -> dict:
+    params = {}
+    if workflow_id:
+        params["workflowId"] = workflow_id
+    if status:
+        params["status"] = status
+    if include_data:
+        params["includeData"] = "true"
+    return params
+
+
 def list_workflows(active_only: bool = False) -> dict:
     """
     List all workflows.
@@ -342,22 +561,29 @@ def trigger_webhook(webhook_path: str, data: dict, method: str = "POST") -> dict
     )
 
 
-def list_executions(workflow_id: Optional[str] = None, status: Optional[str] = None) -> dict:
+def list_executions(
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
     """
-    List workflow executions.
+    List one page of workflow executions.
 
     Args:
         workflow_id: Filter by workflow ID
         status: Filter by status (error, success, waiting)
+        limit: Page size (server default if omitted)
+        cursor: nextCursor from the previous page
 
     Returns:
-        dict: List of executions
+        dict: Executions under "data" and the "nextCursor" for the next page
     """
-    params = {}
-    if workflow_id:
-        params["workflowId"] = workflow_id
-    if status:
-        params["status"] = status
+    params = _execution_params(workflow_id, status)
+    if limit:
+        params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
 
     return _request_json(
         "GET",
@@ -368,6 +594,31 @@ def list_executions(workflow_id: Optional[str] = None, status: Optional[str] = N
     )
 
 
+def iter_executions(
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Yield every execution, following pagination.
+
+    Args:
+        workflow_id: Filter by workflow ID
+        status: Filter by status (error, success, waiting)
+        page_size: Executions fetched per request
+
+    Yields:
+        dict: One execution at a time
+    """
+    cursor = None
+    while True:
+        page = list_executions(workflow_id, status, limit=page_size, cursor=cursor)
+        yield from page.get("data") or []
+        cursor = page.get("nextCursor")
+        if not cursor:
+            return
+
+
 def health_check() -> dict:
     """
     Perform a lightweight API check to verify connectivity and auth.
@@ -391,6 +642,294 @@ def health_check() -> dict:
     return {"status": "ok", "workflows": len(workflows)}
 
 
+# Fields n8n accepts when creating a workflow; the rest are server-assigned
+WORKFLOW_CREATE_FIELDS = ("name", "nodes", "connections", "settings", "staticData")
+
+
+class _NdjsonSink:
+    """
+    Append-only NDJSON file shared by worker threads.
+
+    Remembers the "id" of every record it holds, so records already written
+    by an interrupted run are not written twice when resuming.
+    """
+
+    def __init__(self, path: Path, resume: bool) -> None:
+        self.path = path
+        self.ids = set()
+        if resume and path.exists():
+            self._seal()
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        self.ids.add(str(json.loads(line)["id"]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        else:
+            path.write_bytes(b"")
+        self._file = open(path, "ab")
+        self._lock = threading.Lock()
+
+    def _seal(self) -> None:
+        """Drop a partial last line left by a run that died mid-write."""
+        with open(self.path, "rb+") as f:
+            pos = f.seek(0, os.SEEK_END)
+            while pos > 0:
+                step = min(65536, pos)
+                pos -= step
+                f.seek(pos)
+                newline = f.read(step).rfind(b"\n")
+                if newline != -1:
+                    f.truncate(pos + newline + 1)
+                    return
+            f.truncate(0)
+
+    def write(self, records: List[dict]) -> int:
+        """Append records not written before; returns how many were new."""
+        written = 0
+        with self._lock:
+            for record in records:
+                record_id = str(record.get("id"))
+                if record_id in self.ids:
+                    continue
+                self._file.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.ids.add(record_id)
+                written += 1
+            self._file.flush()
+        return written
+
+    def sync(self) -> None:
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _load_state(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(path: Path, state: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
+
+
+def export_instance(
+    out_dir: str,
+    *,
+    client: Optional[N8nClient] = None,
+    include_executions: bool = True,
+    include_data: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    resume: bool = True,
+) -> dict:
+    """
+    Stream every workflow and execution to NDJSON files in out_dir.
+
+    Workflows go to workflows.ndjson and executions to executions.ndjson,
+    written page by page as they arrive. Executions are paged straight from
+    /executions rather than per exported workflow, so executions of deleted
+    or unlisted workflows are kept too. After each page the listing's cursor
+    is checkpointed in export_state.json, so with resume an interrupted
+    export continues where it stopped, without duplicates.
+
+    The workflow and execution listings run side by side, and each requests
+    its next page while the current one is written. A listing follows
+    nextCursor, so its own pages are fetched one after another; the
+    per-item requests on a page (workflows listed without nodes, and each
+    execution's data with include_data) are spread over the pool.
+
+    Args:
+        out_dir: Directory for the export files (created if missing)
+        client: Client to use (defaults to one built from N8N_API_URL/KEY)
+        include_executions: Also export executions
+        include_data: Include full execution data (much larger)
+        concurrency: Maximum concurrent requests across the whole export
+        page_size: Items requested per page
+        resume: Continue a previous export in out_dir instead of starting over
+
+    Returns:
+        dict: Counts of workflows/executions written and duplicates skipped
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    state_path = out / "export_state.json"
+    state = _load_state(state_path) if resume else {}
+    state_lock = threading.Lock()
+    counts = {"workflows": 0, "executions": 0, "skipped": 0}
+
+    def checkpoint(chain: dict, page: dict) -> None:
+        with state_lock:
+            chain["cursor"] = page.get("nextCursor")
+            chain["done"] = not chain["cursor"]
+            _save_state(state_path, state)
+
+    slots = threading.BoundedSemaphore(concurrency)
+    stop = threading.Event()
+
+    def next_page(pages: Iterator[dict]) -> Optional[dict]:
+        with slots:
+            return next(pages, None)
+
+    def export_chain(name: str, sink: _NdjsonSink, fetch_item,
+                     pool: ThreadPoolExecutor, listings: ThreadPoolExecutor) -> None:
+        chain = state.setdefault(name, {"cursor": None, "done": False})
+        if chain["done"]:
+            return
+        pages = client.iter_pages(f"/api/v1/{name}", page_size=page_size, cursor=chain["cursor"])
+        pending = listings.submit(next_page, pages)
+        try:
+            while not stop.is_set():
+                page = pending.result()
+                if page is None:
+                    return
+                # Request the next page while this one's items are fetched and written
+                pending = listings.submit(next_page, pages)
+                items = list(pool.map(fetch_item, page.get("data") or []))
+                written = sink.write(items)
+                with state_lock:
+                    counts[name] += written
+                    counts["skipped"] += len(items) - written
+                sink.sync()
+                checkpoint(chain, page)
+        except BaseException:
+            stop.set()  # the other chain stops after its current page
+            raise
+        finally:
+            wait([pending])  # leave no request running after a failure
+
+    def fetch_workflow(wf: dict) -> dict:
+        if "nodes" in wf:
+            return wf
+        # Some versions list workflows without their nodes
+        with slots:
+            return client.get_workflow(wf["id"])
+
+    def fetch_execution(execution: dict) -> dict:
+        if not include_data:
+            return execution
+        with slots:
+            return client.get_execution(execution["id"], include_data=True)
+
+    own_client = client is None
+    client = client or N8nClient(max_connections=concurrency)
+    workflows = _NdjsonSink(out / "workflows.ndjson", resume and "workflows" in state)
+    executions = None
+    try:
+        # One listing worker for the execution chain and one prefetch per chain
+        with ThreadPoolExecutor(max_workers=concurrency) as pool, \
+                ThreadPoolExecutor(max_workers=3) as listings:
+            running = None
+            if include_executions:
+                executions = _NdjsonSink(out / "executions.ndjson", resume and "executions" in state)
+                running = listings.submit(
+                    export_chain, "executions", executions, fetch_execution, pool, listings
+                )
+            try:
+                export_chain("workflows", workflows, fetch_workflow, pool, listings)
+            finally:
+                if running is not None:
+                    wait([running])
+            if running is not None:
+                running.result()
+    finally:
+        workflows.close()
+        if executions is not None:
+            executions.close()
+        if own_client:
+            client.close()
+
+    counts["dir"] = str(out)
+    return counts
+
+
+def import_workflows(
+    in_dir: str,
+    *,
+    client: Optional[N8nClient] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    resume: bool = True,
+) -> dict:
+    """
+    Create every workflow from in_dir/workflows.ndjson on the target instance.
+
+    The file is read as a stream with at most `concurrency` creates in
+    flight. Each success is appended to import_state.ndjson as
+    {"id": <source id>, "new_id": <created id>}; with resume, workflows
+    already recorded there are skipped, so an interrupted import can simply
+    be run again. n8n's API cannot create executions, so executions.ndjson
+    is export-only.
+
+    Args:
+        in_dir: Directory written by export_instance
+        client: Client to use (defaults to one built from N8N_API_URL/KEY)
+        concurrency: Maximum concurrent requests
+        resume: Skip workflows a previous import already created
+
+    Returns:
+        dict: Counts of imported and skipped workflows, and per-workflow errors
+    """
+    source = Path(in_dir) / "workflows.ndjson"
+    done = _NdjsonSink(Path(in_dir) / "import_state.ndjson", resume)
+    result = {"imported": 0, "skipped": 0, "errors": []}
+
+    def create(workflow: dict) -> None:
+        body = {k: workflow[k] for k in WORKFLOW_CREATE_FIELDS if k in workflow}
+        body.setdefault("settings", {})
+        created = client.create_workflow(body)
+        done.write([{"id": str(workflow.get("id")), "new_id": created["id"]}])
+
+    def collect(finished, in_flight: Dict) -> None:
+        for future in finished:
+            workflow_id = in_flight.pop(future)
+            try:
+                future.result()
+                result["imported"] += 1
+            except HttpRequestError as e:
+                result["errors"].append({"id": workflow_id, "error": str(e), "response": e.response_text})
+            except (KeyError, TypeError, ValueError) as e:
+                # A malformed workflow or create response fails only that workflow
+                result["errors"].append({"id": workflow_id, "error": f"{type(e).__name__}: {e}"})
+
+    own_client = client is None
+    client = client or N8nClient(max_connections=concurrency)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool, open(source, "rb") as f:
+            in_flight: Dict = {}
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    workflow = json.loads(line)
+                except ValueError as e:
+                    result["errors"].append({"line": line_no, "error": f"Invalid JSON: {e}"})
+                    continue
+                if not isinstance(workflow, dict):
+                    result["errors"].append({"line": line_no, "error": "Expected a JSON object"})
+                    continue
+                if str(workflow.get("id")) in done.ids:
+                    result["skipped"] += 1
+                    continue
+                if len(in_flight) >= concurrency * 2:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(finished, in_flight)
+                in_flight[pool.submit(create, workflow)] = workflow.get("id")
+            collect(wait(in_flight).done, in_flight)
+    finally:
+        done.close()
+        if own_client:
+            client.close()
+
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(description="n8n API Client")
     parser.add_argument(
@@ -408,6 +947,8 @@ def main():
             "webhook",
             "executions",
             "health",
+            "export",
+            "import",
         ],
         help="Action to perform",
     )
@@ -421,6 +962,16 @@ def main():
     parser.add_argument("--webhook-path", help="Webhook path for webhook action")
     parser.add_argument("--active-only", action="store_true", help="List only active workflows")
     parser.add_argument("--status", help="Filter executions by status")
+    parser.add_argument(
+        "--all", action="store_true", help="Stream every page of executions as NDJSON"
+    )
+    parser.add_argument("--dir", help="Directory for export/import NDJSON files")
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Concurrent requests for export/import"
+    )
+    parser.add_argument("--include-data", action="store_true", help="Export full execution data")
+    parser.add_argument("--no-executions", action="store_true", help="Export workflows only")
+    parser.add_argument("--fresh", action="store_true", help="Start over instead of resuming")
 
     args = parser.parse_args()
 
@@ -489,11 +1040,31 @@ def main():
             result = trigger_webhook(args.webhook_path, data)
 
         elif args.action == "executions":
+            if args.all:
+                for execution in iter_executions(workflow_id=args.workflow_id, status=args.status):
+                    print(json.dumps(execution))
+                return
             result = list_executions(workflow_id=args.workflow_id, status=args.status)
 
         elif args.action == "health":
             result = health_check()
 
+        elif args.action == "export":
+            if not args.dir:
+                raise ValueError("--dir required for export action")
+            result = export_instance(
+                args.dir,
+                include_executions=not args.no_executions,
+                include_data=args.include_data,
+                concurrency=args.concurrency,
+                resume=not args.fresh,
+            )
+
+        elif args.action == "import":
+            if not args.dir:
+                raise ValueError("--dir required for import action")
+            result = import_workflows(args.dir, concurrency=args.concurrency, resume=not args.fresh)
+
         print(json.dumps(result, indent=2))
 
     except HttpRequestError as e:
@@ -4,6 +4,10 @@ MyWork Plugin Manager — extend mw with custom commands.
 
 Plugins are Python files in ~/.mywork/plugins/ or <project>/.mw-plugins/
 Each plugin exports: NAME, DESCRIPTION, and a run(args) function.
+Metadata is read from the source (not by importing) and cached in
+~/.mywork/plugins/manifest.json; only the plugin being run is imported.
+Name the file after NAME (as `mw plugin create` does) so dispatch can go
+straight to it.
 
 Usage:
     mw plugin list              List installed plugins
@@ -13,6 +17,8 @@ Usage:
     mw plugin info <name>       Show plugin details
 """
 
+import ast
+import hashlib
 import os
 import sys
 import json
@@ -66,8 +72,144 @@ def save_registry(reg):
     PLUGIN_REGISTRY.write_text(json.dumps(reg, indent=2))
 
 
-def discover_plugins():
-    """Find all plugins from global + local dirs."""
+MANIFEST_VERSION = 1
+METADATA_FIELDS = {"NAME": "name", "DESCRIPTION": "description", "VERSION": "version", "AUTHOR": "author"}
+METADATA_DEFAULTS = {"description": "No description", "version": "0.0.0", "author": ""}
+
+# Plugin modules imported in this process, by path
+_LOADED = {}
+
+
+def read_metadata(path):
+    """Read NAME/DESCRIPTION/VERSION/AUTHOR from a plugin's source without running it.
+
+    Values that are not literals are left to an import; "dynamic" says so.
+    Raises SyntaxError/OSError like an import would.
+    """
+    path = Path(path)
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    meta = {"name": path.stem, **METADATA_DEFAULTS, "dynamic": False}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in METADATA_FIELDS:
+                try:
+                    meta[METADATA_FIELDS[target.id]] = ast.literal_eval(value)
+                except (ValueError, TypeError, SyntaxError):
+                    meta["dynamic"] = True
+    return meta
+
+
+class PluginManifest:
+    """Plugin metadata cached by file, in ~/.mywork/plugins/manifest.json.
+
+    An entry is trusted while the file's size and mtime are unchanged; after
+    that it is re-read only if the file's sha256 changed.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else GLOBAL_PLUGIN_DIR / "manifest.json"
+        self.entries = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data["plugins"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def metadata(self, f):
+        """Metadata for a plugin file, or {"error": message} if it cannot be read."""
+        key = str(Path(f).resolve())
+        try:
+            st = os.stat(key)
+        except OSError as e:
+            return {"error": str(e)}
+        entry = self.entries.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[3]
+        try:
+            digest = hashlib.sha256(Path(key).read_bytes()).hexdigest()
+        except OSError as e:
+            return {"error": str(e)}
+        if entry and entry[2] == digest:
+            meta = entry[3]
+        else:
+            try:
+                meta = read_metadata(key)
+            except (SyntaxError, ValueError, OSError) as e:
+                meta = {"error": str(e)}
+        self.entries[key] = [st.st_size, st.st_mtime_ns, digest, meta]
+        self.dirty = True
+        return meta
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            live = {k: v for k, v in self.entries.items() if os.path.exists(k)}
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "plugins": live}))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # the manifest is a cache; metadata is re-read next time
+
+
+def load_plugin(path):
+    """Import a plugin module once per process and hand back the same object after."""
+    path = str(Path(path).resolve())
+    mod = _LOADED.get(path)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _LOADED[path] = mod
+    return mod
+
+
+def _plugin_info(f, d, manifest):
+    meta = manifest.metadata(f)
+    if "error" in meta:
+        return {
+            "name": f.stem,
+            "description": f"⚠️ Error loading: {meta['error']}",
+            "path": str(f),
+            "source": "error",
+        }
+    if meta["dynamic"]:
+        # Computed metadata: only an import can tell
+        try:
+            mod = load_plugin(f)
+        except Exception as e:
+            return {
+                "name": f.stem,
+                "description": f"⚠️ Error loading: {e}",
+                "path": str(f),
+                "source": "error",
+            }
+        meta = {**meta, **{field: getattr(mod, attr, meta[field])
+                           for attr, field in METADATA_FIELDS.items()}}
+    return {
+        "name": meta["name"],
+        "description": meta["description"],
+        "version": meta["version"],
+        "author": meta["author"],
+        "path": str(f),
+        "source": "local" if d == LOCAL_PLUGIN_DIR else "global",
+    }
+
+
+def discover_plugins(manifest=None):
+    """Find all plugins from global + local dirs, without importing them."""
+    own_manifest = manifest is None
+    manifest = manifest or PluginManifest()
     plugins = {}
     for d in [GLOBAL_PLUGIN_DIR, LOCAL_PLUGIN_DIR]:
         if not d.exists():
@@ -75,29 +217,33 @@ def discover_plugins():
         for f in d.glob("*.py"):
             if f.name.startswith("_"):
                 continue
-            try:
-                spec = importlib.util.spec_from_file_location(f.stem, str(f))
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)
-                name = getattr(mod, "NAME", f.stem)
-                plugins[name] = {
-                    "name": name,
-                    "description": getattr(mod, "DESCRIPTION", "No description"),
-                    "version": getattr(mod, "VERSION", "0.0.0"),
-                    "author": getattr(mod, "AUTHOR", ""),
-                    "path": str(f),
-                    "source": "local" if d == LOCAL_PLUGIN_DIR else "global",
-                }
-            except Exception as e:
-                plugins[f.stem] = {
-                    "name": f.stem,
-                    "description": f"⚠️ Error loading: {e}",
-                    "path": str(f),
-                    "source": "error",
-                }
+            info = _plugin_info(f, d, manifest)
+            plugins[info["name"]] = info
+    if own_manifest:
+        manifest.save()
     return plugins
 
 
+def find_plugin(name, manifest=None):
+    """Look up one plugin, reading only <name>.py when the file is named after it."""
+    own_manifest = manifest is None
+    manifest = manifest or PluginManifest()
+    found = None
+    for d in [LOCAL_PLUGIN_DIR, GLOBAL_PLUGIN_DIR]:
+        f = d / f"{name}.py"
+        if name.startswith("_") or not f.is_file():
+            continue
+        info = _plugin_info(f, d, manifest)
+        if info["name"] == name:
+            found = info
+            break
+    if found is None:
+        found = discover_plugins(manifest).get(name)
+    if own_manifest:
+        manifest.save()
+    return found
+
+
 def cmd_list():
     plugins = discover_plugins()
     if not plugins:
@@ -148,14 +294,14 @@ def cmd_install(args):
     dest = GLOBAL_PLUGIN_DIR / src.name
     shutil.copy2(src, dest)
     # Validate
-    try:
-        spec = importlib.util.spec_from_file_location(src.stem, str(dest))
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        name = getattr(mod, "NAME", src.stem)
-    except Exception as e:
-        print(f"⚠️ Installed but failed to load: {e}")
+    manifest = PluginManifest()
+    meta = manifest.metadata(dest)
+    if "error" in meta:
+        print(f"⚠️ Installed but failed to load: {meta['error']}")
         name = src.stem
+    else:
+        name = _plugin_info(dest, GLOBAL_PLUGIN_DIR, manifest)["name"]
+    manifest.save()
     reg = load_registry()
     reg[name] = {"installed": datetime.now().isoformat(), "path": str(dest)}
     save_registry(reg)
@@ -167,11 +313,11 @@ def cmd_remove(args):
         print("❌ Usage: mw plugin remove <name>")
         return
     name = args[0]
-    plugins = discover_plugins()
-    if name not in plugins:
+    info = find_plugin(name)
+    if info is None:
         print(f"❌ Plugin '{name}' not found")
         return
-    path = Path(plugins[name]["path"])
+    path = Path(info["path"])
     if path.exists():
         path.unlink()
     reg = load_registry()
@@ -184,12 +330,11 @@ def cmd_info(args):
     if not args:
         print("❌ Usage: mw plugin info <name>")
         return
-    plugins = discover_plugins()
     name = args[0]
-    if name not in plugins:
+    info = find_plugin(name)
+    if info is None:
         print(f"❌ Plugin '{name}' not found")
         return
-    info = plugins[name]
     print(f"🔌 {info['name']} v{info.get('version', '?')}")
     print(f"   Description: {info['description']}")
     print(f"   Author:      {info.get('author', 'Unknown')}")
@@ -198,18 +343,15 @@ def cmd_info(args):
 
 
 def run_plugin(name, args):
-    """Execute a plugin by name."""
-    plugins = discover_plugins()
-    if name not in plugins:
+    """Execute a plugin by name, importing only that plugin."""
+    info = find_plugin(name)
+    if info is None:
         return False
-    info = plugins[name]
     if info["source"] == "error":
         print(f"❌ Plugin '{name}' has errors and cannot run")
         return True
     try:
-        spec = importlib.util.spec_from_file_location(name, info["path"])
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
+        mod = load_plugin(info["path"])
         if hasattr(mod, "run"):
             mod.run(args)
         else:
@@ -17,10 +17,15 @@ import os
 import re
 import subprocess
 import sys
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from collections import defaultdict
 from pathlib import Path
 
+try:
+    from git_history import GitHistory
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from git_history import GitHistory
+
 MYWORK_ROOT = Path(os.environ.get("MYWORK_ROOT", Path(__file__).parent.parent))
 
 # ANSI colors
@@ -75,12 +80,13 @@ def analyze_tech_debt() -> dict:
 
 def analyze_hotspots(days: int = 30) -> list:
     """Find files that change most frequently (churn = bugs)."""
-    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    log = git(f'log --since="{since}" --name-only --pretty=format:')
-    if not log:
+    history = GitHistory.load(MYWORK_ROOT, days=days)
+    if history is None:
         return []
     
-    counts = Counter(f for f in log.splitlines() if f.strip() and not f.startswith('.'))
+    counts = history.file_counts(days)
+    for f in [f for f in counts if f.startswith('.')]:
+        del counts[f]
     return counts.most_common(15)
 
 
@@ -150,33 +156,10 @@ def analyze_test_coverage() -> dict:
 
 def analyze_contributor_patterns(days: int = 30) -> dict:
     """Analyze who's contributing what."""
-    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    log = git(f'log --since="{since}" --format="%an|%aI" --shortstat')
-    if not log:
+    history = GitHistory.load(MYWORK_ROOT, days=days)
+    if history is None:
         return {}
-    
-    contributors = defaultdict(lambda: {'commits': 0, 'days_active': set()})
-    lines = log.splitlines()
-    
-    for line in lines:
-        if '|' in line and '20' in line:
-            parts = line.split('|')
-            if len(parts) == 2:
-                name = parts[0].strip()
-                try:
-                    date = parts[1][:10]
-                    contributors[name]['commits'] += 1
-                    contributors[name]['days_active'].add(date)
-                except Exception:
-                    pass
-    
-    result = {}
-    for name, data in contributors.items():
-        result[name] = {
-            'commits': data['commits'],
-            'active_days': len(data['days_active']),
-        }
-    return result
+    return history.author_activity(days)
 
 
 def generate_health_grade(debt: dict, hotspots: list, coverage: dict) -> tuple:
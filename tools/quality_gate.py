@@ -1,17 +1,26 @@
 """
 MyWork Quality Gate — mw check
 
-Pre-commit/pre-push quality gate that runs all checks in sequence:
-lint → test → security → audit. Returns pass/fail with a summary.
+Pre-commit/pre-push quality gate that runs lint, test, types, security and
+git checks concurrently and reports them in a fixed order. Returns pass/fail
+with a summary.
+
+Checks that only depend on the project's files (lint, test, types) are
+cached: a pass is remembered under a fingerprint of every file's content
+and reused until something changes. A failing blocking check (tests,
+security) cancels the checks still running.
 """
 
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 # ANSI colors
 CYAN = "\033[96m"
@@ -26,26 +35,46 @@ FAIL = "❌"
 WARN = "⚠️"
 SKIP = "⏭️"
 
+CACHE_DIR = Path(os.environ.get("MYWORK_CHECK_CACHE", Path.home() / ".mywork" / "check_cache"))
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", ".mypy_cache",
+             ".pytest_cache", ".ruff_cache", ".tox", "dist", "build"}
+
+_local = threading.local()  # per-worker cancel event, read by _run_check
+
 
 def _run_check(name: str, cmd: List[str], cwd: str = None, timeout: int = 120) -> Tuple[bool, str, float]:
-    """Run a check command and return (passed, output, duration_seconds)."""
+    """Run a check command and return (passed, output, duration_seconds).
+
+    When the gate cancels the run (a blocking check failed elsewhere), the
+    process is killed and the check reports (None, "Cancelled", ...).
+    """
     start = time.time()
+    cancel: Optional[threading.Event] = getattr(_local, "cancel", None)
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True,
-            cwd=cwd, timeout=timeout
-        )
-        duration = time.time() - start
-        output = (result.stdout + result.stderr).strip()
-        passed = result.returncode == 0
-        return passed, output, duration
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start
-        return False, f"Timed out after {timeout}s", duration
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=cwd)
     except FileNotFoundError:
         duration = time.time() - start
         return None, f"Command not found: {cmd[0]}", duration  # type: ignore
 
+    deadline = start + timeout
+    while True:
+        wait = max(0.0, deadline - time.time())
+        try:
+            stdout, stderr = proc.communicate(timeout=min(wait, 0.05) if cancel else wait)
+            break
+        except subprocess.TimeoutExpired:
+            if time.time() < deadline and not (cancel and cancel.is_set()):
+                continue
+            proc.kill()
+            proc.communicate()
+            duration = time.time() - start
+            if time.time() >= deadline:
+                return False, f"Timed out after {timeout}s", duration
+            return None, "Cancelled", duration  # type: ignore
+    duration = time.time() - start
+    output = (stdout + stderr).strip()
+    return proc.returncode == 0, output, duration
+
 
 def _detect_project(path: str) -> dict:
     """Detect project type and available checks."""
@@ -216,6 +245,174 @@ def _check_git(project: dict) -> Tuple[str, bool, str, float]:
     return "git", True, status, dur
 
 
+class GateCheck(NamedTuple):
+    name: str
+    fn: Callable[[dict], Tuple[str, Optional[bool], str, float]]
+    cacheable: bool = False  # result depends only on the project's files
+    blocking: bool = False   # a failure cancels the rest of the gate
+
+
+def default_checks(quick: bool = False) -> List[GateCheck]:
+    """The gate's checks, in report order."""
+    checks = [GateCheck("Lint", _check_lint, cacheable=True)]
+    if not quick:
+        checks.extend([
+            GateCheck("Test", _check_tests, cacheable=True, blocking=True),
+            GateCheck("Types", _check_types, cacheable=True),
+            GateCheck("Security", _check_security, blocking=True),
+        ])
+    checks.append(GateCheck("Git", _check_git))
+    return checks
+
+
+class CheckCache:
+    """
+    Last passing result of each cacheable check, keyed on a fingerprint of
+    the project's files. File digests are kept alongside with their size
+    and mtime, so only files that changed since the last run are re-hashed.
+    """
+
+    def __init__(self, project_path: str, cache_dir: Path = None):
+        self.project_path = Path(project_path).resolve()
+        digest = hashlib.sha1(str(self.project_path).encode()).hexdigest()[:16]
+        self.path = Path(cache_dir or CACHE_DIR) / f"{digest}.json"
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        self.files: Dict[str, list] = data.get("files", {})
+        self.results: Dict[str, dict] = data.get("results", {})
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _list_files(self) -> List[str]:
+        root = self.project_path
+        if (root / ".git").exists():
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                capture_output=True, cwd=root,
+            )
+            if result.returncode == 0:
+                return sorted({f for f in result.stdout.decode(errors="surrogateescape").split("\0") if f})
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel = os.path.relpath(dirpath, root)
+            files.extend(name if rel == "." else os.path.join(rel, name) for name in filenames)
+        return sorted(files)
+
+    def fingerprint(self) -> str:
+        """Content hash of every project file (plus the interpreter running the checks)."""
+        if self._fingerprint is not None:
+            return self._fingerprint
+        overall = hashlib.sha256(f"{sys.executable}\0{sys.version}".encode())
+        files = {}
+        for rel in self._list_files():
+            path = self.project_path / rel
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # deleted but still in the index
+            cached = self.files.get(rel)
+            if cached and cached[:2] == [st.st_size, st.st_mtime_ns]:
+                digest = cached[2]
+            else:
+                h = hashlib.sha256()
+                try:
+                    with open(path, "rb") as f:
+                        while block := f.read(1 << 20):
+                            h.update(block)
+                except OSError:
+                    continue
+                digest = h.hexdigest()
+            files[rel] = [st.st_size, st.st_mtime_ns, digest]
+            overall.update(f"{rel}\0{digest}\0".encode())
+        self.files = files
+        self._fingerprint = overall.hexdigest()
+        return self._fingerprint
+
+    def get(self, check: str) -> Optional[dict]:
+        entry = self.results.get(check)
+        if entry and entry.get("key") == self.fingerprint():
+            return entry
+        return None
+
+    def put(self, check: str, tool: str, detail: str, duration: float):
+        with self._lock:
+            self.results[check] = {"key": self.fingerprint(), "tool": tool,
+                                   "detail": detail, "duration": duration}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"files": self.files, "results": self.results}))
+        os.replace(tmp, self.path)
+
+
+def run_gate(project: dict, checks: List[GateCheck], jobs: int = None,
+             cache: Optional[CheckCache] = None, fail_fast: bool = True,
+             on_result: Callable[[dict], None] = None) -> List[dict]:
+    """
+    Run checks concurrently on up to `jobs` threads.
+
+    Results come back in the order of `checks`, whatever order they finish
+    in; on_result is called with each one as soon as it and every check
+    before it are done, so streamed output is deterministic too.
+    """
+    jobs = max(1, jobs or len(checks))
+    cancel = threading.Event()
+    if cache is not None and any(c.cacheable for c in checks):
+        cache.fingerprint()  # hash once, before any check touches the tree
+
+    def run(check: GateCheck) -> dict:
+        result = {"check": check.name, "cached": False}
+        hit = cache.get(check.name) if cache is not None and check.cacheable else None
+        if hit:
+            result.update(tool=hit["tool"], passed=True, detail=hit["detail"], duration=0.0, cached=True)
+        elif cancel.is_set():
+            result.update(tool=check.name.lower(), passed=None, detail="Cancelled", duration=0.0)
+        else:
+            _local.cancel = cancel
+            try:
+                tool, passed, detail, dur = check.fn(project)
+            except Exception as e:
+                tool, passed, detail, dur = check.name.lower(), False, f"{type(e).__name__}: {e}", 0.0
+            finally:
+                _local.cancel = None
+            result.update(tool=tool, passed=passed, detail=detail, duration=dur)
+            if passed and cache is not None and check.cacheable:
+                cache.put(check.name, tool, detail, dur)
+        if result["passed"] is False and check.blocking and fail_fast:
+            cancel.set()
+        return result
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="check") as pool:
+        futures = [pool.submit(run, check) for check in checks]
+        for future in futures:
+            result = future.result()
+            result["duration"] = round(result["duration"], 2)
+            results.append(result)
+            if on_result:
+                on_result(result)
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError:
+            pass  # a read-only home just means no caching
+    return results
+
+
+def _print_result(result: dict):
+    passed, dur = result["passed"], result["duration"]
+    icon = SKIP if passed is None else CHECK if passed else FAIL
+    dur_str = "cached" if result["cached"] else f"{dur:.1f}s" if dur >= 1 else f"{dur*1000:.0f}ms"
+    print(f"  {icon} {BOLD}{result['check']:<10}{RESET} {DIM}({result['tool']}, {dur_str}){RESET}")
+    if passed is False:
+        for line in result["detail"].split("\n")[:3]:
+            print(f"     {DIM}{line}{RESET}")
+
+
 def cmd_check(args: List[str] = None) -> int:
     """Run quality gate checks."""
     args = args or []
@@ -232,6 +429,9 @@ Pre-commit/pre-push quality gate. Runs all checks and reports pass/fail.
     mw check --quick            Skip slow checks (types, security)
     mw check --fix              Auto-fix what's possible (lint)
     mw check --json             Output results as JSON
+    mw check --jobs N           Run at most N checks at once (default: all)
+    mw check --no-cache         Re-run checks even if nothing changed
+    mw check --no-fail-fast     Keep running after a blocking failure
     mw check --pre-commit       Install as git pre-commit hook
 
 {BOLD}Checks:{RESET}
@@ -241,6 +441,9 @@ Pre-commit/pre-push quality gate. Runs all checks and reports pass/fail.
     4. {GREEN}Security{RESET}  — Secret scanning, vulnerability audit
     5. {GREEN}Git{RESET}       — Branch hygiene, uncommitted changes
 
+    Checks run in parallel. Lint, test and type results are cached until a
+    project file changes; a test or security failure cancels the rest.
+
 {BOLD}Examples:{RESET}
     mw check                    # Full quality gate
     mw check --quick            # Fast checks only (lint + git)
@@ -252,7 +455,19 @@ Pre-commit/pre-push quality gate. Runs all checks and reports pass/fail.
     fix_mode = "--fix" in args
     json_mode = "--json" in args
     pre_commit = "--pre-commit" in args
-    path_args = [a for a in args if not a.startswith("--")]
+    use_cache = "--no-cache" not in args
+    fail_fast = "--no-fail-fast" not in args
+    jobs = None
+    for flag in ("--jobs", "-j"):
+        if flag in args:
+            i = args.index(flag)
+            try:
+                jobs = int(args[i + 1])
+            except (IndexError, ValueError):
+                print(f"  {RED}{flag} needs a number{RESET}")
+                return 1
+            args = args[:i] + args[i + 2:]
+    path_args = [a for a in args if not a.startswith("-")]
     project_path = path_args[0] if path_args else os.getcwd()
 
     # Install pre-commit hook
@@ -264,53 +479,14 @@ Pre-commit/pre-push quality gate. Runs all checks and reports pass/fail.
     print(f"\n{BOLD}🛡️  Quality Gate — {project['name']}{RESET}")
     print(f"{'─' * 50}")
 
-    checks = [
-        ("Lint", _check_lint),
-    ]
-
-    if not quick:
-        checks.extend([
-            ("Test", _check_tests),
-            ("Types", _check_types),
-            ("Security", _check_security),
-        ])
-
-    checks.append(("Git", _check_git))
+    checks = default_checks(quick)
+    cache = CheckCache(project["path"]) if use_cache else None
 
-    results = []
-    total_time = 0.0
-    all_passed = True
-
-    for check_name, check_fn in checks:
-        tool, passed, detail, dur = check_fn(project)
-        total_time += dur
-
-        if passed is None:
-            icon = SKIP
-            status = "skipped"
-        elif passed:
-            icon = CHECK
-            status = "passed"
-        else:
-            icon = FAIL
-            status = "FAILED"
-            all_passed = False
-
-        # Format duration
-        dur_str = f"{dur:.1f}s" if dur >= 1 else f"{dur*1000:.0f}ms"
-
-        print(f"  {icon} {BOLD}{check_name:<10}{RESET} {DIM}({tool}, {dur_str}){RESET}")
-        if not passed and passed is not None:
-            for line in detail.split("\n")[:3]:
-                print(f"     {DIM}{line}{RESET}")
-
-        results.append({
-            "check": check_name,
-            "tool": tool,
-            "passed": passed,
-            "detail": detail,
-            "duration": round(dur, 2),
-        })
+    start = time.time()
+    results = run_gate(project, checks, jobs=jobs, cache=cache, fail_fast=fail_fast,
+                       on_result=_print_result)
+    total_time = time.time() - start
+    all_passed = all(r["passed"] is not False for r in results)
 
     # Summary
     print(f"{'─' * 50}")
@@ -337,6 +513,7 @@ Pre-commit/pre-push quality gate. Runs all checks and reports pass/fail.
             "passed": all_passed,
             "checks": results,
             "total_time": round(total_time, 2),
+            "check_time": round(sum(r["duration"] for r in results), 2),
         }, indent=2))
 
     return 0 if all_passed else 1
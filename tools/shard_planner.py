@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Shard Planner
+=============
+Runs many test suites at once and merges their results.
+
+- Suites run concurrently on a worker pool, up to the CPU count.
+- A pytest suite whose last run took longer than ``SHARD_SECONDS`` is
+  collected and split into shards. The shards are balanced on a persisted
+  per-test duration history.
+- Previously failing tests and tests in recently changed files run first,
+  in sharded and whole suites alike.
+
+Used by ``mw test --all`` and the e2e suite runner.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+DURATIONS_DIR = Path(os.environ.get("MYWORK_TEST_DURATIONS", Path.home() / ".mywork" / "test_durations"))
+HISTORY_VERSION = 1
+DEFAULT_DURATION = 1.0  # seconds assumed when nothing has been recorded yet
+SHARD_SECONDS = 5.0  # suites slower than this are split into shards
+
+PYTEST_STATUS = re.compile(r"^(\S.*?::\S.*?) (PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS)\b")
+PYTEST_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)s (?:setup|call|teardown)\s+(\S.*?)\s*$")
+STATUS_COUNTS = {"PASSED": "passed", "XPASS": "passed", "FAILED": "failed",
+                 "ERROR": "failed", "SKIPPED": "skipped", "XFAIL": "skipped"}
+PYTEST_REPORT_ARGS = ["-v", "--tb=short", "-p", "no:cacheprovider", "--durations=0", "--durations-min=0"]
+
+
+class DurationHistory:
+    """What the last runs of one suite measured.
+
+    Stored per root directory under ~/.mywork/test_durations:
+
+    - ``durations``: seconds per pytest node id or script
+    - ``failed``: node ids that failed the last time they ran
+    - ``suite_duration``: wall time of the last full run
+    - ``last_run``: when that run started
+    """
+
+    def __init__(self, root, history_dir=None):
+        digest = hashlib.sha1(str(Path(root).resolve()).encode()).hexdigest()[:16]
+        self.path = Path(history_dir or DURATIONS_DIR) / f"{digest}.json"
+        self.durations: Dict[str, float] = {}
+        self.failed = set()
+        self.suite_duration: Optional[float] = None
+        self.last_run = 0.0
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == HISTORY_VERSION:
+                self.durations = data["durations"]
+                self.failed = set(data["failed"])
+                self.suite_duration = data["suite_duration"]
+                self.last_run = data["last_run"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def update(self, durations: Dict[str, float], statuses: Dict[str, str] = None,
+               suite_duration: float = None, started: float = None):
+        """Record a run. Only tests that ran change their failed state."""
+        self.durations.update(durations)
+        if statuses:
+            self.failed -= set(statuses)
+            self.failed |= {t for t, s in statuses.items() if s in ("FAILED", "ERROR")}
+        if suite_duration is not None:
+            self.suite_duration = suite_duration
+        if started is not None:
+            self.last_run = started
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({
+                "version": HISTORY_VERSION, "durations": self.durations,
+                "failed": sorted(self.failed), "suite_duration": self.suite_duration,
+                "last_run": self.last_run}, sort_keys=True))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # history is best effort
+
+
+def balance_shards(tests: List[str], durations: Dict[str, float], shards: int):
+    """Split tests into at most `shards` groups of near-equal expected duration.
+
+    Longest-processing-time first: the slowest test goes onto whichever shard
+    is lightest so far. Tests without history count as the mean of those with
+    it. Each shard keeps the input order and comes back as (tests, expected).
+    """
+    if not tests:
+        return []
+    known = [durations[t] for t in tests if t in durations]
+    default = sum(known) / len(known) if known else DEFAULT_DURATION
+    order = {test: i for i, test in enumerate(tests)}
+    count = max(1, min(shards, len(tests)))
+    heap = [(0.0, i) for i in range(count)]
+    groups = [[] for _ in range(count)]
+    for test in sorted(tests, key=lambda t: (-durations.get(t, default), order[t])):
+        load, i = heapq.heappop(heap)
+        groups[i].append(test)
+        heapq.heappush(heap, (load + durations.get(test, default), i))
+    loads = {i: load for load, i in heap}
+    return [(sorted(g, key=order.get), loads[i]) for i, g in enumerate(groups)]
+
+
+def parse_pytest_output(stdout: str):
+    """Per-node status and total setup+call+teardown time from `pytest -v --durations=0`."""
+    statuses, durations = {}, {}
+    for line in stdout.splitlines():
+        m = PYTEST_STATUS.match(line)
+        if m:
+            node, status = m.groups()
+            if statuses.get(node) not in ("FAILED", "ERROR"):  # teardown errors follow PASSED
+                statuses[node] = status
+            continue
+        m = PYTEST_DURATION.match(line)
+        if m and "::" in m.group(2):
+            durations[m.group(2)] = durations.get(m.group(2), 0.0) + float(m.group(1))
+    return statuses, durations
+
+
+def changed_files(root: Path, files, since: float):
+    """The files (relative to root) modified after `since`"""
+    changed = set()
+    for rel in files:
+        try:
+            if os.stat(os.path.join(root, rel)).st_mtime > since:
+                changed.add(rel)
+        except OSError:
+            pass
+    return changed
+
+
+def prioritize(tests: List[str], failed, changed):
+    """Failed tests first, then tests in changed files, otherwise unchanged order"""
+    def rank(test):
+        if test in failed:
+            return 0
+        return 1 if test.split("::", 1)[0] in changed else 2
+    return sorted(tests, key=rank)
+
+
+class Suite(NamedTuple):
+    """One project's tests: pytest (argv prefix) or any shell command."""
+    name: str
+    cwd: Path
+    pytest: Optional[List[str]] = None  # e.g. ["pytest", "--timeout=30"]
+    command: Optional[str] = None
+
+
+class _Job(NamedTuple):
+    suite: int
+    shard: int
+    tests: Optional[List[str]]  # node ids, or None for the whole suite
+    expected: float
+    urgent: bool  # holds previously failing or recently changed tests
+
+
+class SuiteScheduler:
+    """Run suites concurrently, sharding the slow pytest ones.
+
+    Scheduling has two rounds. First, slow pytest suites and those with
+    failing or changed tests are collected in parallel. Then every shard and
+    whole suite is queued: urgent jobs first, the rest longest-expected
+    first. ``run()`` returns one merged result per suite, in input order.
+    """
+
+    def __init__(self, suites: List[Suite], workers: int = None, history_dir=None,
+                 shard_seconds: float = SHARD_SECONDS, timeout: float = None):
+        self.suites = list(suites)
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_seconds = shard_seconds
+        self.timeout = timeout
+        self.histories = [DurationHistory(s.cwd, history_dir) for s in self.suites]
+
+    def _exec(self, cmd, cwd, shell=False):
+        start = time.perf_counter()
+        try:
+            proc = subprocess.run(cmd, cwd=cwd, shell=shell, capture_output=True, text=True,
+                                  timeout=self.timeout)
+            returncode, stdout, stderr = proc.returncode, proc.stdout, proc.stderr
+        except subprocess.TimeoutExpired as e:
+            returncode, stderr = -1, f"Timed out after {self.timeout}s"
+            stdout = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        except OSError as e:
+            returncode, stdout, stderr = 127, "", str(e)
+        return {"returncode": returncode, "stdout": stdout, "stderr": stderr,
+                "duration": round(time.perf_counter() - start, 3)}
+
+    def _pytest_argv(self, suite, *args):
+        return [*suite.pytest, f"--rootdir={suite.cwd}", *args]
+
+    def collect(self, index: int) -> Optional[List[str]]:
+        """Node ids of one pytest suite, or None if collection failed"""
+        suite = self.suites[index]
+        result = self._exec(self._pytest_argv(suite, "--collect-only", "--verbosity=-1",
+                                              "-p", "no:cacheprovider"), suite.cwd)
+        if result["returncode"] not in (0, 5):
+            return None
+        return [line.strip() for line in result["stdout"].splitlines() if "::" in line]
+
+    def plan(self, index: int, tests: Optional[List[str]]) -> List[_Job]:
+        """Shard jobs for one suite (a single job unless it's worth splitting)
+
+        A collected suite that is not split still runs as one job over its
+        node ids in priority order.
+        """
+        suite, history = self.suites[index], self.histories[index]
+        if tests is None:
+            return [_Job(index, 0, None, history.suite_duration or DEFAULT_DURATION, self._urgent(index))]
+
+        changed = changed_files(suite.cwd, {t.split("::", 1)[0] for t in tests}, history.last_run)
+        ordered = prioritize(tests, history.failed, changed)
+        known = [history.durations[t] for t in tests if t in history.durations]
+        mean = sum(known) / len(known) if known else DEFAULT_DURATION
+        total = sum(history.durations.get(t, mean) for t in tests)
+        count = 1
+        if self._should_shard(index):
+            count = min(self.workers, max(1, math.ceil(total / self.shard_seconds)))
+        jobs = []
+        for shard, (shard_tests, expected) in enumerate(balance_shards(ordered, history.durations, count)):
+            urgent = any(t in history.failed or t.split("::", 1)[0] in changed for t in shard_tests)
+            jobs.append(_Job(index, shard, shard_tests, expected, urgent))
+        return jobs
+
+    def _should_shard(self, index):
+        history = self.histories[index]
+        return (self.suites[index].pytest is not None and self.workers > 1
+                and (history.suite_duration or 0) > self.shard_seconds)
+
+    def _urgent(self, index):
+        """Whether the suite's last run had failures or its test files changed since"""
+        suite, history = self.suites[index], self.histories[index]
+        files = {t.split("::", 1)[0] for t in history.durations if "::" in t}
+        return bool(history.failed) or bool(changed_files(suite.cwd, files, history.last_run))
+
+    def _should_collect(self, index):
+        """Shard it, or run its failing and changed tests ahead of the rest"""
+        return self.suites[index].pytest is not None and (self._should_shard(index) or self._urgent(index))
+
+    def _run_job(self, job: _Job):
+        suite = self.suites[job.suite]
+        if suite.pytest is None:
+            return self._exec(suite.command, suite.cwd, shell=True)
+        return self._exec(self._pytest_argv(suite, *PYTEST_REPORT_ARGS, *(job.tests or [])), suite.cwd)
+
+    def run(self) -> List[Dict]:
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            to_collect = [i for i in range(len(self.suites)) if self._should_collect(i)]
+            collected = dict(zip(to_collect, pool.map(self.collect, to_collect)))
+            jobs = [job for i in range(len(self.suites)) for job in self.plan(i, collected.get(i))]
+            order = sorted(range(len(jobs)), key=lambda j: (not jobs[j].urgent, -jobs[j].expected, j))
+            futures = {j: pool.submit(self._run_job, jobs[j]) for j in order}
+            outputs = [futures[j].result() for j in range(len(jobs))]
+
+        results = []
+        for index in range(len(self.suites)):
+            mine = [(job, out) for job, out in zip(jobs, outputs) if job.suite == index]
+            results.append(self._merge(index, mine, started))
+        for history in self.histories:
+            history.save()
+        return results
+
+    def _merge(self, index, runs, started) -> Dict:
+        """One result per suite from its shard outputs, in shard order"""
+        suite, history = self.suites[index], self.histories[index]
+        duration = max(out["duration"] for _, out in runs)
+        result = {
+            "name": suite.name,
+            "shards": len(runs),
+            "duration": duration,
+            "cpu_time": round(sum(out["duration"] for _, out in runs), 3),
+            "output": "".join(out["stdout"] + out["stderr"] for _, out in runs),
+            "counts": None,
+            "failed_tests": [],
+            "durations": {},
+        }
+        codes = [out["returncode"] for _, out in runs]
+        if suite.pytest is None:
+            result["returncode"] = next((c for c in codes if c != 0), 0)
+            history.update({}, suite_duration=duration, started=started)
+            return result
+
+        statuses, durations = {}, {}
+        for job, out in runs:
+            shard_statuses, shard_durations = parse_pytest_output(out["stdout"])
+            statuses.update(shard_statuses)
+            durations.update(shard_durations)
+            if job.tests and out["returncode"] not in (0, 1, 5):
+                # Crashed or timed out: whatever did not report counts as an error
+                statuses.update({t: "ERROR" for t in job.tests if t not in shard_statuses})
+        counts = {"passed": 0, "failed": 0, "skipped": 0}
+        for status in statuses.values():
+            counts[STATUS_COUNTS[status]] += 1
+        result["counts"] = counts
+        result["failed_tests"] = [t for t, s in statuses.items() if s in ("FAILED", "ERROR")]
+        result["durations"] = durations
+        if all(c == 5 for c in codes):
+            result["returncode"] = 5
+        else:
+            result["returncode"] = next((c for c in codes if c not in (0, 5)), 0)
+        history.update(durations, statuses, suite_duration=round(sum(durations.values()), 3) or duration,
+                       started=started)
+        return result
+
+
+def slowest_tests(results: List[Dict], count: int = 10):
+    """(suite, node id, seconds) of the slowest tests across all results"""
+    timed = [(r["name"], test, secs) for r in results for test, secs in r["durations"].items()]
+    return sorted(timed, key=lambda t: -t[2])[:count]
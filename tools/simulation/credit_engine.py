@@ -4,12 +4,22 @@ Virtual Credit System for MyWork-AI
 Manages virtual balances, transactions, and reporting
 """
 import json
+import sys
 import uuid
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from enum import Enum
 
+try:
+    from event_log import STR, ColumnarLog
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from event_log import STR, ColumnarLog
+
 class TransactionType(Enum):
     TOP_UP = "top_up"
     SPEND = "spend"
@@ -69,6 +79,17 @@ class CreditEngine:
         self.total_credits_issued = 0.0
         self.total_credits_burned = 0.0
         
+        # Indexes maintained on write so queries don't rescan self.transactions
+        self._user_index: Dict[str, List[int]] = defaultdict(list)  # user_id -> positions
+        self._timestamps: List[str] = []  # parallel to self.transactions
+        self._chronological = True  # False once the clock has gone backwards
+        self._daily_volume: Dict[str, Dict[str, List[float]]] = {}  # day -> type -> [count, volume]
+        self._completed_by_type: Counter = Counter()
+        
+        # Bulk commissions (earn_commissions) are logged column-wise instead of as Transactions
+        self.commission_log = ColumnarLog(user=STR, amount="d", level="b", batch="l")
+        self.commission_batches: List[Dict[str, Any]] = []  # batch index -> metadata
+        
     def create_user_balance(self, user_id: str, initial_balance: float = 0.0) -> bool:
         """Create a new user balance record"""
         if user_id in self.balances:
@@ -130,9 +151,26 @@ class CreditEngine:
             reference_id=reference_id
         )
         
-        self.transactions.append(transaction)
+        self._index_transaction(transaction)
         return transaction_id
     
+    def _index_transaction(self, transaction: Transaction):
+        """Append a transaction and update the per-user index and daily rollups"""
+        position = len(self.transactions)
+        self.transactions.append(transaction)
+        self._user_index[transaction.user_id].append(position)
+        if self._timestamps and transaction.timestamp < self._timestamps[-1]:
+            self._chronological = False
+        self._timestamps.append(transaction.timestamp)
+        
+        if transaction.status == TransactionStatus.COMPLETED:
+            tx_type = transaction.transaction_type.value
+            self._completed_by_type[tx_type] += 1
+            day = self._daily_volume.setdefault(transaction.timestamp[:10], {})
+            bucket = day.setdefault(tx_type, [0, 0.0])
+            bucket[0] += 1
+            bucket[1] += transaction.amount
+    
     def _validate_transaction(self, user_id: str, amount: float, 
                             transaction_type: TransactionType) -> Tuple[bool, str]:
         """Validate if a transaction can be performed"""
@@ -329,6 +367,71 @@ class CreditEngine:
         
         return True, transaction_id
     
+    def earn_commissions(self, user_ids: Sequence[str], amounts: Sequence[float],
+                         levels: Sequence[int] = None, source: str = "bulk",
+                         reference_id: str = None) -> Dict[str, Any]:
+        """Award a batch of commissions with one balance update per user
+        
+        Rows below min_transaction are rejected. Deltas are summed per user
+        and validated once: if the user is missing or frozen, or the sum would
+        exceed max_balance, all of that user's rows in the batch are rejected.
+        Accepted rows are appended to commission_log (no Transaction objects,
+        ids or per-row timestamps).
+        """
+        if levels is None:
+            levels = [1] * len(user_ids)
+        # NumPy columns (e.g. from MLMSimulator.process_sales) iterate much faster as lists
+        amounts = amounts.tolist() if hasattr(amounts, "tolist") else amounts
+        levels = levels.tolist() if hasattr(levels, "tolist") else levels
+        
+        totals: Dict[str, float] = defaultdict(float)
+        min_transaction = self.min_transaction
+        for user_id, amount in zip(user_ids, amounts):
+            if amount >= min_transaction:
+                totals[user_id] += amount
+        
+        rejected_users = set()
+        for user_id, total in totals.items():
+            balance = self.balances.get(user_id)
+            if balance is None or balance.is_frozen or balance.balance + total > self.max_balance:
+                rejected_users.add(user_id)
+        
+        timestamp = datetime.now().isoformat()
+        credited = 0.0
+        for user_id, total in totals.items():
+            if user_id in rejected_users:
+                continue
+            user_balance = self.balances[user_id]
+            user_balance.balance += total
+            user_balance.total_commissions += total
+            user_balance.last_updated = timestamp
+            credited += total
+        self.total_credits_issued += credited
+        
+        accepted = [i for i, (user_id, amount) in enumerate(zip(user_ids, amounts))
+                    if amount >= min_transaction and user_id not in rejected_users]
+        batch = len(self.commission_batches)
+        self.commission_batches.append({
+            "timestamp": timestamp,
+            "source": source,
+            "reference_id": reference_id,
+            "count": len(accepted),
+            "volume": credited,
+        })
+        self.commission_log.extend(
+            user=[user_ids[i] for i in accepted],
+            amount=[amounts[i] for i in accepted],
+            level=[levels[i] for i in accepted],
+            batch=[batch] * len(accepted),
+        )
+        
+        return {
+            "applied": len(accepted),
+            "rejected": len(user_ids) - len(accepted),
+            "users_credited": len(totals) - len(rejected_users),
+            "total_amount": round(credited, 2),
+        }
+    
     def refund(self, user_id: str, amount: float, reason: str,
               reference_id: str = None) -> Tuple[bool, str]:
         """Process a refund to user"""
@@ -369,9 +472,26 @@ class CreditEngine:
         return self.balances[user_id].balance
     
     def get_user_transactions(self, user_id: str, limit: int = None) -> List[Transaction]:
-        """Get transaction history for a user"""
-        user_transactions = [tx for tx in self.transactions if tx.user_id == user_id]
-        user_transactions.sort(key=lambda x: x.timestamp, reverse=True)
+        """Get transaction history for a user (newest first)"""
+        positions = self._user_index.get(user_id, [])
+        transactions = self.transactions
+        
+        if not self._chronological:
+            user_transactions = [transactions[i] for i in positions]
+            user_transactions.sort(key=lambda x: x.timestamp, reverse=True)
+            return user_transactions[:limit] if limit else user_transactions
+        
+        # Positions are in timestamp order: walk back from the newest, keeping
+        # equal timestamps in insertion order like a stable descending sort
+        user_transactions = []
+        end = len(positions)
+        while end > 0 and not (limit and len(user_transactions) >= limit):
+            timestamp = transactions[positions[end - 1]].timestamp
+            start = end - 1
+            while start > 0 and transactions[positions[start - 1]].timestamp == timestamp:
+                start -= 1
+            user_transactions.extend(transactions[i] for i in positions[start:end])
+            end = start
         
         if limit:
             user_transactions = user_transactions[:limit]
@@ -446,21 +566,44 @@ class CreditEngine:
         cutoff_date = datetime.now() - timedelta(days=days)
         cutoff_iso = cutoff_date.isoformat()
         
-        recent_transactions = [tx for tx in self.transactions 
-                             if tx.timestamp >= cutoff_iso and tx.status == TransactionStatus.COMPLETED]
-        
         volume_by_type = {}
         total_volume = 0.0
-        transaction_count = len(recent_transactions)
+        transaction_count = 0
         
-        for tx in recent_transactions:
-            tx_type = tx.transaction_type.value
+        def add(tx_type: str, count: int, volume: float):
+            nonlocal total_volume, transaction_count
             if tx_type not in volume_by_type:
                 volume_by_type[tx_type] = {"count": 0, "volume": 0.0}
-            
-            volume_by_type[tx_type]["count"] += 1
-            volume_by_type[tx_type]["volume"] += tx.amount
-            total_volume += tx.amount
+            volume_by_type[tx_type]["count"] += count
+            volume_by_type[tx_type]["volume"] += volume
+            total_volume += volume
+            transaction_count += count
+        
+        if self._chronological:
+            # Whole days after the cutoff come from the daily rollup; only the
+            # cutoff day itself is scanned, starting at the first recent transaction
+            cutoff_day = cutoff_iso[:10]
+            for day in reversed(self._daily_volume):
+                if day <= cutoff_day:
+                    break
+                for tx_type, (count, volume) in self._daily_volume[day].items():
+                    add(tx_type, count, volume)
+            position = bisect_left(self._timestamps, cutoff_iso)
+            while position < len(self.transactions) and self._timestamps[position][:10] == cutoff_day:
+                tx = self.transactions[position]
+                if tx.status == TransactionStatus.COMPLETED:
+                    add(tx.transaction_type.value, 1, tx.amount)
+                position += 1
+        else:
+            for tx in self.transactions:
+                if tx.timestamp >= cutoff_iso and tx.status == TransactionStatus.COMPLETED:
+                    add(tx.transaction_type.value, 1, tx.amount)
+        
+        for batch in reversed(self.commission_batches):
+            if batch["timestamp"] < cutoff_iso:
+                break
+            if batch["count"]:
+                add(TransactionType.COMMISSION.value, batch["count"], batch["volume"])
         
         return {
             "period_days": days,
@@ -485,15 +628,11 @@ class CreditEngine:
         total_refunds = sum(b.total_refunds for b in self.balances.values())
         
         # Transaction stats
-        completed_transactions = [tx for tx in self.transactions 
-                                if tx.status == TransactionStatus.COMPLETED]
-        
-        transaction_types = {}
-        for tx in completed_transactions:
-            tx_type = tx.transaction_type.value
-            if tx_type not in transaction_types:
-                transaction_types[tx_type] = 0
-            transaction_types[tx_type] += 1
+        transaction_types = dict(self._completed_by_type)
+        if len(self.commission_log):
+            tx_type = TransactionType.COMMISSION.value
+            transaction_types[tx_type] = transaction_types.get(tx_type, 0) + len(self.commission_log)
+        completed_transactions = sum(transaction_types.values())
         
         return {
             "system_overview": {
@@ -512,8 +651,8 @@ class CreditEngine:
                 "average_balance": round(total_circulation / total_users, 2) if total_users > 0 else 0
             },
             "transaction_stats": {
-                "total_transactions": len(self.transactions),
-                "completed_transactions": len(completed_transactions),
+                "total_transactions": len(self.transactions) + len(self.commission_log),
+                "completed_transactions": completed_transactions,
                 "transactions_by_type": transaction_types
             },
             "top_earners": self.get_top_earners(5),
@@ -521,15 +660,33 @@ class CreditEngine:
             "report_generated": datetime.now().isoformat()
         }
     
-    def export_data(self, filename: str = None) -> str:
-        """Export all credit system data"""
+    @staticmethod
+    def _transaction_record(tx: Transaction) -> Dict[str, Any]:
+        """JSON-ready dict for a transaction (enums as their values)"""
+        record = asdict(tx)
+        record["transaction_type"] = tx.transaction_type.value if hasattr(tx.transaction_type, "value") else str(tx.transaction_type)
+        record["status"] = tx.status.value if hasattr(tx.status, "value") else str(tx.status)
+        return record
+    
+    def export_data(self, filename: str = None, stream: bool = False) -> str:
+        """Export all credit system data
+        
+        With stream=True (or a .jsonl filename) records are written one JSON
+        object per line as they are produced, so memory stays flat no matter
+        how many transactions exist. Each line has a "record" field: config,
+        balance, transaction, commission (bulk log rows) and finally report.
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"credit_system_export_{timestamp}.json"
+            extension = "jsonl" if stream else "json"
+            filename = f"credit_system_export_{timestamp}.{extension}"
+        
+        if stream or filename.endswith(".jsonl"):
+            return self._export_jsonl(filename)
         
         export_data = {
             "balances": {uid: asdict(balance) for uid, balance in self.balances.items()},
-            "transactions": [asdict(tx) for tx in self.transactions],
+            "transactions": [self._transaction_record(tx) for tx in self.transactions],
             "system_config": {
                 "max_balance": self.max_balance,
                 "min_transaction": self.min_transaction,
@@ -540,15 +697,43 @@ class CreditEngine:
             "export_timestamp": datetime.now().isoformat()
         }
         
-        # Convert enum values to strings for JSON serialization
-        for tx in export_data["transactions"]:
-            tx["transaction_type"] = tx["transaction_type"].value if hasattr(tx["transaction_type"], "value") else str(tx["transaction_type"])
-            tx["status"] = tx["status"].value if hasattr(tx["status"], "value") else str(tx["status"])
-        
         with open(filename, 'w') as f:
             json.dump(export_data, f, indent=2, default=str)
         
         return filename
+    
+    def _export_jsonl(self, filename: str) -> str:
+        """Stream the export as JSON Lines"""
+        def write(f, record_type: str, record: Dict[str, Any]):
+            f.write(json.dumps({"record": record_type, **record}, default=str))
+            f.write("\n")
+        
+        with open(filename, 'w') as f:
+            write(f, "config", {
+                "max_balance": self.max_balance,
+                "min_transaction": self.min_transaction,
+                "total_credits_issued": self.total_credits_issued,
+                "total_credits_burned": self.total_credits_burned,
+                "export_timestamp": datetime.now().isoformat()
+            })
+            for balance in self.balances.values():
+                write(f, "balance", asdict(balance))
+            for tx in self.transactions:
+                write(f, "transaction", self._transaction_record(tx))
+            batches = self.commission_batches
+            for row in self.commission_log.rows():
+                batch = batches[row["batch"]]
+                write(f, "commission", {
+                    "user_id": row["user"],
+                    "amount": row["amount"],
+                    "level": row["level"],
+                    "timestamp": batch["timestamp"],
+                    "source": batch["source"],
+                    "reference_id": batch["reference_id"]
+                })
+            write(f, "report", self.generate_system_report())
+        
+        return filename
 
 def main():
     """Main function for testing the credit engine"""
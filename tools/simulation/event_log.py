@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Columnar Event Log for MyWork-AI simulations
+Append-only log stored column-wise so that millions of simulated events cost
+a few bytes each instead of one dict or dataclass per event.
+"""
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+STR = "str"
+
+
+class ColumnarLog:
+    """Append-only table whose columns are typed arrays.
+
+    The schema maps column names to array typecodes ("l", "d", "b", ...) or
+    STR. String columns are interned: each distinct value is stored once and
+    rows hold its integer code.
+    """
+
+    def __init__(self, **schema: str):
+        self.schema = dict(schema)
+        self.columns: Dict[str, array] = {
+            name: array("l" if typecode == STR else typecode)
+            for name, typecode in schema.items()
+        }
+        self.values: Dict[str, List[str]] = {name: [] for name, t in schema.items() if t == STR}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in self.values}
+        self._spilled_values: Dict[str, int] = dict.fromkeys(self.values, 0)
+
+    def __len__(self) -> int:
+        first = next(iter(self.columns.values()), None)
+        return len(first) if first is not None else 0
+
+    def intern(self, name: str, value: str) -> int:
+        """Code for value in string column name, adding it if new."""
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.values[name])
+            self.values[name].append(value)
+        return code
+
+    def append(self, **row: Any):
+        for name, column in self.columns.items():
+            value = row[name]
+            column.append(self.intern(name, value) if name in self.values else value)
+
+    def extend(self, **columns: Sequence):
+        """Append equal-length column sequences (lists, arrays or NumPy arrays)."""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1 or set(columns) != set(self.columns):
+            raise ValueError("extend() needs every column, all of the same length")
+        for name, values in columns.items():
+            column = self.columns[name]
+            if name in self.values:
+                intern = self.intern
+                column.extend(intern(name, v) for v in values)
+            elif np is not None and isinstance(values, np.ndarray):
+                column.frombytes(np.ascontiguousarray(values, dtype=column.typecode).tobytes())
+            else:
+                column.extend(values)
+
+    def column(self, name: str) -> Sequence:
+        """Raw column; string columns are returned decoded."""
+        if name in self.values:
+            values = self.values[name]
+            return [values[code] for code in self.columns[name]]
+        return self.columns[name]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            row[name] = self.values[name][value] if name in self.values else value
+        return row
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(start, stop):
+            yield self.row(index)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the numeric columns."""
+        return sum(len(c) * c.itemsize for c in self.columns.values())
+
+    def spill(self, directory: Union[str, Path]) -> int:
+        """Append the buffered rows to column files in directory and drop them.
+
+        Each column goes to <name>.col as raw native-endian array bytes; string
+        columns also append their new distinct values to <name>.values, one JSON
+        string per line. Interned codes survive, so a log can keep appending and
+        spilling while its on-disk copy grows. Returns the number of rows written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        schema_file = directory / "schema.json"
+        if not schema_file.exists():
+            schema_file.write_text(json.dumps(self.schema))
+        rows = len(self)
+        for name, column in self.columns.items():
+            with open(directory / f"{name}.col", "ab") as f:
+                column.tofile(f)
+            del column[:]
+        for name, values in self.values.items():
+            new = values[self._spilled_values[name]:]
+            with open(directory / f"{name}.values", "a") as f:
+                f.writelines(json.dumps(value) + "\n" for value in new)
+            self._spilled_values[name] = len(values)
+        return rows
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "ColumnarLog":
+        """Read back a log written by spill()."""
+        directory = Path(directory)
+        log = cls(**json.loads((directory / "schema.json").read_text()))
+        for name, column in log.columns.items():
+            column.frombytes((directory / f"{name}.col").read_bytes())
+        for name in log.values:
+            with open(directory / f"{name}.values") as f:
+                for line in f:
+                    log.intern(name, json.loads(line))
+            log._spilled_values[name] = len(log.values[name])
+        return log
@@ -4,12 +4,27 @@ MLM/Referral Simulator for MyWork-AI
 Builds referral trees and manages commission cascades
 """
 import json
+import sys
 import uuid
+from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
 from enum import Enum
-from collections import defaultdict, deque
+from collections import defaultdict
+
+try:
+    from event_log import STR, ColumnarLog
+    from referral_tree import ReferralTree
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from event_log import STR, ColumnarLog
+    from referral_tree import ReferralTree
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 class CommissionLevel(Enum):
     LEVEL_1 = 1
@@ -32,6 +47,13 @@ class ReferralNode:
     created_at: str
     is_active: bool = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Write activity through to the simulator's flat active array, if attached
+        if name == "is_active" and "_active_slot" in self.__dict__:
+            active, index = self._active_slot
+            active[index] = 1 if value else 0
+
 @dataclass
 class CommissionEvent:
     """Commission event record"""
@@ -60,6 +82,19 @@ class MLMSimulator:
         self.commission_events: List[CommissionEvent] = []
         self.user_referral_codes: Dict[str, str] = {}  # code -> user_id mapping
         
+        # Array-backed counters: O(depth) inserts, O(1) descendant/level stats
+        self.tree = ReferralTree(max_levels)
+        self.tree_ids: Dict[str, int] = {}  # user_id -> tree node id
+        self.tree_users: List[str] = []  # tree node id -> user_id
+        
+        # Bulk sales (process_sales) are logged column-wise instead of as CommissionEvents
+        self.sales_log = ColumnarLog(buyer="l", product=STR, amount="d", batch="l")
+        self.commission_log = ColumnarLog(sale="l", recipient="l", level="b", amount="d")
+        self.sales_batches: List[str] = []  # batch index -> timestamp
+        self.bulk_commission_by_level: Dict[int, float] = defaultdict(float)
+        self.bulk_commissions_paid = 0.0
+        self.bulk_sales_volume = 0.0
+        
     def generate_referral_code(self, user_id: str) -> str:
         """Generate unique referral code for user"""
         # Create a code based on user_id with some randomness
@@ -106,6 +141,11 @@ class MLMSimulator:
             # Update referrer's children list
             referrer_node.children.append(user_id)
             referrer_node.direct_referrals += 1
+        
+        tree_id = self.tree.add(self.tree_ids[referrer_id] if referrer_id else -1)
+        self.tree_ids[user_id] = tree_id
+        self.tree_users.append(user_id)
+        if referrer_id:
             self._update_total_referrals(referrer_id)
         
         # Create new node
@@ -121,6 +161,7 @@ class MLMSimulator:
             created_at=datetime.now().isoformat()
         )
         
+        object.__setattr__(node, "_active_slot", (self.tree.active, tree_id))
         self.referral_tree[user_id] = node
         return True, referral_code
     
@@ -148,44 +189,20 @@ class MLMSimulator:
         return False
     
     def _update_total_referrals(self, user_id: str):
-        """Update total referrals count for user and all ancestors"""
-        # Use BFS to count all descendants
-        if user_id not in self.referral_tree:
+        """Sync total referrals for user and all ancestors from the tree counters"""
+        if user_id not in self.tree_ids:
             return
         
-        total_count = self._count_all_descendants(user_id)
-        self.referral_tree[user_id].total_referrals = total_count
-        
-        # Update all ancestors
-        current_id = self.referral_tree[user_id].referrer_id
-        while current_id:
-            ancestor_total = self._count_all_descendants(current_id)
-            self.referral_tree[current_id].total_referrals = ancestor_total
-            current_id = self.referral_tree[current_id].referrer_id
+        tree_id = self.tree_ids[user_id]
+        self.referral_tree[user_id].total_referrals = self.tree.total[tree_id]
+        for ancestor in self.tree.upline(tree_id):
+            self.referral_tree[self.tree_users[ancestor]].total_referrals = self.tree.total[ancestor]
     
     def _count_all_descendants(self, user_id: str) -> int:
-        """Count all descendants of a user using BFS"""
-        if user_id not in self.referral_tree:
+        """Count all descendants of a user"""
+        if user_id not in self.tree_ids:
             return 0
-        
-        count = 0
-        queue = deque([user_id])
-        visited = set()
-        
-        while queue:
-            current_id = queue.popleft()
-            
-            if current_id in visited:
-                continue
-            
-            visited.add(current_id)
-            
-            if current_id in self.referral_tree:
-                children = self.referral_tree[current_id].children
-                count += len(children)
-                queue.extend(children)
-        
-        return count
+        return self.tree.total[self.tree_ids[user_id]]
     
     def get_upline_chain(self, user_id: str) -> List[ReferralNode]:
         """Get the upline chain for a user (up to max_levels)"""
@@ -237,6 +254,7 @@ class MLMSimulator:
             
             # Update node's total commission
             referrer_node.total_commission_earned += commission_amount
+            self.tree.earned[self.tree_ids[referrer_node.user_id]] += commission_amount
         
         return commission_breakdown
     
@@ -263,6 +281,71 @@ class MLMSimulator:
         
         return True, event.event_id, total_commission
     
+    def process_sales(self, buyer_ids: Sequence[str], sale_amounts: Sequence[float],
+                      product_ids: Sequence[str]) -> Dict[str, Any]:
+        """Process a batch of sales at once (Monte-Carlo scale).
+        
+        Commissions for every sale are computed in one pass over the tree's
+        parent array. No per-sale CommissionEvent, uuid or timestamp is
+        created: sales and commissions go to the columnar sales_log and
+        commission_log, and each recipient's total gets one aggregated delta.
+        Buyers not in the referral tree are skipped.
+        
+        The returned recipients/levels/commission_amounts columns can be fed
+        straight into CreditEngine.earn_commissions().
+        """
+        tree_ids = self.tree_ids
+        keep = [i for i, buyer_id in enumerate(buyer_ids) if buyer_id in tree_ids]
+        buyers = [tree_ids[buyer_ids[i]] for i in keep]
+        amounts = [sale_amounts[i] for i in keep]
+        products = [product_ids[i] for i in keep]
+        
+        # tree.active is kept current by ReferralNode.is_active writes
+        sales, nodes, levels, commissions = self.tree.pay_many(buyers, amounts, self.commission_rates)
+        
+        first_sale = len(self.sales_log)
+        batch = len(self.sales_batches)
+        self.sales_batches.append(datetime.now().isoformat())
+        self.sales_log.extend(buyer=buyers, product=products, amount=amounts, batch=[batch] * len(buyers))
+        
+        if np is not None:
+            rounded = np.round(commissions, 2)
+            deltas = np.bincount(nodes, weights=commissions, minlength=len(self.tree))
+            recipient_deltas = [(int(n), float(deltas[n])) for n in np.flatnonzero(deltas)]
+            by_level = np.bincount(levels, weights=rounded)
+            level_totals = [(level, float(by_level[level])) for level in np.flatnonzero(by_level)]
+            sale_rows = sales + first_sale
+            total_commission = float(rounded.sum())
+        else:
+            rounded = [round(c, 2) for c in commissions]
+            node_deltas: Dict[int, float] = defaultdict(float)
+            level_sums: Dict[int, float] = defaultdict(float)
+            for node, level, commission, cents in zip(nodes, levels, commissions, rounded):
+                node_deltas[node] += commission
+                level_sums[level] += cents
+            recipient_deltas = list(node_deltas.items())
+            level_totals = list(level_sums.items())
+            sale_rows = [sale + first_sale for sale in sales]
+            total_commission = sum(rounded)
+        
+        self.commission_log.extend(sale=sale_rows, recipient=nodes, level=levels, amount=rounded)
+        for node, delta in recipient_deltas:
+            self.referral_tree[self.tree_users[node]].total_commission_earned += delta
+        for level, amount in level_totals:
+            self.bulk_commission_by_level[int(level)] += amount
+        self.bulk_commissions_paid += total_commission
+        self.bulk_sales_volume += float(sum(amounts))
+        
+        return {
+            "processed": len(buyers),
+            "skipped": len(buyer_ids) - len(buyers),
+            "commissions": len(nodes),
+            "total_commission": round(total_commission, 2),
+            "recipients": [self.tree_users[node] for node in nodes],
+            "levels": levels,
+            "commission_amounts": rounded,
+        }
+    
     def get_referral_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive referral statistics for a user"""
         if user_id not in self.referral_tree:
@@ -303,30 +386,9 @@ class MLMSimulator:
     
     def _count_referrals_at_level(self, user_id: str, target_level: int) -> int:
         """Count referrals at a specific level relative to the user"""
-        if user_id not in self.referral_tree:
+        if user_id not in self.tree_ids:
             return 0
-        
-        count = 0
-        queue = deque([(user_id, 0)])  # (user_id, current_relative_level)
-        visited = set()
-        
-        while queue:
-            current_id, current_level = queue.popleft()
-            
-            if current_id in visited:
-                continue
-            
-            visited.add(current_id)
-            
-            if current_level == target_level and current_id != user_id:
-                count += 1
-            
-            if current_level < target_level and current_id in self.referral_tree:
-                children = self.referral_tree[current_id].children
-                for child_id in children:
-                    queue.append((child_id, current_level + 1))
-        
-        return count
+        return self.tree.level_count(self.tree_ids[user_id], target_level)
     
     def visualize_tree(self, root_user_id: str = None, max_depth: int = 3) -> str:
         """Create ASCII visualization of referral tree"""
@@ -432,6 +494,8 @@ class MLMSimulator:
         total_users = len(self.referral_tree)
         total_commissions_paid = sum(event.total_commission_paid for event in self.commission_events)
         total_sales_volume = sum(event.sale_amount for event in self.commission_events)
+        total_commissions_paid += self.bulk_commissions_paid
+        total_sales_volume += self.bulk_sales_volume
         
         # Level distribution
         level_distribution = defaultdict(int)
@@ -451,6 +515,8 @@ class MLMSimulator:
             for commission in event.commission_tree:
                 level = commission["level"]
                 commission_by_level[level] += commission["commission_amount"]
+        for level, amount in self.bulk_commission_by_level.items():
+            commission_by_level[level] += amount
         
         # Recent activity (last 30 events)
         recent_activity = []
@@ -466,7 +532,7 @@ class MLMSimulator:
         return {
             "overview": {
                 "total_users": total_users,
-                "total_commission_events": len(self.commission_events),
+                "total_commission_events": len(self.commission_events) + len(self.sales_log),
                 "total_commissions_paid": round(total_commissions_paid, 2),
                 "total_sales_volume": round(total_sales_volume, 2),
                 "average_commission_rate": round(total_commissions_paid / total_sales_volume * 100, 2) if total_sales_volume > 0 else 0,
@@ -6,6 +6,7 @@ Simulates full product lifecycle and webhook events
 import json
 import uuid
 import random
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional, Tuple
@@ -129,6 +130,23 @@ class ProductLifecycleSimulator:
         self.reviews: Dict[str, Review] = {}
         self.webhook_events: List[WebhookEvent] = []
         
+        # Indexes and status counters maintained on every write so metrics and
+        # dashboards don't rescan every order and review. Entities must be
+        # added and moved between statuses through the methods below.
+        self._orders_by_product: Dict[str, List[str]] = defaultdict(list)
+        self._reviews_by_product: Dict[str, List[str]] = defaultdict(list)
+        self._products_by_seller: Dict[str, List[str]] = defaultdict(list)
+        self._order_status_by_product: Dict[str, Counter] = defaultdict(Counter)
+        self._review_status_by_product: Dict[str, Counter] = defaultdict(Counter)
+        self._product_status_by_seller: Dict[str, Counter] = defaultdict(Counter)
+        self._product_type_by_seller: Dict[str, Counter] = defaultdict(Counter)
+        self._product_status_counts: Counter = Counter()
+        self._product_type_counts: Counter = Counter()
+        self._order_status_counts: Counter = Counter()
+        self._review_status_counts: Counter = Counter()
+        self._webhook_type_counts: Counter = Counter()
+        self._approved_rating_sum = 0
+        
         self.product_categories = [
             "Electronics", "Books", "Software", "Courses", "Templates",
             "Graphics", "Music", "Videos", "Services", "Consulting"
@@ -144,6 +162,61 @@ class ProductLifecycleSimulator:
             "Bundle", "Collection", "System", "Framework", "Solution", "Package"
         ]
     
+    def _add_product(self, product: Product):
+        """Store a product and index it under its seller"""
+        self.products[product.product_id] = product
+        self._products_by_seller[product.seller_id].append(product.product_id)
+        self._product_status_by_seller[product.seller_id][product.status] += 1
+        self._product_type_by_seller[product.seller_id][product.product_type] += 1
+        self._product_status_counts[product.status] += 1
+        self._product_type_counts[product.product_type] += 1
+    
+    def _add_order(self, order: Order):
+        """Store an order and index it under its product"""
+        self.orders[order.order_id] = order
+        self._orders_by_product[order.product_id].append(order.order_id)
+        self._order_status_by_product[order.product_id][order.status] += 1
+        self._order_status_counts[order.status] += 1
+    
+    def _add_review(self, review: Review):
+        """Store a review and index it under its product"""
+        self.reviews[review.review_id] = review
+        self._reviews_by_product[review.product_id].append(review.review_id)
+        self._review_status_by_product[review.product_id][review.status] += 1
+        self._review_status_counts[review.status] += 1
+    
+    def _add_webhook(self, event: WebhookEvent):
+        self.webhook_events.append(event)
+        self._webhook_type_counts[event.event_type] += 1
+    
+    def _set_product_status(self, product: Product, status: ProductStatus):
+        by_seller = self._product_status_by_seller[product.seller_id]
+        by_seller[product.status] -= 1
+        self._product_status_counts[product.status] -= 1
+        product.status = status
+        by_seller[status] += 1
+        self._product_status_counts[status] += 1
+    
+    def _set_order_status(self, order: Order, status: OrderStatus):
+        by_product = self._order_status_by_product[order.product_id]
+        by_product[order.status] -= 1
+        self._order_status_counts[order.status] -= 1
+        order.status = status
+        by_product[status] += 1
+        self._order_status_counts[status] += 1
+    
+    def _set_review_status(self, review: Review, status: ReviewStatus):
+        by_product = self._review_status_by_product[review.product_id]
+        by_product[review.status] -= 1
+        self._review_status_counts[review.status] -= 1
+        if review.status == ReviewStatus.APPROVED:
+            self._approved_rating_sum -= review.rating
+        review.status = status
+        by_product[status] += 1
+        self._review_status_counts[status] += 1
+        if status == ReviewStatus.APPROVED:
+            self._approved_rating_sum += review.rating
+    
     def generate_realistic_product(self, seller_id: str, product_type: ProductType = None) -> Product:
         """Generate a realistic product"""
         if product_type is None:
@@ -186,7 +259,7 @@ class ProductLifecycleSimulator:
             metadata={"generated": True, "version": "1.0"}
         )
         
-        self.products[product.product_id] = product
+        self._add_product(product)
         return product
     
     def submit_for_review(self, product_id: str) -> Tuple[bool, str]:
@@ -199,7 +272,7 @@ class ProductLifecycleSimulator:
         if product.status != ProductStatus.DRAFT:
             return False, f"Product must be in draft status to submit for review"
         
-        product.status = ProductStatus.PENDING_REVIEW
+        self._set_product_status(product, ProductStatus.PENDING_REVIEW)
         product.updated_at = datetime.now().isoformat()
         
         return True, "Product submitted for review"
@@ -219,10 +292,10 @@ class ProductLifecycleSimulator:
             approve = random.random() > 0.1  # 90% approval rate
         
         if approve:
-            product.status = ProductStatus.APPROVED
+            self._set_product_status(product, ProductStatus.APPROVED)
             result_msg = "Product approved"
         else:
-            product.status = ProductStatus.REJECTED
+            self._set_product_status(product, ProductStatus.REJECTED)
             result_msg = f"Product rejected: {reason}"
         
         product.updated_at = datetime.now().isoformat()
@@ -238,7 +311,7 @@ class ProductLifecycleSimulator:
         if product.status != ProductStatus.APPROVED:
             return False, f"Product must be approved before activation"
         
-        product.status = ProductStatus.ACTIVE
+        self._set_product_status(product, ProductStatus.ACTIVE)
         product.updated_at = datetime.now().isoformat()
         
         return True, "Product activated"
@@ -278,7 +351,7 @@ class ProductLifecycleSimulator:
             metadata={"product_type": product.product_type.value}
         )
         
-        self.orders[order.order_id] = order
+        self._add_order(order)
         return True, order.order_id
     
     def simulate_payment_success(self, order_id: str) -> Tuple[bool, str]:
@@ -290,7 +363,7 @@ class ProductLifecycleSimulator:
         product = self.products[order.product_id]
         
         # Update order status
-        order.status = OrderStatus.CONFIRMED
+        self._set_order_status(order, OrderStatus.CONFIRMED)
         order.stripe_charge_id = f"ch_{uuid.uuid4().hex[:24]}"
         order.updated_at = datetime.now().isoformat()
         
@@ -326,7 +399,7 @@ class ProductLifecycleSimulator:
             data=webhook_data
         )
         
-        self.webhook_events.append(webhook_event)
+        self._add_webhook(webhook_event)
         
         return True, webhook_event.event_id
     
@@ -343,10 +416,10 @@ class ProductLifecycleSimulator:
         
         # Update order status based on product type
         if product.product_type in [ProductType.DIGITAL, ProductType.FREE]:
-            order.status = OrderStatus.DELIVERED
+            self._set_order_status(order, OrderStatus.DELIVERED)
             order.delivery_date = datetime.now().isoformat()
         else:
-            order.status = OrderStatus.SHIPPED
+            self._set_order_status(order, OrderStatus.SHIPPED)
             # Simulate delivery in 1-7 days
             delivery_date = datetime.now() + timedelta(days=random.randint(1, 7))
             order.delivery_date = delivery_date.isoformat()
@@ -386,7 +459,7 @@ class ProductLifecycleSimulator:
             metadata={"order_amount": order.amount}
         )
         
-        self.reviews[review.review_id] = review
+        self._add_review(review)
         return True, review.review_id
     
     def moderate_review(self, review_id: str, approve: bool = None, reason: str = "") -> Tuple[bool, str]:
@@ -408,11 +481,11 @@ class ProductLifecycleSimulator:
                 approve = random.random() > 0.05  # 95% approval for good ratings
         
         if approve:
-            review.status = ReviewStatus.APPROVED
+            self._set_review_status(review, ReviewStatus.APPROVED)
             self._update_product_rating(review.product_id, review.rating)
             result_msg = "Review approved"
         else:
-            review.status = ReviewStatus.REJECTED
+            self._set_review_status(review, ReviewStatus.REJECTED)
             result_msg = f"Review rejected: {reason}"
         
         review.updated_at = datetime.now().isoformat()
@@ -450,7 +523,7 @@ class ProductLifecycleSimulator:
             return False, f"Refund amount cannot exceed order amount"
         
         # Update order
-        order.status = OrderStatus.REFUNDED
+        self._set_order_status(order, OrderStatus.REFUNDED)
         order.refund_reason = reason
         order.updated_at = datetime.now().isoformat()
         
@@ -482,7 +555,7 @@ class ProductLifecycleSimulator:
             data=webhook_data
         )
         
-        self.webhook_events.append(webhook_event)
+        self._add_webhook(webhook_event)
         
         return True, webhook_event.event_id
     
@@ -528,7 +601,7 @@ class ProductLifecycleSimulator:
             data=webhook_data
         )
         
-        self.webhook_events.append(webhook_event)
+        self._add_webhook(webhook_event)
         events.append(webhook_event.event_id)
         
         # Simulate monthly invoice payment
@@ -550,7 +623,7 @@ class ProductLifecycleSimulator:
             data=invoice_webhook_data
         )
         
-        self.webhook_events.append(invoice_webhook)
+        self._add_webhook(invoice_webhook)
         events.append(invoice_webhook.event_id)
         
         return events
@@ -562,17 +635,11 @@ class ProductLifecycleSimulator:
         
         product = self.products[product_id]
         
-        # Count orders by status
-        product_orders = [order for order in self.orders.values() if order.product_id == product_id]
-        order_stats = {}
-        for status in OrderStatus:
-            order_stats[status.value] = sum(1 for order in product_orders if order.status == status)
-        
-        # Count reviews by status
-        product_reviews = [review for review in self.reviews.values() if review.product_id == product_id]
-        review_stats = {}
-        for status in ReviewStatus:
-            review_stats[status.value] = sum(1 for review in product_reviews if review.status == status)
+        # Orders and reviews by status, from the counters kept per product
+        order_counts = self._order_status_by_product.get(product_id, Counter())
+        order_stats = {status.value: order_counts[status] for status in OrderStatus}
+        review_counts = self._review_status_by_product.get(product_id, Counter())
+        review_stats = {status.value: review_counts[status] for status in ReviewStatus}
         
         # Calculate conversion rate
         views = product.view_count
@@ -604,7 +671,7 @@ class ProductLifecycleSimulator:
     
     def get_seller_dashboard(self, seller_id: str) -> Dict[str, Any]:
         """Get seller dashboard data"""
-        seller_products = [p for p in self.products.values() if p.seller_id == seller_id]
+        seller_products = [self.products[pid] for pid in self._products_by_seller.get(seller_id, ())]
         
         if not seller_products:
             return {"seller_id": seller_id, "error": "No products found"}
@@ -616,21 +683,17 @@ class ProductLifecycleSimulator:
         total_refunds = sum(p.refund_count for p in seller_products)
         total_refund_amount = sum(p.refund_amount for p in seller_products)
         
-        # Product breakdown by status
-        status_breakdown = {}
-        for status in ProductStatus:
-            status_breakdown[status.value] = sum(1 for p in seller_products if p.status == status)
-        
-        # Type breakdown
-        type_breakdown = {}
-        for ptype in ProductType:
-            type_breakdown[ptype.value] = sum(1 for p in seller_products if p.product_type == ptype)
+        # Product breakdown by status and type
+        status_counts = self._product_status_by_seller[seller_id]
+        status_breakdown = {status.value: status_counts[status] for status in ProductStatus}
+        type_counts = self._product_type_by_seller[seller_id]
+        type_breakdown = {ptype.value: type_counts[ptype] for ptype in ProductType}
         
         return {
             "seller_id": seller_id,
             "summary": {
                 "total_products": len(seller_products),
-                "active_products": sum(1 for p in seller_products if p.status == ProductStatus.ACTIVE),
+                "active_products": status_counts[ProductStatus.ACTIVE],
                 "total_revenue": round(total_revenue, 2),
                 "total_views": total_views,
                 "total_purchases": total_purchases,
@@ -793,17 +856,17 @@ class ProductLifecycleSimulator:
         return {
             "products": {
                 "total": len(self.products),
-                "by_status": {status.value: sum(1 for p in self.products.values() if p.status == status) for status in ProductStatus},
-                "by_type": {ptype.value: sum(1 for p in self.products.values() if p.product_type == ptype) for ptype in ProductType}
+                "by_status": {status.value: self._product_status_counts[status] for status in ProductStatus},
+                "by_type": {ptype.value: self._product_type_counts[ptype] for ptype in ProductType}
             },
             "orders": {
                 "total": len(self.orders),
-                "by_status": {status.value: sum(1 for o in self.orders.values() if o.status == status) for status in OrderStatus}
+                "by_status": {status.value: self._order_status_counts[status] for status in OrderStatus}
             },
             "reviews": {
                 "total": len(self.reviews),
-                "by_status": {status.value: sum(1 for r in self.reviews.values() if r.status == status) for status in ReviewStatus},
-                "average_rating": round(sum(r.rating for r in self.reviews.values() if r.status == ReviewStatus.APPROVED) / max(1, sum(1 for r in self.reviews.values() if r.status == ReviewStatus.APPROVED)), 2)
+                "by_status": {status.value: self._review_status_counts[status] for status in ReviewStatus},
+                "average_rating": round(self._approved_rating_sum / max(1, self._review_status_counts[ReviewStatus.APPROVED]), 2)
             },
             "financial": {
                 "total_revenue": round(total_revenue, 2),
@@ -812,7 +875,7 @@ class ProductLifecycleSimulator:
             },
             "webhooks": {
                 "total_events": len(self.webhook_events),
-                "by_type": {event_type.value: sum(1 for w in self.webhook_events if w.event_type == event_type) for event_type in WebhookEventType}
+                "by_type": {event_type.value: self._webhook_type_counts[event_type] for event_type in WebhookEventType}
             }
         }
 
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Array-backed Referral Tree Engine for MyWork-AI
+Maintains descendant and per-level referral counts incrementally so that
+inserts cost O(depth) and referral stats are O(1), even for million-user trees.
+
+Usage:
+    python3 referral_tree.py --bench [users]   Build and pay out a random tree
+                                               (per sale, then as one batch)
+"""
+import random
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+DEFAULT_COMMISSION_RATES = {1: 0.20, 2: 0.10, 3: 0.05, 4: 0.02, 5: 0.01}
+
+
+class ReferralTree:
+    """Referral tree stored as parallel arrays indexed by integer node id.
+
+    parent[i] is the referrer of node i (-1 for roots). total[i] counts all
+    descendants and level_counts[k][i] the descendants exactly k+1 levels
+    below i; both are bumped along the upline on every insert.
+    """
+
+    def __init__(self, max_levels: int = 5):
+        self.max_levels = max_levels
+        self.parent = array("l")
+        self.depth = array("b")
+        self.direct = array("l")
+        self.total = array("l")
+        self.level_counts = [array("l") for _ in range(max_levels)]
+        self.earned = array("d")
+        self.active = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, parent: int = -1) -> int:
+        """Insert a node under parent (-1 for a root) and return its id."""
+        depth = 0
+        if parent >= 0:
+            depth = self.depth[parent] + 1
+            if depth > self.max_levels:
+                raise ValueError(f"Maximum referral depth ({self.max_levels}) exceeded")
+
+        node = len(self.parent)
+        self.parent.append(parent)
+        self.depth.append(depth)
+        self.direct.append(0)
+        self.total.append(0)
+        for counts in self.level_counts:
+            counts.append(0)
+        self.earned.append(0.0)
+        self.active.append(1)
+
+        if parent >= 0:
+            self.direct[parent] += 1
+        parents, total, level_counts = self.parent, self.total, self.level_counts
+        ancestor = parent
+        level = 0
+        while ancestor >= 0:
+            total[ancestor] += 1
+            level_counts[level][ancestor] += 1
+            ancestor = parents[ancestor]
+            level += 1
+        return node
+
+    def add_many(self, parents: Sequence[int]) -> range:
+        """Insert a batch of nodes; parents may refer to nodes earlier in the batch.
+
+        Same result as calling add() for each parent in order, with the
+        per-node column appends done in bulk.
+        """
+        first = len(self.parent)
+        count = len(parents)
+        depths = self.depth
+        try:
+            for offset, parent in enumerate(parents):
+                if parent >= first + offset:
+                    raise ValueError(f"Parent {parent} does not exist yet")
+                depth = depths[parent] + 1 if parent >= 0 else 0
+                if depth > self.max_levels:
+                    raise ValueError(f"Maximum referral depth ({self.max_levels}) exceeded")
+                depths.append(depth)
+        except ValueError:
+            del depths[first:]  # a rejected batch leaves the tree as it was
+            raise
+
+        self.parent.extend(parents)
+        zeros = array("l", bytes(count * self.direct.itemsize))
+        self.direct.extend(zeros)
+        self.total.extend(zeros)
+        for counts in self.level_counts:
+            counts.extend(zeros)
+        self.earned.extend(array("d", bytes(count * self.earned.itemsize)))
+        self.active.extend(b"\x01" * count)
+
+        all_parents, direct, total, level_counts = self.parent, self.direct, self.total, self.level_counts
+        for parent in parents:
+            if parent < 0:
+                continue
+            direct[parent] += 1
+            ancestor = parent
+            level = 0
+            while ancestor >= 0:
+                total[ancestor] += 1
+                level_counts[level][ancestor] += 1
+                ancestor = all_parents[ancestor]
+                level += 1
+        return range(first, first + count)
+
+    def upline(self, node: int) -> List[int]:
+        """Ancestors of node, nearest first, up to max_levels."""
+        chain = []
+        ancestor = self.parent[node]
+        while ancestor >= 0 and len(chain) < self.max_levels:
+            chain.append(ancestor)
+            ancestor = self.parent[ancestor]
+        return chain
+
+    def level_count(self, node: int, level: int) -> int:
+        """Number of referrals exactly `level` levels below node."""
+        if level < 1 or level > self.max_levels:
+            return 0
+        return self.level_counts[level - 1][node]
+
+    def pay(self, buyer: int, amount: float,
+            rates: Optional[Dict[int, float]] = None) -> List[Tuple[int, int, float]]:
+        """Credit upline commissions for one sale.
+
+        Returns (node, level, commission) for each paid ancestor; inactive
+        ancestors are skipped without shifting the levels above them.
+        """
+        rates = rates or DEFAULT_COMMISSION_RATES
+        paid = []
+        level = 1
+        ancestor = self.parent[buyer]
+        while ancestor >= 0 and level in rates:
+            if self.active[ancestor]:
+                commission = amount * rates[level]
+                self.earned[ancestor] += commission
+                paid.append((ancestor, level, commission))
+            ancestor = self.parent[ancestor]
+            level += 1
+        return paid
+
+    def pay_many(self, buyers: Sequence[int], amounts: Sequence[float],
+                 rates: Optional[Dict[int, float]] = None) -> Tuple[Sequence, ...]:
+        """Credit upline commissions for a batch of sales at once.
+
+        Returns parallel columns (sale, node, level, commission) ordered by
+        sale then level, where sale indexes into buyers. Uses NumPy to walk
+        the parent array one level at a time for all sales when available.
+        """
+        rates = rates or DEFAULT_COMMISSION_RATES
+        if np is not None:
+            return self._pay_many_numpy(buyers, amounts, rates)
+
+        sales, nodes, levels, commissions = array("l"), array("l"), array("b"), array("d")
+        parents, active, earned = self.parent, self.active, self.earned
+        for sale, (buyer, amount) in enumerate(zip(buyers, amounts)):
+            level = 1
+            ancestor = parents[buyer]
+            while ancestor >= 0 and level in rates:
+                if active[ancestor]:
+                    commission = amount * rates[level]
+                    earned[ancestor] += commission
+                    sales.append(sale)
+                    nodes.append(ancestor)
+                    levels.append(level)
+                    commissions.append(commission)
+                ancestor = parents[ancestor]
+                level += 1
+        return sales, nodes, levels, commissions
+
+    def _pay_many_numpy(self, buyers, amounts, rates):
+        parent = np.frombuffer(self.parent, dtype=self.parent.typecode)
+        active = np.frombuffer(self.active, dtype=np.uint8).astype(bool)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        current = np.asarray(buyers, dtype=np.int64)
+        sale_ids = np.arange(len(current))
+
+        parts = []
+        level = 1
+        while level in rates and len(current):
+            ancestor = parent[current]
+            reached = ancestor >= 0
+            current, ancestor, sale_ids = current[reached], ancestor[reached], sale_ids[reached]
+            paid = active[ancestor]
+            parts.append((sale_ids[paid], ancestor[paid], np.full(int(paid.sum()), level, np.int8),
+                          amounts[sale_ids[paid]] * rates[level]))
+            current = ancestor
+            level += 1
+
+        if parts:
+            sales, nodes, levels, commissions = (np.concatenate(col) for col in zip(*parts))
+            order = np.lexsort((levels, sales))
+            sales, nodes, levels, commissions = sales[order], nodes[order], levels[order], commissions[order]
+            earned = np.frombuffer(self.earned, dtype=np.float64)
+            earned += np.bincount(nodes, weights=commissions, minlength=len(earned))
+            del earned  # release the buffer so the array can grow again
+        else:
+            empty = np.empty(0, dtype=np.int64)
+            sales, nodes, levels, commissions = empty, empty, empty.astype(np.int8), empty.astype(np.float64)
+        del parent
+        return sales, nodes, levels, commissions
+
+    @classmethod
+    def random_tree(cls, users: int, max_levels: int = 5, roots: int = 10,
+                    seed: Optional[int] = None) -> "ReferralTree":
+        """Build a random tree whose referrers are drawn uniformly from eligible users."""
+        rng = random.Random(seed)
+        roots = min(roots, users)
+        parents = array("l", [-1] * roots)
+        depths = [0] * roots
+        eligible = list(range(roots))
+        for node in range(roots, users):
+            parent = eligible[int(rng.random() * len(eligible))]
+            parents.append(parent)
+            depth = depths[parent] + 1
+            depths.append(depth)
+            if depth < max_levels:
+                eligible.append(node)
+        tree = cls(max_levels)
+        tree.add_many(parents)
+        return tree
+
+
+def benchmark(users: int = 1_000_000, sales: Optional[int] = None, seed: int = 42) -> Dict[str, float]:
+    """Time building a random tree and paying out one sale per user."""
+    sales = users if sales is None else sales
+    start = time.perf_counter()
+    tree = ReferralTree.random_tree(users, seed=seed)
+    built = time.perf_counter()
+
+    rng = random.Random(seed)
+    n = len(tree)
+    buyers = [int(rng.random() * n) for _ in range(sales)]
+    paid_total = 0.0
+    for buyer in buyers:
+        for _, _, commission in tree.pay(buyer, 100.0):
+            paid_total += commission
+    paid = time.perf_counter()
+
+    _, _, _, commissions = tree.pay_many(buyers, [100.0] * sales)
+    batch_total = float(sum(commissions))
+    batched = time.perf_counter()
+
+    return {
+        "users": n,
+        "sales": sales,
+        "build_seconds": round(built - start, 2),
+        "payout_seconds": round(paid - built, 2),
+        "batch_payout_seconds": round(batched - paid, 2),
+        "commissions_paid": round(paid_total, 2),
+        "batch_commissions_paid": round(batch_total, 2),
+        "root_total_referrals": tree.total[0],
+    }
+
+
+def main(args: List[str] = None) -> int:
+    args = sys.argv[1:] if args is None else args
+    if not args or args[0] != "--bench":
+        print(__doc__)
+        return 0
+
+    users = int(args[1]) if len(args) > 1 else 1_000_000
+    print(f"🌳 Referral tree benchmark — {users:,} users")
+    result = benchmark(users)
+    print(f"   Build:   {result['build_seconds']}s")
+    print(f"   Payout:  {result['payout_seconds']}s ({result['sales']:,} sales)")
+    print(f"   Batch:   {result['batch_payout_seconds']}s ({'NumPy' if np is not None else 'pure Python'})")
+    print(f"   Paid:    ${result['commissions_paid']:,.2f} (batch ${result['batch_commissions_paid']:,.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -399,6 +399,16 @@ class SimulationOrchestrator:
             self.log_step("System integrity scenario failed", False, str(e))
             return False
     
+    def scenarios(self) -> List[Tuple[str, Any]]:
+        """The simulation phases, in the order they must run"""
+        return [
+            ("User Registration & Referrals", self.scenario_user_registration),
+            ("Product Listings & Approval", self.scenario_product_listings),
+            ("Marketplace Activity & Commissions", self.scenario_marketplace_activity),
+            ("Refunds & Credit Returns", self.scenario_refunds_processing),
+            ("System Integrity Check", self.scenario_system_integrity)
+        ]
+    
     def run_full_simulation(self) -> bool:
         """Run the complete marketplace simulation"""
         print("🚀 Starting Full MyWork-AI Marketplace Simulation")
@@ -407,16 +417,8 @@ class SimulationOrchestrator:
         start_time = datetime.now()
         
         # Run all scenarios
-        scenarios = [
-            ("User Registration & Referrals", self.scenario_user_registration),
-            ("Product Listings & Approval", self.scenario_product_listings),
-            ("Marketplace Activity & Commissions", self.scenario_marketplace_activity),
-            ("Refunds & Credit Returns", self.scenario_refunds_processing),
-            ("System Integrity Check", self.scenario_system_integrity)
-        ]
-        
         all_passed = True
-        for scenario_name, scenario_func in scenarios:
+        for scenario_name, scenario_func in self.scenarios():
             success = self.run_scenario(scenario_name, scenario_func)
             if not success:
                 all_passed = False
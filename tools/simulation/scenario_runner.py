@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Parallel Scenario Runner for MyWork-AI
+Runs independent SimulationOrchestrator scenarios across a process pool,
+streams each scenario's events to a columnar log on disk and merges the
+summary statistics at the end.
+
+Every scenario owns its RNG streams, derived from the sweep seed and the
+scenario name, so its results do not depend on which worker runs it or on
+what that worker ran before: a sweep gives identical per-scenario results
+serially and on any number of cores.
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+try:
+    from event_log import STR, ColumnarLog
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from event_log import STR, ColumnarLog
+from run_simulation import SimulationOrchestrator
+
+# Orchestrator attributes a scenario may override
+SCENARIO_PARAMS = ("target_users", "target_sellers", "target_purchases", "target_refunds")
+
+# One row per credit transaction, MLM commission event and webhook
+EVENT_SCHEMA = {"phase": STR, "source": STR, "kind": STR, "user": STR, "amount": "d"}
+
+
+class Scenario(NamedTuple):
+    name: str
+    seed: int
+    params: Dict[str, int] = {}
+
+
+def scenario_seed(base_seed: int, name: str) -> int:
+    """A 64-bit seed for scenario name, stable across processes and runs."""
+    digest = hashlib.sha256(f"{base_seed}:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def make_sweep(replicas: int, grid: Optional[Dict[str, Sequence[int]]] = None,
+               base_seed: int = 0) -> List[Scenario]:
+    """replicas seeds for every combination of the grid's parameter values."""
+    grid = grid or {}
+    unknown = set(grid) - set(SCENARIO_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown scenario parameters: {', '.join(sorted(unknown))}")
+    scenarios = []
+    for values in itertools.product(*grid.values()):
+        params = dict(zip(grid, values))
+        prefix = "".join(f"{key}={value}," for key, value in params.items())
+        for replica in range(replicas):
+            name = f"{prefix}r{replica}"
+            scenarios.append(Scenario(name, scenario_seed(base_seed, name), params))
+    return scenarios
+
+
+@contextlib.contextmanager
+def deterministic(seed: int) -> Iterator[None]:
+    """Seed the simulators' global RNG and uuid4 for the duration of a scenario.
+
+    The simulators draw from the random module and uuid.uuid4(); both are
+    replaced by streams derived from seed and restored afterwards.
+    """
+    state = random.getstate()
+    uuid4 = uuid.uuid4
+    ids = random.Random(f"uuid:{seed}")
+    random.seed(seed)
+    uuid.uuid4 = lambda: uuid.UUID(int=ids.getrandbits(128), version=4)
+    try:
+        yield
+    finally:
+        uuid.uuid4 = uuid4
+        random.setstate(state)
+
+
+def _drain_events(orchestrator: SimulationOrchestrator, phase: str, log: ColumnarLog,
+                  cursors: Dict[str, int]):
+    """Append the events recorded since the last call to log."""
+    transactions = orchestrator.credit_engine.transactions
+    for tx in transactions[cursors["credit"]:]:
+        log.append(phase=phase, source="credit", kind=tx.transaction_type.value,
+                   user=tx.user_id, amount=tx.amount)
+    cursors["credit"] = len(transactions)
+
+    commissions = orchestrator.mlm_simulator.commission_events
+    for event in commissions[cursors["mlm"]:]:
+        log.append(phase=phase, source="mlm", kind="commission",
+                   user=event.buyer_id, amount=event.total_commission_paid)
+    cursors["mlm"] = len(commissions)
+
+    webhooks = orchestrator.product_simulator.webhook_events
+    for event in webhooks[cursors["webhook"]:]:
+        log.append(phase=phase, source="webhook", kind=event.event_type.value,
+                   user=event.data.get("metadata", {}).get("buyer_id", ""),
+                   amount=event.data.get("amount", 0) / 100)
+    cursors["webhook"] = len(webhooks)
+
+
+def scenario_stats(orchestrator: SimulationOrchestrator) -> Dict[str, float]:
+    """Flat numeric summary of a finished scenario; no timestamps or ids."""
+    credit = orchestrator.credit_engine
+    products = orchestrator.product_simulator
+    mlm = orchestrator.mlm_simulator
+    orders_by_status = products.get_system_stats()["orders"]["by_status"]
+    return {
+        "scenarios_passed": orchestrator.scenarios_passed,
+        "scenarios_failed": orchestrator.scenarios_failed,
+        "users": len(orchestrator.user_simulator.users),
+        "products": len(products.products),
+        "orders": len(products.orders),
+        "refunded_orders": orders_by_status.get("refunded", 0),
+        "reviews": len(products.reviews),
+        "webhook_events": len(products.webhook_events),
+        "credit_transactions": len(credit.transactions),
+        "commission_events": len(mlm.commission_events),
+        "revenue": round(sum(p.total_revenue for p in products.products.values()), 2),
+        "commissions": round(sum(e.total_commission_paid for e in mlm.commission_events), 2),
+        "credits_issued": round(credit.total_credits_issued, 2),
+        "credits_burned": round(credit.total_credits_burned, 2),
+    }
+
+
+def run_scenario(scenario: Scenario, log_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Run one scenario in this process and return its summary.
+
+    With log_dir, events are spilled to log_dir/<scenario name> after every
+    phase, so a worker never holds more than one phase of events in memory.
+    The log is written to a fresh .partial directory and renamed over any
+    log left by an earlier run once the scenario finishes.
+    """
+    start = time.perf_counter()
+    log = ColumnarLog(**EVENT_SCHEMA)
+    out = Path(log_dir) / scenario.name if log_dir else None
+    partial_out = out.with_name(out.name + ".partial") if out is not None else None
+    if partial_out is not None:
+        shutil.rmtree(partial_out, ignore_errors=True)
+    cursors = {"credit": 0, "mlm": 0, "webhook": 0}
+    events = 0
+    with deterministic(scenario.seed), contextlib.redirect_stdout(io.StringIO()):
+        orchestrator = SimulationOrchestrator()
+        for key, value in scenario.params.items():
+            setattr(orchestrator, key, value)
+        for phase, func in orchestrator.scenarios():
+            orchestrator.run_scenario(phase, func)
+            _drain_events(orchestrator, phase, log, cursors)
+            events += len(log)
+            if out is not None:
+                log.spill(partial_out)
+            else:
+                log = ColumnarLog(**EVENT_SCHEMA)
+        stats = scenario_stats(orchestrator)
+    if out is not None:
+        shutil.rmtree(out, ignore_errors=True)
+        partial_out.rename(out)
+    stats["events"] = events
+    return {
+        "name": scenario.name,
+        "seed": scenario.seed,
+        "params": dict(scenario.params),
+        "stats": stats,
+        "log": str(out) if out is not None else None,
+        "duration": time.perf_counter() - start,
+    }
+
+
+def merge_stats(results: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Total, mean, min and max of every statistic across scenarios."""
+    merged = {}
+    for key in (results[0]["stats"] if results else ()):
+        values = [r["stats"][key] for r in results]
+        merged[key] = {
+            "total": round(sum(values), 2),
+            "mean": round(sum(values) / len(values), 4),
+            "min": min(values),
+            "max": max(values),
+        }
+    return merged
+
+
+def run_sweep(scenarios: Sequence[Scenario], workers: Optional[int] = None,
+              log_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Run scenarios on workers processes; results keep the input order."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(scenarios) or 1))
+    start = time.perf_counter()
+    run = partial(run_scenario, log_dir=log_dir)
+    if workers == 1:
+        results = [run(scenario) for scenario in scenarios]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # A few chunks per worker keeps IPC off the critical path for
+            # small scenarios without leaving one worker with the long tail
+            chunksize = max(1, len(scenarios) // (workers * 4))
+            results = list(pool.map(run, scenarios, chunksize=chunksize))
+    return {
+        "workers": workers,
+        "wall_time_seconds": round(time.perf_counter() - start, 3),
+        "scenarios": results,
+        "merged": merge_stats(results),
+    }
+
+
+def _parse_grid(specs: Sequence[str]) -> Dict[str, List[int]]:
+    grid = {}
+    for spec in specs:
+        key, _, values = spec.partition("=")
+        grid[key] = [int(v) for v in values.split(",") if v]
+    return grid
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a sweep of simulation scenarios in parallel")
+    parser.add_argument("--scenarios", type=int, default=100,
+                        help="seeds per grid point (default: 100)")
+    parser.add_argument("--grid", action="append", default=[], metavar="PARAM=V1,V2",
+                        help=f"sweep a parameter; one of {', '.join(SCENARIO_PARAMS)}")
+    parser.add_argument("--seed", type=int, default=0, help="sweep seed (default: 0)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--log-dir", help="write each scenario's event log under this directory")
+    parser.add_argument("--json", help="write the full sweep results to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        scenarios = make_sweep(args.scenarios, _parse_grid(args.grid), args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"🚀 Running {len(scenarios)} scenarios")
+    sweep = run_sweep(scenarios, args.workers, args.log_dir)
+    print(f"Finished in {sweep['wall_time_seconds']:.2f}s on {sweep['workers']} workers\n")
+
+    print(f"{'statistic':<22}{'total':>14}{'mean':>12}{'min':>10}{'max':>10}")
+    for key, agg in sweep["merged"].items():
+        print(f"{key:<22}{agg['total']:>14,.2f}{agg['mean']:>12,.2f}{agg['min']:>10,.2f}{agg['max']:>10,.2f}")
+
+    failed = [r["name"] for r in sweep["scenarios"] if r["stats"]["scenarios_failed"]]
+    if args.json:
+        Path(args.json).write_text(json.dumps(sweep, indent=2))
+        print(f"\n📄 Results saved to: {args.json}")
+    if failed:
+        print(f"\n❌ {len(failed)} of {len(scenarios)} scenarios had failing phases")
+    else:
+        print(f"\n✅ All {len(scenarios)} scenarios passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,17 +12,28 @@ Usage:
     mw skills install <url>      # Install skill from GitHub URL
     mw skills create <name>      # Scaffold a new skill
     mw skills remove <name>      # Remove a skill
+    mw skills install <path> <path> ...  # Install several local skills concurrently
     mw skills run <name> <cmd>   # Run skill command
+    mw skills run --in-process <name> <cmd>
+                                 # Run a Python command inside this process
     mw skills info <name>        # Show skill information
+
+Parsed manifests are cached in ~/.mywork/skill_index and re-read only when
+a SKILL.md changes. Set MW_SKILLS_IN_PROCESS=1 to run Python commands in
+process by default.
 """
 
+import hashlib
 import os
 import sys
 import json
 import subprocess
 import shutil
 import tempfile
+import threading
+import traceback
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -31,14 +42,36 @@ SKILLS_DIR = Path(__file__).parent
 INSTALLED_DIR = SKILLS_DIR / "installed"
 SKILL_MANIFEST = "SKILL.md"
 SKILL_CONFIG = "skill.json"
+INDEX_DIR = Path(os.environ.get("MYWORK_SKILL_INDEX", Path.home() / ".mywork" / "skill_index"))
+INDEX_VERSION = 1
+
+_print_lock = threading.Lock()
+
+
+def _say(message: str):
+    """print() for install code, which install_skills runs on several threads."""
+    with _print_lock:
+        print(message)
 
 
 class SkillManager:
-    def __init__(self):
-        """Initialize the Skills Manager."""
+    def __init__(self, in_process: Optional[bool] = None):
+        """Initialize the Skills Manager.
+
+        in_process runs Python skill commands inside this interpreter instead
+        of spawning one per command; it defaults to $MW_SKILLS_IN_PROCESS.
+        """
         self.skills_dir = SKILLS_DIR
         self.installed_dir = INSTALLED_DIR
         self.installed_dir.mkdir(exist_ok=True)
+        if in_process is None:
+            in_process = os.environ.get("MW_SKILLS_IN_PROCESS") == "1"
+        self.in_process = in_process
+        digest = hashlib.sha1(str(self.installed_dir.resolve()).encode()).hexdigest()[:16]
+        self.index_path = INDEX_DIR / f"{digest}.json"
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_dirty = False
+        self._compiled: Dict[str, Any] = {}
 
     def list_skills(self) -> List[Dict[str, Any]]:
         """List all installed skills with metadata."""
@@ -46,21 +79,30 @@ class SkillManager:
         
         if not self.installed_dir.exists():
             return skills
-            
-        for skill_dir in self.installed_dir.iterdir():
-            if not skill_dir.is_dir() or skill_dir.name.startswith('.'):
-                continue
-                
-            skill_info = self._load_skill_info(skill_dir)
-            if skill_info:
-                skills.append(skill_info)
+        
+        with os.scandir(self.installed_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                skill_info = self._load_skill_info(Path(entry.path))
+                if skill_info:
+                    skills.append(skill_info)
+        self._save_index()
                 
         return sorted(skills, key=lambda x: x['name'])
 
+    def install_skills(self, sources: List[str], jobs: Optional[int] = None) -> Dict[str, bool]:
+        """Install several skills at once; copying and validation run concurrently."""
+        if not sources:
+            return {}
+        with ThreadPoolExecutor(max_workers=jobs or min(8, len(sources))) as pool:
+            results = list(pool.map(self.install_skill, sources))
+        return dict(zip(sources, results))
+
     def install_skill(self, url: str, name: Optional[str] = None) -> bool:
         """Install a skill from GitHub URL."""
         try:
-            print(f"🔄 Installing skill from: {url}")
+            _say(f"🔄 Installing skill from: {url}")
             
             # Determine skill name
             if not name:
@@ -68,7 +110,7 @@ class SkillManager:
                 
             skill_path = self.installed_dir / name
             if skill_path.exists():
-                print(f"❌ Skill '{name}' already exists")
+                _say(f"❌ Skill '{name}' already exists")
                 return False
 
             # Clone or download skill
@@ -81,7 +123,7 @@ class SkillManager:
                 return self._install_from_local(url, skill_path)
                 
         except Exception as e:
-            print(f"❌ Error installing skill: {e}")
+            _say(f"❌ Error installing skill: {e}")
             return False
 
     def create_skill(self, name: str) -> bool:
@@ -158,9 +200,12 @@ class SkillManager:
                 cmd = [str(script_path)] + (args or [])
 
             # Set environment
+            skill_env = {'SKILL_PATH': str(skill_info['path']), 'SKILL_NAME': skill_name}
+            if self.in_process and script_path.suffix == '.py':
+                return self._run_in_process(script_path, args or [], skill_env)
+            
             env = os.environ.copy()
-            env['SKILL_PATH'] = str(skill_info['path'])
-            env['SKILL_NAME'] = skill_name
+            env.update(skill_env)
             
             return subprocess.call(cmd, env=env)
             
@@ -168,6 +213,48 @@ class SkillManager:
             print(f"❌ Error running command: {e}")
             return 1
 
+    def _run_in_process(self, script_path: Path, args: List[str], skill_env: Dict[str, str]) -> int:
+        """Run a Python skill script as __main__ in this interpreter.
+
+        sys.argv, sys.path, the working directory and the SKILL_* variables
+        are set as a subprocess would see them and restored afterwards.
+        Compiled scripts and the modules they import stay loaded, so repeat
+        commands skip both interpreter start-up and compilation.
+        """
+        path = str(script_path)
+        mtime = script_path.stat().st_mtime_ns
+        cached = self._compiled.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, compile(script_path.read_bytes(), path, 'exec'))
+            self._compiled[path] = cached
+        
+        saved_argv, saved_path, saved_cwd = sys.argv, sys.path[:], os.getcwd()
+        saved_env = {key: os.environ.get(key) for key in skill_env}
+        sys.argv = [path] + list(args)
+        sys.path.insert(0, str(script_path.parent))
+        os.environ.update(skill_env)
+        try:
+            exec(cached[1], {'__name__': '__main__', '__file__': path, '__builtins__': __builtins__})
+            return 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+        finally:
+            sys.stdout.flush()
+            sys.argv = saved_argv
+            sys.path[:] = saved_path
+            os.chdir(saved_cwd)
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
     def show_skill_info(self, name: str) -> bool:
         """Show detailed information about a skill."""
         skill_info = self._get_skill_info(name)
@@ -193,25 +280,62 @@ class SkillManager:
         return True
 
     def _load_skill_info(self, skill_path: Path) -> Optional[Dict[str, Any]]:
-        """Load skill information from SKILL.md."""
-        manifest_path = skill_path / SKILL_MANIFEST
-        if not manifest_path.exists():
-            return None
-            
+        """Load skill information from SKILL.md, via the index while the manifest is unchanged."""
+        manifest_path = os.path.join(skill_path, SKILL_MANIFEST)
         try:
-            content = manifest_path.read_text()
-            skill_info = self._parse_skill_manifest(content)
-            skill_info['path'] = skill_path
-            return skill_info
-        except Exception:
+            st = os.stat(manifest_path)
+        except OSError:
             return None
+        
+        index = self._load_index()
+        key = skill_path.name
+        entry = index.get(key)
+        if not (entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size):
+            try:
+                content = Path(manifest_path).read_text()
+                info = self._parse_skill_manifest(content)
+            except Exception:
+                return None
+            entry = index[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'info': info}
+            self._index_dirty = True
+        # Callers may mutate what they get; the index keeps its own copy
+        info = entry['info']
+        skill_info = dict(info)
+        skill_info['dependencies'] = list(info['dependencies'])
+        skill_info['commands'] = {name: dict(cmd) for name, cmd in info['commands'].items()}
+        skill_info['path'] = skill_path
+        return skill_info
 
     def _get_skill_info(self, name: str) -> Optional[Dict[str, Any]]:
         """Get skill info by name."""
         skill_path = self.installed_dir / name
         if not skill_path.exists():
             return None
-        return self._load_skill_info(skill_path)
+        skill_info = self._load_skill_info(skill_path)
+        self._save_index()
+        return skill_info
+
+    def _load_index(self) -> Dict[str, Any]:
+        if self._index is None:
+            try:
+                data = json.loads(self.index_path.read_text())
+                self._index = data['skills'] if data.get('version') == INDEX_VERSION else {}
+            except (OSError, ValueError, KeyError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        if not self._index_dirty:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            live = {k: v for k, v in self._index.items() if (self.installed_dir / k).is_dir()}
+            tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({'version': INDEX_VERSION, 'skills': live}))
+            os.replace(tmp, self.index_path)
+            self._index_dirty = False
+        except OSError:
+            pass  # the index is a cache; manifests are re-read next time
 
     def _parse_skill_manifest(self, content: str) -> Dict[str, Any]:
         """Parse SKILL.md manifest file following Anthropic standard."""
@@ -286,14 +410,14 @@ class SkillManager:
             # Validate skill structure
             if not self._validate_skill(skill_path):
                 shutil.rmtree(skill_path)
-                print("❌ Invalid skill structure")
+                _say("❌ Invalid skill structure")
                 return False
                 
-            print(f"✅ Installed skill from {url}")
+            _say(f"✅ Installed skill from {url}")
             return True
             
         except subprocess.CalledProcessError:
-            print("❌ Git clone failed")
+            _say("❌ Git clone failed")
             return False
 
     def _install_from_url(self, url: str, skill_path: Path) -> bool:
@@ -308,14 +432,14 @@ class SkillManager:
                 
             if not self._validate_skill(skill_path):
                 shutil.rmtree(skill_path)
-                print("❌ Invalid skill structure")
+                _say("❌ Invalid skill structure")
                 return False
                 
-            print(f"✅ Installed skill from {url}")
+            _say(f"✅ Installed skill from {url}")
             return True
             
         except Exception:
-            print("❌ Download failed")
+            _say("❌ Download failed")
             return False
 
     def _install_from_local(self, path: str, skill_path: Path) -> bool:
@@ -323,21 +447,21 @@ class SkillManager:
         try:
             source_path = Path(path)
             if not source_path.exists():
-                print(f"❌ Source path not found: {path}")
+                _say(f"❌ Source path not found: {path}")
                 return False
                 
             shutil.copytree(source_path, skill_path)
             
             if not self._validate_skill(skill_path):
                 shutil.rmtree(skill_path)
-                print("❌ Invalid skill structure")
+                _say("❌ Invalid skill structure")
                 return False
                 
-            print(f"✅ Installed skill from {path}")
+            _say(f"✅ Installed skill from {path}")
             return True
             
         except Exception as e:
-            print(f"❌ Local install failed: {e}")
+            _say(f"❌ Local install failed: {e}")
             return False
 
     def _validate_skill(self, skill_path: Path) -> bool:
@@ -505,6 +629,9 @@ def main():
         if not args:
             print("Usage: mw skills install <url> [name]")
             return 1
+        if len(args) > 1 and all(Path(a).is_dir() for a in args):
+            results = manager.install_skills(args)
+            return 0 if all(results.values()) else 1
         url = args[0]
         name = args[1] if len(args) > 1 else None
         return 0 if manager.install_skill(url, name) else 1
@@ -522,6 +649,9 @@ def main():
         return 0 if manager.remove_skill(args[0]) else 1
 
     elif command == 'run':
+        if args and args[0] == '--in-process':
+            manager.in_process = True
+            args = args[1:]
         if len(args) < 2:
             print("Usage: mw skills run <skill-name> <command> [args...]")
             return 1
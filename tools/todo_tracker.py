@@ -7,14 +7,28 @@ Usage:
     mw todo --file X     Filter to specific file
     mw todo --type fixme Filter by type (todo/fixme/hack/xxx)
     mw todo --json       Output as JSON
+    mw todo --priority P Filter by priority (high/medium/low/info)
+    mw todo --cached     Query the index without rescanning changed files
+    mw todo --blame      Add author and age (git blame) to each marker
+
+Markers are kept in an index under ~/.mywork/todo_index; each run only
+rescans files whose size or mtime changed, so warm runs are fast enough
+for editor and hook integrations.
 """
 
+import hashlib
 import os
 import re
+import subprocess
 import sys
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import repeat
 from pathlib import Path
 from collections import defaultdict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 # Patterns to scan
 MARKERS = {
@@ -37,48 +51,263 @@ SKIP_DIRS = {
 EXTENSIONS = {".py", ".js", ".ts", ".tsx", ".jsx", ".sh", ".yaml", ".yml", ".toml", ".md"}
 
 
-def scan_file(filepath: Path):
-    """Scan a single file for TODO markers."""
+INDEX_DIR = Path(os.environ.get("MYWORK_TODO_INDEX", Path.home() / ".mywork" / "todo_index"))
+INDEX_VERSION = 1
+POOL_THRESHOLD = 256  # changed files before a rescan is spread over processes
+BATCH_SIZE = 64
+
+
+class ScanProfile(NamedTuple):
+    """What to look for: a pattern whose groups come in (marker, text) pairs,
+    the marker words it can match, and which files to scan."""
+    pattern: str
+    flags: int
+    markers: Tuple[str, ...]
+    extensions: FrozenSet[str]
+    skip_dirs: FrozenSet[str]
+    ignore_ext_case: bool = False
+
+    def fingerprint(self) -> str:
+        # Sorted, not repr(): frozenset order changes with PYTHONHASHSEED
+        stable = json.dumps([self.pattern, self.flags, list(self.markers), sorted(self.extensions),
+                             sorted(self.skip_dirs), self.ignore_ext_case])
+        return hashlib.sha1(stable.encode()).hexdigest()[:12]
+
+
+DEFAULT_PROFILE = ScanProfile(PATTERN.pattern, PATTERN.flags, tuple(MARKERS),
+                              frozenset(EXTENSIONS), frozenset(SKIP_DIRS))
+
+
+@cache
+def _compile(profile: ScanProfile):
+    candidates = re.compile("|".join(re.escape(m) for m in profile.markers), re.IGNORECASE)
+    return candidates, re.compile(profile.pattern, profile.flags)
+
+
+def _scan_text(text: str, profile: ScanProfile) -> List[list]:
+    """[line, marker, text] for every match, in one pass over the file.
+
+    Only lines containing a marker word are handed to the full pattern, so a
+    file without markers costs a single regex scan.
+    """
+    candidates, pattern = _compile(profile)
     items = []
+    lineno, counted_to, line_start = 1, 0, -1
+    for hit in candidates.finditer(text):
+        start = text.rfind("\n", 0, hit.start()) + 1
+        if start == line_start:
+            continue
+        line_start = start
+        end = text.find("\n", start)
+        m = pattern.search(text, start, len(text) if end < 0 else end)
+        if not m:
+            continue
+        lineno += text.count("\n", counted_to, start)
+        counted_to = start
+        groups = m.groups()
+        i = next(i for i in range(0, len(groups), 2) if groups[i] is not None)
+        items.append([lineno, groups[i].upper(), (groups[i + 1] or "").strip()])
+    return items
+
+
+def _read_items(path: str, profile: ScanProfile) -> List[list]:
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            for lineno, line in enumerate(f, 1):
-                m = PATTERN.search(line)
-                if m:
-                    marker = m.group(1).upper()
-                    text = m.group(2).strip()
-                    items.append({
-                        "file": str(filepath),
-                        "line": lineno,
-                        "marker": marker,
-                        "text": text,
-                        "priority": MARKERS.get(marker, {}).get("priority", "low"),
-                    })
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return _scan_text(f.read(), profile)
     except (PermissionError, OSError):
-        pass
-    return items
+        return []
 
 
-def scan_project(root: str, file_filter=None, type_filter=None):
-    """Scan entire project for TODO markers."""
-    root = Path(root)
-    all_items = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-        for fname in filenames:
-            fpath = Path(dirpath) / fname
-            if fpath.suffix not in EXTENSIONS:
-                continue
-            rel = str(fpath.relative_to(root))
-            if file_filter and file_filter not in rel:
+def _scan_batch(root: str, rels: List[str], profile: ScanProfile) -> List[List[list]]:
+    return [_read_items(os.path.join(root, rel), profile) for rel in rels]
+
+
+def scan_file(filepath: Path):
+    """Scan a single file for TODO markers."""
+    return [
+        {"file": str(filepath), "line": line, "marker": marker, "text": text,
+         "priority": MARKERS.get(marker, {}).get("priority", "low")}
+        for line, marker, text in _read_items(str(filepath), DEFAULT_PROFILE)
+    ]
+
+
+def _walk(root: str, profile: ScanProfile):
+    """(relative path, size, mtime_ns) of every file the profile scans."""
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = os.scandir(os.path.join(root, rel_dir))
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in profile.skip_dirs:
+                            stack.append(rel)
+                        continue
+                    ext = os.path.splitext(entry.name)[1]
+                    if (ext.lower() if profile.ignore_ext_case else ext) not in profile.extensions:
+                        continue
+                    if entry.is_file():
+                        st = entry.stat()
+                        yield rel, st.st_size, st.st_mtime_ns
+                except OSError:
+                    continue
+
+
+class TodoIndex:
+    """Persisted marker index for one tree.
+
+    File stats and markers live in separate files under ~/.mywork/todo_index
+    so a query only loads the (small) marker table; refresh() loads the stat
+    table and rescans files whose size or mtime changed. Blame is looked up
+    on demand and kept until the file changes.
+    """
+
+    def __init__(self, root, profile: ScanProfile = DEFAULT_PROFILE, index_dir: Path = None):
+        self.root = os.path.abspath(root)
+        self.profile = profile
+        key = hashlib.sha1(f"{self.root}\0{profile.fingerprint()}".encode()).hexdigest()[:16]
+        index_dir = Path(index_dir or INDEX_DIR)
+        self.stat_path = index_dir / f"{key}.stat.json"
+        self.items_path = index_dir / f"{key}.items.json"
+        self.files: Dict[str, dict] = self._load(self.items_path)  # rel -> {"items", "blame"?}
+        self.stats: Optional[Dict[str, list]] = None              # rel -> [size, mtime_ns]
+        self.dirty = False
+
+    @staticmethod
+    def _load(path: Path) -> dict:
+        try:
+            data = json.loads(path.read_text())
+            return data["files"] if data.get("version") == INDEX_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def refresh(self, workers: Optional[int] = None) -> Dict[str, int]:
+        """Rescan new and changed files; drop deleted ones."""
+        if self.stats is None:
+            self.stats = self._load(self.stat_path)
+        if not self.stats:
+            self.files = {}
+        seen = set()
+        changed = []
+        for rel, size, mtime in _walk(self.root, self.profile):
+            seen.add(rel)
+            old = self.stats.get(rel)
+            if not old or old[0] != size or old[1] != mtime:
+                changed.append(rel)
+                self.stats[rel] = [size, mtime]
+        removed = [rel for rel in self.stats if rel not in seen]
+        for rel in removed:
+            del self.stats[rel]
+            self.files.pop(rel, None)
+
+        batches = [changed[i:i + BATCH_SIZE] for i in range(0, len(changed), BATCH_SIZE)]
+        workers = workers or os.cpu_count() or 1
+        if len(changed) >= POOL_THRESHOLD and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_scan_batch, repeat(self.root), batches, repeat(self.profile))
+                scanned = [items for batch in results for items in batch]
+        else:
+            scanned = _scan_batch(self.root, changed, self.profile)
+        for rel, items in zip(changed, scanned):
+            if items:
+                self.files[rel] = {"items": items}
+            else:
+                self.files.pop(rel, None)
+
+        self.dirty = self.dirty or bool(changed or removed)
+        return {"files": len(seen), "scanned": len(changed), "removed": len(removed)}
+
+    def query(self, marker: str = None, priority: str = None, path: str = None) -> List[dict]:
+        """Indexed items, by file then line, optionally filtered."""
+        results = []
+        for rel in sorted(self.files):
+            if path and path not in rel:
                 continue
-            items = scan_file(fpath)
-            for item in items:
-                item["file"] = rel
-                if type_filter and item["marker"].lower() != type_filter.lower():
+            for line, mark, text in self.files[rel]["items"]:
+                if marker and mark.lower() != marker.lower():
+                    continue
+                pri = MARKERS.get(mark, {}).get("priority", "low")
+                if priority and pri != priority.lower():
                     continue
-                all_items.append(item)
-    return all_items
+                results.append({"file": rel, "line": line, "marker": mark, "text": text, "priority": pri})
+        return results
+
+    def blame(self, items: List[dict]) -> List[dict]:
+        """Add author and age_days to items, running git blame only for lines not seen before."""
+        by_file = defaultdict(list)
+        for item in items:
+            by_file[item["file"]].append(item)
+        now = time.time()
+        for rel, file_items in by_file.items():
+            entry = self.files.get(rel)
+            if entry is None:
+                continue
+            cache = entry.setdefault("blame", {})
+            missing = sorted({i["line"] for i in file_items if str(i["line"]) not in cache})
+            if missing:
+                found = _git_blame(self.root, rel, missing)
+                for line in missing:
+                    cache[str(line)] = found.get(line, [None, None])
+                self.dirty = True
+            for item in file_items:
+                author, stamp = cache[str(item["line"])]
+                item["author"] = author
+                item["age_days"] = int((now - stamp) // 86400) if stamp else None
+        return items
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.items_path.parent.mkdir(parents=True, exist_ok=True)
+            tables = [(self.items_path, self.files)]
+            if self.stats is not None:
+                tables.append((self.stat_path, self.stats))
+            for path, table in tables:
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": table},
+                                          separators=(",", ":")))
+                os.replace(tmp, path)
+            self.dirty = False
+        except OSError:
+            pass  # the index is a cache; the next run rescans
+
+
+def _git_blame(root: str, rel: str, lines: List[int]) -> Dict[int, list]:
+    """line -> [author, author-time] from one git blame call."""
+    cmd = ["git", "-C", root, "blame", "--line-porcelain"]
+    for line in lines:
+        cmd += ["-L", f"{line},{line}"]
+    try:
+        out = subprocess.run(cmd + ["--", rel], capture_output=True, text=True,
+                             errors="replace", timeout=30).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    found, line, author = {}, None, None
+    for row in out.splitlines():
+        parts = row.split(" ")
+        if len(parts) >= 3 and len(parts[0]) == 40 and parts[1].isdigit() and parts[2].isdigit():
+            line = int(parts[2])
+        elif row.startswith("author "):
+            author = row[len("author "):]
+        elif row.startswith("author-time ") and line is not None:
+            found[line] = [author, int(parts[1])]
+    return found
+
+
+def scan_project(root: str, file_filter=None, type_filter=None, priority_filter=None,
+                 refresh: bool = True):
+    """Scan entire project for TODO markers (through the persisted index)."""
+    index = TodoIndex(root)
+    if refresh:
+        index.refresh()
+        index.save()
+    return index.query(marker=type_filter, priority=priority_filter, path=file_filter)
 
 
 def print_grouped(items):
@@ -114,7 +343,10 @@ def print_grouped(items):
             print(f"   \033[96m{filepath}\033[0m")
             for item in file_items:
                 text = item["text"][:70] + ("..." if len(item["text"]) > 70 else "")
-                print(f"      L{item['line']:>4}: {text}")
+                who = ""
+                if item.get("author"):
+                    who = f" \033[2m({item['author']}, {item['age_days']}d)\033[0m"
+                print(f"      L{item['line']:>4}: {text}{who}")
         print()
 
 
@@ -152,6 +384,9 @@ def main():
     type_filter = None
     as_json = "--json" in args
     stats_only = "--stats" in args
+    cached = "--cached" in args
+    with_blame = "--blame" in args
+    priority_filter = None
 
     if "--file" in args:
         idx = args.index("--file")
@@ -161,7 +396,17 @@ def main():
         idx = args.index("--type")
         type_filter = args[idx + 1] if idx + 1 < len(args) else None
 
-    items = scan_project(project_root, file_filter, type_filter)
+    if "--priority" in args:
+        idx = args.index("--priority")
+        priority_filter = args[idx + 1] if idx + 1 < len(args) else None
+
+    index = TodoIndex(project_root)
+    if not cached or not index.stat_path.exists():
+        index.refresh()
+    items = index.query(marker=type_filter, priority=priority_filter, path=file_filter)
+    if with_blame:
+        index.blame(items)
+    index.save()
 
     if as_json:
         print(json.dumps(items, indent=2))
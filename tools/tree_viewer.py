@@ -21,11 +21,12 @@ Usage:
 """
 
 import os
+import re
 import sys
 import subprocess
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # ANSI colors
 RESET = "\033[0m"
@@ -72,38 +73,204 @@ def human_size(size: int) -> str:
     return f"{size:.1f}T"
 
 
-def get_git_status(root: Path) -> Dict[str, str]:
-    """Get git status for all files."""
+_SKIP_NAMES = frozenset(p for p in ALWAYS_SKIP if "*" not in p)
+_SKIP_SUFFIXES = tuple(p.replace("*", "") for p in ALWAYS_SKIP if "*" in p)
+
+
+def find_repo_root(path: Path) -> Optional[Path]:
+    """Nearest ancestor (or path itself) containing .git."""
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def get_git_status(root: Path, repo_root: Optional[Path] = None) -> Dict[str, str]:
+    """Git status for files under root, keyed relative to root.
+
+    The pathspec limits git to the displayed subtree, and untracked
+    directories are reported once (as "dir/") rather than file by file.
+    """
+    repo_root = repo_root or find_repo_root(root)
+    if repo_root is None:
+        return {}
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain", "-uall"],
+            ["git", "status", "--porcelain", "-z", "-unormal", "--", "."],
             capture_output=True, text=True, cwd=root, timeout=5,
         )
         if result.returncode != 0:
             return {}
-        status = {}
-        for line in result.stdout.strip().split("\n"):
-            if len(line) >= 4:
-                st = line[:2].strip()
-                path = line[3:]
-                status[path] = st
-        return status
     except Exception:
         return {}
+    prefix = root.relative_to(repo_root).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+    status = {}
+    records = iter(result.stdout.split("\0"))
+    for record in records:
+        if len(record) < 4:
+            continue
+        st, path = record[:2].strip(), record[3:]
+        if st.startswith(("R", "C")):
+            next(records, None)  # the rename source follows
+        if path.startswith(prefix):
+            status[path[len(prefix):]] = st
+    return status
 
 
-def get_gitignore_patterns(root: Path) -> Set[str]:
-    """Get list of gitignored files."""
-    try:
-        result = subprocess.run(
-            ["git", "ls-files", "--others", "--ignored", "--exclude-standard", "--directory"],
-            capture_output=True, text=True, cwd=root, timeout=5,
-        )
-        if result.returncode != 0:
-            return set()
-        return {p.rstrip("/") for p in result.stdout.strip().split("\n") if p}
-    except Exception:
-        return set()
+def _status_for(git_status: Dict[str, str], rel: str) -> str:
+    """Status of rel, inheriting "??" from an untracked parent directory."""
+    st = git_status.get(rel) or git_status.get(rel + "/")
+    if st or not git_status:
+        return st or ""
+    parts = rel.split("/")
+    for i in range(len(parts) - 1, 0, -1):
+        if git_status.get("/".join(parts[:i]) + "/") == "??":
+            return "??"
+    return ""
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate one gitignore glob (no leading/trailing slash) to a regex."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+            while i + 1 < n and pattern[i + 1] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "^") else i + 1)
+            if end < 0:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """The patterns of one .gitignore, compiled, applying below its directory.
+
+    Follows gitignore semantics: the last matching pattern wins, "!" negates,
+    a trailing "/" matches directories only, and a pattern with a slash
+    elsewhere is anchored to the file's directory while one without matches
+    a name at any depth.
+    """
+
+    def __init__(self, base: str, lines: List[str]):
+        self.base = base  # directory relative to the walk root, "" for the root itself
+        self.rules = []   # (regex, negate, dir_only, anchored), in file order
+        for line in lines:
+            line = line.rstrip("\n")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:] if line[1:2] in ("!", "#") else line
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            regex = re.compile(_glob_to_regex(line.lstrip("/")), re.DOTALL)
+            self.rules.append((regex, negate, dir_only, anchored))
+        # Without negations any match ignores, so one alternation per kind suffices
+        if not any(negate for _, negate, _, _ in self.rules):
+            self._fast = {
+                is_dir: tuple(
+                    re.compile("|".join(f"(?:{r.pattern})" for r, _, d, a in self.rules
+                                        if a == anchored and (is_dir or not d)) or "(?!)", re.DOTALL)
+                    for anchored in (False, True))
+                for is_dir in (False, True)
+            }
+        else:
+            self._fast = None
+
+    @classmethod
+    def load(cls, path: Path, base: str) -> Optional["IgnoreRules"]:
+        try:
+            rules = cls(base, path.read_text(encoding="utf-8", errors="ignore").splitlines())
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, rel: str, name: str, is_dir: bool) -> Optional[bool]:
+        """True if ignored, False if re-included by a negation, None if no pattern applies."""
+        local = rel[len(self.base) + 1:] if self.base else rel
+        if self._fast is not None:
+            by_name, by_path = self._fast[is_dir]
+            return True if by_name.fullmatch(name) or by_path.fullmatch(local) else None
+        for regex, negate, dir_only, anchored in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(local if anchored else name):
+                return not negate
+        return None
+
+
+def _is_ignored(stack: List[IgnoreRules], rel: str, name: str, is_dir: bool) -> bool:
+    # Deeper .gitignore files take precedence over shallower ones
+    for rules in reversed(stack):
+        verdict = rules.match(rel, name, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _ancestor_rules(root: Path, repo_root: Optional[Path]) -> List[IgnoreRules]:
+    """Rules from .git/info/exclude and .gitignore files above root, rebased onto root."""
+    if repo_root is None:
+        return []
+    stack = []
+    sources = [(repo_root / ".git" / "info" / "exclude", repo_root)]
+    rel_parts = root.relative_to(repo_root).parts
+    for i in range(len(rel_parts)):
+        directory = repo_root.joinpath(*rel_parts[:i])
+        sources.append((directory / ".gitignore", directory))
+    for path, directory in sources:
+        rules = IgnoreRules.load(path, "") if path.is_file() else None
+        if rules is None:
+            continue
+        # Paths below root are seen from `directory`; rebase by prefixing
+        prefix = root.relative_to(directory).as_posix()
+        stack.append(_Rebased(rules, "" if prefix == "." else prefix))
+    return stack
+
+
+class _Rebased:
+    """An ancestor's rules, matched against paths relative to the walk root."""
+
+    def __init__(self, rules: IgnoreRules, prefix: str):
+        self.rules, self.prefix = rules, prefix
+
+    def match(self, rel: str, name: str, is_dir: bool) -> Optional[bool]:
+        return self.rules.match(f"{self.prefix}/{rel}" if self.prefix else rel, name, is_dir)
 
 
 def get_icon(name: str, is_dir: bool) -> str:
@@ -137,88 +304,122 @@ def git_status_color(status: str) -> str:
     return ""
 
 
-def build_tree(
+def iter_tree(
     root: Path,
     max_depth: int = 3,
     show_all: bool = False,
     dirs_only: bool = False,
     filter_ext: Optional[str] = None,
     show_size: bool = False,
-    as_json: bool = False,
-) -> Tuple[List[str], dict]:
-    """Build tree output lines and stats."""
-    git_status = get_git_status(root)
-    gitignored = get_gitignore_patterns(root) if not show_all else set()
-    
-    lines = []
-    stats = {"dirs": 0, "files": 0, "total_size": 0}
-    
-    def _should_skip(name: str, rel: str) -> bool:
-        if not show_all and name.startswith("."):
-            return True
-        if name in ALWAYS_SKIP:
-            return True
-        for pattern in ALWAYS_SKIP:
-            if "*" in pattern and name.endswith(pattern.replace("*", "")):
-                return True
-        if not show_all and rel in gitignored:
-            return True
-        return False
+    stats: Optional[dict] = None,
+) -> Iterator[str]:
+    """Yield tree lines as each directory is read, updating stats as it goes.
+
+    Only one directory listing is held per level, so output starts at once
+    and memory stays flat however large the tree is.
+    """
+    if stats is None:
+        stats = {}
+    stats.update({"dirs": 0, "files": 0, "total_size": 0})
+    repo_root = find_repo_root(root)
+    git_status = get_git_status(root, repo_root)
+    ignore_stack = [] if show_all else _ancestor_rules(root, repo_root)
     
-    def _walk(path: Path, prefix: str, depth: int, rel_prefix: str):
-        if depth > max_depth:
-            return
-        
+    def _visible(path: str, rel_prefix: str):
         try:
-            entries = sorted(path.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
-        except PermissionError:
-            return
+            with os.scandir(path) as it:
+                entries = []
+                for entry in it:
+                    try:
+                        entries.append((not entry.is_dir(), entry.name.lower(), entry))
+                    except OSError:
+                        continue
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            if not show_all:
+                ignore_stack.append(None)
+            return []
+        entries.sort(key=lambda e: (e[0], e[1]))
+        
+        if not show_all:
+            rules = IgnoreRules.load(Path(path) / ".gitignore", rel_prefix) \
+                if any(e[2].name == ".gitignore" for e in entries) else None
+            ignore_stack.append(rules)
         
-        # Filter
+        active = [r for r in ignore_stack if r]
         visible = []
-        for entry in entries:
-            rel = os.path.join(rel_prefix, entry.name) if rel_prefix else entry.name
-            if _should_skip(entry.name, rel):
+        for is_file, _, entry in entries:
+            name = entry.name
+            is_dir = not is_file
+            if not show_all and name.startswith("."):
                 continue
-            if dirs_only and not entry.is_dir():
+            if name in _SKIP_NAMES or name.endswith(_SKIP_SUFFIXES):
                 continue
-            if filter_ext and not entry.is_dir() and not entry.name.endswith(filter_ext):
+            if dirs_only and not is_dir:
                 continue
-            visible.append((entry, rel))
-        
-        for i, (entry, rel) in enumerate(visible):
-            is_last = i == len(visible) - 1
-            connector = "└── " if is_last else "├── "
-            child_prefix = prefix + ("    " if is_last else "│   ")
-            
-            is_dir = entry.is_dir()
-            icon = get_icon(entry.name, is_dir)
-            name = entry.name
-            
-            # Git status
-            gs = git_status.get(rel, "")
-            gs_color = git_status_color(gs)
-            gs_label = f" {gs_color}[{gs}]{RESET}" if gs else ""
-            
-            # Size
-            size_label = ""
-            if show_size and not is_dir:
-                try:
-                    sz = entry.stat().st_size
-                    stats["total_size"] += sz
-                    size_label = f" {DIM}({human_size(sz)}){RESET}"
-                except OSError:
-                    pass
-            
-            if is_dir:
-                stats["dirs"] += 1
-                lines.append(f"{prefix}{connector}{icon} {BOLD}{BLUE}{name}/{RESET}{gs_label}")
-                _walk(entry, child_prefix, depth + 1, rel)
-            else:
-                stats["files"] += 1
-                lines.append(f"{prefix}{connector}{icon} {name}{gs_label}{size_label}")
+            if filter_ext and not is_dir and not name.endswith(filter_ext):
+                continue
+            rel = f"{rel_prefix}/{name}" if rel_prefix else name
+            if active and _is_ignored(active, rel, name, is_dir):
+                continue
+            visible.append((entry, rel, is_dir))
+        return visible
     
-    _walk(root, "", 1, "")
+    # One frame per open directory: [visible entries, next index, prefix, depth]
+    stack = [[_visible(str(root), ""), 0, "", 1]]
+    while stack:
+        frame = stack[-1]
+        visible, index, prefix, depth = frame
+        if index == len(visible):
+            stack.pop()
+            if not show_all:
+                ignore_stack.pop()
+            continue
+        frame[1] += 1
+        entry, rel, is_dir = visible[index]
+        is_last = index == len(visible) - 1
+        connector = "└── " if is_last else "├── "
+        child_prefix = prefix + ("    " if is_last else "│   ")
+        
+        icon = get_icon(entry.name, is_dir)
+        name = entry.name
+        
+        # Git status
+        gs = _status_for(git_status, rel)
+        gs_color = git_status_color(gs)
+        gs_label = f" {gs_color}[{gs}]{RESET}" if gs else ""
+        
+        # Size
+        size_label = ""
+        if show_size and not is_dir:
+            try:
+                sz = entry.stat().st_size
+                stats["total_size"] += sz
+                size_label = f" {DIM}({human_size(sz)}){RESET}"
+            except OSError:
+                pass
+        
+        if is_dir:
+            stats["dirs"] += 1
+            yield f"{prefix}{connector}{icon} {BOLD}{BLUE}{name}/{RESET}{gs_label}"
+            if depth + 1 <= max_depth:
+                stack.append([_visible(entry.path, rel), 0, child_prefix, depth + 1])
+        else:
+            stats["files"] += 1
+            yield f"{prefix}{connector}{icon} {name}{gs_label}{size_label}"
+
+
+def build_tree(
+    root: Path,
+    max_depth: int = 3,
+    show_all: bool = False,
+    dirs_only: bool = False,
+    filter_ext: Optional[str] = None,
+    show_size: bool = False,
+    as_json: bool = False,
+) -> Tuple[List[str], dict]:
+    """Build tree output lines and stats."""
+    stats: dict = {}
+    lines = list(iter_tree(root, max_depth, show_all, dirs_only, filter_ext, show_size, stats))
     return lines, stats
 
 
@@ -273,9 +474,12 @@ def cmd_tree(args: List[str] = None) -> int:
         print(f"❌ Not a directory: {root}")
         return 1
     
-    lines, stats = build_tree(root, max_depth, show_all, dirs_only, filter_ext, show_size, as_json)
+    stats: dict = {}
+    lines = iter_tree(root, max_depth, show_all, dirs_only, filter_ext, show_size, stats)
     
     if as_json:
+        for _ in lines:
+            pass
         print(json.dumps({
             "root": str(root),
             "dirs": stats["dirs"],
@@ -287,7 +491,7 @@ def cmd_tree(args: List[str] = None) -> int:
     # Header
     print(f"\n{BOLD}📂 {root.name}/{RESET}")
     for line in lines:
-        print(line)
+        print(line, flush=sys.stdout.isatty())
     
     # Summary
     size_info = f", {human_size(stats['total_size'])}" if show_size else ""